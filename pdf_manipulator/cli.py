@@ -2,10 +2,13 @@
 
 import sys
 import signal
+import sqlite3
 import argparse
 
 from pathlib import Path
+from datetime import datetime
 from rich.console import Console
+from rich.table import Table
 
 from pdf_manipulator.ui import display_pdf_table
 from pdf_manipulator._version import __version__
@@ -25,6 +28,24 @@ from pdf_manipulator.core.malformation_utils import (
     check_and_fix_malformation_batch,
     check_and_fix_malformation_early
 )
+from pdf_manipulator.core.cache.text_cache import configure_text_cache
+from pdf_manipulator.core.cache.text_index import configure_text_index, get_text_index
+from pdf_manipulator.core.cache.analysis_store import configure_analysis_store
+from pdf_manipulator.core.cache.folder_manifest import configure_folder_manifests
+from pdf_manipulator.core.cache.page_index import configure_page_index
+from pdf_manipulator.core.cache.parse_store import configure_parse_store
+from pdf_manipulator.core.malformation_detector import (
+    DEFAULT_SAMPLE_SIZE,
+    DEFAULT_SAMPLING,
+    SAMPLING_STRATEGIES,
+    configure_malformation_detection,
+)
+from pdf_manipulator.core.page_range.page_text import (
+    build_page_text_index,
+    configure_text_extraction,
+    page_text_index_info,
+)
+from pdf_manipulator.core.page_range.sharded_extraction import DEFAULT_SHARD_SIZE
 from pdf_manipulator.renamer import PatternProcessor
 from pdf_manipulator.renamer.template_engine import validate_template_against_variables
 
@@ -78,12 +99,17 @@ Content-Based Selection:
                         size:>1MB      (pages over 1MB)
                         size:>=2MB     (pages 2MB or larger)
                         size:<=100KB   (pages 100KB or smaller)
+    
+    Duplicate pages:    dup:seen       (pages already in an earlier PDF)
+                        dup:doc        (repeats of an earlier page in the same PDF)
+                        dup:any        (either)
 
 Boolean Expressions:
     AND logic:          "contains:'Invoice' & contains:'Total'"
     OR logic:           "type:text | type:mixed"
     NOT logic:          "all & !type:empty"  (all pages except empty ones)
     Complex:            "type:text & size:<500KB"  (small text pages)
+    Skip repeats:       "all & !dup:seen"  (drop cover pages seen in earlier PDFs)
 
 Smart Filename Generation:
     Pattern Extraction:
@@ -123,13 +149,20 @@ Extraction Options:
 
 Ghostscript Options:
     --gs-quality        Quality setting: screen, ebook, printer, prepress, default
-    --recursive         Process subdirectories recursively (for --gs-batch-fix)
+    --recursive         Process subdirectories recursively (folder scans and --gs-batch-fix)
     --dry-run           Show what would be done without actually doing it
     --replace-originals Replace original files with Ghostscript fixed versions
 
 Modes:
     --interactive       Process each PDF interactively (ask for each file)
     --batch             Process all matching PDFs without prompting
+    --jobs N            With --batch, extract from N PDFs at once in worker processes
+                        (0 = one worker per CPU). Output is still printed in file order.
+                        Folder scans of 32+ PDFs use one worker per CPU unless --jobs is set
+                        With --gs-batch-fix, run N Ghostscript repairs at once (default: one per CPU,
+                        --jobs 1 repairs one file at a time)
+    --text-workers N    Extract page text of large PDFs with N worker processes, each
+                        handling a contiguous range of --text-shard-size pages (default 50)
 
 Examples:
     %(prog)s                           # Scan current directory
@@ -220,8 +253,31 @@ Phase 3 Pattern Examples:
         --scrape-pattern="tax=Tax:r1nb1-" \\              # Extracts all numbers until non-numeric
         --filename-template="{amount}_{tax}_invoice.pdf"
 
+Caching:
+    --text-cache-dir    Where extracted page text is cached between runs
+                        (default: $XDG_CACHE_HOME/pdf-manipulator or ~/.cache/pdf-manipulator)
+    --no-text-cache     Always re-extract page text; never read or write the cache
+                        The cache is keyed by file content, so edited PDFs are re-extracted
+    --no-analysis-cache Always re-analyze pages for type:, size: and --analyze-detailed
+                        (results are stored per page, so edited PDFs only redo changed pages)
+    --no-page-index     Remember page fingerprints for this run only; dup:seen then only
+                        knows the PDFs processed in this run (in input order)
+    --no-parse-cache    Always evaluate --extract-pages; never reuse the selection stored
+                        for an unchanged PDF and the same expression and group options
+                        (implied by --no-text-cache)
+    --index-build       Build a page text index for the PDF(s); later contains: and
+                        line-starts: patterns only examine pages the index allows
+    --index-status      Show which PDFs are indexed (an edited PDF needs a rebuild)
+    
+    %(prog)s archive.pdf --index-build
+    %(prog)s archive.pdf --extract-pages="contains:'Invoice' & !contains:'VOID'"
+
 Safety options:
     --no-auto-fix     Disable automatic malformation fixing in batch mode
+    --malformation-sample N       Pages checked per PDF for malformation (default 3)
+    --malformation-sampling MODE  Which pages: first, last, random or stratified
+                                  (default: stratified - spread over the document,
+                                  first and last page included)
     --replace         Replace/delete originals after processing (still asks!)
     --replace-originals  Replace originals with Ghostscript fixed versions (CAREFUL!)
 
@@ -376,6 +432,9 @@ def main():
         help=('Filter extracted page groups by index (e.g., "1,3,4") or content criteria '
             '(e.g., "contains:\'Important\'", "type:text & !37-96"). '
             'Only matching groups will be kept.'))
+    filtering.add_argument('--filter-mode', type=str, default='any', metavar='MODE',
+        help=('How many pages of a group must match content criteria in --filter-matches: '
+            'any (default), all, or count>=N (e.g., "count>=2")'))
     filtering.add_argument('--group-start', type=str, metavar='PATTERN',
         help='Start new groups at pages matching pattern (e.g., "contains:\'Chapter\'", "type:text")')
     filtering.add_argument('--group-end', type=str, metavar='PATTERN', 
@@ -393,9 +452,36 @@ def main():
     modes.add_argument('--batch', action='store_true',
         help='Process all matching PDFs without individual prompts')
     modes.add_argument('--recursive', action='store_true',
-        help='Process subdirectories recursively (for --gs-batch-fix)')
+        help='Include PDFs in subdirectories when processing a folder')
     modes.add_argument('--dry-run', action='store_true',
         help='Show what would be done without actually doing it')
+    modes.add_argument('--jobs', type=int, default=None, metavar='N',
+        help='Number of worker processes for batch extraction (default: 1, 0 = one per CPU); '
+             'concurrent repairs for --gs-batch-fix (default: one per CPU, 1 = serial)')
+    modes.add_argument('--text-workers', type=int, default=1, metavar='N',
+        help='Worker processes for page text extraction of large PDFs (default: 1, 0 = one per CPU)')
+    modes.add_argument('--text-shard-size', type=int, default=DEFAULT_SHARD_SIZE, metavar='PAGES',
+        help=f'Pages per text extraction worker task (default: {DEFAULT_SHARD_SIZE})')
+
+    # Persistent caches
+    caching = parser.add_argument_group('caching')
+    caching.add_argument('--text-cache-dir', type=Path, metavar='DIR',
+        help='Directory for the persistent page text cache (default: ~/.cache/pdf-manipulator)')
+    caching.add_argument('--no-text-cache', action='store_true',
+        help='Do not read or write the persistent page text cache')
+    caching.add_argument('--no-analysis-cache', action='store_true',
+        help='Do not read or write stored page analysis (type, size, image count)')
+    caching.add_argument('--no-scan-cache', action='store_true',
+        help='Do not read or write folder scan manifests (page counts, malformation checks)')
+    caching.add_argument('--no-page-index', action='store_true',
+        help='Do not read or write the page fingerprint index used by dup: (this run only)')
+    caching.add_argument('--no-parse-cache', action='store_true',
+        help='Do not read or write stored --extract-pages results (always evaluate the expression; '
+             'implied by --no-text-cache)')
+    caching.add_argument('--index-build', action='store_true',
+        help='Build the persistent page text index for the PDF(s) to speed up repeated queries')
+    caching.add_argument('--index-status', action='store_true',
+        help='Show page text index status for the PDF(s)')
 
     # File operation (output) previewing, conflict resolution
     preview = parser.add_argument_group('preview and conflict resolution')
@@ -406,6 +492,10 @@ def main():
     safety = parser.add_argument_group('safety options')
     safety.add_argument('--no-auto-fix', action='store_true',
         help='Disable automatic malformation fixing in batch mode')
+    safety.add_argument('--malformation-sample', type=int, default=DEFAULT_SAMPLE_SIZE, metavar='N',
+        help=f'Pages checked per PDF when detecting malformation (default: {DEFAULT_SAMPLE_SIZE})')
+    safety.add_argument('--malformation-sampling', choices=SAMPLING_STRATEGIES, default=DEFAULT_SAMPLING,
+        help=f'Which pages malformation detection checks (default: {DEFAULT_SAMPLING})')
     safety.add_argument('--replace', action='store_true',
         help='Replace original files after processing (CAREFUL!)')
     safety.add_argument('--replace-originals', action='store_true',
@@ -417,6 +507,24 @@ def main():
     OpCtx.reset()           # Clear any previous state
     OpCtx.set_args(args)    # Set the arguments cache, they won't change
 
+    if args.no_text_cache and args.text_cache_dir:
+        console.print("[red]Error: Cannot use both --no-text-cache and --text-cache-dir[/red]")
+        sys.exit(1)
+
+    if args.no_text_cache and (args.index_build or args.index_status):
+        console.print("[red]Error: --index-build and --index-status cannot be used with --no-text-cache[/red]")
+        sys.exit(1)
+
+    if args.text_workers < 0 or args.text_shard_size < 1:
+        console.print("[red]Error: --text-workers must be >= 0 and --text-shard-size must be >= 1[/red]")
+        sys.exit(1)
+
+    if args.malformation_sample < 1:
+        console.print("[red]Error: --malformation-sample must be at least 1[/red]")
+        sys.exit(1)
+
+    configure_caches(args)
+
     # Handle --strip-first as alias for --extract-pages=1
     if args.strip_first:
         if args.extract_pages:
@@ -438,8 +546,16 @@ def main():
         console.print("[red]Error: Cannot use both --gs-fix and --gs-batch-fix[/red]")
         sys.exit(1)
 
-    if args.recursive and not args.gs_batch_fix:
-        console.print("[red]Error: --recursive can only be used with --gs-batch-fix[/red]")
+    if args.recursive and not args.path.is_dir():
+        console.print("[red]Error: --recursive can only be used with a folder[/red]")
+        sys.exit(1)
+
+    if args.jobs is not None and args.jobs < 0:
+        console.print("[red]Error: --jobs must be 0 (one per CPU) or a positive number[/red]")
+        sys.exit(1)
+
+    if args.jobs is not None and not (args.batch or args.gs_batch_fix):
+        console.print("[red]Error: --jobs can only be used with --batch or --gs-batch-fix[/red]")
         sys.exit(1)
 
     if args.replace_originals and not (args.gs_fix or args.gs_batch_fix):
@@ -461,11 +577,16 @@ def main():
 
     # Validate filter syntax early
     if args.filter_matches:
-        from pdf_manipulator.core.page_range.group_filtering import validate_filter_syntax
+        from pdf_manipulator.core.page_range.group_filtering import validate_filter_syntax, parse_filter_mode
         is_valid, error_msg = validate_filter_syntax(args.filter_matches)
         if not is_valid:
             console.print(f"[red]Error: Invalid filter syntax: {error_msg}[/red]")
             sys.exit(1)
+        try:
+            parse_filter_mode(args.filter_mode)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            sys.exit(1)
 
     # NEW: Validate scraper arguments
     is_valid, error_msg = validate_scraper_arguments(args)
@@ -483,6 +604,7 @@ def main():
         ])
     ghostscript_operations = sum([args.gs_fix, args.gs_batch_fix])
     scraper_operations = sum([args.scrape_text, args.dump_text])
+    index_operations = sum([args.index_build, args.index_status])
     
     if regular_operations > 1:
         console.print("[red]Error: Please specify only one regular operation at a time[/red]")
@@ -496,7 +618,12 @@ def main():
         console.print("[red]Error: Please specify only one scraper operation at a time[/red]")
         sys.exit(1)
 
-    if sum([regular_operations > 0, ghostscript_operations > 0, scraper_operations > 0]) > 1:
+    if index_operations > 1:
+        console.print("[red]Error: Please specify only one index operation at a time[/red]")
+        sys.exit(1)
+
+    if sum([regular_operations > 0, ghostscript_operations > 0, scraper_operations > 0,
+            index_operations > 0]) > 1:
         console.print("[red]Error: Cannot mix different operation types[/red]")
         sys.exit(1)
 
@@ -515,6 +642,9 @@ def main():
     elif args.scrape_text or args.dump_text:
         handle_scraper_operations(args, is_file, is_folder)
         return
+    elif args.index_build or args.index_status:
+        handle_index_operations(args, is_file, is_folder)
+        return
 
     # Process regular operations based on input type
     if is_file:
@@ -536,17 +666,44 @@ def main():
         process_single_file_operations(args, pdf_files)
     else:
         console.print(f"[blue]Scanning {args.path.absolute()}...[/blue]\n")
-        pdf_files = scan_folder(args.path)
+        pdf_files = scan_folder(args.path, recursive=args.recursive, jobs=get_scan_jobs(args))
         if not pdf_files:
             console.print("[yellow]No PDF files found![/yellow]")
             sys.exit(0)
         
-        pdf_files = check_and_fix_malformation_batch(pdf_files, "scanning")
+        pdf_files = check_and_fix_malformation_batch(pdf_files, "scanning", jobs=get_scan_jobs(args))
         
         display_pdf_table(pdf_files)
         handle_folder_operations(args, pdf_files)
 
 
+def configure_caches(args: argparse.Namespace):
+    """Configure the persistent caches, text extraction and malformation detection from command line arguments."""
+    configure_text_cache(cache_dir=getattr(args, 'text_cache_dir', None),
+                            enabled=not getattr(args, 'no_text_cache', False))
+    configure_text_index(cache_dir=getattr(args, 'text_cache_dir', None),
+                            enabled=not getattr(args, 'no_text_cache', False))
+    configure_analysis_store(cache_dir=getattr(args, 'text_cache_dir', None),
+                                enabled=not getattr(args, 'no_analysis_cache', False))
+    configure_folder_manifests(cache_dir=getattr(args, 'text_cache_dir', None),
+                                enabled=not getattr(args, 'no_scan_cache', False))
+    configure_page_index(cache_dir=getattr(args, 'text_cache_dir', None),
+                            enabled=not getattr(args, 'no_page_index', False))
+    # Stored selections come from cached text, so --no-text-cache bypasses them too
+    configure_parse_store(cache_dir=getattr(args, 'text_cache_dir', None),
+                            enabled=not (getattr(args, 'no_parse_cache', False) or
+                                            getattr(args, 'no_text_cache', False)))
+    configure_text_extraction(workers=getattr(args, 'text_workers', 1),
+                                shard_size=getattr(args, 'text_shard_size', DEFAULT_SHARD_SIZE))
+    configure_malformation_detection(sample_size=getattr(args, 'malformation_sample', DEFAULT_SAMPLE_SIZE),
+                                        sampling=getattr(args, 'malformation_sampling', DEFAULT_SAMPLING))
+
+
+def get_scan_jobs(args) -> int | None:
+    """Worker processes for scanning a folder: --jobs if given (1 = serial), otherwise automatic (None)."""
+    return args.jobs
+
+
 def is_interactive_mode(args) -> bool:
     """Determine if we're in interactive mode (default unless --batch specified)."""
     return not getattr(args, 'batch', False)
@@ -632,7 +789,8 @@ def handle_ghostscript_operations(args: argparse.Namespace, is_file: bool, is_fo
                 folder_path=args.path,
                 recursive=args.recursive,
                 dry_run=args.dry_run,
-                preserve_originals=not args.replace_originals
+                preserve_originals=not args.replace_originals,
+                jobs=args.jobs      # Not given (None): one gs process per CPU
             )
 
             if results:
@@ -655,6 +813,50 @@ def handle_scraper_operations(args: argparse.Namespace, is_file: bool, is_folder
     sys.exit(0)
 
 
+def handle_index_operations(args: argparse.Namespace, is_file: bool, is_folder: bool):
+    """Build or report the persistent page text index for a file or every PDF in a folder."""
+    if is_file:
+        pdf_files = scan_file(args.path)
+    else:
+        pdf_files = scan_folder(args.path, recursive=args.recursive, jobs=get_scan_jobs(args))
+    if not pdf_files:
+        console.print("[yellow]No PDF files found![/yellow]")
+        sys.exit(0)
+
+    if args.index_build:
+        failures = 0
+        for pdf_path, page_count, _ in pdf_files:
+            try:
+                info = build_page_text_index(pdf_path, page_count)
+            except (ValueError, OSError, sqlite3.Error) as e:
+                console.print(f"[red]✗ {pdf_path.name}: {e}[/red]")
+                failures += 1
+                continue
+            console.print(f"[green]✓ Indexed {pdf_path.name}: {info['total_pages']} pages, "
+                            f"{info['term_count']:,} terms, {info['total_bytes'] / 1024:.0f} KB[/green]")
+        sys.exit(1 if failures else 0)
+
+    table = Table(title="Page Text Index")
+    table.add_column("File", style="cyan")
+    table.add_column("Pages", justify="right")
+    table.add_column("Status")
+    table.add_column("Terms", justify="right")
+    table.add_column("Built")
+
+    for pdf_path, page_count, _ in pdf_files:
+        info = page_text_index_info(pdf_path)
+        if info is None:
+            table.add_row(pdf_path.name, str(page_count), "[yellow]not indexed[/yellow]", "-", "-")
+        else:
+            built = datetime.fromtimestamp(info['built_at']).strftime('%Y-%m-%d %H:%M')
+            table.add_row(pdf_path.name, str(page_count), "[green]indexed[/green]",
+                            f"{info['term_count']:,}", built)
+
+    console.print(table)
+    console.print(f"[dim]Index database: {get_text_index().stats()['path']}[/dim]")
+    sys.exit(0)
+
+
 def extract_enhanced_args(args) -> dict:
     """
     Extract enhanced arguments for PDF operations.
@@ -0,0 +1,207 @@
+"""
+Process-Pool Batch Extraction
+File: pdf_manipulator/core/batch_pool.py
+
+Runs the per-PDF extraction pipeline of `--extract-pages --batch` on a pool
+of worker processes (`--jobs N`). Parsing and writing are CPU-bound in
+pypdf/pdfplumber, so processes (not threads) are what actually scales.
+
+How state is kept sane:
+- Each worker has its own OperationContext, initialized from the same args
+  the parent parsed. OpCtx is class-global, which is exactly what we want
+  per process - workers never share it.
+- Worker console output is captured and sent back with the result. Results
+  are yielded in input order, so the log reads exactly like a serial run.
+- dup: verdicts don't depend on the start method: without a persistent page
+  index, the documents the parent fingerprinted before dispatch are handed
+  to every worker as its run index.
+- Output file conflicts are resolved under a lock shared by all workers, and
+  the chosen path is claimed on disk before it is written, so two workers
+  can never pick the same "rename" target.
+- Replacing originals and the final summary happen in the parent.
+"""
+
+import io
+import signal
+import argparse
+import multiprocessing
+
+from pathlib import Path
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+from pdf_manipulator.core.operation_context import OpCtx
+from pdf_manipulator.core.file_conflicts import set_reservation_lock, release_reservations
+from pdf_manipulator.core.warning_suppression import suppress_all_pdf_warnings
+from pdf_manipulator.core.cache.text_cache import configure_text_cache, get_text_cache
+from pdf_manipulator.core.cache.text_index import configure_text_index
+from pdf_manipulator.core.cache.analysis_store import configure_analysis_store, get_analysis_store
+from pdf_manipulator.core.cache.page_index import configure_page_index, get_page_index
+from pdf_manipulator.core.cache.parse_store import DEFAULT_MAX_ENTRIES, configure_parse_store, get_parse_store
+from pdf_manipulator.core.page_fingerprint import run_index_documents, seed_run_index
+from pdf_manipulator.core.page_range.page_text import configure_text_extraction
+from pdf_manipulator.core.malformation_detector import (
+    DEFAULT_SAMPLE_SIZE,
+    DEFAULT_SAMPLING,
+    configure_malformation_detection,
+)
+from pdf_manipulator.core.folder_operations import (
+    BatchExtractResult,
+    batch_extract_single_pdf,
+    _null_context,
+)
+
+
+class _CapturedOutput(io.StringIO):
+    """StringIO that reports the parent's terminal status so rich keeps colors."""
+
+    def __init__(self, is_tty: bool):
+        super().__init__()
+        self._is_tty = is_tty
+
+    def isatty(self) -> bool:
+        return self._is_tty
+
+
+# Per-worker settings, filled in by _init_worker()
+_worker_settings: dict = {}
+
+
+def _init_worker(args: argparse.Namespace, reservation_lock, text_cache_settings: tuple | None,
+                    is_tty: bool, task_settings: dict):
+    """Give the worker process its own operation context and cache configuration."""
+    # Ctrl+C is handled by the parent, which shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    OpCtx.reset()
+    OpCtx.set_args(args)
+
+    set_reservation_lock(reservation_lock)
+
+    # The text index lives next to the text cache and is switched with it
+    if text_cache_settings is None:
+        configure_text_cache(enabled=False)
+        configure_text_index(enabled=False)
+    else:
+        cache_dir, max_bytes = text_cache_settings
+        configure_text_cache(cache_dir=cache_dir, max_bytes=max_bytes)
+        configure_text_index(cache_dir=cache_dir)
+
+    analysis_store_dir = task_settings.get('analysis_store_dir')
+    configure_analysis_store(cache_dir=analysis_store_dir, enabled=analysis_store_dir is not None)
+
+    page_index_dir = task_settings.get('page_index_dir')
+    configure_page_index(cache_dir=page_index_dir, enabled=page_index_dir is not None)
+
+    # Spawned workers start with an empty run index - dup: needs the parent's
+    run_fingerprints = task_settings.get('run_fingerprints')
+    if run_fingerprints is not None:
+        seed_run_index(run_fingerprints)
+
+    parse_store_dir = task_settings.get('parse_store_dir')
+    configure_parse_store(cache_dir=parse_store_dir, enabled=parse_store_dir is not None,
+                            max_entries=task_settings.get('parse_store_max_entries', DEFAULT_MAX_ENTRIES))
+
+    # The pool already uses every core - no nested page-parallel extraction
+    configure_text_extraction(workers=1)
+
+    configure_malformation_detection(sample_size=getattr(args, 'malformation_sample', DEFAULT_SAMPLE_SIZE),
+                                        sampling=getattr(args, 'malformation_sampling', DEFAULT_SAMPLING))
+
+    _worker_settings.clear()
+    _worker_settings.update(task_settings)
+    _worker_settings['args'] = args
+    _worker_settings['is_tty'] = is_tty
+
+
+def _extract_in_worker(task: tuple[Path, int]) -> BatchExtractResult:
+    """Run the extraction pipeline for one PDF inside a worker process."""
+    pdf_path, page_count = task
+    settings = _worker_settings
+    args = settings['args']
+    dry_run = settings['dry_run']
+
+    from pdf_manipulator.core.folder_operations import console
+
+    buffer = _CapturedOutput(settings['is_tty'])
+    with redirect_stdout(buffer):
+        console.print(f"\n[cyan]Processing {pdf_path.name}[/cyan]...")
+
+        suppress_context = suppress_all_pdf_warnings() if not dry_run else _null_context()
+        try:
+            with suppress_context:
+                result = batch_extract_single_pdf(
+                    args, pdf_path, page_count,
+                    settings['patterns'], settings['template'], settings['source_page'],
+                    dry_run, settings['enhanced_args'])
+        except Exception as e:
+            # One broken PDF must not take down a batch of thousands
+            result = BatchExtractResult(pdf_path=pdf_path, mode='single', error=str(e) or type(e).__name__)
+        finally:
+            # Placeholders that never got written (errors, skips) are removed
+            release_reservations()
+
+    result.output = buffer.getvalue()
+    return result
+
+
+def run_batch_extract_parallel(args: argparse.Namespace, pdf_files: list[tuple[Path, int, float]],
+                                patterns: list[str], template: str, source_page: int, dry_run: bool,
+                                enhanced_args: dict, jobs: int) -> Iterator[BatchExtractResult]:
+    """
+    Extract from every PDF using a pool of worker processes.
+
+    Args:
+        args: Parsed command line arguments (each worker builds its own OpCtx from them)
+        pdf_files: List of (path, page_count, size_mb) tuples
+        patterns, template, source_page: Smart naming settings
+        dry_run: Whether to only report what would be created
+        enhanced_args: Output of extract_enhanced_args() computed once in the parent
+        jobs: Number of worker processes
+
+    Yields:
+        BatchExtractResult per PDF, in the same order as pdf_files
+    """
+    from pdf_manipulator.core.folder_operations import console
+
+    text_cache = get_text_cache()
+    text_cache_settings = (str(text_cache.cache_dir), text_cache.max_bytes) if text_cache else None
+
+    analysis_store = get_analysis_store()
+    page_index = get_page_index()
+    parse_store = get_parse_store()
+
+    task_settings = {
+        'analysis_store_dir': str(analysis_store.cache_dir) if analysis_store else None,
+        'page_index_dir': str(page_index.cache_dir) if page_index else None,
+        'run_fingerprints': run_index_documents(),
+        'parse_store_dir': str(parse_store.cache_dir) if parse_store else None,
+        'parse_store_max_entries': parse_store.max_entries if parse_store else DEFAULT_MAX_ENTRIES,
+        'patterns': patterns,
+        'template': template,
+        'source_page': source_page,
+        'dry_run': dry_run,
+        'enhanced_args': enhanced_args,
+    }
+
+    reservation_lock = multiprocessing.Lock()
+    tasks = [(pdf_path, page_count) for pdf_path, page_count, _ in pdf_files]
+    workers = min(jobs, len(tasks))
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(args, reservation_lock, text_cache_settings, console.is_terminal, task_settings))
+
+    try:
+        # map() yields in submission order, which doubles as the reorder buffer
+        yield from executor.map(_extract_in_worker, tasks)
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown(wait=True)
+
+
+# End of file #
@@ -0,0 +1,75 @@
+"""
+Persistent on-disk caches for PDF Manipulator.
+File: pdf_manipulator/core/cache/__init__.py
+
+Caches here survive across runs and are keyed by document content, so a
+renamed or copied PDF still hits and a modified PDF never serves stale data.
+"""
+
+from pdf_manipulator.core.cache.settings import default_cache_dir, resolve_cache_dir
+from pdf_manipulator.core.cache.fingerprint import (
+    ContentFingerprint,
+    content_fingerprint,
+    file_digest,
+)
+from pdf_manipulator.core.cache.text_cache import (
+    PageTextCache,
+    configure_text_cache,
+    get_text_cache,
+    get_document_key,
+)
+from pdf_manipulator.core.cache.analysis_store import (
+    PageAnalysisStore,
+    configure_analysis_store,
+    get_analysis_store,
+)
+from pdf_manipulator.core.cache.folder_manifest import (
+    FolderManifestStore,
+    configure_folder_manifests,
+    get_folder_manifests,
+)
+from pdf_manipulator.core.cache.text_index import (
+    PageTextIndex,
+    configure_text_index,
+    get_text_index,
+)
+from pdf_manipulator.core.cache.page_index import (
+    PageFingerprintIndex,
+    configure_page_index,
+    get_page_index,
+)
+from pdf_manipulator.core.cache.parse_store import (
+    ParseResultStore,
+    configure_parse_store,
+    get_parse_store,
+)
+
+
+__all__ = [
+    'default_cache_dir',
+    'resolve_cache_dir',
+    'ContentFingerprint',
+    'content_fingerprint',
+    'file_digest',
+    'PageTextCache',
+    'configure_text_cache',
+    'get_text_cache',
+    'get_document_key',
+    'PageAnalysisStore',
+    'configure_analysis_store',
+    'get_analysis_store',
+    'FolderManifestStore',
+    'configure_folder_manifests',
+    'get_folder_manifests',
+    'PageTextIndex',
+    'configure_text_index',
+    'get_text_index',
+    'PageFingerprintIndex',
+    'configure_page_index',
+    'get_page_index',
+    'ParseResultStore',
+    'configure_parse_store',
+    'get_parse_store',
+]
+
+# End of file #
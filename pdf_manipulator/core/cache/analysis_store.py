@@ -0,0 +1,287 @@
+"""
+Persistent Page Analysis Store
+File: pdf_manipulator/core/cache/analysis_store.py
+
+SQLite-backed store of PageAnalysis results (type, size, text length, image
+count, confidence), so type:, size:, --analyze-detailed and group size
+filters read precomputed metadata after the first run over a document.
+
+Three tables:
+- page_analysis: keyed by page fingerprint (digest of the page's object
+  graph, see page_size.py) - an edited document only re-analyzes the pages
+  whose objects actually changed
+- document_pages: document content hash + page number -> fingerprint, so an
+  unchanged document doesn't even have to fingerprint its pages
+- malformation: document content hash -> malformation verdict, keyed by the
+  detection revision and sampling settings (see malformation_detector.py)
+
+Both are keyed by an analysis revision too: changing the classification
+rules or the size method never serves results computed the old way.
+
+Failures in the store (locked database, read-only directory, corrupt file)
+never fail the operation - pages are simply analyzed as if nothing was stored.
+"""
+
+import os
+import sqlite3
+
+from pathlib import Path
+
+from pdf_manipulator.core.cache.settings import resolve_cache_dir
+
+
+DB_FILENAME = 'page_analysis.sqlite3'
+
+# Bump when PageAnalyzer's classification or measurements change
+ANALYSIS_REVISION = 1
+
+_SQL_BATCH_SIZE = 500       # Stay well below SQLite's bound parameter limit
+
+# Stored PageAnalysis fields, in column order
+ANALYSIS_FIELDS = ('page_type', 'size_bytes', 'text_length', 'image_count',
+                    'has_meaningful_text', 'confidence')
+
+
+def analysis_revision(exact_sizes: bool) -> str:
+    """Revision key for analyses produced with the given size method."""
+    return f"r{ANALYSIS_REVISION}-{'exact' if exact_sizes else 'estimated'}"
+
+
+class PageAnalysisStore:
+    """
+    Content-addressed store of per-page analysis records.
+
+    Records are plain dicts with the ANALYSIS_FIELDS keys; PageAnalyzer turns
+    them back into PageAnalysis objects.
+    """
+
+    def __init__(self, cache_dir: Path | str | None = None):
+        self.cache_dir = resolve_cache_dir(cache_dir)
+        self.db_path = self.cache_dir / DB_FILENAME
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reuse) the database connection. Reconnects after fork."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS page_analysis (
+                fingerprint         TEXT NOT NULL,
+                revision            TEXT NOT NULL,
+                page_type           TEXT NOT NULL,
+                size_bytes          INTEGER NOT NULL,
+                text_length         INTEGER NOT NULL,
+                image_count         INTEGER NOT NULL,
+                has_meaningful_text INTEGER NOT NULL,
+                confidence          REAL NOT NULL,
+                PRIMARY KEY (fingerprint, revision)
+            );
+            CREATE TABLE IF NOT EXISTS document_pages (
+                doc_key     TEXT NOT NULL,
+                revision    TEXT NOT NULL,
+                page        INTEGER NOT NULL,
+                fingerprint TEXT NOT NULL,
+                PRIMARY KEY (doc_key, revision, page)
+            );
+            CREATE TABLE IF NOT EXISTS malformation (
+                doc_key      TEXT NOT NULL,
+                revision     TEXT NOT NULL,
+                is_malformed INTEGER NOT NULL,
+                description  TEXT NOT NULL,
+                PRIMARY KEY (doc_key, revision)
+            );
+        """)
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def close(self):
+        """Close the database connection (it is reopened on next use)."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+        self._conn_pid = None
+
+    def get_document(self, doc_key: str, revision: str) -> dict[int, dict]:
+        """
+        Stored analyses for every known page of a document.
+
+        Returns:
+            Dict of page number -> analysis record
+        """
+        columns = ', '.join(f"a.{field}" for field in ANALYSIS_FIELDS)
+        try:
+            rows = self._connect().execute(
+                f"SELECT d.page, {columns} FROM document_pages d "
+                f"JOIN page_analysis a ON a.fingerprint = d.fingerprint AND a.revision = d.revision "
+                f"WHERE d.doc_key = ? AND d.revision = ?", (doc_key, revision)).fetchall()
+        except sqlite3.Error:
+            return {}
+
+        return {row[0]: _record(row[1:]) for row in rows}
+
+    def get_fingerprints(self, fingerprints, revision: str) -> dict[str, dict]:
+        """
+        Stored analyses for pages with the given fingerprints.
+
+        Returns:
+            Dict of fingerprint -> analysis record for the ones found
+        """
+        wanted = sorted(set(fingerprints))
+        columns = ', '.join(ANALYSIS_FIELDS)
+        found = {}
+        try:
+            conn = self._connect()
+            for i in range(0, len(wanted), _SQL_BATCH_SIZE):
+                batch = wanted[i:i + _SQL_BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                for row in conn.execute(
+                        f"SELECT fingerprint, {columns} FROM page_analysis "
+                        f"WHERE revision = ? AND fingerprint IN ({placeholders})",
+                        (revision, *batch)):
+                    found[row[0]] = _record(row[1:])
+        except sqlite3.Error:
+            return {}
+        return found
+
+    def store(self, doc_key: str, revision: str, pages: dict[int, tuple[str, dict]]):
+        """
+        Store analyses and remember which fingerprint each page of the document has.
+
+        Args:
+            doc_key: Document content key (see get_document_key)
+            revision: See analysis_revision()
+            pages: Page number -> (fingerprint, analysis record)
+        """
+        if not pages:
+            return
+
+        analysis_rows = [(fingerprint, revision, *(record[field] for field in ANALYSIS_FIELDS))
+                            for fingerprint, record in pages.values()]
+        page_rows = [(doc_key, revision, page, fingerprint) for page, (fingerprint, _) in pages.items()]
+
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO page_analysis (fingerprint, revision, "
+                    f"{', '.join(ANALYSIS_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", analysis_rows)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO document_pages (doc_key, revision, page, fingerprint) "
+                    "VALUES (?, ?, ?, ?)", page_rows)
+        except sqlite3.Error:
+            pass
+
+    def get_malformations(self, doc_keys, revision: str) -> dict[str, tuple[bool, str]]:
+        """
+        Stored malformation verdicts for documents with the given content keys.
+
+        Returns:
+            Dict of doc_key -> (is_malformed, description) for the ones found
+        """
+        wanted = sorted(set(doc_keys))
+        found = {}
+        try:
+            conn = self._connect()
+            for i in range(0, len(wanted), _SQL_BATCH_SIZE):
+                batch = wanted[i:i + _SQL_BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                for doc_key, is_malformed, description in conn.execute(
+                        f"SELECT doc_key, is_malformed, description FROM malformation "
+                        f"WHERE revision = ? AND doc_key IN ({placeholders})",
+                        (revision, *batch)):
+                    found[doc_key] = (bool(is_malformed), description)
+        except sqlite3.Error:
+            return {}
+        return found
+
+    def store_malformations(self, verdicts: dict[str, tuple[bool, str]], revision: str):
+        """
+        Store malformation verdicts.
+
+        Args:
+            verdicts: doc_key -> (is_malformed, description)
+            revision: See malformation_detector.malformation_revision()
+        """
+        if not verdicts:
+            return
+
+        rows = [(doc_key, revision, int(bool(is_malformed)), description)
+                for doc_key, (is_malformed, description) in verdicts.items()]
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO malformation (doc_key, revision, is_malformed, description) "
+                    "VALUES (?, ?, ?, ?)", rows)
+        except sqlite3.Error:
+            pass
+
+    def stats(self) -> dict:
+        """Return document count, distinct analyzed pages and the database path."""
+        try:
+            conn = self._connect()
+            documents = conn.execute("SELECT COUNT(DISTINCT doc_key) FROM document_pages").fetchone()[0]
+            pages = conn.execute("SELECT COUNT(*) FROM page_analysis").fetchone()[0]
+            return {'documents': documents, 'pages': pages, 'path': str(self.db_path)}
+        except sqlite3.Error:
+            return {'documents': 0, 'pages': 0, 'path': str(self.db_path)}
+
+    def clear(self):
+        """Remove every stored analysis."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM page_analysis")
+                conn.execute("DELETE FROM document_pages")
+                conn.execute("DELETE FROM malformation")
+        except sqlite3.Error:
+            pass
+
+
+def _record(values) -> dict:
+    """Analysis record from a row of ANALYSIS_FIELDS values."""
+    record = dict(zip(ANALYSIS_FIELDS, values))
+    record['has_meaningful_text'] = bool(record['has_meaningful_text'])
+    return record
+
+
+#################################################################################################
+# Process-wide configuration
+
+_analysis_store: PageAnalysisStore | None = None
+
+
+def configure_analysis_store(cache_dir: Path | str | None = None,
+                                enabled: bool = True) -> PageAnalysisStore | None:
+    """
+    Enable, relocate or disable the persistent page analysis store.
+
+    Args:
+        cache_dir: Directory for the store database (None = default location)
+        enabled: False turns the store off for this process
+
+    Returns:
+        The active store, or None when disabled
+    """
+    global _analysis_store
+
+    if _analysis_store is not None:
+        _analysis_store.close()
+
+    _analysis_store = PageAnalysisStore(cache_dir) if enabled else None
+    return _analysis_store
+
+
+def get_analysis_store() -> PageAnalysisStore | None:
+    """Return the active page analysis store, or None if not configured/disabled."""
+    return _analysis_store
+
+
+# End of file #
@@ -0,0 +1,155 @@
+"""
+Document Fingerprint Service
+File: pdf_manipulator/core/cache/fingerprint.py
+
+One place that hashes PDFs, so the caches, repair idempotence and dedup all
+share the work instead of each reading the file again:
+
+- file_digest(): SHA-256 of the raw file bytes (the document key of the
+  caches). The file is memory-mapped and hashed in slices, so hashing never
+  copies a large file into Python memory.
+- content_fingerprint(): hashes of what a PDF shows, ignoring metadata - a
+  hash per page (content stream + media box) plus a digest of the whole
+  document. Pages are hashed one at a time, so only one page's content is
+  held at once.
+
+Both are memoized per file identity (device, inode, size, mtime) for the
+lifetime of the process: a renamed or hard-linked file is not re-hashed, and
+a rewritten one never serves a stale hash.
+"""
+
+import os
+import mmap
+import hashlib
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
+
+
+HASH_SLICE_SIZE = 8 * 1024 * 1024       # hashlib releases the GIL for large updates
+
+
+@dataclass(frozen=True)
+class ContentFingerprint:
+    """Metadata-independent hashes of a PDF."""
+    digest: str                         # Whole document
+    page_hashes: tuple[str, ...]        # One per page, in page order
+    from_file_bytes: bool = False       # Content could not be read; digest is file_digest()
+
+
+#################################################################################################
+# Memo
+
+# file identity -> hash, so one run never hashes a file twice
+_file_digest_memo: dict[tuple[int, int, int, int], str] = {}
+_content_memo: dict[tuple[int, int, int, int], ContentFingerprint] = {}
+
+
+def file_identity(stat: os.stat_result) -> tuple[int, int, int, int]:
+    """(device, inode, size, mtime_ns) - changes whenever the file's bytes may have."""
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def remember_file_digest(stat: os.stat_result, digest: str):
+    """Seed the memo with a file digest computed elsewhere (e.g. a folder manifest)."""
+    _file_digest_memo[file_identity(stat)] = digest
+
+
+def clear_fingerprint_memo():
+    """Forget all memoized hashes."""
+    _file_digest_memo.clear()
+    _content_memo.clear()
+
+
+#################################################################################################
+# Hashing
+
+def file_digest(file_path: Path) -> str:
+    """
+    SHA-256 of a file's bytes, hashed from a memory map.
+
+    Raises:
+        OSError: If the file can't be read
+    """
+    with open(file_path, 'rb') as f:
+        identity = file_identity(os.fstat(f.fileno()))
+        cached = _file_digest_memo.get(identity)
+        if cached is not None:
+            return cached
+
+        digest = hashlib.sha256()
+        if identity[2] > 0:     # Empty files can't be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for start in range(0, len(view), HASH_SLICE_SIZE):
+                        digest.update(view[start:start + HASH_SLICE_SIZE])
+                finally:
+                    view.release()
+
+    _file_digest_memo[identity] = digest.hexdigest()
+    return _file_digest_memo[identity]
+
+
+def _hash_pages(file_path: Path) -> ContentFingerprint:
+    from pypdf import PdfReader
+
+    with suppress_pdf_warnings():
+        reader = PdfReader(file_path)
+        document = hashlib.sha256()
+        page_hashes = []
+
+        for i, page in enumerate(reader.pages):
+            page_digest = hashlib.sha256()
+            try:
+                # Page content (a ContentStream is a dictionary - an empty one still has data)
+                content = page.get_contents()
+                if content is not None:
+                    data = content.get_data()
+                    document.update(data)
+                    page_digest.update(data)
+                    del data
+
+                # Page dimensions, for structural comparison
+                media_box = str(page.mediabox).encode('utf-8')
+                document.update(media_box)
+                page_digest.update(media_box)
+
+            except Exception:
+                # If we can't extract content from a page, use the page number as fallback
+                fallback = f"page_{i}".encode('utf-8')
+                document.update(fallback)
+                page_digest = hashlib.sha256(fallback)
+
+            page_hashes.append(page_digest.hexdigest())
+
+    return ContentFingerprint(document.hexdigest(), tuple(page_hashes))
+
+
+def content_fingerprint(file_path: Path) -> ContentFingerprint:
+    """
+    Per-page and document hashes of a PDF's content, ignoring metadata.
+
+    Falls back to the file digest (from_file_bytes=True, no page hashes) for
+    files pypdf can't read.
+
+    Raises:
+        OSError: If the file can't be read at all
+    """
+    identity = file_identity(Path(file_path).stat())
+    cached = _content_memo.get(identity)
+    if cached is not None:
+        return cached
+
+    try:
+        fingerprint = _hash_pages(file_path)
+    except Exception:
+        fingerprint = ContentFingerprint(file_digest(file_path), (), from_file_bytes=True)
+
+    _content_memo[identity] = fingerprint
+    return fingerprint
+
+
+# End of file #
@@ -0,0 +1,236 @@
+"""
+Folder Scan Manifests
+File: pdf_manipulator/core/cache/folder_manifest.py
+
+One JSON manifest per scanned folder recording, for every PDF in it: page
+count, file size, read error, content hash and malformation verdict. Entries
+are keyed by the file's (inode, size, mtime_ns), so re-running the tool over
+an unchanged folder skips PDF parsing and malformation detection entirely -
+only new or modified files are opened.
+
+Manifests live in the cache directory (never in the scanned folder), one per
+(folder, recursive) pair. They are written atomically, so a crashed or
+concurrent run can at worst lose its own updates.
+
+Stored content hashes also seed get_document_key's memo, so the text cache
+and analysis store don't re-hash unchanged files either.
+
+Failures (unreadable or corrupt manifest, read-only cache directory) never
+fail the scan - the folder is simply scanned as if nothing was stored.
+"""
+
+import os
+import json
+import hashlib
+
+from pathlib import Path
+
+from pdf_manipulator.core.cache.settings import resolve_cache_dir
+from pdf_manipulator.core.cache.text_cache import remember_document_key
+
+
+MANIFEST_DIRNAME = 'folder_manifests'
+
+# Bump when page counting or malformation detection changes
+MANIFEST_REVISION = 1
+
+
+def file_signature(stat: os.stat_result) -> list[int]:
+    """The (inode, size, mtime_ns) signature an entry is valid for."""
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+
+class FolderManifest:
+    """
+    Stored scan results for the PDFs of one folder.
+
+    Entries are dicts with 'signature', 'pages', 'size_mb', 'error', 'sha256'
+    and 'malformation' ([is_malformed, description, revision] or None until checked).
+    """
+
+    def __init__(self, manifest_path: Path, folder: Path, recursive: bool, entries: dict | None = None):
+        self.manifest_path = manifest_path
+        self.folder = folder
+        self.recursive = recursive
+        self.entries: dict[str, dict] = entries or {}
+        self.dirty = False
+
+    def _key(self, pdf_path: Path) -> str:
+        return Path(os.path.abspath(pdf_path)).relative_to(self.folder).as_posix()
+
+    def lookup(self, pdf_path: Path, stat: os.stat_result) -> dict | None:
+        """Stored entry for a file, or None if it is new or has changed since."""
+        entry = self.entries.get(self._key(pdf_path))
+        if entry is None or entry.get('signature') != file_signature(stat):
+            return None
+
+        if entry.get('sha256'):
+            remember_document_key(stat, entry['sha256'])
+        return entry
+
+    def update(self, pdf_path: Path, stat: os.stat_result, pages: int, size_mb: float,
+                error: str | None = None, sha256: str | None = None):
+        """Record fresh scan results for a file (drops any stored malformation verdict)."""
+        self.entries[self._key(pdf_path)] = {
+            'signature': file_signature(stat),
+            'pages': pages,
+            'size_mb': size_mb,
+            'error': error,
+            'sha256': sha256,
+            'malformation': None,
+        }
+        if sha256:
+            remember_document_key(stat, sha256)
+        self.dirty = True
+
+    def retain(self, pdf_paths):
+        """Forget files that are no longer in the folder."""
+        keep = {self._key(pdf_path) for pdf_path in pdf_paths}
+        removed = [key for key in self.entries if key not in keep]
+        for key in removed:
+            del self.entries[key]
+        if removed:
+            self.dirty = True
+
+    def save(self):
+        """Write the manifest if anything changed (atomic replace, errors ignored)."""
+        if not self.dirty:
+            return
+
+        data = {
+            'revision': MANIFEST_REVISION,
+            'folder': str(self.folder),
+            'recursive': self.recursive,
+            'entries': self.entries,
+        }
+        temp_path = self.manifest_path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.manifest_path)
+            self.dirty = False
+        except OSError:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+
+
+class FolderManifestStore:
+    """
+    Loads and saves folder manifests, and remembers the ones loaded by this
+    process so per-file lookups (malformation verdicts) can find their entry.
+    """
+
+    def __init__(self, cache_dir: Path | str | None = None):
+        self.cache_dir = resolve_cache_dir(cache_dir)
+        self.manifest_dir = self.cache_dir / MANIFEST_DIRNAME
+        self._loaded: dict[tuple[str, bool], FolderManifest] = {}
+        self._by_file: dict[str, FolderManifest] = {}
+
+    def _manifest_path(self, folder: Path, recursive: bool) -> Path:
+        name = hashlib.sha256(f"{folder}|{int(recursive)}".encode('utf-8')).hexdigest()[:32]
+        return self.manifest_dir / f"{name}.json"
+
+    def load(self, folder_path: Path, recursive: bool = False) -> FolderManifest:
+        """Manifest for a folder scan (empty if none was stored or it can't be read)."""
+        folder = Path(os.path.abspath(folder_path))
+        loaded = self._loaded.get((str(folder), recursive))
+        if loaded is not None:
+            return loaded
+
+        manifest_path = self._manifest_path(folder, recursive)
+        entries = {}
+        try:
+            with open(manifest_path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('revision') == MANIFEST_REVISION and data.get('folder') == str(folder):
+                entries = data.get('entries', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        manifest = FolderManifest(manifest_path, folder, recursive, entries)
+        self._loaded[(str(folder), recursive)] = manifest
+        return manifest
+
+    def track(self, manifest: FolderManifest, pdf_paths):
+        """Remember which manifest holds each of these files."""
+        for pdf_path in pdf_paths:
+            self._by_file[os.path.abspath(pdf_path)] = manifest
+
+    def _current_entry(self, pdf_path: Path) -> dict | None:
+        manifest = self._by_file.get(os.path.abspath(pdf_path))
+        if manifest is None:
+            return None
+        try:
+            return manifest.lookup(pdf_path, Path(pdf_path).stat())
+        except (OSError, ValueError):
+            return None
+
+    def get_malformation(self, pdf_path: Path, revision: str) -> tuple[bool, str] | None:
+        """Stored malformation verdict for a scanned file, if it is still current."""
+        entry = self._current_entry(pdf_path)
+        if entry is None or entry.get('malformation') is None:
+            return None
+        stored = entry['malformation']
+        if len(stored) != 3 or stored[2] != revision:
+            return None     # Checked with other rules or sampling settings
+        return bool(stored[0]), stored[1]
+
+    def set_malformation(self, pdf_path: Path, verdict: tuple[bool, str], revision: str):
+        """Record a malformation verdict for a scanned file (no-op for untracked files)."""
+        entry = self._current_entry(pdf_path)
+        if entry is not None:
+            entry['malformation'] = [bool(verdict[0]), verdict[1], revision]
+            self._by_file[os.path.abspath(pdf_path)].dirty = True
+
+    def flush(self):
+        """Save every loaded manifest that has changed."""
+        for manifest in self._loaded.values():
+            manifest.save()
+
+    def clear(self):
+        """Remove every stored manifest."""
+        self._loaded.clear()
+        self._by_file.clear()
+        for manifest_path in self.manifest_dir.glob('*.json'):
+            try:
+                manifest_path.unlink()
+            except OSError:
+                pass
+
+
+#################################################################################################
+# Process-wide configuration
+
+_folder_manifests: FolderManifestStore | None = None
+
+
+def configure_folder_manifests(cache_dir: Path | str | None = None,
+                                enabled: bool = True) -> FolderManifestStore | None:
+    """
+    Enable, relocate or disable folder scan manifests.
+
+    Args:
+        cache_dir: Directory holding the manifests (None = default location)
+        enabled: False turns manifests off for this process
+
+    Returns:
+        The active store, or None when disabled
+    """
+    global _folder_manifests
+
+    if _folder_manifests is not None:
+        _folder_manifests.flush()
+
+    _folder_manifests = FolderManifestStore(cache_dir) if enabled else None
+    return _folder_manifests
+
+
+def get_folder_manifests() -> FolderManifestStore | None:
+    """Return the active folder manifest store, or None if not configured/disabled."""
+    return _folder_manifests
+
+
+# End of file #
@@ -0,0 +1,204 @@
+"""
+Persistent Page Fingerprint Index
+File: pdf_manipulator/core/cache/page_index.py
+
+SQLite-backed index of which pages every processed document contains, by
+page fingerprint (normalized content stream + resources, see
+page_fingerprint.py - independent of object numbering, so the same cover
+page in two differently produced files matches). The dup: page selector
+uses it to drop pages already seen in earlier documents.
+
+Two tables:
+- documents: document content hash -> the order it was first indexed in.
+  "Earlier" means indexed before, so re-running a batch keeps the same
+  verdicts: the first document with a page keeps it, later ones drop it.
+- pages: document content hash + page number -> fingerprint
+
+Both are keyed by a fingerprint revision too, so changing how pages are
+normalized never matches fingerprints computed the old way.
+
+Failures in the index (locked database, read-only directory, corrupt file)
+never fail the operation - an unreadable index reports nothing as seen.
+"""
+
+import os
+import sqlite3
+
+from pathlib import Path
+
+from pdf_manipulator.core.cache.settings import resolve_cache_dir
+
+
+DB_FILENAME = 'page_fingerprints.sqlite3'
+
+
+class PageFingerprintIndex:
+    """
+    Index of page fingerprints per document, in the order documents were indexed.
+
+    Example:
+        index = get_page_index()
+        if index.get_document(doc_key, revision) is None:
+            index.add_document(doc_key, revision, fingerprints)
+        seen = index.seen_before(doc_key, revision)
+    """
+
+    def __init__(self, cache_dir: Path | str | None = None):
+        self.cache_dir = resolve_cache_dir(cache_dir)
+        self.db_path = self.cache_dir / DB_FILENAME
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reuse) the database connection. Reconnects after fork."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                seq      INTEGER PRIMARY KEY AUTOINCREMENT,
+                doc_key  TEXT NOT NULL,
+                revision TEXT NOT NULL,
+                pages    INTEGER NOT NULL,
+                UNIQUE (doc_key, revision)
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                doc_key     TEXT NOT NULL,
+                revision    TEXT NOT NULL,
+                page        INTEGER NOT NULL,
+                fingerprint TEXT NOT NULL,
+                PRIMARY KEY (doc_key, revision, page)
+            );
+            CREATE INDEX IF NOT EXISTS pages_by_fingerprint ON pages (fingerprint, revision);
+        """)
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def close(self):
+        """Close the database connection (it is reopened on next use)."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+        self._conn_pid = None
+
+    def get_document(self, doc_key: str, revision: str) -> list[str] | None:
+        """
+        Fingerprints of an indexed document's pages.
+
+        Returns:
+            List of fingerprints in page order, or None if the document isn't indexed
+        """
+        try:
+            conn = self._connect()
+            known = conn.execute("SELECT pages FROM documents WHERE doc_key = ? AND revision = ?",
+                                    (doc_key, revision)).fetchone()
+            if known is None:
+                return None
+            rows = conn.execute("SELECT page, fingerprint FROM pages WHERE doc_key = ? AND revision = ? "
+                                "ORDER BY page", (doc_key, revision)).fetchall()
+        except sqlite3.Error:
+            return None
+
+        if len(rows) != known[0]:
+            return None
+        return [fingerprint for _, fingerprint in rows]
+
+    def add_document(self, doc_key: str, revision: str, fingerprints: list[str]):
+        """
+        Index a document's pages (a document already indexed keeps its place in the order).
+
+        Args:
+            doc_key: Document content key (see get_document_key)
+            revision: See page_fingerprint.PAGE_FINGERPRINT_REVISION
+            fingerprints: Page fingerprints in page order
+        """
+        rows = [(doc_key, revision, page, fingerprint)
+                for page, fingerprint in enumerate(fingerprints, start=1)]
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("INSERT OR IGNORE INTO documents (doc_key, revision, pages) VALUES (?, ?, ?)",
+                                (doc_key, revision, len(fingerprints)))
+                conn.executemany("INSERT OR REPLACE INTO pages (doc_key, revision, page, fingerprint) "
+                                    "VALUES (?, ?, ?, ?)", rows)
+        except sqlite3.Error:
+            pass
+
+    def seen_before(self, doc_key: str, revision: str) -> set[int]:
+        """
+        Pages of an indexed document whose fingerprint occurs in a document indexed earlier.
+
+        Returns:
+            Set of page numbers (empty if the document isn't indexed)
+        """
+        try:
+            rows = self._connect().execute(
+                "SELECT DISTINCT p.page FROM pages p "
+                "JOIN documents d ON d.doc_key = p.doc_key AND d.revision = p.revision "
+                "JOIN pages o ON o.fingerprint = p.fingerprint AND o.revision = p.revision "
+                "JOIN documents od ON od.doc_key = o.doc_key AND od.revision = o.revision "
+                "WHERE p.doc_key = ? AND p.revision = ? AND od.seq < d.seq",
+                (doc_key, revision)).fetchall()
+        except sqlite3.Error:
+            return set()
+        return {page for (page,) in rows}
+
+    def stats(self) -> dict:
+        """Return indexed document and page counts and the database path."""
+        try:
+            conn = self._connect()
+            documents = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            pages = conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            return {'documents': documents, 'pages': pages, 'path': str(self.db_path)}
+        except sqlite3.Error:
+            return {'documents': 0, 'pages': 0, 'path': str(self.db_path)}
+
+    def clear(self):
+        """Remove every indexed document."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM pages")
+                conn.execute("DELETE FROM documents")
+        except sqlite3.Error:
+            pass
+
+
+#################################################################################################
+# Process-wide configuration
+
+_page_index: PageFingerprintIndex | None = None
+
+
+def configure_page_index(cache_dir: Path | str | None = None,
+                            enabled: bool = True) -> PageFingerprintIndex | None:
+    """
+    Enable, relocate or disable the persistent page fingerprint index.
+
+    Args:
+        cache_dir: Directory for the index database (None = default location)
+        enabled: False turns the index off for this process
+
+    Returns:
+        The active index, or None when disabled
+    """
+    global _page_index
+
+    if _page_index is not None:
+        _page_index.close()
+
+    _page_index = PageFingerprintIndex(cache_dir) if enabled else None
+    return _page_index
+
+
+def get_page_index() -> PageFingerprintIndex | None:
+    """Return the active page fingerprint index, or None if not configured/disabled."""
+    return _page_index
+
+
+# End of file #
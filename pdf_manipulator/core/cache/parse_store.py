@@ -0,0 +1,189 @@
+"""
+Persistent Parse Result Store
+File: pdf_manipulator/core/cache/parse_store.py
+
+SQLite-backed store of page range parsing results (selected pages,
+description, page groups), so re-running the same --extract-pages
+expression over an unchanged PDF skips pattern evaluation entirely.
+
+Results are keyed by the parse cache key computed in operation_context.py:
+document content hash, page count, text extractor ids, expression and the
+group filtering and boundary arguments. The key also includes a parse revision, so changing how
+expressions are evaluated never serves results computed the old way.
+
+Only results that depend on nothing but the document and the arguments are
+stored. Expressions reading other files (file:) or other documents (dup:)
+stay in the in-memory cache of one run.
+
+The store is bounded like the in-memory cache: once it holds more than
+max_entries results, the least recently used ones are dropped.
+
+Failures in the store (locked database, read-only directory, corrupt file)
+never fail the operation - the expression is simply parsed again.
+"""
+
+import os
+import json
+import time
+import sqlite3
+
+from pathlib import Path
+
+from pdf_manipulator.core.cache.settings import resolve_cache_dir
+
+
+DB_FILENAME = 'parse_results.sqlite3'
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class ParseResultStore:
+    """
+    Store of parsing results by cache key, bounded to max_entries (LRU).
+
+    Results are plain dicts (see OperationContext) stored as JSON.
+
+    Example:
+        store = get_parse_store()
+        result = store.get(cache_key)
+        if result is None:
+            store.put(cache_key, {'pages': [...], 'description': '...', 'groups': [...]})
+    """
+
+    def __init__(self, cache_dir: Path | str | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = resolve_cache_dir(cache_dir)
+        self.db_path = self.cache_dir / DB_FILENAME
+        self.max_entries = max_entries
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reuse) the database connection. Reconnects after fork."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS parse_results (
+                cache_key TEXT PRIMARY KEY,
+                result    TEXT NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_parse_results_last_used ON parse_results (last_used);
+        """)
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def close(self):
+        """Close the database connection (it is reopened on next use)."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+        self._conn_pid = None
+
+    def get(self, cache_key: str) -> dict | None:
+        """Return a stored result, or None if there is none (or it can't be read)."""
+        try:
+            conn = self._connect()
+            row = conn.execute("SELECT result FROM parse_results WHERE cache_key = ?",
+                                (cache_key,)).fetchone()
+            if row is None:
+                return None
+
+            with conn:
+                conn.execute("UPDATE parse_results SET last_used = ? WHERE cache_key = ?",
+                                (time.time(), cache_key))
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def put(self, cache_key: str, result: dict):
+        """Store a result (replacing any result stored under the same key), then enforce the limit."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO parse_results (cache_key, result, last_used) "
+                                "VALUES (?, ?, ?)", (cache_key, json.dumps(result), time.time()))
+
+            self.evict_to_limit()
+
+        except sqlite3.Error:
+            pass
+
+    def evict_to_limit(self) -> int:
+        """
+        Drop least recently used results until at most max_entries remain.
+
+        Returns:
+            Number of results evicted
+        """
+        try:
+            conn = self._connect()
+            excess = conn.execute("SELECT COUNT(*) FROM parse_results").fetchone()[0] - self.max_entries
+            if excess <= 0:
+                return 0
+
+            with conn:
+                conn.execute("DELETE FROM parse_results WHERE cache_key IN "
+                                "(SELECT cache_key FROM parse_results ORDER BY last_used ASC LIMIT ?)",
+                                (excess,))
+            return excess
+
+        except sqlite3.Error:
+            return 0
+
+    def stats(self) -> dict:
+        """Return the stored result count, the limit and the database path."""
+        try:
+            entries = self._connect().execute("SELECT COUNT(*) FROM parse_results").fetchone()[0]
+            return {'entries': entries, 'max_entries': self.max_entries, 'path': str(self.db_path)}
+        except sqlite3.Error:
+            return {'entries': 0, 'max_entries': self.max_entries, 'path': str(self.db_path)}
+
+    def clear(self):
+        """Remove every stored result."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM parse_results")
+        except sqlite3.Error:
+            pass
+
+
+#################################################################################################
+# Process-wide configuration
+
+_parse_store: ParseResultStore | None = None
+
+
+def configure_parse_store(cache_dir: Path | str | None = None, enabled: bool = True,
+                            max_entries: int = DEFAULT_MAX_ENTRIES) -> ParseResultStore | None:
+    """
+    Enable, relocate or disable the persistent parse result store.
+
+    Args:
+        cache_dir: Directory for the store database (None = default location)
+        enabled: False turns the store off for this process
+        max_entries: Result count before least recently used results are evicted
+
+    Returns:
+        The active store, or None when disabled
+    """
+    global _parse_store
+
+    if _parse_store is not None:
+        _parse_store.close()
+
+    _parse_store = ParseResultStore(cache_dir, max_entries) if enabled else None
+    return _parse_store
+
+
+def get_parse_store() -> ParseResultStore | None:
+    """Return the active parse result store, or None if not configured/disabled."""
+    return _parse_store
+
+
+# End of file #
@@ -0,0 +1,43 @@
+"""
+Persistent Cache Settings
+File: pdf_manipulator/core/cache/settings.py
+
+Single place that decides where the on-disk caches live. The caches are
+opt-in for library use: nothing is written to disk until a cache has been
+configured (the CLI does this right after argument parsing).
+
+Location precedence:
+1. Explicit directory passed to the configure functions (--text-cache-dir)
+2. $PDF_MANIPULATOR_CACHE_DIR
+3. $XDG_CACHE_HOME/pdf-manipulator
+4. ~/.cache/pdf-manipulator
+"""
+
+import os
+
+from pathlib import Path
+
+
+CACHE_DIR_ENV_VAR = 'PDF_MANIPULATOR_CACHE_DIR'
+CACHE_DIR_NAME = 'pdf-manipulator'
+
+
+def default_cache_dir() -> Path:
+    """Return the default cache directory (not created here)."""
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    if override:
+        return Path(override).expanduser()
+
+    xdg_cache = os.environ.get('XDG_CACHE_HOME')
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / '.cache'
+    return base / CACHE_DIR_NAME
+
+
+def resolve_cache_dir(cache_dir: Path | str | None = None) -> Path:
+    """Resolve an optional user-supplied directory to an absolute cache path."""
+    if cache_dir is None:
+        return default_cache_dir()
+    return Path(cache_dir).expanduser().resolve()
+
+
+# End of file #
@@ -0,0 +1,278 @@
+"""
+Persistent Page Text Cache
+File: pdf_manipulator/core/cache/text_cache.py
+
+SQLite-backed store of extracted page text, so repeated runs against the same
+PDF (re-running an --extract-pages expression while tuning it, batch jobs over
+a folder that was processed yesterday) only pay for a content hash instead of
+a full pdfplumber pass.
+
+Entries are keyed by:
+- document key: SHA-256 of the file contents (rename/copy safe, edit safe)
+- extractor id: extraction library + version + our own extraction revision,
+  so upgrading pdfplumber or changing how we post-process text never serves
+  text produced by the old pipeline
+
+The cache is size-limited. Documents are the eviction unit and the least
+recently used ones are dropped once the stored text exceeds the limit.
+
+Failures in the cache (locked database, read-only directory, corrupt file)
+never fail the operation - the caller simply extracts as if nothing was cached.
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+
+from pathlib import Path
+
+from pdf_manipulator.core.cache.settings import resolve_cache_dir
+from pdf_manipulator.core.cache.fingerprint import file_digest, remember_file_digest
+
+
+DB_FILENAME = 'page_text.sqlite3'
+DEFAULT_MAX_CACHE_BYTES = 512 * 1024 * 1024     # 512 MB of (compressed) text
+
+# Bump when the way page text is produced or normalized changes in a way that
+# would make previously cached text wrong for the new code.
+TEXT_EXTRACTION_REVISION = 1
+
+_SQL_BATCH_SIZE = 500       # Stay well below SQLite's bound parameter limit
+
+
+#################################################################################################
+# Document keys
+
+def get_document_key(pdf_path: Path) -> str:
+    """
+    Get the content-based cache key for a PDF file.
+
+    This is the file's SHA-256 from the fingerprint service, memoized per
+    file identity for the lifetime of the process, so repeated lookups while
+    evaluating an expression are free.
+    """
+    return file_digest(pdf_path)
+
+
+def remember_document_key(stat: os.stat_result, doc_key: str):
+    """Seed the document key memo with a hash computed elsewhere (e.g. a folder manifest)."""
+    remember_file_digest(stat, doc_key)
+
+
+def make_extractor_id(library: str, library_version: str) -> str:
+    """Build the extractor component of a cache key (e.g. 'pdfplumber-0.11.4/r1')."""
+    return f"{library}-{library_version}/r{TEXT_EXTRACTION_REVISION}"
+
+
+#################################################################################################
+# SQLite store
+
+class PageTextCache:
+    """
+    Size-limited, content-addressed store of page text.
+
+    Pages are numbered 1-based, like everywhere else in the page selection code.
+    Partial documents are allowed: callers may store only the pages they needed.
+    """
+
+    def __init__(self, cache_dir: Path | str | None = None, max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        self.cache_dir = resolve_cache_dir(cache_dir)
+        self.db_path = self.cache_dir / DB_FILENAME
+        self.max_bytes = max_bytes
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reuse) the database connection. Reconnects after fork."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_key     TEXT NOT NULL,
+                extractor   TEXT NOT NULL,
+                total_bytes INTEGER NOT NULL DEFAULT 0,
+                last_used   REAL NOT NULL,
+                PRIMARY KEY (doc_key, extractor)
+            );
+            CREATE TABLE IF NOT EXISTS page_texts (
+                doc_key     TEXT NOT NULL,
+                extractor   TEXT NOT NULL,
+                page        INTEGER NOT NULL,
+                text        BLOB NOT NULL,
+                PRIMARY KEY (doc_key, extractor, page)
+            );
+            CREATE INDEX IF NOT EXISTS idx_documents_last_used ON documents (last_used);
+        """)
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def close(self):
+        """Close the database connection (it is reopened on next use)."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+        self._conn_pid = None
+
+    def get_pages(self, doc_key: str, extractor: str,
+                    page_numbers: list[int] | None = None) -> dict[int, str]:
+        """
+        Fetch cached text for a document.
+
+        Args:
+            doc_key: Document content key (see get_document_key)
+            extractor: Extractor id (see make_extractor_id)
+            page_numbers: 1-based pages to fetch, or None for every cached page
+
+        Returns:
+            Dict of page number -> text for the pages that were cached
+        """
+        try:
+            conn = self._connect()
+            if page_numbers is None:
+                rows = conn.execute(
+                    "SELECT page, text FROM page_texts WHERE doc_key = ? AND extractor = ?",
+                    (doc_key, extractor)).fetchall()
+            else:
+                # Only read the requested pages - lazy callers often want a handful of 1000
+                wanted = sorted(set(page_numbers))
+                rows = []
+                for i in range(0, len(wanted), _SQL_BATCH_SIZE):
+                    batch = wanted[i:i + _SQL_BATCH_SIZE]
+                    placeholders = ','.join('?' * len(batch))
+                    rows.extend(conn.execute(
+                        f"SELECT page, text FROM page_texts WHERE doc_key = ? AND extractor = ? "
+                        f"AND page IN ({placeholders})", (doc_key, extractor, *batch)).fetchall())
+
+            if rows:
+                with conn:
+                    conn.execute(
+                        "UPDATE documents SET last_used = ? WHERE doc_key = ? AND extractor = ?",
+                        (time.time(), doc_key, extractor))
+
+            return {page: zlib.decompress(blob).decode('utf-8') for page, blob in rows}
+
+        except (sqlite3.Error, OSError, zlib.error, UnicodeDecodeError):
+            return {}
+
+    def store_pages(self, doc_key: str, extractor: str, texts: dict[int, str]):
+        """Store text for some or all pages of a document, then enforce the size limit."""
+        if not texts:
+            return
+
+        rows = [(doc_key, extractor, page, zlib.compress((text or '').encode('utf-8')))
+                for page, text in texts.items()]
+
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO page_texts (doc_key, extractor, page, text) "
+                    "VALUES (?, ?, ?, ?)", rows)
+                total = conn.execute(
+                    "SELECT COALESCE(SUM(LENGTH(text)), 0) FROM page_texts "
+                    "WHERE doc_key = ? AND extractor = ?", (doc_key, extractor)).fetchone()[0]
+                conn.execute(
+                    "INSERT OR REPLACE INTO documents (doc_key, extractor, total_bytes, last_used) "
+                    "VALUES (?, ?, ?, ?)", (doc_key, extractor, total, time.time()))
+
+            self.evict_to_limit()
+
+        except (sqlite3.Error, OSError):
+            pass
+
+    def evict_to_limit(self) -> int:
+        """
+        Drop least recently used documents until the cache fits in max_bytes.
+
+        Returns:
+            Number of documents evicted
+        """
+        try:
+            conn = self._connect()
+            total = conn.execute("SELECT COALESCE(SUM(total_bytes), 0) FROM documents").fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+
+            evicted = 0
+            victims = conn.execute(
+                "SELECT doc_key, extractor, total_bytes FROM documents ORDER BY last_used ASC").fetchall()
+            with conn:
+                for doc_key, extractor, size in victims:
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute("DELETE FROM page_texts WHERE doc_key = ? AND extractor = ?",
+                                    (doc_key, extractor))
+                    conn.execute("DELETE FROM documents WHERE doc_key = ? AND extractor = ?",
+                                    (doc_key, extractor))
+                    total -= size
+                    evicted += 1
+            return evicted
+
+        except sqlite3.Error:
+            return 0
+
+    def stats(self) -> dict:
+        """Return document count, page count and stored bytes."""
+        try:
+            conn = self._connect()
+            documents, total_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(total_bytes), 0) FROM documents").fetchone()
+            pages = conn.execute("SELECT COUNT(*) FROM page_texts").fetchone()[0]
+            return {'documents': documents, 'pages': pages, 'bytes': total_bytes,
+                    'max_bytes': self.max_bytes, 'path': str(self.db_path)}
+        except sqlite3.Error:
+            return {'documents': 0, 'pages': 0, 'bytes': 0,
+                    'max_bytes': self.max_bytes, 'path': str(self.db_path)}
+
+    def clear(self):
+        """Remove every cached entry."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM page_texts")
+                conn.execute("DELETE FROM documents")
+        except sqlite3.Error:
+            pass
+
+
+#################################################################################################
+# Process-wide configuration
+
+_text_cache: PageTextCache | None = None
+
+
+def configure_text_cache(cache_dir: Path | str | None = None, enabled: bool = True,
+                            max_bytes: int = DEFAULT_MAX_CACHE_BYTES) -> PageTextCache | None:
+    """
+    Enable, relocate or disable the persistent page text cache.
+
+    Args:
+        cache_dir: Directory for the cache database (None = default location)
+        enabled: False turns the persistent cache off for this process
+        max_bytes: Size limit before least recently used documents are evicted
+
+    Returns:
+        The active cache, or None when disabled
+    """
+    global _text_cache
+
+    if _text_cache is not None:
+        _text_cache.close()
+
+    _text_cache = PageTextCache(cache_dir, max_bytes) if enabled else None
+    return _text_cache
+
+
+def get_text_cache() -> PageTextCache | None:
+    """Return the active persistent text cache, or None if not configured/disabled."""
+    return _text_cache
+
+
+# End of file #
@@ -0,0 +1,306 @@
+"""
+Persistent Page Text Index
+File: pdf_manipulator/core/cache/text_index.py
+
+Inverted index of page text for documents that are queried over and over
+(an analyst trying 50 --extract-pages expressions against one 3,000-page PDF).
+Built explicitly with --index-build, then used transparently by contains: and
+line-starts: patterns to skip every page that can't possibly match.
+
+Terms (all lowercased, so one index serves both case-sensitive and /i queries):
+- 't' + every 3-character substring of the page text (trigrams)
+- 'l' + the first 1, 2 and 3 characters of every stripped, non-empty line
+
+Postings are page bitmasks (bit N = page N), stored as little-endian bytes.
+A query ANDs the postings of all its terms; the result is a superset of the
+matching pages, which callers verify against the real text. Needles shorter
+than a trigram, and regexes, can't be narrowed and return None.
+
+Entries are keyed like the text cache: document content hash + text pipeline
+id, so an edited PDF or an upgraded extractor simply has no index.
+
+Failures in the index (locked database, corrupt file) never fail the
+operation - lookups return None and callers scan as if no index existed.
+"""
+
+import os
+import time
+import sqlite3
+
+from pathlib import Path
+
+from pdf_manipulator.core.cache.settings import resolve_cache_dir
+from pdf_manipulator.core.page_range.page_set import PageSet
+
+
+DB_FILENAME = 'page_index.sqlite3'
+
+GRAM_SIZE = 3
+TRIGRAM_PREFIX = 't'
+LINE_START_PREFIX = 'l'
+
+_SQL_BATCH_SIZE = 500       # Stay well below SQLite's bound parameter limit
+
+
+#################################################################################################
+# Terms
+
+def page_terms(text: str) -> set[str]:
+    """Every index term of one page."""
+    terms = set()
+    if not text:
+        return terms
+
+    lowered = text.lower()
+    for i in range(len(lowered) - GRAM_SIZE + 1):
+        terms.add(TRIGRAM_PREFIX + lowered[i:i + GRAM_SIZE])
+
+    for line in text.split('\n'):
+        line = line.strip().lower()
+        for length in range(1, min(len(line), GRAM_SIZE) + 1):
+            terms.add(LINE_START_PREFIX + line[:length])
+
+    return terms
+
+
+def substring_query_terms(value: str) -> set[str] | None:
+    """Terms every page containing value (in any case) must have; None if too short to narrow."""
+    lowered = value.lower()
+    if len(lowered) < GRAM_SIZE:
+        return None
+    return {TRIGRAM_PREFIX + lowered[i:i + GRAM_SIZE] for i in range(len(lowered) - GRAM_SIZE + 1)}
+
+
+def line_start_query_terms(value: str) -> set[str] | None:
+    """Terms every page with a line starting with value (in any case) must have."""
+    lowered = value.lower()
+    if not lowered:
+        return None
+
+    terms = {LINE_START_PREFIX + lowered[:GRAM_SIZE]}
+    terms |= substring_query_terms(value) or set()
+    return terms
+
+
+#################################################################################################
+# SQLite store
+
+class PageTextIndex:
+    """
+    Persistent term -> page postings, one set per document and text pipeline.
+
+    Indexes are only ever built on request; unlike the text cache there is no
+    size limit - remove() or clear() drop indexes that are no longer wanted.
+    """
+
+    def __init__(self, cache_dir: Path | str | None = None):
+        self.cache_dir = resolve_cache_dir(cache_dir)
+        self.db_path = self.cache_dir / DB_FILENAME
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        self._indexed: dict[tuple[str, str], bool] = {}     # Memo of has_document()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reuse) the database connection. Reconnects after fork."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS indexed_documents (
+                doc_key     TEXT NOT NULL,
+                pipeline    TEXT NOT NULL,
+                total_pages INTEGER NOT NULL,
+                term_count  INTEGER NOT NULL,
+                total_bytes INTEGER NOT NULL,
+                built_at    REAL NOT NULL,
+                PRIMARY KEY (doc_key, pipeline)
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                doc_key     TEXT NOT NULL,
+                pipeline    TEXT NOT NULL,
+                term        TEXT NOT NULL,
+                pages       BLOB NOT NULL,
+                PRIMARY KEY (doc_key, pipeline, term)
+            );
+        """)
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def close(self):
+        """Close the database connection (it is reopened on next use)."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+        self._conn_pid = None
+
+    def build(self, doc_key: str, pipeline: str, texts: dict[int, str]) -> dict:
+        """
+        Index every page of a document, replacing any previous index for it.
+
+        Args:
+            doc_key: Document content key (see get_document_key)
+            pipeline: Text pipeline id the texts were produced by
+            texts: Page number -> text for every page of the document
+
+        Returns:
+            Dict with total_pages, term_count and total_bytes of the new index
+        """
+        postings: dict[str, list[int]] = {}
+        for page, text in texts.items():
+            for term in page_terms(text):
+                postings.setdefault(term, []).append(page)
+
+        rows = [(doc_key, pipeline, term, _mask_to_blob(PageSet(pages).mask))
+                for term, pages in postings.items()]
+        total_bytes = sum(len(row[3]) for row in rows)
+        total_pages = max(texts, default=0)
+
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM postings WHERE doc_key = ? AND pipeline = ?", (doc_key, pipeline))
+            conn.executemany(
+                "INSERT INTO postings (doc_key, pipeline, term, pages) VALUES (?, ?, ?, ?)", rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO indexed_documents "
+                "(doc_key, pipeline, total_pages, term_count, total_bytes, built_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (doc_key, pipeline, total_pages, len(rows), total_bytes, time.time()))
+
+        self._indexed[(doc_key, pipeline)] = True
+        return {'total_pages': total_pages, 'term_count': len(rows), 'total_bytes': total_bytes}
+
+    def has_document(self, doc_key: str, pipeline: str) -> bool:
+        """True if an index exists for this document and pipeline."""
+        memo_key = (doc_key, pipeline)
+        if memo_key not in self._indexed:
+            self._indexed[memo_key] = self.document_info(doc_key, pipeline) is not None
+        return self._indexed[memo_key]
+
+    def document_info(self, doc_key: str, pipeline: str) -> dict | None:
+        """Index details for a document, or None if it isn't indexed."""
+        try:
+            row = self._connect().execute(
+                "SELECT total_pages, term_count, total_bytes, built_at FROM indexed_documents "
+                "WHERE doc_key = ? AND pipeline = ?", (doc_key, pipeline)).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+        total_pages, term_count, total_bytes, built_at = row
+        return {'total_pages': total_pages, 'term_count': term_count,
+                'total_bytes': total_bytes, 'built_at': built_at}
+
+    def lookup(self, doc_key: str, pipeline: str, terms: set[str]) -> int | None:
+        """
+        Pages having every term, as a bitmask.
+
+        Returns:
+            Bitmask of candidate pages (0 if some term never occurs), or None if
+            the document isn't indexed or the index can't be read
+        """
+        if not terms or not self.has_document(doc_key, pipeline):
+            return None
+
+        try:
+            conn = self._connect()
+            wanted = sorted(terms)
+            found = {}
+            for i in range(0, len(wanted), _SQL_BATCH_SIZE):
+                batch = wanted[i:i + _SQL_BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                found.update(conn.execute(
+                    f"SELECT term, pages FROM postings WHERE doc_key = ? AND pipeline = ? "
+                    f"AND term IN ({placeholders})", (doc_key, pipeline, *batch)).fetchall())
+        except sqlite3.Error:
+            return None
+
+        if len(found) < len(wanted):
+            return 0
+
+        mask = -1
+        for blob in found.values():
+            mask &= int.from_bytes(blob, 'little')
+        return mask
+
+    def remove(self, doc_key: str, pipeline: str | None = None):
+        """Drop the index of a document (for one pipeline, or all of them)."""
+        try:
+            conn = self._connect()
+            with conn:
+                if pipeline is None:
+                    conn.execute("DELETE FROM postings WHERE doc_key = ?", (doc_key,))
+                    conn.execute("DELETE FROM indexed_documents WHERE doc_key = ?", (doc_key,))
+                else:
+                    conn.execute("DELETE FROM postings WHERE doc_key = ? AND pipeline = ?",
+                                    (doc_key, pipeline))
+                    conn.execute("DELETE FROM indexed_documents WHERE doc_key = ? AND pipeline = ?",
+                                    (doc_key, pipeline))
+        except sqlite3.Error:
+            pass
+        self._indexed.clear()
+
+    def stats(self) -> dict:
+        """Return indexed document count, term count and stored bytes."""
+        try:
+            documents, terms, total_bytes = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(term_count), 0), COALESCE(SUM(total_bytes), 0) "
+                "FROM indexed_documents").fetchone()
+            return {'documents': documents, 'terms': terms, 'bytes': total_bytes, 'path': str(self.db_path)}
+        except sqlite3.Error:
+            return {'documents': 0, 'terms': 0, 'bytes': 0, 'path': str(self.db_path)}
+
+    def clear(self):
+        """Remove every index."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM postings")
+                conn.execute("DELETE FROM indexed_documents")
+        except sqlite3.Error:
+            pass
+        self._indexed.clear()
+
+
+def _mask_to_blob(mask: int) -> bytes:
+    """Bitmask as little-endian bytes (empty for 0)."""
+    return mask.to_bytes((mask.bit_length() + 7) // 8, 'little')
+
+
+#################################################################################################
+# Process-wide configuration
+
+_text_index: PageTextIndex | None = None
+
+
+def configure_text_index(cache_dir: Path | str | None = None, enabled: bool = True) -> PageTextIndex | None:
+    """
+    Enable, relocate or disable the persistent page text index.
+
+    Args:
+        cache_dir: Directory for the index database (None = default location)
+        enabled: False turns index lookups and builds off for this process
+
+    Returns:
+        The active index, or None when disabled
+    """
+    global _text_index
+
+    if _text_index is not None:
+        _text_index.close()
+
+    _text_index = PageTextIndex(cache_dir) if enabled else None
+    return _text_index
+
+
+def get_text_index() -> PageTextIndex | None:
+    """Return the active page text index, or None if not configured/disabled."""
+    return _text_index
+
+
+# End of file #
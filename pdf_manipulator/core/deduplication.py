@@ -5,6 +5,8 @@ File: pdf_manipulator/core/deduplication.py
 
 from rich.console import Console
 
+from pdf_manipulator.core.page_range.page_set import PageSet
+
 console = Console()
 
 
@@ -18,6 +20,19 @@ def detect_duplicates(groups: list) -> dict:
     Returns:
         Dictionary with duplicate analysis results
     """
+    # Cheap bitset pass first - most selections have no overlaps at all
+    if not _has_any_duplicates(groups):
+        return {
+            'has_duplicates': False,
+            'duplicate_pages': [],
+            'affected_groups': [],
+            'overlap_summary': "",
+            'page_to_groups': {page: [(group_idx, getattr(group, 'original_spec', f"group{group_idx+1}"))]
+                                for group_idx, group in enumerate(groups)
+                                if hasattr(group, 'pages') and group.pages
+                                for page in group.pages}
+        }
+    
     page_to_groups = {}  # page_num -> list of (group_index, group_spec)
     duplicate_pages = set()
     
@@ -57,6 +72,22 @@ def detect_duplicates(groups: list) -> dict:
     }
 
 
+def _has_any_duplicates(groups: list) -> bool:
+    """Check whether any page appears twice, within or across groups."""
+    seen = PageSet()
+    
+    for group in groups:
+        if not hasattr(group, 'pages') or not group.pages:
+            continue
+        
+        group_pages = PageSet(group.pages)
+        if len(group_pages) != len(group.pages) or not group_pages.isdisjoint(seen):
+            return True
+        seen |= group_pages
+    
+    return False
+
+
 def determine_default_dedup_strategy(args) -> str:
     """
     Determine the default deduplication strategy based on output mode.
@@ -128,7 +159,7 @@ def _apply_strict_deduplication(groups: list, duplicate_info: dict) -> list:
     """
     Apply strict deduplication - each page appears only once (first occurrence wins).
     """
-    seen_pages = set()
+    seen_pages = PageSet()
     deduplicated_groups = []
     
     for group in groups:
@@ -137,12 +168,21 @@ def _apply_strict_deduplication(groups: list, duplicate_info: dict) -> list:
             deduplicated_groups.append(group)
             continue
         
-        # Filter out pages we've already seen
-        new_pages = []
-        for page in group.pages:
-            if page not in seen_pages:
-                new_pages.append(page)
-                seen_pages.add(page)
+        group_pages = PageSet(group.pages)
+        
+        if len(group_pages) == len(group.pages) and group_pages.isdisjoint(seen_pages):
+            # Nothing to drop - the common case
+            new_pages = list(group.pages)
+        else:
+            # Filter out pages we've already seen (input order kept, first occurrence wins)
+            new_pages = []
+            taken = set()
+            for page in group.pages:
+                if page not in seen_pages and page not in taken:
+                    new_pages.append(page)
+                    taken.add(page)
+        
+        seen_pages |= group_pages
         
         if new_pages:
             # Create new group with remaining pages
@@ -201,13 +201,11 @@ def _extract_sample_text(pdf_path: Path, page_number: int, max_length: int = 30)
     This is a placeholder - could be enhanced to extract actual text snippets.
     """
     try:
-        from pypdf import PdfReader
+        from pdf_manipulator.core.document_session import get_document_session
         from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
         
         with suppress_pdf_warnings():
-            reader = PdfReader(pdf_path)
-            page = reader.pages[page_number - 1]  # Convert to 0-indexed
-            text = page.extract_text()
+            text = get_document_session(pdf_path).pypdf_page_text(page_number)
             
             if not text or len(text.strip()) < 20:
                 return None
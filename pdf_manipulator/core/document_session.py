@@ -0,0 +1,159 @@
+"""
+Shared Document Sessions
+File: pdf_manipulator/core/document_session.py
+
+One DocumentSession per PDF owns the handles the per-file pipeline reads the
+document through, so a run parses each file once instead of once per step
+(page count, malformation check, type:/size: patterns, page text, output
+size estimate, extraction):
+
+- one pypdf PdfReader, opened on first use
+- one pdfplumber handle, opened on first use
+- the page text provider (page_range/page_text.py)
+- the page size estimator and page analyses (page_size.py, page_analysis.py)
+- memoized pypdf page text for the scraper and renamer processors
+
+Sessions live in a small LRU registry keyed by (path, size, mtime_ns): an
+edited file gets a fresh session, and batch runs over many files don't pile
+up open handles.
+
+The reader is shared. Don't modify its pages in place - add them to a
+PdfWriter (which clones them) and modify the copies.
+"""
+
+from pypdf import PdfReader
+from pathlib import Path
+from collections import OrderedDict
+
+from pdf_manipulator.core.page_size import PageSizeEstimator
+from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
+
+
+MAX_SESSIONS = 4
+
+
+class DocumentSession:
+    """Open-once handles and per-document memos for one PDF file."""
+
+    def __init__(self, pdf_path: Path):
+        self.pdf_path = Path(pdf_path)
+
+        self._reader: PdfReader | None = None
+        self._plumber_pdf = None
+        self._text_provider = None
+        self._size_estimator: PageSizeEstimator | None = None
+        self._analyses: dict[bool, dict] = {}       # exact_sizes -> page -> PageAnalysis
+        self._pypdf_texts: dict[int, str] = {}
+
+    @property
+    def reader(self) -> PdfReader:
+        """The document's pypdf reader (raises like PdfReader on unreadable files)."""
+        if self._reader is None:
+            with suppress_pdf_warnings():
+                self._reader = PdfReader(self.pdf_path)
+        return self._reader
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the document."""
+        return len(self.reader.pages)
+
+    @property
+    def size_estimator(self) -> PageSizeEstimator:
+        """Page size estimator over the shared reader (memoizes per object)."""
+        if self._size_estimator is None:
+            self._size_estimator = PageSizeEstimator(self.reader)
+        return self._size_estimator
+
+    def plumber(self):
+        """The document's pdfplumber handle (raises ImportError without pdfplumber)."""
+        if self._plumber_pdf is None:
+            import pdfplumber
+            self._plumber_pdf = pdfplumber.open(self.pdf_path)
+        return self._plumber_pdf
+
+    def close_plumber(self):
+        """Release the pdfplumber handle (it is reopened on next use)."""
+        if self._plumber_pdf is not None:
+            try:
+                self._plumber_pdf.close()
+            except Exception:
+                pass
+            self._plumber_pdf = None
+
+    def text_provider(self, total_pages: int):
+        """The document's lazy page text provider."""
+        from pdf_manipulator.core.page_range.page_text import PageTextProvider
+
+        if self._text_provider is None:
+            self._text_provider = PageTextProvider(self.pdf_path, total_pages, session=self)
+        elif total_pages > self._text_provider.total_pages:
+            self._text_provider.total_pages = total_pages
+        return self._text_provider
+
+    def page_analyses(self, exact_sizes: bool) -> dict:
+        """Shared page number -> PageAnalysis memo for the given size method."""
+        return self._analyses.setdefault(exact_sizes, {})
+
+    def pypdf_page_text(self, page_number: int) -> str:
+        """Raw pypdf text of a page (1-based), extracted once."""
+        text = self._pypdf_texts.get(page_number)
+        if text is None:
+            with suppress_pdf_warnings():
+                text = self.reader.pages[page_number - 1].extract_text() or ""
+            self._pypdf_texts[page_number] = text
+        return text
+
+    def close(self):
+        """Release every handle and memo held by the session."""
+        self.close_plumber()
+        self._reader = None
+        self._text_provider = None
+        self._size_estimator = None
+        self._analyses.clear()
+        self._pypdf_texts.clear()
+
+
+#################################################################################################
+# Session registry
+
+_sessions: OrderedDict = OrderedDict()      # (path, size, mtime_ns) -> DocumentSession
+
+
+def get_document_session(pdf_path: Path) -> DocumentSession:
+    """
+    Get the shared session for a PDF, creating it on first use.
+
+    Sessions are keyed by resolved path, size and modification time, so a
+    file that changed on disk never gets handles or memos of its old contents.
+    """
+    path = Path(pdf_path).resolve()
+    try:
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        key = (str(path), -1, -1)
+
+    session = _sessions.get(key)
+    if session is not None:
+        _sessions.move_to_end(key)
+        return session
+
+    session = DocumentSession(path)
+    _sessions[key] = session
+
+    while len(_sessions) > MAX_SESSIONS:
+        _, evicted = _sessions.popitem(last=False)
+        evicted.close()
+
+    return session
+
+
+def close_document_sessions():
+    """Close and forget every session (useful for testing)."""
+    for session in _sessions.values():
+        session.close()
+    _sessions.clear()
+
+
+# End of file #
@@ -77,6 +77,10 @@ def resolve_file_conflicts(output_paths: list[Path],
     """
     Resolve file conflicts according to specified strategy.
     
+    When output reservation is enabled (parallel batch workers), resolution
+    happens under the shared lock and each resolved path is claimed on disk
+    before returning, so concurrent workers see each other's outputs.
+    
     Args:
         output_paths: List of planned output file paths
         strategy: Conflict resolution strategy
@@ -88,6 +92,22 @@ def resolve_file_conflicts(output_paths: list[Path],
     Raises:
         ValueError: If strategy is 'fail' and conflicts exist
     """
+    if _reservation_lock is None:
+        return _resolve_file_conflicts(output_paths, strategy, interactive)
+    
+    with _reservation_lock:
+        resolved_paths, skipped_paths = _resolve_file_conflicts(output_paths, strategy, interactive)
+        for path in resolved_paths:
+            if not path.exists():
+                path.touch()
+                _reserved_paths.append(path)
+    
+    return resolved_paths, skipped_paths
+
+
+def _resolve_file_conflicts(output_paths: list[Path], strategy: str,
+                            interactive: bool) -> tuple[list[Path], list[Path]]:
+    """Strategy logic behind resolve_file_conflicts() (no reservation handling)."""
     conflicts = check_file_conflicts(output_paths)
     
     if not conflicts:
@@ -136,6 +156,35 @@ def resolve_file_conflicts(output_paths: list[Path],
     return resolved_paths, skipped_paths
 
 
+#################################################################################################
+# Output reservation for parallel batch workers
+
+_reservation_lock = None            # multiprocessing.Lock shared by batch workers, or None
+_reserved_paths: list[Path] = []    # Placeholders this process created and has not released
+
+
+def set_reservation_lock(lock):
+    """
+    Enable (or with None, disable) cross-process output reservation.
+    
+    Called in each --jobs worker with a lock shared by the whole pool.
+    """
+    global _reservation_lock
+    _reservation_lock = lock
+    _reserved_paths.clear()
+
+
+def release_reservations():
+    """Remove reserved placeholders that were never written (skipped or failed outputs)."""
+    for path in _reserved_paths:
+        try:
+            if path.exists() and path.stat().st_size == 0:
+                path.unlink()
+        except OSError:
+            pass
+    _reserved_paths.clear()
+
+
 def ask_user_conflict_resolution(path: Path) -> Optional[Path]:
     """
     Ask user how to resolve a specific file conflict.
@@ -9,9 +9,12 @@ PHASE 2 ENHANCEMENTS:
 - Enhanced error handling and user feedback
 """
 
+import os
+import shutil
 import argparse
 
 from pathlib import Path
+from dataclasses import dataclass, field
 from rich.console import Console
 from rich.prompt import Confirm
 
@@ -27,6 +30,9 @@ from pdf_manipulator.core.operations import (
     split_to_pages,
 )
 from pdf_manipulator.core.operation_context import OpCtx
+from pdf_manipulator.core.file_conflicts import resolve_file_conflicts
+from pdf_manipulator.core.page_fingerprint import register_documents
+from pdf_manipulator.core.cache.fingerprint import file_digest
 from pdf_manipulator.core.malformation_utils import check_and_fix_malformation_with_args
 from pdf_manipulator.core.warning_suppression import suppress_all_pdf_warnings
 from pdf_manipulator.ui_enhanced import format_page_ranges, show_page_selection_preview
@@ -196,6 +202,17 @@ def process_extract_split_mode(args: argparse.Namespace, pdf_files: list[tuple[P
             process_multipage_pdfs(pdf_files, "split", args.replace)
 
 
+@dataclass
+class BatchExtractResult:
+    """Outcome of running the extraction pipeline on one PDF of a batch."""
+    pdf_path: Path
+    mode: str                                   # 'grouped', 'separate' or 'single'
+    output_paths: list[Path] = field(default_factory=list)
+    skipped_reason: str | None = None           # Set when the PDF was skipped (ValueError)
+    error: str | None = None                    # Set when a worker failed unexpectedly
+    output: str = ""                            # Console output captured in a worker process
+
+
 def process_batch_extract(args: argparse.Namespace, pdf_files: list[tuple[Path, int, float]],
                             patterns: list[str], template: str, source_page: int, dry_run: bool):
     """Handle batch extraction processing with pattern support."""
@@ -204,89 +221,310 @@ def process_batch_extract(args: argparse.Namespace, pdf_files: list[tuple[Path,
     from pdf_manipulator.cli import extract_enhanced_args
     enhanced_args = extract_enhanced_args(args)
 
+    # dup:seen compares with documents indexed earlier - index them in input order
+    # up front, so the verdicts don't depend on which worker finishes first
+    if 'dup:' in (args.extract_pages or '').lower():
+        register_documents([pdf_path for pdf_path, _, _ in pdf_files])
+
+    # Byte-identical inputs are extracted once; the copies get cloned outputs
+    duplicates = {} if dry_run else _find_identical_files(pdf_files)
+    duplicate_paths = {dup[0] for dups in duplicates.values() for dup in dups}
+    unique_files = [pdf_file for pdf_file in pdf_files if pdf_file[0] not in duplicate_paths]
+
+    # Batch extraction is serial unless --jobs is given
+    requested_jobs = getattr(args, 'jobs', None)
+    jobs = resolve_job_count(1 if requested_jobs is None else requested_jobs)
+    if jobs > 1 and len(unique_files) > 1:
+        from pdf_manipulator.core.batch_pool import run_batch_extract_parallel
+
+        console.print(f"[dim]Processing {len(unique_files)} PDFs with {jobs} worker processes[/dim]")
+        results = []
+        leftovers = []
+        for result in run_batch_extract_parallel(args, unique_files, patterns, template, source_page,
+                                                    dry_run, enhanced_args, jobs):
+            # Worker output arrives in input order, already formatted
+            console.file.write(result.output)
+            console.file.flush()
+            leftovers.extend(_finish_with_clones(args, result, duplicates, dry_run, results, enhanced_args))
+
+        # Copies whose outputs couldn't be cloned are extracted like any other file
+        with suppress_all_pdf_warnings():
+            for pdf_path, page_count, file_size in leftovers:
+                console.print(f"\n[cyan]Processing {pdf_path.name}[/cyan]...")
+                result = batch_extract_single_pdf(args, pdf_path, page_count, patterns, template,
+                                                    source_page, dry_run, enhanced_args)
+                _finish_batch_extract_result(args, result, dry_run)
+                results.append(result)
+
+        _show_batch_extract_summary(results, dry_run)
+        return
+
     suppress_context = suppress_all_pdf_warnings() if not dry_run else None
     
+    results = []
     with suppress_context if suppress_context else _null_context():
         # For extract, process all PDFs (not just multi-page)
-        for pdf_path, page_count, file_size in pdf_files:
+        pending = list(unique_files)
+        while pending:
+            pdf_path, page_count, file_size = pending.pop(0)
             console.print(f"\n[cyan]Processing {pdf_path.name}[/cyan]...")
 
-            # CRITICAL: Set PDF context BEFORE any parsing operations
-            OpCtx.set_current_pdf(pdf_path, page_count)
+            result = batch_extract_single_pdf(args, pdf_path, page_count, patterns, template,
+                                                source_page, dry_run, enhanced_args)
+            pending[:0] = _finish_with_clones(args, result, duplicates, dry_run, results, enhanced_args)
 
-            try:
-                # Validate extraction for this PDF (early error detection)
-                from pdf_manipulator.core.parser import parse_page_range_from_args
-                pages_to_extract, desc, groups = parse_page_range_from_args(args, page_count, pdf_path)
-                
-                # Variables above are intentionally unused - this is validation only
-                # Operations functions do their own parsing internally
-                
-                if args.respect_groups:
-                    # Extract with groupings respected
-                    output_files = extract_pages_grouped(
-                        pdf_path=pdf_path,
-                        page_range=args.extract_pages,
-                        patterns=patterns,
-                        template=template,
-                        source_page=source_page,
-                        dry_run=dry_run,
-                        dedup_strategy=enhanced_args['dedup_strategy'],
-                        use_timestamp=getattr(args, 'timestamp', False),
-                        custom_prefix=getattr(args, 'name_prefix', None),
-                        conflict_strategy=enhanced_args['conflict_strategy'],  # FIXED: Added this parameter
-                        interactive=enhanced_args['interactive']  # FIXED: Added this parameter
-                    )
-                    if output_files and not dry_run:
-                        console.print(f"[green]✓ Created {len(output_files)} grouped files[/green]")
-                        if args.replace:
-                            pdf_path.unlink()
-                            console.print("[yellow]✓ Deleted original[/yellow]")
-                            
-                elif args.separate_files:
-                    # Extract as separate files
-                    output_files = extract_pages_separate(
-                        pdf_path=pdf_path,
-                        page_range=args.extract_pages,
-                        patterns=patterns,
-                        template=template,
-                        source_page=source_page,
-                        dry_run=dry_run,
-                        dedup_strategy=enhanced_args['dedup_strategy'],
-                        use_timestamp=getattr(args, 'timestamp', False),
-                        custom_prefix=getattr(args, 'name_prefix', None),
-                        conflict_strategy=enhanced_args['conflict_strategy'],  # FIXED: Added this parameter
-                        interactive=enhanced_args['interactive']  # FIXED: Added this parameter
-                    )
-                    if output_files and not dry_run:
-                        console.print(f"[green]✓ Created {len(output_files)} separate files[/green]")
-                        if args.replace:
-                            pdf_path.unlink()
-                            console.print("[yellow]✓ Deleted original[/yellow]")
-                else:
-                    # Extract as single document
-                    output_path, new_size = extract_pages(
-                        pdf_path=pdf_path,
-                        page_range=args.extract_pages,
-                        patterns=patterns,
-                        template=template,
-                        source_page=source_page,
-                        dry_run=dry_run,
-                        dedup_strategy=enhanced_args['dedup_strategy'],
-                        use_timestamp=getattr(args, 'timestamp', False),
-                        custom_prefix=getattr(args, 'name_prefix', None),
-                        conflict_strategy=enhanced_args['conflict_strategy'],  # FIXED: Added this parameter  
-                        interactive=enhanced_args['interactive']  # FIXED: Added this parameter
-                    )
-                    if output_path and not dry_run:
-                        console.print(f"[green]✓ Created:[/green] {output_path.name}")
-                        if args.replace:
-                            pdf_path.unlink()
-                            output_path.rename(pdf_path)
-                            console.print("[yellow]✓ Replaced original[/yellow]")
+    if len(results) > 1:
+        _show_batch_extract_summary(results, dry_run)
 
-            except ValueError as e:
-                console.print(f"[yellow]Skipping {pdf_path.name}: {e}[/yellow]")
+
+def _find_identical_files(pdf_files: list[tuple[Path, int, float]]) -> dict[Path, list[tuple[Path, int, float]]]:
+    """
+    Group byte-identical PDFs of a batch.
+
+    Returns:
+        First file's path -> the later files with the same bytes (only groups with copies)
+    """
+    first_by_digest = {}
+    duplicates = {}
+    for pdf_file in pdf_files:
+        try:
+            digest = file_digest(pdf_file[0])
+        except OSError:
+            continue
+        first = first_by_digest.setdefault(digest, pdf_file[0])
+        if first != pdf_file[0]:
+            duplicates.setdefault(first, []).append(pdf_file)
+    return duplicates
+
+
+def _cloned_output_name(name: str, original_stem: str, copy_stem: str) -> str | None:
+    """Output name for a copy: the original's stem swapped for the copy's, or None if it isn't in the name."""
+    position = 0
+    while position != -1:
+        if name[position:].startswith(original_stem + '_'):
+            return name[:position] + copy_stem + name[position + len(original_stem):]
+        position = name.find('_', position)
+        position = position + 1 if position != -1 else -1
+    return None
+
+
+def _clone_outputs(original: BatchExtractResult, copy_path: Path,
+                    enhanced_args: dict) -> BatchExtractResult | None:
+    """
+    Copy an original's outputs for a byte-identical copy.
+
+    Outputs go next to the copy, like the copy's own extraction would write
+    them, and existing files are handled by the --conflicts strategy.
+
+    Returns:
+        Result for the copy, or None when an output name can't be mapped
+        (the copy is then extracted normally)
+    """
+    sources = {}
+    for output_path in original.output_paths:
+        name = _cloned_output_name(output_path.name, original.pdf_path.stem, copy_path.stem)
+        if name is None:
+            return None
+        target = copy_path.parent / name
+        if target in sources:
+            return None
+        sources[target] = output_path
+
+    try:
+        resolved_paths, skipped_paths = resolve_file_conflicts(list(sources), enhanced_args['conflict_strategy'],
+                                                    enhanced_args['interactive'])
+    except ValueError as e:
+        return BatchExtractResult(pdf_path=copy_path, mode=original.mode, skipped_reason=str(e))
+
+    # Resolution keeps the order, one resolved path per target that isn't skipped
+    kept = [target for target in sources if target not in skipped_paths]
+    for target, resolved in zip(kept, resolved_paths):
+        shutil.copyfile(sources[target], resolved)
+
+    return BatchExtractResult(pdf_path=copy_path, mode=original.mode, output_paths=resolved_paths)
+
+
+def _finish_with_clones(args: argparse.Namespace, result: BatchExtractResult,
+                        duplicates: dict[Path, list[tuple[Path, int, float]]], dry_run: bool,
+                        results: list[BatchExtractResult],
+                        enhanced_args: dict) -> list[tuple[Path, int, float]]:
+    """
+    Finish a result, then give its byte-identical copies cloned outputs.
+
+    Clones are made before the original is finished, since --replace may
+    delete or rename the original's outputs.
+
+    Returns:
+        Copies that still need to be extracted
+    """
+    copies = duplicates.get(result.pdf_path, [])
+    clones = []
+    leftovers = []
+    for copy_file in copies:
+        if result.error:
+            leftovers.append(copy_file)
+        elif result.skipped_reason:
+            clones.append(BatchExtractResult(pdf_path=copy_file[0], mode=result.mode,
+                                                skipped_reason=result.skipped_reason))
+        else:
+            clone = _clone_outputs(result, copy_file[0], enhanced_args)
+            if clone is None:
+                leftovers.append(copy_file)
+            else:
+                clones.append(clone)
+
+    _finish_batch_extract_result(args, result, dry_run)
+    results.append(result)
+
+    for clone in clones:
+        console.print(f"\n[cyan]Processing {clone.pdf_path.name}[/cyan]...")
+        console.print(f"[dim]Identical to {result.pdf_path.name} - reusing its result[/dim]")
+        if clone.skipped_reason:
+            console.print(f"[yellow]Skipping {clone.pdf_path.name}: {clone.skipped_reason}[/yellow]")
+        _finish_batch_extract_result(args, clone, dry_run)
+        results.append(clone)
+
+    return leftovers
+
+
+def batch_extract_single_pdf(args: argparse.Namespace, pdf_path: Path, page_count: int,
+                                patterns: list[str], template: str, source_page: int, dry_run: bool,
+                                enhanced_args: dict) -> BatchExtractResult:
+    """
+    Run the parse, select and write pipeline for one PDF of a batch.
+
+    Used both by the serial loop and by worker processes (--jobs), so the two
+    modes cannot drift apart. Replacing originals is left to the caller.
+    """
+    if args.respect_groups:
+        mode = 'grouped'
+    elif args.separate_files:
+        mode = 'separate'
+    else:
+        mode = 'single'
+
+    result = BatchExtractResult(pdf_path=pdf_path, mode=mode)
+
+    # CRITICAL: Set PDF context BEFORE any parsing operations
+    OpCtx.set_current_pdf(pdf_path, page_count)
+
+    try:
+        # Validate extraction for this PDF (early error detection)
+        from pdf_manipulator.core.parser import parse_page_range_from_args
+        pages_to_extract, desc, groups = parse_page_range_from_args(args, page_count, pdf_path)
+        
+        # Variables above are intentionally unused - this is validation only
+        # Operations functions do their own parsing internally
+        
+        if mode == 'grouped':
+            # Extract with groupings respected
+            output_files = extract_pages_grouped(
+                pdf_path=pdf_path,
+                page_range=args.extract_pages,
+                patterns=patterns,
+                template=template,
+                source_page=source_page,
+                dry_run=dry_run,
+                dedup_strategy=enhanced_args['dedup_strategy'],
+                use_timestamp=getattr(args, 'timestamp', False),
+                custom_prefix=getattr(args, 'name_prefix', None),
+                conflict_strategy=enhanced_args['conflict_strategy'],  # FIXED: Added this parameter
+                interactive=enhanced_args['interactive']  # FIXED: Added this parameter
+            )
+            result.output_paths = [path for path, _ in output_files or []]
+                    
+        elif mode == 'separate':
+            # Extract as separate files
+            output_files = extract_pages_separate(
+                pdf_path=pdf_path,
+                page_range=args.extract_pages,
+                patterns=patterns,
+                template=template,
+                source_page=source_page,
+                dry_run=dry_run,
+                dedup_strategy=enhanced_args['dedup_strategy'],
+                use_timestamp=getattr(args, 'timestamp', False),
+                custom_prefix=getattr(args, 'name_prefix', None),
+                conflict_strategy=enhanced_args['conflict_strategy'],  # FIXED: Added this parameter
+                interactive=enhanced_args['interactive']  # FIXED: Added this parameter
+            )
+            result.output_paths = [path for path, _ in output_files or []]
+        else:
+            # Extract as single document
+            output_path, new_size = extract_pages(
+                pdf_path=pdf_path,
+                page_range=args.extract_pages,
+                patterns=patterns,
+                template=template,
+                source_page=source_page,
+                dry_run=dry_run,
+                dedup_strategy=enhanced_args['dedup_strategy'],
+                use_timestamp=getattr(args, 'timestamp', False),
+                custom_prefix=getattr(args, 'name_prefix', None),
+                conflict_strategy=enhanced_args['conflict_strategy'],  # FIXED: Added this parameter  
+                interactive=enhanced_args['interactive']  # FIXED: Added this parameter
+            )
+            if output_path:
+                result.output_paths = [output_path]
+
+    except ValueError as e:
+        console.print(f"[yellow]Skipping {pdf_path.name}: {e}[/yellow]")
+        result.skipped_reason = str(e)
+
+    return result
+
+
+def _finish_batch_extract_result(args: argparse.Namespace, result: BatchExtractResult, dry_run: bool):
+    """Report created files and replace originals (always done in the main process)."""
+    if result.error:
+        console.print(f"[red]Failed {result.pdf_path.name}: {result.error}[/red]")
+        return
+
+    if not result.output_paths or dry_run:
+        return
+
+    pdf_path = result.pdf_path
+
+    if result.mode == 'grouped':
+        console.print(f"[green]✓ Created {len(result.output_paths)} grouped files[/green]")
+        if args.replace:
+            pdf_path.unlink()
+            console.print("[yellow]✓ Deleted original[/yellow]")
+    elif result.mode == 'separate':
+        console.print(f"[green]✓ Created {len(result.output_paths)} separate files[/green]")
+        if args.replace:
+            pdf_path.unlink()
+            console.print("[yellow]✓ Deleted original[/yellow]")
+    else:
+        output_path = result.output_paths[0]
+        console.print(f"[green]✓ Created:[/green] {output_path.name}")
+        if args.replace:
+            pdf_path.unlink()
+            output_path.rename(pdf_path)
+            console.print("[yellow]✓ Replaced original[/yellow]")
+
+
+def _show_batch_extract_summary(results: list[BatchExtractResult], dry_run: bool):
+    """Print totals for a batch extraction run."""
+    processed = sum(1 for r in results if not r.error and not r.skipped_reason)
+    skipped = sum(1 for r in results if r.skipped_reason)
+    failed = sum(1 for r in results if r.error)
+    created = sum(len(r.output_paths) for r in results if not r.error)
+
+    console.print(f"\n[blue]Batch summary:[/blue] {processed} processed, {skipped} skipped, {failed} failed")
+    if not dry_run:
+        console.print(f"[blue]Files created:[/blue] {created}")
+
+    for r in results:
+        if r.error:
+            console.print(f"  [red]✗ {r.pdf_path.name}: {r.error}[/red]")
+
+
+def resolve_job_count(jobs: int | None) -> int:
+    """Turn a --jobs value into a worker count (0 or None means one per CPU)."""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
 
 
 def process_batch_split(args: argparse.Namespace, pdf_files: list[tuple[Path, int, float]], dry_run: bool):
@@ -3,19 +3,18 @@ Ghostscript integration for PDF manipulation.
 Add this as pdf_manipulator/core/ghostscript.py
 """
 
-import io
 import sys
+import time
 import shutil
-import hashlib
 import tempfile
 import subprocess
 
 from typing import Optional, Tuple, List
 from pathlib import Path
-from contextlib import redirect_stderr
 from rich.console import Console
 
-from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
+from pdf_manipulator.core.cache.fingerprint import content_fingerprint, file_digest
+from pdf_manipulator.core.malformation_detector import detect_malformation, inspect_pdf
 
 
 console = Console()
@@ -26,6 +25,11 @@ class GhostscriptError(Exception):
     pass
 
 
+class GhostscriptTransientError(GhostscriptError):
+    """Ghostscript failure worth retrying (timeout, process could not be started)."""
+    pass
+
+
 def find_ghostscript_executable() -> Optional[str]:
     """
     Find Ghostscript executable on the system.
@@ -110,6 +114,7 @@ def run_ghostscript_command(args: List[str], timeout: int = 60) -> subprocess.Co
         
     Raises:
         GhostscriptError: If Ghostscript is not available or command fails
+        GhostscriptTransientError: If the command timed out or could not be started
     """
     gs_path = find_ghostscript_executable()
     if not gs_path:
@@ -141,12 +146,15 @@ def run_ghostscript_command(args: List[str], timeout: int = 60) -> subprocess.Co
         return result
         
     except subprocess.TimeoutExpired:
-        raise GhostscriptError(f"Ghostscript command timed out after {timeout} seconds")
+        raise GhostscriptTransientError(f"Ghostscript command timed out after {timeout} seconds")
     except subprocess.SubprocessError as e:
         raise GhostscriptError(f"Subprocess error: {e}")
+    except OSError as e:
+        # Out of processes/file handles under load - another try may succeed
+        raise GhostscriptTransientError(f"Could not start Ghostscript: {e}")
 
 
-def fix_malformed_pdf(input_path: Path, quality: str = "default") -> Tuple[Path, float]:
+def fix_malformed_pdf(input_path: Path, quality: str = "default", timeout: int = 60) -> Tuple[Path, float]:
     """Fix with content-only hash comparison."""
     console.print(f"[blue]Fixing malformed PDF with Ghostscript...[/blue]")
     console.print(f"[dim]Quality: {quality}[/dim]")
@@ -171,7 +179,7 @@ def fix_malformed_pdf(input_path: Path, quality: str = "default") -> Tuple[Path,
         ]
         
         try:
-            result = run_ghostscript_command(args)
+            result = run_ghostscript_command(args, timeout=timeout)
             
             if not temp_path.exists():
                 raise GhostscriptError("Output file was not created")
@@ -333,98 +341,30 @@ def detect_pdf_structural_issues(pdf_path: Path) -> tuple[bool, str]:
     Returns:
         Tuple of (has_issues, description)
     """
-    try:
-        from pypdf import PdfReader
-        from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
-        
-        # Use our warning suppression system to capture structured warning data
-        with suppress_pdf_warnings() as warning_filter:
-            reader = PdfReader(pdf_path)
-            # Try to access pages to trigger warnings
-            total_pages = len(reader.pages)
-            
-            # Sample a few pages to trigger more warnings
-            for i in range(min(3, total_pages)):
-                try:
-                    page = reader.pages[i]
-                    # Try to access page resources to trigger warnings
-                    if hasattr(page, 'get_contents'):
-                        page.get_contents()
-                except Exception:
-                    pass  # Ignore extraction errors, we just want to trigger warnings
-        
-        # Check what warnings were captured using structured data
-        if warning_filter and warning_filter.suppressed_count > 0:
-            # Check for "wrong pointing object" specifically
-            wrong_objects = warning_filter.suppressed_types.get("wrong pointing object", 0)
-            if wrong_objects > 0:
-                return True, f"Structural corruption: {wrong_objects} invalid object references"
-            
-            # Check for other structural issues patterns
-            ignoring_count = warning_filter.suppressed_types.get("Ignoring wrong pointing object", 0)
-            if ignoring_count > 0:
-                return True, f"Structural corruption: {ignoring_count} invalid object references"
-            
-            # Check for multiple warnings indicating structural problems
-            if warning_filter.suppressed_count > 5:
-                return True, f"Multiple PDF structure warnings detected ({warning_filter.suppressed_count} warnings)"
-        
-        return False, "No structural issues detected"
-        
-    except Exception as e:
-        return False, f"Could not analyze PDF structure: {e}"
+    structural, _, error = inspect_pdf(pdf_path)
+    if structural:
+        return True, structural
+    if error:
+        return False, f"Could not analyze PDF structure: {error}"
+    return False, "No structural issues detected"
 
 
 def detect_malformed_pdf(pdf_path: Path) -> tuple[bool, str]:
     """
     Detect if a PDF has issues that Ghostscript can fix.
     
+    Opens the file once and checks the pages picked by the configured
+    sampling strategy (see malformation_detector.py).
+    
     Returns:
         Tuple of (is_malformed, description)
     """
-    issues = []
-    
-    # Check for structural corruption first
-    has_structural_issues, structural_desc = detect_pdf_structural_issues(pdf_path)
-    if has_structural_issues:
-        issues.append(structural_desc)
-    
-    # Check for resource malformation (existing logic)
-    try:
-        from pypdf import PdfReader
-        
-        # Suppress warnings for this analysis since we already checked them above
-        with redirect_stderr(io.StringIO()):
-            reader = PdfReader(pdf_path)
-            total_pages = len(reader.pages)
-            
-            # Sample first few pages to check for malformation
-            pages_to_check = min(3, total_pages)
-            
-            for i in range(pages_to_check):
-                page = reader.pages[i]
-                if '/XObject' in page.get('/Resources', {}):
-                    xobjects = page['/Resources']['/XObject'].get_object()
-                    images = [x for x in xobjects if xobjects[x].get('/Subtype') == '/Image']
-                    image_count = len(images)
-                    
-                    # If page has 50%+ of total pages as image references, it's likely malformed
-                    if image_count >= total_pages * 0.5:
-                        issues.append(f"Resource duplication: {image_count} images per page")
-                        break
-        
-    except Exception as e:
-        if not issues:  # Only report this if we haven't found other issues
-            issues.append(f"Could not analyze PDF: {e}")
-    
-    if issues:
-        return True, "; ".join(issues)
-    else:
-        return False, "No issues detected"
+    return detect_malformation(pdf_path)
 
 
 def safe_batch_fix_pdfs(folder_path: Path, recursive: bool = False, 
-                        dry_run: bool = False, preserve_originals: bool = True) -> list[tuple[Path, str]]:
+                        dry_run: bool = False, preserve_originals: bool = True,
+                        jobs: int | None = None, quality: str = "default") -> list[tuple[Path, str]]:
     """
     Safely fix malformed PDFs in batch with safety checks.
     
@@ -433,9 +373,11 @@ def safe_batch_fix_pdfs(folder_path: Path, recursive: bool = False,
         recursive: Process subdirectories
         dry_run: Only report what would be done
         preserve_originals: Keep original files
+        jobs: Worker processes for detection and concurrent Ghostscript repairs (None or 0 = one per CPU)
+        quality: Ghostscript quality setting
         
     Returns:
-        List of (file_path, result_message) tuples
+        List of (file_path, result_message) tuples, in the order the files were found
     """
     if not check_ghostscript_availability():
         raise GhostscriptError("Ghostscript not available for batch processing")
@@ -451,13 +393,15 @@ def safe_batch_fix_pdfs(folder_path: Path, recursive: bool = False,
     
     console.print(f"[blue]Found {len(pdf_files)} PDF files[/blue]")
     
-    results = []
     malformed_files = []
     
-    # First pass: detect malformed files
+    # First pass: detect malformed files (on a process pool for large folders, stored verdicts reused)
+    from pdf_manipulator.core.malformation_utils import check_pdf_malformations
+    
     console.print("[blue]Scanning for malformed PDFs...[/blue]")
+    verdicts = check_pdf_malformations(pdf_files, jobs=jobs)
     for pdf_file in pdf_files:
-        is_malformed, description = detect_malformed_pdf(pdf_file)
+        is_malformed, description = verdicts[pdf_file]
         if is_malformed:
             malformed_files.append((pdf_file, description))
             console.print(f"[yellow]📄 {pdf_file.name}: {description}[/yellow]")
@@ -491,42 +435,79 @@ def safe_batch_fix_pdfs(folder_path: Path, recursive: bool = False,
         console.print("[yellow]Operation cancelled[/yellow]")
         return []
     
-    # Process malformed files
-    for pdf_file, description in malformed_files:
-        try:
-            console.print(f"\n[cyan]Processing {pdf_file.name}[/cyan]...")
-            
-            output_path, new_size = fix_malformed_pdf(pdf_file, quality="default")
-            
-            if output_path and output_path.exists():
-                original_size = pdf_file.stat().st_size / (1024 * 1024)
-                
-                # Safety check: warn if file size changed dramatically
-                size_change = abs(new_size - original_size) / original_size * 100
-                if size_change > 20:  # More than 20% change
-                    console.print(f"[yellow]⚠️  Size changed by {size_change:.1f}% - please verify result[/yellow]")
-                
-                if not preserve_originals:
-                    # Replace original with fixed version
-                    backup_path = pdf_file.with_suffix('.pdf.backup')
-                    pdf_file.rename(backup_path)  # Backup original
-                    output_path.rename(pdf_file)  # Move fixed to original location
-                    console.print(f"[green]✓ Replaced original (backup: {backup_path.name})[/green]")
-                    results.append((pdf_file, f"Fixed and replaced (was {description})"))
-                else:
-                    console.print(f"[green]✓ Fixed: {output_path.name}[/green]")
-                    results.append((pdf_file, f"Fixed as {output_path.name} ({description})"))
-            else:
-                results.append((pdf_file, f"Failed to fix: {description}"))
-                
-        except GhostscriptError as e:
-            console.print(f"[red]Failed to fix {pdf_file.name}: {e}[/red]")
-            results.append((pdf_file, f"Error: {e}"))
-        except Exception as e:
-            console.print(f"[red]Unexpected error with {pdf_file.name}: {e}[/red]")
-            results.append((pdf_file, f"Unexpected error: {e}"))
+    # Process malformed files - several Ghostscript jobs at once
+    from rich.progress import Progress, BarColumn, MofNCompleteColumn, TimeElapsedColumn
+    from pdf_manipulator.core.gs_scheduler import run_repair_jobs
+    
+    messages = {}
+    started = time.monotonic()
+    with Progress("[progress.description]{task.description}", BarColumn(), MofNCompleteColumn(),
+                  TimeElapsedColumn(), console=console) as progress:
+        task = progress.add_task("Fixing PDFs", total=len(malformed_files))
+        for job in run_repair_jobs(malformed_files, jobs=jobs, quality=quality):
+            messages[job.pdf_path] = _finish_repair_job(job, preserve_originals, progress.console)
+            progress.advance(task)
+    
+    _print_repair_summary(messages, time.monotonic() - started)
+    return [(pdf_file, messages[pdf_file]) for pdf_file, _ in malformed_files]
+
+
+def _print_job_output(job, out: Console):
+    """Show what a failed job printed in its worker process (Ghostscript errors etc.), dimmed."""
+    output = job.output.strip()
+    if output:
+        out.print(output, style="dim", markup=False, highlight=False)
+
+
+def _finish_repair_job(job, preserve_originals: bool, out: Console) -> str:
+    """Report one finished repair job and replace the original if asked; returns the result message."""
+    pdf_file, description = job.pdf_path, job.description
+    retried = f" after {job.attempts} attempts" if job.attempts > 1 else ""
+    
+    if job.error:
+        out.print(f"[red]Failed to fix {pdf_file.name}{retried}: {job.error}[/red]")
+        _print_job_output(job, out)
+        return f"Error: {job.error}"
+    
+    if not (job.output_path and job.output_path.exists()):
+        out.print(f"[red]Failed to fix {pdf_file.name}[/red]")
+        _print_job_output(job, out)
+        return f"Failed to fix: {description}"
+    
+    try:
+        original_size = pdf_file.stat().st_size / (1024 * 1024)
+        
+        # Safety check: warn if file size changed dramatically
+        if original_size > 0:
+            size_change = abs(job.new_size_mb - original_size) / original_size * 100
+            if size_change > 20:  # More than 20% change
+                out.print(f"[yellow]⚠️  {pdf_file.name}: size changed by {size_change:.1f}% - please verify result[/yellow]")
+        
+        if not preserve_originals:
+            # Replace original with fixed version
+            backup_path = pdf_file.with_suffix('.pdf.backup')
+            pdf_file.rename(backup_path)  # Backup original
+            job.output_path.rename(pdf_file)  # Move fixed to original location
+            out.print(f"[green]✓ {pdf_file.name}: replaced original (backup: {backup_path.name}) "
+                      f"in {job.elapsed:.1f}s{retried}[/green]")
+            return f"Fixed and replaced (was {description})"
+        
+        out.print(f"[green]✓ Fixed: {job.output_path.name} in {job.elapsed:.1f}s{retried}[/green]")
+        return f"Fixed as {job.output_path.name} ({description})"
     
-    return results
+    except Exception as e:
+        out.print(f"[red]Unexpected error with {pdf_file.name}: {e}[/red]")
+        return f"Unexpected error: {e}"
+
+
+def _print_repair_summary(messages: dict, elapsed: float):
+    """Print counts of fixed and failed files of a batch repair."""
+    failed = sum(1 for message in messages.values() if not message.startswith("Fixed"))
+    fixed = len(messages) - failed
+    
+    console.print(f"\n[blue]Repaired {fixed} of {len(messages)} PDFs in {elapsed:.1f}s[/blue]")
+    if failed:
+        console.print(f"[red]{failed} failed[/red]")
 
 
 # Quality settings explanation
@@ -562,53 +543,22 @@ def _get_unique_output_path(input_path: Path) -> Path:
         counter += 1
 
 
-def _get_file_hash(file_path: Path, chunk_size: int = 8192) -> str:
+def _get_file_hash(file_path: Path) -> str:
     """Get SHA256 hash of file with error handling."""
     try:
-        hash_sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
-    except (OSError, PermissionError):
+        return file_digest(file_path)
+    except (OSError, PermissionError, ValueError):
         return ""
 
 
 def _get_content_hash(file_path: Path) -> str:
     """Get hash of PDF content without metadata."""
-    from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
-    
     try:
-        from pypdf import PdfReader
-        
-        with suppress_pdf_warnings():
-            reader = PdfReader(file_path)
-            content_parts = []
-            
-            # Hash just the page content streams (not metadata)
-            for i, page in enumerate(reader.pages):
-                try:
-                    # Get page content
-                    if hasattr(page, 'get_contents'):
-                        content = page.get_contents()
-                        if content:
-                            content_parts.append(content.get_data())
-                    
-                    # Also include page dimensions for structural comparison
-                    if hasattr(page, 'mediabox'):
-                        media_box = str(page.mediabox).encode('utf-8')
-                        content_parts.append(media_box)
-                        
-                except Exception:
-                    # If we can't extract content from a page, use page number as fallback
-                    content_parts.append(f"page_{i}".encode('utf-8'))
-            
-            # Combine all page contents and hash
-            combined_content = b''.join(content_parts)
-            return hashlib.sha256(combined_content).hexdigest()
-        
-    except Exception as e:
-        console.print(f"[dim]Content hash failed ({e}), using file hash[/dim]")
-        # Fallback to file hash if content extraction fails
-        return _get_file_hash(file_path)
+        fingerprint = content_fingerprint(file_path)
+    except OSError:
+        return ""
+    
+    if fingerprint.from_file_bytes:
+        console.print("[dim]Content hash failed, using file hash[/dim]")
+    return fingerprint.digest
 
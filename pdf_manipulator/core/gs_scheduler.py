@@ -0,0 +1,158 @@
+"""
+Parallel Ghostscript Repair Scheduler
+File: pdf_manipulator/core/gs_scheduler.py
+
+Runs the Ghostscript repairs of `--gs-batch-fix` as concurrent jobs. Each
+`gs` process is single-threaded, so a quarantine folder only uses the
+machine when several run at once.
+
+How jobs are run:
+- Each job runs fix_malformed_pdf() in a worker process (the content hash
+  of the repaired file is pypdf work, so threads would serialize on it).
+  Worker console output is captured and returned with the result.
+- The Ghostscript timeout of a job scales with the size of its input.
+- Transient failures (timeouts, gs could not be started) are retried with
+  exponential backoff; a retry after a timeout gets twice the time.
+- Results are yielded as jobs finish, so the caller can show progress;
+  replacing originals and the summary happen in the parent.
+"""
+
+import io
+import os
+import time
+import signal
+
+from dataclasses import dataclass
+from pathlib import Path
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator
+
+from pdf_manipulator.core.ghostscript import GhostscriptError, GhostscriptTransientError, fix_malformed_pdf
+
+
+BASE_TIMEOUT = 60               # Seconds for any file, however small
+TIMEOUT_SECONDS_PER_MB = 6      # Plus this much per MB of input
+MAX_TIMEOUT = 3600
+DEFAULT_RETRIES = 2
+RETRY_BACKOFF = 2.0             # Seconds before the first retry, doubled per retry
+
+
+@dataclass
+class RepairJobResult:
+    """Outcome of repairing one PDF of a batch."""
+    pdf_path: Path
+    description: str                            # Detected malformation
+    output_path: Path | None = None
+    new_size_mb: float = 0.0
+    attempts: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+    output: str = ""                            # Console output captured in a worker process
+
+
+def job_timeout(pdf_path: Path) -> int:
+    """Ghostscript timeout for a file, scaled by its size."""
+    try:
+        size_mb = pdf_path.stat().st_size / (1024 * 1024)
+    except OSError:
+        size_mb = 0
+    return min(MAX_TIMEOUT, int(BASE_TIMEOUT + size_mb * TIMEOUT_SECONDS_PER_MB))
+
+
+def run_repair_job(pdf_path: Path, description: str, quality: str = "default",
+                    retries: int = DEFAULT_RETRIES, backoff: float = RETRY_BACKOFF) -> RepairJobResult:
+    """
+    Repair one PDF, retrying transient Ghostscript failures.
+
+    Args:
+        pdf_path: PDF to repair
+        description: Detected malformation (carried into the result)
+        quality: Ghostscript quality setting
+        retries: Retries after a transient failure
+        backoff: Seconds before the first retry, doubled for each further retry
+
+    Returns:
+        RepairJobResult (error is set if the repair failed)
+    """
+    result = RepairJobResult(pdf_path=pdf_path, description=description)
+    timeout = job_timeout(pdf_path)
+    started = time.monotonic()
+
+    while True:
+        result.attempts += 1
+        try:
+            result.output_path, result.new_size_mb = fix_malformed_pdf(pdf_path, quality=quality, timeout=timeout)
+            break
+        except GhostscriptTransientError as e:
+            if result.attempts > retries:
+                result.error = str(e)
+                break
+            time.sleep(backoff * 2 ** (result.attempts - 1))
+            timeout = min(MAX_TIMEOUT, timeout * 2)
+        except GhostscriptError as e:
+            result.error = str(e)
+            break
+        except Exception as e:
+            # One broken PDF must not take down a batch of thousands
+            result.error = str(e) or type(e).__name__
+            break
+
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+def _init_worker():
+    # Ctrl+C is handled by the parent, which shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _repair_in_worker(task: tuple[Path, str, str, int, float]) -> RepairJobResult:
+    """Run one repair job inside a worker process, capturing its console output."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        result = run_repair_job(*task)
+    result.output = buffer.getvalue()
+    return result
+
+
+def run_repair_jobs(malformed_files: list[tuple[Path, str]], jobs: int | None = None,
+                    quality: str = "default", retries: int = DEFAULT_RETRIES,
+                    backoff: float = RETRY_BACKOFF) -> Iterator[RepairJobResult]:
+    """
+    Repair PDFs with up to `jobs` Ghostscript processes at once.
+
+    Args:
+        malformed_files: List of (path, description) tuples
+        jobs: Concurrent jobs (None or 0 = one per CPU, 1 = in this process)
+        quality: Ghostscript quality setting
+        retries: Retries after a transient failure
+        backoff: Seconds before the first retry, doubled for each further retry
+
+    Yields:
+        RepairJobResult per PDF, in completion order
+    """
+    tasks = [(pdf_path, description, quality, retries, backoff) for pdf_path, description in malformed_files]
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+
+    if workers <= 1:
+        for task in tasks:
+            yield run_repair_job(*task)
+        return
+
+    # Big files first, so the longest jobs don't start last and leave the pool idle
+    tasks.sort(key=lambda task: job_timeout(task[0]), reverse=True)
+
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    try:
+        futures = [executor.submit(_repair_in_worker, task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown(wait=True)
+
+
+# End of file #
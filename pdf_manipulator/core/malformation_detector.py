@@ -0,0 +1,201 @@
+"""
+Single-Open Malformation Detection
+File: pdf_manipulator/core/malformation_detector.py
+
+Decides whether a PDF has problems Ghostscript can fix, opening the file
+once: one PdfReader is parsed while pypdf warnings are captured (structural
+corruption - wrong pointing objects, piles of structure warnings), and the
+same reader's sampled pages are checked for resource duplication (a page
+referencing images for half the document or more).
+
+Which pages are sampled is configurable (--malformation-sample/-sampling):
+- 'first' / 'last': the first or last N pages
+- 'random': N random pages, seeded by the document's page count and size so
+  a verdict is reproducible for the same content
+- 'stratified' (default): N pages spread evenly over the document, always
+  including the first and last page, so corruption in late pages is caught
+
+Verdicts are keyed by malformation_revision(), which covers the detection
+rules and the sampling settings - stored verdicts (folder manifests, the
+analysis store) made with other settings are never served.
+"""
+
+import random
+
+from pypdf import PdfReader
+from pathlib import Path
+
+from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
+
+
+SAMPLING_STRATEGIES = ('first', 'last', 'random', 'stratified')
+DEFAULT_SAMPLE_SIZE = 3
+DEFAULT_SAMPLING = 'stratified'
+
+# Bump when the detection rules change
+DETECTION_REVISION = 1
+
+RESOURCE_DUPLICATION_RATIO = 0.5    # Images on one page vs. total pages
+MAX_STRUCTURE_WARNINGS = 5
+
+
+#################################################################################################
+# Detection settings
+
+_sample_size = DEFAULT_SAMPLE_SIZE
+_sampling = DEFAULT_SAMPLING
+
+
+def configure_malformation_detection(sample_size: int = DEFAULT_SAMPLE_SIZE, sampling: str = DEFAULT_SAMPLING):
+    """
+    Configure which pages malformation detection samples.
+
+    Args:
+        sample_size: Pages checked per document
+        sampling: One of SAMPLING_STRATEGIES
+    """
+    global _sample_size, _sampling
+
+    if sample_size < 1:
+        raise ValueError("sample_size must be at least 1")
+    if sampling not in SAMPLING_STRATEGIES:
+        raise ValueError(f"sampling must be one of: {', '.join(SAMPLING_STRATEGIES)}")
+
+    _sample_size = sample_size
+    _sampling = sampling
+
+
+def get_malformation_detection() -> tuple[int, str]:
+    """Current (sample_size, sampling) settings."""
+    return _sample_size, _sampling
+
+
+def malformation_revision() -> str:
+    """Key for verdicts made with the current rules and sampling settings."""
+    return f"m{DETECTION_REVISION}-{_sampling}-{_sample_size}"
+
+
+#################################################################################################
+# Detection
+
+def sample_page_indices(total_pages: int, sample_size: int = DEFAULT_SAMPLE_SIZE,
+                        sampling: str = DEFAULT_SAMPLING, seed=None) -> list[int]:
+    """
+    Zero-based indices of the pages to check, in page order.
+
+    Args:
+        total_pages: Pages in the document
+        sample_size: Pages to pick (all of them for shorter documents)
+        sampling: One of SAMPLING_STRATEGIES
+        seed: Seed for 'random' sampling (default: the page count)
+    """
+    count = min(sample_size, total_pages)
+    if count <= 0:
+        return []
+
+    if sampling == 'first':
+        return list(range(count))
+    if sampling == 'last':
+        return list(range(total_pages - count, total_pages))
+    if sampling == 'random':
+        rng = random.Random(total_pages if seed is None else seed)
+        return sorted(rng.sample(range(total_pages), count))
+    if sampling == 'stratified':
+        if count == 1:
+            return [0]
+        return [round(i * (total_pages - 1) / (count - 1)) for i in range(count)]
+
+    raise ValueError(f"Unknown sampling strategy: {sampling}")
+
+
+def _structural_issue(warning_filter) -> str | None:
+    """Description of the structural corruption the captured warnings show, if any."""
+    if not warning_filter or warning_filter.suppressed_count == 0:
+        return None
+
+    # Check for "wrong pointing object" specifically
+    wrong_objects = warning_filter.suppressed_types.get("wrong pointing object", 0)
+    if wrong_objects > 0:
+        return f"Structural corruption: {wrong_objects} invalid object references"
+
+    ignoring_count = warning_filter.suppressed_types.get("Ignoring wrong pointing object", 0)
+    if ignoring_count > 0:
+        return f"Structural corruption: {ignoring_count} invalid object references"
+
+    # Many warnings indicate structural problems too
+    if warning_filter.suppressed_count > MAX_STRUCTURE_WARNINGS:
+        return f"Multiple PDF structure warnings detected ({warning_filter.suppressed_count} warnings)"
+
+    return None
+
+
+def _resource_duplication(pages, total_pages: int) -> str | None:
+    """Description of image resource duplication on the sampled pages, if any."""
+    for page in pages:
+        if '/XObject' in page.get('/Resources', {}):
+            xobjects = page['/Resources']['/XObject'].get_object()
+            image_count = sum(1 for x in xobjects if xobjects[x].get('/Subtype') == '/Image')
+
+            # A page referencing images for half the document or more is likely malformed
+            if image_count >= total_pages * RESOURCE_DUPLICATION_RATIO:
+                return f"Resource duplication: {image_count} images per page"
+    return None
+
+
+def inspect_pdf(pdf_path: Path, sample_size: int | None = None,
+                sampling: str | None = None) -> tuple[str | None, str | None, str | None]:
+    """
+    Open a PDF once and check its sampled pages.
+
+    Args:
+        pdf_path: PDF to check
+        sample_size, sampling: Override the configured settings
+
+    Returns:
+        Tuple of (structural issue, resource duplication, analysis error) - each None if not found
+    """
+    sample_size = sample_size or _sample_size
+    sampling = sampling or _sampling
+
+    structural = None
+    try:
+        with suppress_pdf_warnings() as warning_filter:
+            reader = PdfReader(pdf_path)
+            total_pages = len(reader.pages)
+            seed = f"{total_pages}:{Path(pdf_path).stat().st_size}"
+            pages = [reader.pages[i] for i in sample_page_indices(total_pages, sample_size, sampling, seed)]
+
+            # Reading the content streams triggers the warnings of broken object references
+            for page in pages:
+                try:
+                    page.get_contents()
+                except Exception:
+                    pass
+
+            structural = _structural_issue(warning_filter)
+            return structural, _resource_duplication(pages, total_pages), None
+
+    except Exception as e:
+        return structural, None, str(e)
+
+
+def detect_malformation(pdf_path: Path, sample_size: int | None = None,
+                        sampling: str | None = None) -> tuple[bool, str]:
+    """
+    Detect if a PDF has issues that Ghostscript can fix.
+
+    Returns:
+        Tuple of (is_malformed, description)
+    """
+    structural, duplication, error = inspect_pdf(pdf_path, sample_size, sampling)
+
+    issues = [issue for issue in (structural, duplication) if issue]
+    if error and not issues:
+        issues.append(f"Could not analyze PDF: {error}")
+
+    if issues:
+        return True, "; ".join(issues)
+    return False, "No issues detected"
+
+
+# End of file #
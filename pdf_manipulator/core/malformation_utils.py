@@ -6,14 +6,24 @@ This module provides reusable malformation handling for all operations
 while preserving the carefully debugged idempotent file creation logic.
 """
 
+import os
 import sys
 
 from typing import Optional, Any
 from pathlib import Path
 from rich.console import Console
 from rich.prompt import Confirm
+from concurrent.futures import ProcessPoolExecutor
 
 from pdf_manipulator.core.scanner import get_pdf_info
+from pdf_manipulator.core.cache.folder_manifest import get_folder_manifests
+from pdf_manipulator.core.cache.analysis_store import get_analysis_store
+from pdf_manipulator.core.cache.text_cache import get_document_key
+from pdf_manipulator.core.malformation_detector import (
+    configure_malformation_detection,
+    get_malformation_detection,
+    malformation_revision,
+)
 
 
 console = Console()
@@ -22,9 +32,17 @@ console = Console()
 #################################################################################################
 # Core Detection Functions
 
+PARALLEL_DETECT_THRESHOLD = 32  # Fewer files than this aren't worth starting a pool for
+DETECT_CHUNK_SIZE = 16          # Files per worker task
+
+
 def check_pdf_malformation(pdf_path: Path) -> tuple[bool, str]:
     """
-    Pure malformation detection with no side effects.
+    Pure malformation detection with no side effects on the PDF.
+
+    Verdicts for files from a folder scan are kept in the folder manifest,
+    and verdicts for any file in the analysis store by content hash, so an
+    unchanged document is only ever analyzed once.
     
     Args:
         pdf_path: Path to PDF file to check
@@ -32,13 +50,102 @@ def check_pdf_malformation(pdf_path: Path) -> tuple[bool, str]:
     Returns:
         Tuple of (is_malformed, description)
     """
-    try:
-        from pdf_manipulator.core.ghostscript import detect_malformed_pdf
-        return detect_malformed_pdf(pdf_path)
-    except ImportError:
-        return False, "Ghostscript integration not available"
-    except Exception as e:
-        return False, f"Could not analyze PDF: {e}"
+    return check_pdf_malformations([pdf_path], jobs=1)[pdf_path]
+
+
+def check_pdf_malformations(pdf_paths: list, jobs: int | None = None) -> dict[Path, tuple[bool, str]]:
+    """
+    Malformation verdicts for many PDFs.
+
+    Stored verdicts are used first (folder manifest, then the analysis store
+    by content hash); the remaining files are checked serially or on a
+    process pool, and their verdicts stored.
+
+    Args:
+        pdf_paths: Paths, or (path, page_count, size_mb) tuples from a scan
+        jobs: Worker processes (None = one per CPU for large batches, 0 = one per CPU, 1 = serial)
+
+    Returns:
+        Dict of path -> (is_malformed, description)
+    """
+    pdf_paths = [entry[0] if isinstance(entry, tuple) else entry for entry in pdf_paths]
+    revision = malformation_revision()
+    manifests = get_folder_manifests()
+    store = get_analysis_store()
+
+    verdicts = {}
+    pending = []
+    for pdf_path in pdf_paths:
+        verdict = manifests.get_malformation(pdf_path, revision) if manifests is not None else None
+        if verdict is not None:
+            verdicts[pdf_path] = verdict
+        else:
+            pending.append(pdf_path)
+
+    doc_keys = {}
+    from_store = {}
+    if store is not None and pending:
+        for pdf_path in pending:
+            try:
+                doc_keys[pdf_path] = get_document_key(pdf_path)
+            except OSError:
+                pass
+        stored = store.get_malformations(doc_keys.values(), revision)
+        from_store = {pdf_path: stored[doc_key] for pdf_path, doc_key in doc_keys.items() if doc_key in stored}
+        verdicts.update(from_store)
+
+    # Failed checks are reported but not stored
+    detected = {}
+    for pdf_path, verdict, analyzed in _iter_detections([p for p in pending if p not in verdicts], jobs):
+        verdicts[pdf_path] = verdict
+        if analyzed:
+            detected[pdf_path] = verdict
+
+    if store is not None:
+        store.store_malformations({doc_keys[pdf_path]: verdict for pdf_path, verdict in detected.items()
+                                    if pdf_path in doc_keys}, revision)
+    if manifests is not None:
+        for pdf_path, verdict in {**from_store, **detected}.items():
+            manifests.set_malformation(pdf_path, verdict, revision)
+
+    return verdicts
+
+
+def _detect_chunk(pdf_paths: list[Path], settings: tuple[int, str] | None = None) -> list[tuple[Path, tuple, bool]]:
+    """Worker task: (path, verdict, analyzed) per file - analyzed is False if detection failed."""
+    if settings is not None:
+        configure_malformation_detection(*settings)
+
+    results = []
+    for pdf_path in pdf_paths:
+        try:
+            from pdf_manipulator.core.ghostscript import detect_malformed_pdf
+            results.append((pdf_path, detect_malformed_pdf(pdf_path), True))
+        except ImportError:
+            results.append((pdf_path, (False, "Ghostscript integration not available"), False))
+        except Exception as e:
+            results.append((pdf_path, (False, f"Could not analyze PDF: {e}"), False))
+    return results
+
+
+def _iter_detections(pdf_paths: list[Path], jobs: int | None = None):
+    """_detect_chunk results for every file, serially or on a process pool (completion order)."""
+    if jobs is None:
+        jobs = 0 if len(pdf_paths) >= PARALLEL_DETECT_THRESHOLD else 1
+    workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+
+    chunks = [pdf_paths[i:i + DETECT_CHUNK_SIZE] for i in range(0, len(pdf_paths), DETECT_CHUNK_SIZE)]
+
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield from _detect_chunk(chunk)
+        return
+
+    # Workers get the sampling settings explicitly - they may not inherit this process's state
+    settings = get_malformation_detection()
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        for results in executor.map(_detect_chunk, chunks, [settings] * len(chunks)):
+            yield from results
 
 
 def check_ghostscript_available() -> bool:
@@ -256,14 +363,23 @@ def check_and_fix_malformation_early(pdf_files: list, args) -> list:
 #################################################################################################
 # Batch Processing Functions
 
+def _save_manifests():
+    """Persist malformation verdicts collected during a batch check."""
+    manifests = get_folder_manifests()
+    if manifests is not None:
+        manifests.flush()
+
+
 def check_and_fix_malformation_batch(pdf_files: list[tuple[Path, int, float]], 
-                                    operation_context: str = "operation") -> list[tuple[Path, int, float]]:
+                                    operation_context: str = "operation",
+                                    jobs: int | None = None) -> list[tuple[Path, int, float]]:
     """
     Check for malformed PDFs in batch mode - just warn briefly.
     
     Args:
         pdf_files: List of (pdf_path, page_count, file_size) tuples
         operation_context: Context for messaging
+        jobs: Worker processes for detection (see check_pdf_malformations)
         
     Returns:
         Original pdf_files list (unchanged in batch mode)
@@ -272,11 +388,10 @@ def check_and_fix_malformation_batch(pdf_files: list[tuple[Path, int, float]],
         return pdf_files
     
     # Find malformed files
-    malformed_count = 0
-    for pdf_path, page_count, file_size in pdf_files:
-        is_malformed, description = check_pdf_malformation(pdf_path)
-        if is_malformed:
-            malformed_count += 1
+    verdicts = check_pdf_malformations(pdf_files, jobs=jobs)
+    malformed_count = sum(1 for is_malformed, _ in verdicts.values() if is_malformed)
+
+    _save_manifests()
     
     if malformed_count > 0:
         context_messages = {
@@ -397,6 +512,8 @@ def get_malformation_status_summary(pdf_files: list[tuple[Path, int, float]]) ->
             else:
                 malformation_types["other"] = malformation_types.get("other", 0) + 1
     
+    _save_manifests()
+
     return {
         "total_files": total_files,
         "malformed_count": len(malformed_files),
@@ -11,15 +11,38 @@ ARCHITECTURE:
 - Prevents instantiation with clear error message  
 - Matches StageManager pattern from Excel-Recipe-Processor
 - Universal caching that handles ALL parsing parameters
+
+PARSE CACHE:
+- Results are keyed by (document content hash, page count, text extractor
+  ids, expression, filter_matches, filter_mode, group_start, group_end), so
+  a batch never serves one PDF's pages for another, an edited PDF is parsed
+  again, and upgrading pdfplumber/pypdf re-evaluates content patterns
+- Bounded LRU of PARSE_CACHE_SIZE entries, with hit/miss counters
+- Optional persistent layer (cache/parse_store.py) for re-runs over
+  unchanged files
 """
 
+import json
 import argparse
 import hashlib
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass
+from collections import OrderedDict
 from typing import Optional
 
+from pdf_manipulator.core.cache.parse_store import get_parse_store
+
+
+# Results kept in memory (LRU) - a batch only revisits the PDF it is on
+PARSE_CACHE_SIZE = 64
+
+# Bump when parsing or group filtering starts producing different results
+PARSE_CACHE_REVISION = 1
+
+# Expressions that read something besides the document - never stored persistently
+_UNSTORABLE_MARKERS = ('file:', 'dup:')
+
 
 @dataclass(frozen=True)
 class ParsedResults:
@@ -35,6 +58,7 @@ class ParsedResults:
     group_end: Optional[str]
     cache_timestamp: datetime
     cache_key: str
+    filter_mode: Optional[str] = None
     
     def __str__(self):
         return (f"ParsedResults({len(self.selected_pages)} pages, "
@@ -94,11 +118,14 @@ class OperationContext:
     pdfs_processed = 0
     
     # =============================================================================
-    # SIMPLE PARSING RESULTS STORAGE
+    # PARSING RESULTS CACHE
     # =============================================================================
     
-    # Simple results storage - either None or contains the results for this operation
-    parsed_results = None
+    # cache key -> ParsedResults, least recently used first
+    parse_cache: OrderedDict = OrderedDict()
+    parse_cache_hits = 0
+    parse_cache_misses = 0
+    parse_cache_persistent_hits = 0                # Hits served by the persistent store
     
     def __new__(cls, *args, **kwargs):
         """Prevent instantiation - use class methods directly."""
@@ -129,8 +156,11 @@ class OperationContext:
         cls.operation_start_time = None
         cls.pdfs_processed = 0
         
-        # Reset simple results storage
-        cls.parsed_results = None
+        # Reset the results cache
+        cls.parse_cache = OrderedDict()
+        cls.parse_cache_hits = 0
+        cls.parse_cache_misses = 0
+        cls.parse_cache_persistent_hits = 0
     
     # =============================================================================
     # CORE OPERATION CONTEXT METHODS  
@@ -197,11 +227,9 @@ class OperationContext:
         if not isinstance(page_count, int) or page_count <= 0:
             raise ValueError("page_count must be a positive integer")
         
+        # Cached parsing results are keyed by document - nothing to clear when switching PDFs
         cls.current_pdf_path = pdf_path
         cls.current_page_count = page_count
-
-        # CRITICAL: Clear cached parsing results when switching PDFs
-        cls.parsed_results = None
     
     @classmethod
     def get_page_range_arg(cls):
@@ -251,14 +279,86 @@ class OperationContext:
         return cls.args is not None
     
     # =============================================================================
-    # SIMPLE PARSING RESULTS STORAGE
+    # PARSING RESULTS CACHE
     # =============================================================================
     
+    @classmethod
+    def _parse_parameters(cls) -> dict:
+        """The arguments a parse result depends on (besides the document)."""
+        return {
+            'page_range_arg': cls.get_page_range_arg(),
+            'filter_matches': getattr(cls.args, 'filter_matches', None),
+            'filter_mode': getattr(cls.args, 'filter_mode', None) or 'any',
+            'group_start': getattr(cls.args, 'group_start', None),
+            'group_end': getattr(cls.args, 'group_end', None),
+        }
+    
+    @classmethod
+    def _document_key(cls) -> str:
+        """Content hash of the current PDF (its resolved path if it can't be read)."""
+        from pdf_manipulator.core.cache.text_cache import get_document_key
+        
+        try:
+            return get_document_key(cls.current_pdf_path)
+        except OSError:
+            return f"path:{Path(cls.current_pdf_path).resolve()}"
+    
+    @classmethod
+    def parse_cache_key(cls) -> Optional[str]:
+        """
+        Cache key of the current PDF and parsing arguments.
+        
+        Returns:
+            Hex digest, or None without arguments or PDF context
+        """
+        if not cls.args or not cls.current_pdf_path or not cls.current_page_count:
+            return None
+        
+        from pdf_manipulator.core.page_range.page_text import text_pipeline_id
+        
+        # Content patterns match extracted text, so another extractor can select other pages
+        key = [PARSE_CACHE_REVISION, cls._document_key(), cls.current_page_count, text_pipeline_id()]
+        key.extend(cls._parse_parameters().values())
+        return hashlib.sha256(json.dumps(key).encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def _is_storable(cls, parameters: dict) -> bool:
+        """Whether a result can go to the persistent store (depends on the document only)."""
+        text = ' '.join(str(value).lower() for value in parameters.values() if value)
+        return not any(marker in text for marker in _UNSTORABLE_MARKERS)
+    
+    @classmethod
+    def _remember(cls, results: ParsedResults):
+        """Put results in the in-memory cache, evicting the least recently used."""
+        cls.parse_cache[results.cache_key] = results
+        cls.parse_cache.move_to_end(results.cache_key)
+        while len(cls.parse_cache) > PARSE_CACHE_SIZE:
+            cls.parse_cache.popitem(last=False)
+    
+    @classmethod
+    def _make_results(cls, cache_key: str, selected_pages: set[int], range_description: str,
+                        page_groups: list) -> ParsedResults:
+        parameters = cls._parse_parameters()
+        return ParsedResults(
+            pdf_path=cls.current_pdf_path,
+            page_range_arg=parameters['page_range_arg'],
+            selected_pages=selected_pages,
+            range_description=range_description, 
+            page_groups=page_groups,
+            total_page_count=cls.current_page_count,
+            filter_matches=parameters['filter_matches'],
+            group_start=parameters['group_start'],
+            group_end=parameters['group_end'],
+            cache_timestamp=datetime.now(),
+            cache_key=cache_key,
+            filter_mode=parameters['filter_mode'],
+        )
+    
     @classmethod
     def store_parsed_results(cls, selected_pages: set[int], range_description: str, 
                            page_groups: list):
         """
-        Store parsing results for the current operation.
+        Store parsing results for the current PDF and parsing arguments.
         
         Args:
             selected_pages: Set of selected page numbers
@@ -270,40 +370,80 @@ class OperationContext:
         if not cls.args:
             raise RuntimeError("Arguments not set. Call OperationContext.set_args() first.")
         
-        # Create simple results object
-        cls.parsed_results = ParsedResults(
-            pdf_path=cls.current_pdf_path,
-            page_range_arg=cls.get_page_range_arg(),
-            selected_pages=selected_pages,
-            range_description=range_description, 
-            page_groups=page_groups,
-            total_page_count=cls.current_page_count,
-            filter_matches=getattr(cls.args, 'filter_matches', None),
-            group_start=getattr(cls.args, 'group_start', None),
-            group_end=getattr(cls.args, 'group_end', None),
-            cache_timestamp=datetime.now(),
-            cache_key="simple"  # Not used in simple mode
-        )
+        results = cls._make_results(cls.parse_cache_key(), selected_pages, range_description, page_groups)
+        cls._remember(results)
+        
+        store = get_parse_store()
+        if store is not None and cls._is_storable(cls._parse_parameters()):
+            store.put(results.cache_key, {
+                'pages': sorted(selected_pages),
+                'description': range_description,
+                'groups': [[group.pages, group.is_range, group.original_spec,
+                            getattr(group, 'preserve_order', False)] for group in page_groups],
+            })
+    
+    @classmethod
+    def _lookup(cls, record: bool) -> Optional[ParsedResults]:
+        """Find results for the current key in memory, then in the persistent store."""
+        cache_key = cls.parse_cache_key()
+        if cache_key is None:
+            return None
+        
+        results = cls.parse_cache.get(cache_key)
+        if results is not None:
+            cls.parse_cache.move_to_end(cache_key)
+            if record:
+                cls.parse_cache_hits += 1
+            return results
+        
+        store = get_parse_store()
+        stored = store.get(cache_key) if store is not None else None
+        if stored is not None:
+            from pdf_manipulator.core.page_range.page_group import PageGroup
+            
+            groups = [PageGroup(list(pages), is_range, spec, preserve_order)
+                        for pages, is_range, spec, preserve_order in stored['groups']]
+            results = cls._make_results(cache_key, set(stored['pages']), stored['description'], groups)
+            cls._remember(results)
+            if record:
+                cls.parse_cache_hits += 1
+                cls.parse_cache_persistent_hits += 1
+            return results
+        
+        if record:
+            cls.parse_cache_misses += 1
+        return None
     
     @classmethod  
     def get_cached_parsing_results(cls) -> Optional[ParsedResults]:
         """
-        Get parsing results if they exist for current operation.
+        Get parsing results for the current PDF and parsing arguments.
         
         Returns:
             ParsedResults if available, None otherwise
         """
-        return cls.parsed_results
+        return cls._lookup(record=True)
     
     @classmethod
     def has_parsed_results(cls) -> bool:
-        """Check if parsing results are available."""
-        return cls.parsed_results is not None
+        """Check if parsing results are available (does not count as a cache lookup)."""
+        return cls._lookup(record=False) is not None
     
     @classmethod
     def clear_parsed_results(cls):
-        """Clear stored parsing results."""
-        cls.parsed_results = None
+        """Clear the in-memory parsing results (the persistent store is left alone)."""
+        cls.parse_cache.clear()
+    
+    @classmethod
+    def parse_cache_stats(cls) -> dict:
+        """Return in-memory entry count and hit/miss counters of the parsing results cache."""
+        return {
+            'entries': len(cls.parse_cache),
+            'max_entries': PARSE_CACHE_SIZE,
+            'hits': cls.parse_cache_hits,
+            'misses': cls.parse_cache_misses,
+            'persistent_hits': cls.parse_cache_persistent_hits,
+        }
     
     # =============================================================================
     # HELPER METHODS
@@ -380,6 +520,8 @@ class OperationContext:
         print(f"   Template: {cls.template}")
         print(f"   PDFs processed: {cls.pdfs_processed}")
         print(f"   Has parsed results: {cls.has_parsed_results()}")
+        stats = cls.parse_cache_stats()
+        print(f"   Parse cache: {stats['entries']} entries, {stats['hits']} hits, {stats['misses']} misses")
 
 
 # Convenience alias for shorter reference
@@ -11,15 +11,17 @@ Key changes:
 from pathlib import Path
 from rich.console import Console
 
-from pypdf import PdfReader, PdfWriter
+from pypdf import PdfWriter
 
 from pdf_manipulator.core.parser import parse_page_range
+from pdf_manipulator.core.document_session import get_document_session
 from pdf_manipulator.core.file_conflicts import resolve_file_conflicts
 from pdf_manipulator.core.smart_filenames import (
     generate_extraction_filename,
     generate_smart_description
 )
 from pdf_manipulator.core.operation_context import OpCtx, get_cached_parsing_results, get_parsed_pages
+from pdf_manipulator.core.output_writer import MultiOutputWriter, PlannedOutput
 from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
 from pdf_manipulator.ui_enhanced import show_extraction_summary
 
@@ -132,7 +134,7 @@ def extract_pages(*args, **kwargs) -> tuple[Path, float]:
     
     try:
         with suppress_pdf_warnings():
-            reader = PdfReader(pdf_path)
+            reader = get_document_session(pdf_path).reader
             total_pages = len(reader.pages)
         
         # Parse page range with grouping and order preservation
@@ -245,7 +247,7 @@ def extract_pages_grouped(*args, **kwargs) -> list[tuple[Path, float]]:
     
     try:
         with suppress_pdf_warnings():
-            reader = PdfReader(pdf_path)
+            reader = get_document_session(pdf_path).reader
             total_pages = len(reader.pages)
         
         # Parse page range with grouping and order preservation
@@ -272,6 +274,8 @@ def extract_pages_grouped(*args, **kwargs) -> list[tuple[Path, float]]:
             raise ValueError("No groups remaining after deduplication")
         
         output_files = []
+        planned = []
+        group_details = []
         
         for group_idx, group in enumerate(processed_groups):
             # FIXED: Handle both PageGroup objects and raw lists robustly
@@ -307,18 +311,15 @@ def extract_pages_grouped(*args, **kwargs) -> list[tuple[Path, float]]:
             if resolved_output_path is None:
                 continue  # Skip this group (dry run or user chose skip)
             
-            # Create grouped PDF
-            writer = PdfWriter()
-            for page_num in group_pages:
-                if 1 <= page_num <= total_pages:
-                    writer.add_page(reader.pages[page_num - 1])  # Convert to 0-indexed
-            
-            # Write group output file
-            with open(resolved_output_path, 'wb') as output_file:
-                writer.write(output_file)
-            
-            file_size = resolved_output_path.stat().st_size / 1024 / 1024  # MB
-            output_files.append((resolved_output_path, file_size))
+            # Plan grouped PDF - all groups are written in one pass below
+            planned.append(PlannedOutput(resolved_output_path,
+                                         [page_num for page_num in group_pages if 1 <= page_num <= total_pages]))
+            group_details.append((group_idx, group, group_pages))
+        
+        # Write group output files
+        written = MultiOutputWriter(reader).write_all(planned)
+        for (group_idx, group, group_pages), (output, file_size) in zip(group_details, written):
+            output_files.append((output.output_path, file_size))
             
             # Show group extraction info
             preserve_order = hasattr(group, 'preserve_order') and getattr(group, 'preserve_order', False)
@@ -393,7 +394,7 @@ def extract_pages_separate(*args, **kwargs) -> list[tuple[Path, float]]:
     
     try:
         with suppress_pdf_warnings():
-            reader = PdfReader(pdf_path)
+            reader = get_document_session(pdf_path).reader
             total_pages = len(reader.pages)
         
         # Parse page range with grouping and order preservation
@@ -409,6 +410,8 @@ def extract_pages_separate(*args, **kwargs) -> list[tuple[Path, float]]:
             raise ValueError("No pages remaining after deduplication")
         
         output_files = []
+        planned = []
+        planned_pages = []
         
         for page_num in ordered_pages:
             # Generate filename for this page using existing simple logic
@@ -431,19 +434,15 @@ def extract_pages_separate(*args, **kwargs) -> list[tuple[Path, float]]:
                 console.print(f"[cyan]Page {page_num} would create:[/cyan] {output_path.name}")
                 continue
             
-            # Create single-page PDF
-            writer = PdfWriter()
-            if 1 <= page_num <= total_pages:
-                writer.add_page(reader.pages[page_num - 1])  # Convert to 0-indexed
-            
-            # Write output file
-            with open(output_path, 'wb') as output_file:
-                writer.write(output_file)
-            
-            file_size = output_path.stat().st_size / 1024 / 1024  # MB
-            output_files.append((output_path, file_size))
+            # Plan single-page PDF - all pages are written in one pass below
+            planned.append(PlannedOutput(output_path, [page_num] if 1 <= page_num <= total_pages else []))
+            planned_pages.append(page_num)
+        
+        # Write output files
+        for page_num, (output, file_size) in zip(planned_pages, MultiOutputWriter(reader).write_all(planned)):
+            output_files.append((output.output_path, file_size))
             
-            console.print(f"[green]✓ Extracted page {page_num}:[/green] {output_path.name} ({file_size:.2f} MB)")
+            console.print(f"[green]✓ Extracted page {page_num}:[/green] {output.output_path.name} ({file_size:.2f} MB)")
         
         if not dry_run and output_files:
             console.print(f"[green]✓ Created {len(output_files)} separate files[/green]")
@@ -471,7 +470,7 @@ def analyze_pdf(pdf_path: Path) -> dict:
     """
     try:
         with suppress_pdf_warnings():
-            reader = PdfReader(pdf_path)
+            reader = get_document_session(pdf_path).reader
             
         # Basic analysis
         page_count = len(reader.pages)
@@ -560,7 +559,7 @@ def optimize_pdf(pdf_path: Path, quality: str = "default") -> tuple[Path, float]
         output_path = pdf_path.parent / f"{pdf_path.stem}_optimized.pdf"
         
         with suppress_pdf_warnings():
-            reader = PdfReader(pdf_path)
+            reader = get_document_session(pdf_path).reader
             writer = PdfWriter()
             
             # Add all pages to writer
@@ -608,7 +607,7 @@ def split_to_pages(pdf_path: Path, dry_run: bool = False) -> list[tuple[Path, fl
     """
     try:
         with suppress_pdf_warnings():
-            reader = PdfReader(pdf_path)
+            reader = get_document_session(pdf_path).reader
             total_pages = len(reader.pages)
         
         if total_pages <= 1:
@@ -627,23 +626,15 @@ def split_to_pages(pdf_path: Path, dry_run: bool = False) -> list[tuple[Path, fl
         # Actually split the pages
         console.print(f"[blue]Splitting {pdf_path.name} into {total_pages} pages...[/blue]")
         
-        for page_num in range(1, total_pages + 1):
-            # Create output path for this page
-            output_path = pdf_path.parent / f"{pdf_path.stem}_page{page_num:02d}.pdf"
-            
-            # Create single-page PDF
-            writer = PdfWriter()
-            writer.add_page(reader.pages[page_num - 1])  # Convert to 0-indexed
-            
-            # Write output file
-            with open(output_path, 'wb') as output_file:
-                writer.write(output_file)
-            
-            file_size = output_path.stat().st_size / 1024 / 1024  # MB
-            output_files.append((output_path, file_size))
+        # One output path per page, written in one pass
+        planned = [PlannedOutput(pdf_path.parent / f"{pdf_path.stem}_page{page_num:02d}.pdf", [page_num])
+                   for page_num in range(1, total_pages + 1)]
+        
+        for output, file_size in MultiOutputWriter(reader).write_all(planned):
+            output_files.append((output.output_path, file_size))
             
             # Show progress for each page
-            console.print(f"[green]  ✓ Created page {page_num}:[/green] {output_path.name} ({file_size:.2f} MB)")
+            console.print(f"[green]  ✓ Created page {output.page_numbers[0]}:[/green] {output.output_path.name} ({file_size:.2f} MB)")
         
         console.print(f"[green]✓ Split complete: {len(output_files)} files created[/green]")
         return output_files
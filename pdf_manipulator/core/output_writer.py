@@ -0,0 +1,263 @@
+"""
+One-Pass Multi-Output PDF Writer
+File: pdf_manipulator/core/output_writer.py
+
+Writes many output PDFs cut from one source reader - the grouped and
+separate extraction modes and --split-pages, where one document can turn
+into thousands of files.
+
+How outputs are written:
+- All outputs are planned up front (PlannedOutput: path + page numbers) and
+  built from the one shared reader in the calling thread (pypdf readers are
+  not thread-safe).
+- Objects copied from the reader that reference nothing else - fonts, font
+  files, images, ICC profiles - serialize to the same bytes in every output,
+  so they are serialized once and the bytes are reused by later outputs.
+  Only objects that plan() finds in two or more outputs are kept, and each
+  is dropped after the last output using it, so a split of unique pages
+  keeps nothing in memory. This hooks into PdfWriter internals; on a pypdf without them (see
+  MEMOIZATION_AVAILABLE) outputs are written with a plain PdfWriter.
+- Serialized files are written to disk on a thread pool. At most
+  max_in_flight_mb of serialized output waits for the pool at once; when the
+  budget is used up, the oldest write is waited for first.
+- Results are yielded in plan order with the size of the written file in MB
+  (the same value stat() reports afterwards), so callers print the same
+  per-output lines as before.
+"""
+
+import io
+
+import pypdf
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+
+DEFAULT_WRITE_THREADS = 4
+DEFAULT_MAX_IN_FLIGHT_MB = 256
+MEMO_MIN_BYTES = 64             # Smaller objects are cheaper to serialize than to look up
+
+# PdfWriter internals _MemoizingWriter overrides or reads - checked, since they aren't public API
+_WRITER_INTERNALS = ('_write_pdf_structure', '_id_translated', '_objects', '_encryption', 'pdf_header')
+MEMO_MIN_PYPDF_MAJOR = 5        # _write_pdf_structure returns (object positions, free objects)
+
+
+@dataclass
+class PlannedOutput:
+    """One output file: its path and the 1-based source pages it holds, in order."""
+    output_path: Path
+    page_numbers: list[int] = field(default_factory=list)
+
+
+def _is_self_contained(obj) -> bool:
+    """True if an object holds no indirect references (a stream's /Length aside)."""
+    if isinstance(obj, IndirectObject):
+        return False
+    if isinstance(obj, DictionaryObject):
+        skip = ('/Length',) if isinstance(obj, StreamObject) else ()
+        return all(_is_self_contained(value) for key, value in obj.items() if key not in skip)
+    if isinstance(obj, ArrayObject):
+        return all(_is_self_contained(value) for value in obj)
+    return True
+
+
+def _reachable_objects(page) -> set[int]:
+    """Numbers of the source objects a page reaches (not following /Parent back up the tree)."""
+    reachable = set()
+    stack = [page]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, IndirectObject):
+            if obj.idnum in reachable:
+                continue
+            reachable.add(obj.idnum)
+            stack.append(obj.get_object())
+        elif isinstance(obj, DictionaryObject):
+            stack.extend(value for key, value in obj.items() if key != '/Parent')
+        elif isinstance(obj, ArrayObject):
+            stack.extend(obj)
+    return reachable
+
+
+def _writer_internals_available() -> bool:
+    """True if this pypdf's PdfWriter has the internals _MemoizingWriter relies on."""
+    try:
+        major = int(pypdf.__version__.split('.')[0])
+    except (AttributeError, ValueError):
+        return False
+    writer = PdfWriter()
+    return major >= MEMO_MIN_PYPDF_MAJOR and all(hasattr(writer, name) for name in _WRITER_INTERNALS)
+
+
+MEMOIZATION_AVAILABLE = _writer_internals_available()
+
+
+class _MemoizingWriter(PdfWriter):
+    """PdfWriter that reuses serialized bytes of shared self-contained objects copied from a reader."""
+
+    def __init__(self, reader: PdfReader, memo: dict, uses: dict):
+        super().__init__()
+        self._source_reader = reader
+        self._memo = memo
+        self._uses = uses
+        self.memo_hits = 0
+
+    def _write_pdf_structure(self, stream) -> tuple[list[int], list[int]]:
+        if self._encryption:
+            return super()._write_pdf_structure(stream)
+
+        translated = self._id_translated.get(id(self._source_reader), {})
+        source_ids = {dst: src for src, dst in translated.items() if isinstance(src, int)}
+
+        object_positions = []
+        free_objects = []
+        header = self.pdf_header
+        stream.write((header.encode() if isinstance(header, str) else header) + b"\n")
+        stream.write(b"%\xE2\xE3\xCF\xD3\n")
+
+        for idnum, obj in enumerate(self._objects, start=1):
+            if obj is None:
+                object_positions.append(-1)
+                free_objects.append(idnum)
+                continue
+
+            object_positions.append(stream.tell())
+            stream.write(f"{idnum} 0 obj\n".encode())
+            stream.write(self._serialized(obj, source_ids.get(idnum)))
+            stream.write(b"\nendobj\n")
+
+        free_objects.append(0)  # add 0 to loop in accordance with specification
+        return object_positions, free_objects
+
+    def _serialized(self, obj, source_id: int | None) -> bytes:
+        """Bytes of one object, from the memo if another output copied it from the reader before."""
+        remaining = self._uses.get(source_id) if source_id is not None else None
+        data = self._memo.get(source_id) if remaining is not None else None
+
+        if data is not None:
+            self.memo_hits += 1
+        else:
+            buffer = io.BytesIO()
+            obj.write_to_stream(buffer)
+            data = buffer.getvalue()
+            if remaining is None:
+                return data
+            if len(data) < MEMO_MIN_BYTES or not _is_self_contained(obj):
+                del self._uses[source_id]      # Not worth keeping - stop tracking it
+                return data
+            self._memo[source_id] = data
+
+        # Drop the bytes after the last output using them
+        if remaining <= 1:
+            del self._uses[source_id]
+            del self._memo[source_id]
+        else:
+            self._uses[source_id] = remaining - 1
+        return data
+
+
+class MultiOutputWriter:
+    """
+    Writes many outputs cut from one reader, sharing serialization work between them.
+
+    Usage:
+        engine = MultiOutputWriter(reader)
+        for output, size_mb in engine.write_all(planned_outputs):
+            console.print(f"{output.output_path.name} ({size_mb:.2f} MB)")
+    """
+
+    def __init__(self, reader: PdfReader, threads: int = DEFAULT_WRITE_THREADS,
+                 max_in_flight_mb: float = DEFAULT_MAX_IN_FLIGHT_MB):
+        self.reader = reader
+        self.threads = max(1, threads)
+        self.max_in_flight_bytes = int(max_in_flight_mb * 1024 * 1024)
+        self._memo = {}             # Source object number -> serialized bytes
+        self._uses = {}             # Source object number -> outputs still to be written that use it
+        self.memo_hits = 0
+        self.memo_peak_bytes = 0
+
+    def plan(self, outputs: list[PlannedOutput]):
+        """
+        Count the outputs each source object is copied into.
+
+        Only objects reached from two or more outputs are memoized; without a
+        plan, serialize() memoizes nothing.
+        """
+        page_objects: dict[int, set[int]] = {}
+        counts = Counter()
+        for output in outputs:
+            referenced = set()
+            for page_num in output.page_numbers:
+                if page_num not in page_objects:
+                    page_objects[page_num] = _reachable_objects(self.reader.pages[page_num - 1])
+                referenced |= page_objects[page_num]
+            counts.update(referenced)
+
+        self._memo.clear()
+        self._uses = {idnum: count for idnum, count in counts.items() if count > 1}
+
+    def serialize(self, output: PlannedOutput) -> bytes:
+        """Build one output from the reader and serialize it."""
+        if MEMOIZATION_AVAILABLE:
+            writer = _MemoizingWriter(self.reader, self._memo, self._uses)
+        else:
+            writer = PdfWriter()
+        for page_num in output.page_numbers:
+            writer.add_page(self.reader.pages[page_num - 1])  # Convert to 0-indexed
+
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        self.memo_hits += getattr(writer, 'memo_hits', 0)
+        self.memo_peak_bytes = max(self.memo_peak_bytes, sum(len(data) for data in self._memo.values()))
+        return buffer.getvalue()
+
+    def write_all(self, outputs: list[PlannedOutput]) -> Iterator[tuple[PlannedOutput, float]]:
+        """
+        Write all planned outputs.
+
+        Yields:
+            (output, file_size_mb) per output, in plan order, once its file is written
+        """
+        self.plan(outputs)
+        pending = deque()
+        in_flight = 0
+
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            for output in outputs:
+                data = self.serialize(output)
+
+                # Wait for the oldest writes while the budget is used up
+                while pending and in_flight + len(data) > self.max_in_flight_bytes:
+                    done_output, size, future = pending.popleft()
+                    future.result()
+                    in_flight -= size
+                    yield done_output, size / 1024 / 1024
+
+                pending.append((output, len(data), executor.submit(_write_file, output.output_path, data)))
+                in_flight += len(data)
+
+                # Report writes that already finished, keeping plan order
+                while pending and pending[0][2].done():
+                    done_output, size, future = pending.popleft()
+                    future.result()
+                    in_flight -= size
+                    yield done_output, size / 1024 / 1024
+
+            while pending:
+                done_output, size, future = pending.popleft()
+                future.result()
+                yield done_output, size / 1024 / 1024
+
+
+def _write_file(output_path: Path, data: bytes):
+    with open(output_path, 'wb') as output_file:
+        output_file.write(data)
+
+
+# End of file #
@@ -1,15 +1,30 @@
 """
 Page content analysis for type detection and size calculation.
 Create: pdf_manipulator/core/page_analysis.py
+
+Results are persisted in the page analysis store (if configured) keyed by page
+fingerprint, so later runs - and edited copies of the document - only analyze
+pages that haven't been seen before.
+
+Analyzers read through the document's shared session (document_session.py):
+the reader, size estimator and in-memory analyses are shared by every
+analyzer opened on the same file during a run.
+
+Stored analyses are read in bulk: one query for the document's known pages
+when an analyzer opens, and one fingerprint lookup per analyze_pages() call
+for the rest.
 """
 
-import tempfile
+import re
 
-from pypdf import PdfReader, PdfWriter
 from pathlib import Path
 from dataclasses import dataclass
 from rich.console import Console
 
+from pdf_manipulator.core.page_size import exact_page_size
+from pdf_manipulator.core.document_session import get_document_session
+from pdf_manipulator.core.cache.analysis_store import ANALYSIS_FIELDS, analysis_revision, get_analysis_store
+from pdf_manipulator.core.cache.text_cache import get_document_key
 from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
 
 
@@ -38,21 +53,61 @@ class PageAnalyzer:
     MIN_TEXT_RATIO = 0.3  # Minimum text/image ratio for 'mixed'
     CONFIDENCE_THRESHOLD = 0.8  # Minimum confidence for classification
     
-    def __init__(self, pdf_path: Path):
+    def __init__(self, pdf_path: Path, exact_sizes: bool = False):
+        """
+        Args:
+            pdf_path: PDF to analyze
+            exact_sizes: Serialize each page (in memory) instead of estimating its size
+        """
         self.pdf_path = pdf_path
+        self.exact_sizes = exact_sizes
         self.reader = None
+        self.size_estimator = None
         self.page_cache: dict[int, PageAnalysis] = {}
+        self.pages_analyzed = 0         # Pages actually analyzed (not served from the store)
+        
+        self._store = None
+        self._doc_key: str | None = None
+        self._revision = analysis_revision(exact_sizes)
+        self._pending: dict[int, tuple[str, dict]] = {}     # page -> (fingerprint, record) to store
+        self._unstored: dict[int, str] = {}                  # page -> fingerprint already looked up, not found
     
     def __enter__(self):
         """Context manager entry."""
-        with suppress_pdf_warnings():
-            self.reader = PdfReader(self.pdf_path)
+        session = get_document_session(self.pdf_path)
+        self.reader = session.reader
+        self.size_estimator = session.size_estimator
+        self.page_cache = session.page_analyses(self.exact_sizes)
+        self._open_store()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
+        if self._store is not None and self._pending:
+            self._store.store(self._doc_key, self._revision, self._pending)
+        self._pending.clear()
+        self._unstored.clear()
+        self._store = None
         self.reader = None
-        self.page_cache.clear()
+        self.size_estimator = None
+        self.page_cache = {}
+    
+    def _open_store(self):
+        """Load every stored analysis of this document into the page cache."""
+        self._store = get_analysis_store()
+        if self._store is None:
+            return
+        
+        try:
+            self._doc_key = get_document_key(self.pdf_path)
+        except OSError:
+            self._store = None
+            return
+        
+        total_pages = len(self.reader.pages)
+        for page_number, record in self._store.get_document(self._doc_key, self._revision).items():
+            if 1 <= page_number <= total_pages and page_number not in self.page_cache:
+                self.page_cache[page_number] = self._from_record(page_number, record)
     
     def analyze_page(self, page_number: int) -> PageAnalysis:
         """
@@ -74,6 +129,17 @@ class PageAnalyzer:
         if page_number < 1 or page_number > len(self.reader.pages):
             raise ValueError(f"Page {page_number} out of range (1-{len(self.reader.pages)})")
         
+        # A page with the same objects may have been analyzed before (in any document)
+        fingerprint = self._unstored.pop(page_number, None)
+        if self._store is not None and fingerprint is None:
+            with suppress_pdf_warnings():
+                fingerprint = self.size_estimator.fingerprint(page_number)
+            record = self._store.get_fingerprints([fingerprint], self._revision).get(fingerprint)
+            if record is not None:
+                self._pending[page_number] = (fingerprint, record)
+                self.page_cache[page_number] = self._from_record(page_number, record)
+                return self.page_cache[page_number]
+        
         page = self.reader.pages[page_number - 1]  # Convert to 0-indexed
         
         # Extract text and count images
@@ -101,36 +167,82 @@ class PageAnalyzer:
         
         # Cache the result
         self.page_cache[page_number] = analysis
+        self.pages_analyzed += 1
+        if fingerprint is not None:
+            self._pending[page_number] = (fingerprint, {field: getattr(analysis, field)
+                                                        for field in ANALYSIS_FIELDS})
         return analysis
     
-    def analyze_all_pages(self) -> list[PageAnalysis]:
-        """Analyze all pages in the PDF."""
+    def analyze_pages(self, page_numbers: list[int]) -> list[PageAnalysis]:
+        """
+        Analyze several pages, looking up their stored analyses together.
+        
+        Args:
+            page_numbers: 1-indexed page numbers
+            
+        Returns:
+            PageAnalysis objects in the order of page_numbers
+        """
         if not self.reader:
             raise RuntimeError("PageAnalyzer must be used as context manager")
         
-        results = []
-        total_pages = len(self.reader.pages)
+        self._load_stored_fingerprints(page_numbers)
+        return [self.analyze_page(page_number) for page_number in page_numbers]
+    
+    def _load_stored_fingerprints(self, page_numbers: list[int]):
+        """Serve pages analyzed before (in any document) with one store lookup for all of them."""
+        if self._store is None:
+            return
         
-        for page_num in range(1, total_pages + 1):
-            analysis = self.analyze_page(page_num)
-            results.append(analysis)
+        total_pages = len(self.reader.pages)
+        fingerprints = {}
+        with suppress_pdf_warnings():
+            for page_number in page_numbers:
+                if (1 <= page_number <= total_pages and page_number not in self.page_cache
+                        and page_number not in self._unstored):
+                    fingerprints[page_number] = self.size_estimator.fingerprint(page_number)
+        if not fingerprints:
+            return
+        
+        records = self._store.get_fingerprints(fingerprints.values(), self._revision)
+        for page_number, fingerprint in fingerprints.items():
+            record = records.get(fingerprint)
+            if record is None:
+                self._unstored[page_number] = fingerprint
+            else:
+                self._pending[page_number] = (fingerprint, record)
+                self.page_cache[page_number] = self._from_record(page_number, record)
+    
+    @staticmethod
+    def _from_record(page_number: int, record: dict) -> PageAnalysis:
+        """Rebuild a PageAnalysis from a stored record."""
+        size_bytes = record['size_bytes']
+        return PageAnalysis(
+            page_number=page_number,
+            page_type=record['page_type'],
+            size_bytes=size_bytes,
+            size_kb=size_bytes / 1024,
+            size_mb=size_bytes / (1024 * 1024),
+            text_length=record['text_length'],
+            image_count=record['image_count'],
+            has_meaningful_text=record['has_meaningful_text'],
+            confidence=record['confidence']
+        )
+    
+    def analyze_all_pages(self) -> list[PageAnalysis]:
+        """Analyze all pages in the PDF."""
+        if not self.reader:
+            raise RuntimeError("PageAnalyzer must be used as context manager")
         
-        return results
+        return self.analyze_pages(list(range(1, len(self.reader.pages) + 1)))
     
     def get_pages_by_type(self, page_type: str) -> list[int]:
         """Get list of page numbers matching the specified type."""
         if not self.reader:
             raise RuntimeError("PageAnalyzer must be used as context manager")
         
-        matching_pages = []
-        total_pages = len(self.reader.pages)
-        
-        for page_num in range(1, total_pages + 1):
-            analysis = self.analyze_page(page_num)
-            if analysis.page_type == page_type:
-                matching_pages.append(page_num)
-        
-        return matching_pages
+        return [analysis.page_number for analysis in self.analyze_all_pages()
+                if analysis.page_type == page_type]
     
     def get_pages_by_size(self, size_condition: str) -> list[int]:
         """
@@ -146,18 +258,10 @@ class PageAnalyzer:
             raise RuntimeError("PageAnalyzer must be used as context manager")
         
         # Parse size condition
-        operator, target_bytes = self._parse_size_condition(size_condition)
-        
-        matching_pages = []
-        total_pages = len(self.reader.pages)
+        operator, target_bytes = parse_size_condition(size_condition)
         
-        for page_num in range(1, total_pages + 1):
-            analysis = self.analyze_page(page_num)
-            
-            if self._compare_size(analysis.size_bytes, operator, target_bytes):
-                matching_pages.append(page_num)
-        
-        return matching_pages
+        return [analysis.page_number for analysis in self.analyze_all_pages()
+                if compare_size(analysis.size_bytes, operator, target_bytes)]
     
     def _extract_page_text(self, page) -> str:
         """Extract text from a page, handling errors gracefully."""
@@ -182,7 +286,10 @@ class PageAnalyzer:
     
     def _calculate_page_size(self, page_number: int) -> int:
         """
-        Calculate the size of a single page by extracting it to a temporary file.
+        Calculate the size of a single page as a one-page PDF.
+        
+        Estimated from the page's object graph (shared resources memoized across
+        pages), or serialized into a counting sink when exact_sizes is set.
         
         Args:
             page_number: 1-indexed page number
@@ -191,22 +298,10 @@ class PageAnalyzer:
             Size in bytes
         """
         try:
-            # Create a temporary PDF with just this page
-            writer = PdfWriter()
-            page = self.reader.pages[page_number - 1]  # Convert to 0-indexed
-            writer.add_page(page)
-            
-            # Write to temporary file to measure size
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                writer.write(tmp_file)
-                tmp_path = Path(tmp_file.name)
-            
-            try:
-                size_bytes = tmp_path.stat().st_size
-                return size_bytes
-            finally:
-                # Clean up temporary file
-                tmp_path.unlink(missing_ok=True)
+            with suppress_pdf_warnings():
+                if self.exact_sizes:
+                    return exact_page_size(self.reader, page_number)
+                return self.size_estimator.estimate(page_number)
                 
         except Exception as e:
             console.print(f"[dim]Warning: Could not calculate size for page {page_number}: {e}[/dim]")
@@ -262,54 +357,62 @@ class PageAnalyzer:
             return 'empty', 0.60
     
     def _parse_size_condition(self, condition: str) -> tuple[str, int]:
-        """
-        Parse size condition into operator and target bytes.
-        
-        Args:
-            condition: e.g., '<500KB', '>1MB', '>=2MB'
-            
-        Returns:
-            Tuple of (operator, target_bytes)
-        """
-        import re
-        
-        # Match operator and value with unit
-        match = re.match(r'([<>=]+)(\d+(?:\.\d+)?)(KB|MB|GB)?', condition.upper())
-        if not match:
-            raise ValueError(f"Invalid size condition: {condition}")
-        
-        operator = match.group(1)
-        value = float(match.group(2))
-        unit = match.group(3) or 'B'
-        
-        # Convert to bytes
-        multipliers = {
-            'B': 1,
-            'KB': 1024,
-            'MB': 1024 * 1024,
-            'GB': 1024 * 1024 * 1024
-        }
-        
-        target_bytes = int(value * multipliers[unit])
-        
-        return operator, target_bytes
+        """Parse size condition into operator and target bytes (see parse_size_condition)."""
+        return parse_size_condition(condition)
     
     def _compare_size(self, actual_bytes: int, operator: str, target_bytes: int) -> bool:
-        """Compare actual size with target using operator."""
-        if operator == '<':
-            return actual_bytes < target_bytes
-        elif operator == '<=':
-            return actual_bytes <= target_bytes
-        elif operator == '>':
-            return actual_bytes > target_bytes
-        elif operator == '>=':
-            return actual_bytes >= target_bytes
-        elif operator == '==' or operator == '=':
-            # Allow some tolerance for exact matches
-            tolerance = max(target_bytes * 0.05, 1024)  # 5% or 1KB
-            return abs(actual_bytes - target_bytes) <= tolerance
-        else:
-            raise ValueError(f"Unsupported operator: {operator}")
+        """Compare actual size with target using operator (see compare_size)."""
+        return compare_size(actual_bytes, operator, target_bytes)
+
+
+def parse_size_condition(condition: str) -> tuple[str, int]:
+    """
+    Parse size condition into operator and target bytes.
+    
+    Args:
+        condition: e.g., '<500KB', '>1MB', '>=2MB'
+        
+    Returns:
+        Tuple of (operator, target_bytes)
+    """
+    # Match operator and value with unit
+    match = re.match(r'([<>=]+)(\d+(?:\.\d+)?)(KB|MB|GB)?', condition.upper())
+    if not match:
+        raise ValueError(f"Invalid size condition: {condition}")
+    
+    operator = match.group(1)
+    value = float(match.group(2))
+    unit = match.group(3) or 'B'
+    
+    # Convert to bytes
+    multipliers = {
+        'B': 1,
+        'KB': 1024,
+        'MB': 1024 * 1024,
+        'GB': 1024 * 1024 * 1024
+    }
+    
+    target_bytes = int(value * multipliers[unit])
+    
+    return operator, target_bytes
+
+
+def compare_size(actual_bytes: int, operator: str, target_bytes: int) -> bool:
+    """Compare actual size with target using operator."""
+    if operator == '<':
+        return actual_bytes < target_bytes
+    elif operator == '<=':
+        return actual_bytes <= target_bytes
+    elif operator == '>':
+        return actual_bytes > target_bytes
+    elif operator == '>=':
+        return actual_bytes >= target_bytes
+    elif operator == '==' or operator == '=':
+        # Allow some tolerance for exact matches
+        tolerance = max(target_bytes * 0.05, 1024)  # 5% or 1KB
+        return abs(actual_bytes - target_bytes) <= tolerance
+    else:
+        raise ValueError(f"Unsupported operator: {operator}")
 
 
 def analyze_pdf_pages(pdf_path: Path) -> list[PageAnalysis]:
@@ -0,0 +1,275 @@
+"""
+Cross-Document Page Fingerprints
+File: pdf_manipulator/core/page_fingerprint.py
+
+A page fingerprint identifies what a page shows, independent of the file it
+is in, so the same statement cover page arriving in a hundred differently
+named (and differently produced) PDFs has one fingerprint:
+
+- the page's content streams, decoded and whitespace-normalized (runs of
+  whitespace outside string literals collapse to one space)
+- its resources (fonts, images, form XObjects...), hashed by content rather
+  than by object number: a reference is replaced by the digest of the object
+  it points to, so renumbered objects still match
+- media box and rotation
+
+page_size.py also fingerprints pages, but its digests include object
+numbers - right for recognizing an edited version of the same file, wrong
+for spotting the same page in another file.
+
+Fingerprints are kept in the page fingerprint index (cache/page_index.py),
+which the dup: page selector asks:
+- dup:seen - pages that occur in a document indexed earlier
+- dup:doc  - pages that repeat an earlier page of the same document
+- dup:any  - either
+
+Without a persistent index (--no-page-index) documents are remembered for
+the current run only. A parallel batch fingerprints its documents in the
+parent before dispatch and hands that run index to every worker, so dup:
+finds the same pages whether workers are forked or spawned.
+"""
+
+import io
+import re
+import hashlib
+
+from pathlib import Path
+
+from pypdf import PdfReader
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+from pdf_manipulator.core.cache.page_index import get_page_index
+from pdf_manipulator.core.cache.text_cache import get_document_key
+
+
+# Bump when the normalization or the hashed parts of a page change
+PAGE_FINGERPRINT_REVISION = 1
+
+DUPLICATE_SCOPES = ('seen', 'doc', 'any')
+
+# Keys that point back up the tree or to other pages - never part of what a page shows
+_EXCLUDED_KEYS = frozenset({'/Parent', '/P', '/StructParents', '/StructParent'})
+
+# A string literal (kept as is) or a run of whitespace (collapsed)
+_CONTENT_TOKENS = re.compile(rb'\((?:\\.|[^\\()])*\)|[\x00\t\n\x0c\r ]+', re.DOTALL)
+
+
+def fingerprint_revision() -> str:
+    """Revision key of fingerprints computed by this code."""
+    return f"p{PAGE_FINGERPRINT_REVISION}"
+
+
+def normalize_content(data: bytes) -> bytes:
+    """Collapse whitespace runs outside string literals to single spaces."""
+    return _CONTENT_TOKENS.sub(lambda m: m.group(0) if m.group(0)[:1] == b'(' else b' ', data).strip()
+
+
+class PageFingerprinter:
+    """
+    Per-document page fingerprinter; shared resources are hashed once.
+
+    Example:
+        fingerprinter = PageFingerprinter(reader)
+        fingerprints = [fingerprinter.fingerprint(n) for n in range(1, len(reader.pages) + 1)]
+    """
+
+    def __init__(self, reader: PdfReader):
+        self.reader = reader
+        self._digests: dict[tuple[int, int], bytes] = {}    # (idnum, generation) -> content digest
+
+    def fingerprint(self, page_number: int) -> str:
+        """
+        Fingerprint of a page.
+
+        Args:
+            page_number: 1-indexed page number
+        """
+        page = self.reader.pages[page_number - 1]
+        digest = hashlib.sha256()
+
+        contents = page.get_contents()
+        digest.update(b'content\x00')
+        if contents is not None:
+            digest.update(normalize_content(contents.get_data()))
+
+        digest.update(b'\x00resources\x00')
+        self._feed(page.get('/Resources'), digest, set())
+
+        digest.update(b'\x00box\x00' + str(list(page.mediabox)).encode('utf-8'))
+        digest.update(b'\x00rotate\x00' + str(page.get('/Rotate', 0)).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _object_digest(self, reference: IndirectObject, active: set) -> bytes:
+        """Digest of the object a reference points to, by content (memoized)."""
+        key = (reference.idnum, reference.generation)
+        cached = self._digests.get(key)
+        if cached is not None:
+            return cached
+        if key in active:
+            return b'cycle'
+
+        digest = hashlib.sha256()
+        active.add(key)
+        try:
+            self._feed(reference.get_object(), digest, active)
+        finally:
+            active.discard(key)
+
+        self._digests[key] = digest.digest()
+        return self._digests[key]
+
+    def _feed(self, obj, digest, active: set):
+        """Feed an object's canonical form into a digest."""
+        if isinstance(obj, IndirectObject):
+            digest.update(b'@' + self._object_digest(obj, active))
+        elif isinstance(obj, DictionaryObject):
+            is_stream = isinstance(obj, StreamObject)
+            digest.update(b'<<')
+            for key in sorted(obj.keys()):
+                if key in _EXCLUDED_KEYS or (is_stream and key == '/Length'):
+                    continue
+                digest.update(key.encode('utf-8') + b' ')
+                self._feed(obj.raw_get(key), digest, active)     # Unresolved, so references are memoized
+            digest.update(b'>>')
+            if is_stream:
+                digest.update(b'stream' + hashlib.sha256(obj._data).digest())
+        elif isinstance(obj, ArrayObject):
+            digest.update(b'[')
+            for item in obj:
+                self._feed(item, digest, active)
+                digest.update(b' ')
+            digest.update(b']')
+        elif obj is not None:
+            buffer = io.BytesIO()
+            obj.write_to_stream(buffer)
+            digest.update(buffer.getvalue() + b' ')
+
+
+#################################################################################################
+# Documents
+
+class _RunIndex:
+    """Stand-in for the persistent index: remembers documents for this run only."""
+
+    def __init__(self):
+        self._documents: dict[tuple[str, str], list[str]] = {}     # In indexing order
+
+    def get_document(self, doc_key: str, revision: str) -> list[str] | None:
+        return self._documents.get((doc_key, revision))
+
+    def add_document(self, doc_key: str, revision: str, fingerprints: list[str]):
+        self._documents.setdefault((doc_key, revision), list(fingerprints))
+
+    def seen_before(self, doc_key: str, revision: str) -> set[int]:
+        earlier = set()
+        for key, fingerprints in self._documents.items():
+            if key == (doc_key, revision):
+                own = fingerprints
+                return {page for page, fingerprint in enumerate(own, start=1) if fingerprint in earlier}
+            if key[1] == revision:
+                earlier.update(fingerprints)
+        return set()
+
+
+_run_index = _RunIndex()
+
+
+def _active_index():
+    index = get_page_index()
+    return index if index is not None else _run_index
+
+
+def run_index_documents() -> dict[tuple[str, str], list[str]] | None:
+    """
+    Documents remembered by this run, for handing to worker processes.
+
+    Returns:
+        Fingerprints by (document key, revision) in indexing order, or None
+        when the persistent index is on (workers open it themselves)
+    """
+    if get_page_index() is not None:
+        return None
+    return dict(_run_index._documents)
+
+
+def seed_run_index(documents: dict[tuple[str, str], list[str]]):
+    """Start this process's run index from another process's documents (see run_index_documents)."""
+    global _run_index
+
+    _run_index = _RunIndex()
+    for (doc_key, revision), fingerprints in documents.items():
+        _run_index.add_document(doc_key, revision, fingerprints)
+
+
+def document_page_fingerprints(pdf_path: Path) -> list[str]:
+    """
+    Page fingerprints of a document, indexing it if it isn't indexed yet.
+
+    Returns:
+        List of fingerprints in page order
+    """
+    from pdf_manipulator.core.document_session import get_document_session
+
+    doc_key = get_document_key(pdf_path)
+    revision = fingerprint_revision()
+    index = _active_index()
+
+    fingerprints = index.get_document(doc_key, revision)
+    if fingerprints is not None:
+        return fingerprints
+
+    reader = get_document_session(pdf_path).reader
+    fingerprinter = PageFingerprinter(reader)
+    fingerprints = []
+    for page_number in range(1, len(reader.pages) + 1):
+        try:
+            fingerprints.append(fingerprinter.fingerprint(page_number))
+        except Exception:
+            # Unreadable pages never match a page of another document
+            fingerprints.append(f"unreadable:{doc_key}:{page_number}")
+
+    index.add_document(doc_key, revision, fingerprints)
+    return fingerprints
+
+
+def register_documents(pdf_paths: list[Path]):
+    """Index documents in the given order, so "earlier" follows it (e.g. a batch's input order)."""
+    for pdf_path in pdf_paths:
+        try:
+            document_page_fingerprints(pdf_path)
+        except Exception:
+            continue    # Unreadable files are reported by the operation itself
+
+
+def duplicate_pages(pdf_path: Path, scope: str = 'seen') -> set[int]:
+    """
+    Pages of a document that duplicate pages seen before.
+
+    Args:
+        pdf_path: Document to check
+        scope: 'seen' (in earlier documents), 'doc' (earlier in the same document) or 'any'
+
+    Returns:
+        Set of 1-indexed page numbers
+    """
+    if scope not in DUPLICATE_SCOPES:
+        raise ValueError(f"dup: scope must be one of: {', '.join(DUPLICATE_SCOPES)}")
+
+    fingerprints = document_page_fingerprints(pdf_path)
+    duplicates = set()
+
+    if scope in ('seen', 'any'):
+        duplicates |= _active_index().seen_before(get_document_key(pdf_path), fingerprint_revision())
+
+    if scope in ('doc', 'any'):
+        first_pages = {}
+        for page_number, fingerprint in enumerate(fingerprints, start=1):
+            if fingerprint in first_pages:
+                duplicates.add(page_number)
+            else:
+                first_pages[fingerprint] = page_number
+
+    return duplicates
+
+
+# End of file #
@@ -11,6 +11,8 @@ Architecture:
 - Boolean precedence: parentheses → NOT → AND → OR
 - Complex expression support: unlimited nesting and chaining
 - Pattern integration: works with pattern matching functions
+- Query planning: expressions compile to an AST that is evaluated cheapest
+  operand first on PageSet bitsets (see query_plan.py)
 """
 
 import re
@@ -19,6 +21,18 @@ from pathlib import Path
 from rich.console import Console
 
 from pdf_manipulator.core.page_range.page_group import PageGroup
+from pdf_manipulator.core.page_range.query_plan import (
+    TermNode,
+    NotNode,
+    AndNode,
+    compile_tokens,
+    iter_terms,
+    order_operands,
+    term_cost,
+)
+from pdf_manipulator.core.page_range.page_set import PageSet
+from pdf_manipulator.core.page_range.page_text import get_page_text_provider, index_candidates
+from pdf_manipulator.core.page_range.text_matcher import TextMatcher, TextPredicate, parse_text_predicate
 
 console = Console()
 
@@ -167,23 +181,50 @@ class UnifiedBooleanSupervisor:
     - Quote-aware parsing: operators inside quotes ignored
     - Pattern integration: seamless work with pattern matching
     - Advanced patterns: handles range patterns within boolean expressions
+    - Numeric terms: "1-10 & contains:'X'", "!last 2 & type:text"
+    - Query planning: cheapest operands first, each operand only examines the
+      pages still in play, empty intersections stop early
     """
     
     def __init__(self, pdf_path: Path, total_pages: int):
         self.pdf_path = pdf_path
         self.total_pages = total_pages
+        
+        # Per-evaluation planner state, keyed by term text
+        self._term_costs: dict[str, int] = {}
+        self._known_pages: dict[str, PageSet] = {}                  # Terms evaluated for every page
+        self._term_results: dict[str, tuple[PageSet, PageSet]] = {}  # (pages examined, pages matched)
+        self._range_terms: set[str] = set()                 # 'A to B' terms
+        
+        # Text predicates are evaluated together: when any contains:/line-starts:/
+        # regex: term needs a page, every text predicate is checked on it in the
+        # same pass, so each page's text is fetched and scanned once per expression
+        self._text_terms: dict[str, tuple[TextPredicate, int]] = {}    # term -> (predicate, offset)
+        self._text_matcher: TextMatcher | None = None
+        self._text_scanned = PageSet()
+        self._predicate_pages: dict[TextPredicate, PageSet] = {}        # predicate -> matching pages
     
-    def evaluate(self, expression: str) -> tuple[list[int], list[PageGroup]]:
+    def evaluate(self, expression: str,
+                    candidate_pages: PageSet | set[int] | None = None) -> tuple[list[int], list[PageGroup]]:
         """
         Evaluate ANY boolean expression (simple or advanced).
         
+        Args:
+            expression: Page selection expression
+            candidate_pages: Only decide these pages (None = the whole document).
+                Pages outside it are never examined and never returned.
+        
         Returns:
             Tuple of (all_pages, page_groups) where groups preserve structure
         """
+        candidates = None
+        if candidate_pages is not None:
+            candidates = PageSet(candidate_pages).clip(self.total_pages)
+        
         # Check if this is a boolean expression at all
         if not looks_like_boolean_expression(expression):
             # Not a boolean expression - delegate to simple pattern parsing
-            pages = self._evaluate_simple_expression(expression)
+            pages = self._evaluate_simple_expression(expression, candidates)
             groups = self._create_consecutive_groups(pages, expression)
             return pages, groups
         
@@ -191,13 +232,18 @@ class UnifiedBooleanSupervisor:
         advanced_patterns = self._extract_advanced_patterns(expression)
         
         if advanced_patterns:
-            # Advanced processing with magazine pattern
-            return self._process_with_magazine_pattern(expression, advanced_patterns)
+            # Advanced processing with magazine pattern (sections span pages - whole document)
+            pages, groups = self._process_with_magazine_pattern(expression, advanced_patterns)
+            if candidates is None:
+                return pages, groups
+            pages = (PageSet(pages) & candidates).to_list()
+            return pages, self._create_boolean_groups(pages, expression)
         else:
             # Simple boolean processing with standard precedence
-            return self._process_simple_boolean(expression)
+            return self._process_simple_boolean(expression, candidates)
     
-    def _process_simple_boolean(self, expression: str) -> tuple[list[int], list[PageGroup]]:
+    def _process_simple_boolean(self, expression: str,
+                                candidates: PageSet | None = None) -> tuple[list[int], list[PageGroup]]:
         """Process simple boolean expressions without advanced range patterns."""
         try:
             # Tokenize the expression with fixed tokenization
@@ -207,7 +253,7 @@ class UnifiedBooleanSupervisor:
             self._validate_parentheses_balance(tokens)
             
             # Evaluate the expression with proper precedence
-            result_pages = self._evaluate_boolean_tokens(tokens)
+            result_pages = self._evaluate_boolean_tokens(tokens, candidates)
             
             # Create groups preserving the boolean structure
             groups = self._create_boolean_groups(result_pages, expression)
@@ -310,171 +356,226 @@ class UnifiedBooleanSupervisor:
         if open_count > 0:
             raise ValueError("Unbalanced parentheses: missing closing parenthesis")
     
-    def _evaluate_boolean_tokens(self, tokens: list[str]) -> list[int]:
+    def _evaluate_boolean_tokens(self, tokens: list[str], candidates: PageSet | None = None) -> list[int]:
         """
         Evaluate boolean tokens with proper precedence.
         
         Precedence order: parentheses → NOT → AND → OR
+        
+        The tokens are compiled to an AST and executed by the planner: every
+        operand is evaluated only for the pages that can still change the
+        result, cheapest operands first.
         """
-        # Make a copy to avoid modifying the original
-        tokens = tokens.copy()
+        node = compile_tokens(tokens)
+        
+        self._term_costs.clear()
+        self._known_pages.clear()
+        self._term_results.clear()
+        self._range_terms.clear()
+        self._text_terms.clear()
+        self._classify_terms(node)
+        self._prepare_text_matcher()
+        
+        if candidates is None:
+            candidates = PageSet.all_pages(self.total_pages)
+        result = self._execute(node, candidates)
+        return result.to_list()
+    
+    def _classify_terms(self, node) -> None:
+        """
+        Estimate the cost of every term; numeric terms are evaluated right away (free).
         
-        # Step 1: Resolve parentheses first (highest precedence)
-        tokens = self._resolve_parentheses(tokens)
+        Every other term is syntax-checked here, so a malformed term is reported
+        even when short-circuiting means it would never be evaluated.
+        """
+        from pdf_manipulator.core.page_range.patterns import (
+            looks_like_range_pattern, split_pattern_offset, validate_pattern_expression)
         
-        # Step 2: Resolve NOT operators (second highest precedence)
-        tokens = self._resolve_not_operators(tokens)
+        for term in iter_terms(node):
+            text = term.text
+            if text in self._term_costs:
+                continue
+            
+            pages = self._evaluate_numeric_term(text)
+            if pages is not None:
+                self._known_pages[text] = PageSet(pages)
+                self._term_costs[text] = term_cost(text, is_numeric=True)
+            else:
+                try:
+                    validate_pattern_expression(text)
+                except ValueError as e:
+                    raise ValueError(f"Failed to evaluate pattern '{text}': {e}")
+                
+                is_range = looks_like_range_pattern(text)
+                if is_range:
+                    self._range_terms.add(text)
+                self._term_costs[text] = term_cost(text, is_range=is_range)
+                
+                if not is_range:
+                    base_expression, offset = split_pattern_offset(text)
+                    predicate = parse_text_predicate(base_expression)
+                    if predicate is not None:
+                        self._text_terms[text] = (predicate, offset)
+    
+    def _prepare_text_matcher(self) -> None:
+        """Compile every text predicate of the expression into one matcher."""
+        predicates = [predicate for predicate, _ in self._text_terms.values()]
         
-        # Step 3: Resolve AND operators (third precedence)
-        tokens = self._resolve_and_operators(tokens)
+        self._text_matcher = TextMatcher(predicates)
+        self._text_scanned = PageSet()
+        self._predicate_pages = {predicate: PageSet() for predicate in predicates}
+    
+    def _execute(self, node, candidates: PageSet) -> PageSet:
+        """
+        Evaluate a plan node for the candidate pages only.
         
-        # Step 4: Resolve OR operators (lowest precedence)
-        tokens = self._resolve_or_operators(tokens)
+        Returns:
+            The candidate pages that satisfy the node
+        """
+        if not candidates:
+            return candidates
         
-        # Should have exactly one result
-        if len(tokens) != 1:
-            raise ValueError(f"Invalid boolean expression: unexpected tokens remaining: {tokens}")
+        if isinstance(node, TermNode):
+            return self._execute_term(node.text, candidates)
         
-        result = tokens[0]
-        if isinstance(result, list):
-            return result
-        else:
-            # Single pattern/token - evaluate it
-            return self._evaluate_single_pattern(result)
-    
-    def _resolve_parentheses(self, tokens: list[str]) -> list[str]:
-        """Resolve parentheses groups recursively."""
-        while '(' in tokens and ')' in tokens:
-            # Find the innermost parentheses group
-            open_pos = -1
-            for i, token in enumerate(tokens):
-                if token == '(':
-                    open_pos = i
-                elif token == ')':
-                    if open_pos == -1:
-                        raise ValueError("Unbalanced parentheses: unexpected closing parenthesis")
-                    
-                    # Extract content between parentheses
-                    sub_tokens = tokens[open_pos + 1:i]
-                    
-                    # Recursively evaluate the sub-expression
-                    sub_result = self._evaluate_boolean_tokens(sub_tokens)
-                    
-                    # Replace the parentheses group with the result
-                    tokens = tokens[:open_pos] + [sub_result] + tokens[i + 1:]
-                    break
-            else:
-                # No closing parenthesis found
-                raise ValueError("Unbalanced parentheses: missing closing parenthesis")
+        if isinstance(node, NotNode):
+            return candidates - self._execute(node.child, candidates)
         
-        return tokens
-    
-    def _resolve_not_operators(self, tokens: list[str]) -> list[str]:
-        """Resolve NOT operators (right-associative)."""
-        # Process NOT operators from right to left
-        i = len(tokens) - 1
-        while i >= 0:
-            if tokens[i] == '!':
-                if i >= len(tokens) - 1:
-                    raise ValueError("NOT operator missing operand")
-                
-                operand = tokens[i + 1]
-                
-                # Evaluate operand if needed
-                if isinstance(operand, list):
-                    operand_pages = operand
-                else:
-                    operand_pages = self._evaluate_single_pattern(operand)
-                
-                # NOT operation: complement against all pages
-                all_pages = set(range(1, self.total_pages + 1))
-                not_result = list(all_pages - set(operand_pages))
-                
-                # Replace NOT operator and operand with result
-                tokens = tokens[:i] + [not_result] + tokens[i + 2:]
-            else:
-                i -= 1
+        operands = order_operands(node, self._term_costs, self._known_pages)
         
-        return tokens
+        if isinstance(node, AndNode):
+            # Each operand narrows the pages the next one has to look at
+            for operand in operands:
+                candidates = self._execute(operand, candidates)
+                if not candidates:
+                    break
+            return candidates
+        
+        # OR: later operands only examine pages nothing has matched yet
+        matched = PageSet()
+        for operand in operands:
+            matched |= self._execute(operand, candidates - matched)
+            if matched == candidates:
+                break
+        return matched
     
-    def _resolve_and_operators(self, tokens: list[str]) -> list[str]:
-        """Resolve AND operators (left-associative)."""
-        while '&' in tokens:
-            and_pos = tokens.index('&')
-            
-            if and_pos == 0 or and_pos >= len(tokens) - 1:
-                raise ValueError("AND operator missing operand")
-            
-            left = tokens[and_pos - 1]
-            right = tokens[and_pos + 1]
-            
-            # Evaluate operands if needed
-            if isinstance(left, list):
-                left_pages = left
-            else:
-                left_pages = self._evaluate_single_pattern(left)
+    def _execute_term(self, text: str, candidates: PageSet) -> PageSet:
+        """Evaluate one term for the candidate pages, never examining a page twice."""
+        known = self._known_pages.get(text)
+        if known is not None:
+            return known & candidates
+        
+        if text in self._text_terms:
+            return self._execute_text_term(text, candidates)
+        
+        examined, matched = self._term_results.get(text, (PageSet(), PageSet()))
+        pending = candidates - examined
+        
+        if pending:
+            all_pages = PageSet.all_pages(self.total_pages)
+            candidate_pages = None if pending == all_pages else pending
             
-            if isinstance(right, list):
-                right_pages = right
-            else:
-                right_pages = self._evaluate_single_pattern(right)
+            found = PageSet(self._evaluate_single_pattern(text, candidate_pages))
             
-            # AND operation: intersection
-            and_result = list(set(left_pages) & set(right_pages))
+            if candidate_pages is None or text in self._range_terms:
+                # Whole document evaluated (range patterns can't be restricted)
+                self._known_pages[text] = found & all_pages
+                return found & candidates
             
-            # Replace the three tokens with result
-            tokens = tokens[:and_pos - 1] + [and_result] + tokens[and_pos + 2:]
+            examined |= pending
+            matched |= found & pending
+            self._term_results[text] = (examined, matched)
         
-        return tokens
+        return matched & candidates
     
-    def _resolve_or_operators(self, tokens: list[str]) -> list[str]:
-        """Resolve OR operators (left-associative)."""
-        while '|' in tokens:
-            or_pos = tokens.index('|')
-            
-            if or_pos == 0 or or_pos >= len(tokens) - 1:
-                raise ValueError("OR operator missing operand")
-            
-            left = tokens[or_pos - 1]
-            right = tokens[or_pos + 1]
-            
-            # Evaluate operands if needed
-            if isinstance(left, list):
-                left_pages = left
-            else:
-                left_pages = self._evaluate_single_pattern(left)
-            
-            if isinstance(right, list):
-                right_pages = right
-            else:
-                right_pages = self._evaluate_single_pattern(right)
-            
-            # OR operation: union (automatically removes duplicates)
-            or_result = list(set(left_pages) | set(right_pages))
-            
-            # Replace the three tokens with result
-            tokens = tokens[:or_pos - 1] + [or_result] + tokens[or_pos + 2:]
+    def _execute_text_term(self, text: str, candidates: PageSet) -> PageSet:
+        """Evaluate a text term via the shared matcher (offsets shift the pages examined)."""
+        predicate, offset = self._text_terms[text]
         
-        return tokens
+        # Result page p comes from base page p - offset
+        base_pages = candidates.shift(-offset).clip(self.total_pages)
+        self._scan_text(base_pages, text)
+        
+        return self._predicate_pages[predicate].shift(offset) & candidates
+    
+    def _scan_text(self, pages: PageSet, term: str) -> None:
+        """Run the shared matcher over the pages it hasn't scanned yet."""
+        pending = pages - self._text_scanned
+        if not pending:
+            return
+        
+        if not self.pdf_path or not Path(self.pdf_path).exists():
+            raise ValueError(f"Failed to evaluate pattern '{term}': PDF file not found: {self.pdf_path}")
+        
+        # On an indexed document, pages no predicate can match aren't even fetched
+        to_scan = pending
+        narrowed = index_candidates(self.pdf_path, self._text_matcher.predicates)
+        if narrowed and all(pages is not None for pages in narrowed.values()):
+            to_scan = pending & PageSet().union(*narrowed.values())
+        
+        page_texts = get_page_text_provider(self.pdf_path, self.total_pages).get_many(to_scan)
+        for predicate, found in self._text_matcher.match_pages(page_texts).items():
+            self._predicate_pages[predicate] |= found
+        self._text_scanned |= pending
     
-    def _evaluate_single_pattern(self, pattern: str) -> list[int]:
-        """Evaluate a single pattern and return matching page numbers."""
-        from pdf_manipulator.core.page_range.patterns import parse_pattern_expression
+    def _evaluate_single_pattern(self, pattern: str, candidate_pages: PageSet | None = None) -> list[int]:
+        """
+        Evaluate a single pattern and return matching page numbers.
+        
+        Args:
+            pattern: Numeric term, pattern or 'A to B' range pattern
+            candidate_pages: Only examine these pages (range patterns always
+                examine the whole document - sections span pages)
+        """
+        from pdf_manipulator.core.page_range.patterns import (
+            parse_pattern_expression,
+            parse_range_pattern,
+            looks_like_range_pattern,
+        )
         
         try:
-            return parse_pattern_expression(pattern, self.pdf_path, self.total_pages)
+            # Numeric terms and keywords are free - no PDF access needed
+            pages = self._evaluate_numeric_term(pattern)
+            if pages is not None:
+                return pages
+            
+            if looks_like_range_pattern(pattern):
+                return parse_range_pattern(pattern, self.pdf_path, self.total_pages)
+            
+            return parse_pattern_expression(pattern, self.pdf_path, self.total_pages,
+                                            candidate_pages=candidate_pages)
         except Exception as e:
             raise ValueError(f"Failed to evaluate pattern '{pattern}': {e}")
     
-    def _evaluate_simple_expression(self, expression: str) -> list[int]:
-        """Evaluate a simple (non-boolean) expression."""
+    def _evaluate_numeric_term(self, term: str) -> list[int] | None:
+        """
+        Evaluate page numbers, ranges and keywords ('5', '3-7', 'last 2', 'odd', 'all').
+        
+        Returns:
+            Sorted page numbers, or None if the term isn't numeric
+        """
+        # Lazy import - the parser imports this module
+        from pdf_manipulator.core.page_range.page_range_parser import PageRangeParser
+        
+        pages = PageRangeParser(self.total_pages).parse_numeric_term(term)
+        if pages is None:
+            return None
+        return pages.to_list()
+    
+    def _evaluate_simple_expression(self, expression: str, candidates: PageSet | None = None) -> list[int]:
+        """Evaluate a simple (non-boolean) expression, optionally for the candidate pages only."""
         # Handle special keywords
         if expression.lower().strip() == 'all':
+            if candidates is not None:
+                return candidates.to_list()
             return list(range(1, self.total_pages + 1))
         
         # Try as a pattern
         try:
-            return self._evaluate_single_pattern(expression)
+            pages = self._evaluate_single_pattern(expression, candidates)
+            if candidates is not None:
+                return (PageSet(pages) & candidates).to_list()
+            return pages
         except Exception:
             # If pattern fails, try as numeric range
             # This would need numeric range parsing logic
@@ -10,6 +10,7 @@ from pathlib import Path
 from rich.console import Console
 
 from pdf_manipulator.core.page_range.page_group import PageGroup
+from pdf_manipulator.core.page_range.page_set import PageSet
 from pdf_manipulator.core.page_range.patterns import parse_pattern_expression
 
 
@@ -52,19 +53,19 @@ def apply_boundary_detection(groups: list[PageGroup],
         return groups
     
     # Find boundary pages using pattern matching
-    start_pages = set()
+    start_pages = PageSet()
     if start_pattern:
         try:
-            start_pages = set(parse_pattern_expression(start_pattern, pdf_path, total_pages))
-            console.print(f"[dim]    Start boundaries at pages: {sorted(start_pages)}[/dim]")
+            start_pages = PageSet(parse_pattern_expression(start_pattern, pdf_path, total_pages))
+            console.print(f"[dim]    Start boundaries at pages: {start_pages.to_list()}[/dim]")
         except ValueError as e:
             raise ValueError(f"Invalid start boundary pattern: {e}")
     
-    end_pages = set()
+    end_pages = PageSet()
     if end_pattern:
         try:
-            end_pages = set(parse_pattern_expression(end_pattern, pdf_path, total_pages))
-            console.print(f"[dim]    End boundaries at pages: {sorted(end_pages)}[/dim]")
+            end_pages = PageSet(parse_pattern_expression(end_pattern, pdf_path, total_pages))
+            console.print(f"[dim]    End boundaries at pages: {end_pages.to_list()}[/dim]")
         except ValueError as e:
             raise ValueError(f"Invalid end boundary pattern: {e}")
     
@@ -79,8 +80,8 @@ def apply_boundary_detection(groups: list[PageGroup],
 
 
 def _split_group_at_boundaries(group: PageGroup, 
-                                start_pages: set[int], 
-                                end_pages: set[int]) -> list[PageGroup]:
+                                start_pages: PageSet, 
+                                end_pages: PageSet) -> list[PageGroup]:
     """
     Split a single group at boundary points.
     
@@ -92,8 +93,8 @@ def _split_group_at_boundaries(group: PageGroup,
     
     Args:
         group: PageGroup to split
-        start_pages: Set of page numbers that start new groups
-        end_pages: Set of page numbers that end groups (inclusive)
+        start_pages: Pages that start new groups
+        end_pages: Pages that end groups (inclusive)
         
     Returns:
         List of new PageGroup objects after splitting
@@ -159,12 +160,10 @@ def _create_boundary_group(pages: list[int], original_spec: str) -> PageGroup:
         return PageGroup(pages, False, f"page{pages[0]}")
     
     # Check if consecutive
-    sorted_pages = sorted(pages)
-    is_consecutive = all(sorted_pages[i] == sorted_pages[i-1] + 1 
-                        for i in range(1, len(sorted_pages)))
+    page_set = PageSet(pages)
     
-    if is_consecutive:
-        spec = f"pages{sorted_pages[0]}-{sorted_pages[-1]}"
+    if len(page_set) == len(pages) and page_set.is_consecutive():
+        spec = f"pages{page_set.first()}-{page_set.last()}"
         return PageGroup(pages, True, spec)
     else:
         spec = f"pages{','.join(map(str, sorted(pages)))}"
@@ -11,6 +11,7 @@ from pathlib import Path
 from rich.console import Console
 
 from pdf_manipulator.core.page_range.page_group import PageGroup
+from pdf_manipulator.core.page_range.page_set import PageSet
 from pdf_manipulator.core.page_range.boolean import UnifiedBooleanSupervisor
 
 
@@ -18,7 +19,7 @@ console = Console()
 
 
 def filter_page_groups(groups: list[PageGroup], filter_criteria: str, 
-                        pdf_path: Path, total_pages: int) -> list[PageGroup]:
+                        pdf_path: Path, total_pages: int, mode: str = 'any') -> list[PageGroup]:
     """
     Filter page groups based on criteria.
     
@@ -27,6 +28,8 @@ def filter_page_groups(groups: list[PageGroup], filter_criteria: str,
         filter_criteria: Filter expression (index-based or content-based)
         pdf_path: PDF file path for content analysis
         total_pages: Total pages in PDF
+        mode: How many of a group's pages must match content criteria -
+            'any' (default), 'all' or 'count>=N' (ignored for index filters)
         
     Returns:
         Filtered list of PageGroup objects
@@ -39,6 +42,7 @@ def filter_page_groups(groups: list[PageGroup], filter_criteria: str,
         filter_page_groups(groups, "contains:'Important'", pdf_path, total_pages)
         filter_page_groups(groups, "contains:'Security' & !type:empty", pdf_path, total_pages)
         filter_page_groups(groups, "size:>1MB | contains:'Critical'", pdf_path, total_pages)
+        filter_page_groups(groups, "type:empty", pdf_path, total_pages, mode="count>=2")
     """
     
     if not groups:
@@ -53,7 +57,7 @@ def filter_page_groups(groups: list[PageGroup], filter_criteria: str,
     if _is_index_based_filter(filter_criteria):
         return _filter_by_indices(groups, filter_criteria)
     else:
-        return _filter_by_criteria(groups, filter_criteria, pdf_path, total_pages)
+        return _filter_by_criteria(groups, filter_criteria, pdf_path, total_pages, mode)
 
 
 def _is_index_based_filter(criteria: str) -> bool:
@@ -107,65 +111,117 @@ def _filter_by_indices(groups: list[PageGroup], indices_str: str) -> list[PageGr
 
 
 def _filter_by_criteria(groups: list[PageGroup], criteria: str, 
-                        pdf_path: Path, total_pages: int) -> list[PageGroup]:
-    """Filter groups by content criteria using boolean expressions."""
-    
-    filtered_groups = []
+                        pdf_path: Path, total_pages: int, mode: str = 'any') -> list[PageGroup]:
+    """
+    Filter groups by content criteria using boolean expressions.
     
-    for group in groups:
-        if _group_matches_criteria(group, criteria, pdf_path, total_pages):
-            filtered_groups.append(group)
+    The criteria are evaluated once, for the pages of all groups together;
+    each group is then decided by intersecting its pages with the matches.
+    """
+    matching_pages = _evaluate_criteria(groups, criteria, pdf_path, total_pages)
+    if matching_pages is None:
+        return []
     
-    return filtered_groups
+    kind, min_count = parse_filter_mode(mode)
+    return [group for group in groups if _group_matches(group, matching_pages, kind, min_count)]
 
 
-def _group_matches_criteria(group: PageGroup, criteria: str, 
-                            pdf_path: Path, total_pages: int) -> bool:
-    """Check if a single group matches the filter criteria."""
+def _evaluate_criteria(groups: list[PageGroup], criteria: str,
+                        pdf_path: Path, total_pages: int) -> PageSet | None:
+    """Pages of any group that match the criteria, or None if the criteria can't be evaluated."""
+    group_pages = PageSet().union(*(group.page_set for group in groups))
     
-    # Create a temporary supervisor to evaluate criteria against this group's pages
     supervisor = UnifiedBooleanSupervisor(pdf_path, total_pages)
     
     try:
-        # Evaluate criteria against the group's specific pages
-        matching_pages, _ = supervisor.evaluate(criteria)
-        
-        # Check if any of the group's pages are in the matching set
-        group_page_set = set(group.pages)
-        matching_page_set = set(matching_pages)
-        
-        # Group matches if there's any overlap
-        return bool(group_page_set & matching_page_set)
+        matching_pages, _ = supervisor.evaluate(criteria, candidate_pages=group_pages)
+        return PageSet(matching_pages)
         
     except Exception as e:
-        console.print(f"[yellow]Warning: Could not evaluate criteria '{criteria}' for group {group.original_spec}: {e}[/yellow]")
-        return False
+        console.print(f"[yellow]Warning: Could not evaluate criteria '{criteria}' for page groups: {e}[/yellow]")
+        return None
+
+
+def _group_matches(group: PageGroup, matching_pages: PageSet, kind: str, min_count: int) -> bool:
+    """Check if a group's matching pages satisfy the filter mode."""
+    if kind == 'any':
+        return _check_group_overlap(group, matching_pages)
+    elif kind == 'all':
+        return group.page_set.issubset(matching_pages)
+    else:
+        return len(group.page_set & matching_pages) >= min_count
+
+
+def _group_matches_criteria(group: PageGroup, criteria: str, 
+                            pdf_path: Path, total_pages: int, mode: str = 'any') -> bool:
+    """Check if a single group matches the filter criteria."""
+    return bool(_filter_by_criteria([group], criteria, pdf_path, total_pages, mode))
+
 
+def parse_filter_mode(mode: str | None) -> tuple[str, int]:
+    """
+    Parse a --filter-mode value.
+    
+    Returns:
+        ('any', 1), ('all', 0) or ('count', N) for 'count>=N'
+        
+    Raises:
+        ValueError: If the mode isn't any, all or count>=N (N >= 1)
+    """
+    mode = (mode or 'any').strip().lower()
+    
+    if mode in ('any', 'all'):
+        return mode, 1 if mode == 'any' else 0
+    
+    match = re.fullmatch(r'count\s*>=\s*(\d+)', mode)
+    if match and int(match.group(1)) >= 1:
+        return 'count', int(match.group(1))
+    
+    raise ValueError(f"Invalid filter mode '{mode}': use any, all or count>=N (N >= 1)")
 
-def _check_group_overlap(group: PageGroup, target_pages: set[int]) -> bool:
+
+def _check_group_overlap(group: PageGroup, target_pages: PageSet | set[int]) -> bool:
     """Check if group has any pages that overlap with target pages."""
-    return bool(set(group.pages) & target_pages)
+    return not group.page_set.isdisjoint(target_pages)
 
 
-def _check_group_contains_all(group: PageGroup, target_pages: set[int]) -> bool:
+def _check_group_contains_all(group: PageGroup, target_pages: PageSet | set[int]) -> bool:
     """Check if group contains all target pages."""
-    return target_pages.issubset(set(group.pages))
+    return group.page_set.issuperset(target_pages)
 
 
-def _get_group_total_size(group: PageGroup, pdf_path: Path) -> int:
-    """Calculate total size of all pages in group (in bytes)."""
+def _get_page_sizes(groups: list[PageGroup], pdf_path: Path) -> dict[int, int]:
+    """Size of every page of the groups (in bytes), from one analysis pass."""
     try:
         from pdf_manipulator.core.page_analysis import PageAnalyzer
         
+        page_sizes = {}
         with PageAnalyzer(pdf_path) as analyzer:
-            total_size = 0
-            for page_num in group.pages:
-                analysis = analyzer.analyze_page(page_num)
-                total_size += analysis.size_bytes
-            return total_size
+            for page_num in PageSet().union(*(group.page_set for group in groups)):
+                page_sizes[page_num] = analyzer.analyze_page(page_num).size_bytes
+        return page_sizes
             
     except Exception:
-        return 0
+        return {}
+
+
+def _get_group_total_size(group: PageGroup, pdf_path: Path,
+                            page_sizes: dict[int, int] | None = None) -> int:
+    """
+    Calculate total size of all pages in group (in bytes).
+    
+    Pass page_sizes from _get_page_sizes() when sizing several groups, so
+    the document is analyzed once rather than once per group.
+    """
+    if page_sizes is None:
+        page_sizes = _get_page_sizes([group], pdf_path)
+    return sum(page_sizes.get(page_num, 0) for page_num in group.pages)
+
+
+def get_group_sizes(groups: list[PageGroup], pdf_path: Path) -> list[int]:
+    """Total size of each group (in bytes), analyzing every page once."""
+    page_sizes = _get_page_sizes(groups, pdf_path)
+    return [_get_group_total_size(group, pdf_path, page_sizes) for group in groups]
 
 
 def validate_filter_syntax(filter_criteria: str) -> tuple[bool, str]:
@@ -246,14 +302,15 @@ def describe_filter_result(original_count: int, filtered_count: int, filter_crit
 
 
 def preview_group_filtering(groups: list[PageGroup], filter_criteria: str, 
-                            pdf_path: Path, total_pages: int, show_details: bool = True) -> None:
+                            pdf_path: Path, total_pages: int, show_details: bool = True,
+                            mode: str = 'any') -> None:
     """Preview what groups would be filtered (for dry-run or debugging)."""
     
     console.print(f"\n[blue]Filter Preview: '{filter_criteria}'[/blue]")
     console.print(f"Original groups: {len(groups)}")
     
     try:
-        filtered_groups = filter_page_groups(groups, filter_criteria, pdf_path, total_pages)
+        filtered_groups = filter_page_groups(groups, filter_criteria, pdf_path, total_pages, mode)
         console.print(f"After filtering: {len(filtered_groups)}")
         
         if show_details and len(groups) <= 20:  # Don't spam for large numbers
@@ -5,6 +5,8 @@ File: pdf_manipulator/core/page_range/page_group.py
 
 from dataclasses import dataclass
 
+from pdf_manipulator.core.page_range.page_set import PageSet
+
 
 @dataclass
 class PageGroup:
@@ -12,6 +14,11 @@ class PageGroup:
     is_range: bool
     original_spec: str
     preserve_order: bool = False  # NEW: Whether to maintain input order vs natural sort order
+    
+    @property
+    def page_set(self) -> PageSet:
+        """The group's pages as a PageSet (order and duplicates dropped) for set operations."""
+        return PageSet(self.pages)
 
 
 def create_ordered_group(pages: list[int], original_spec: str, preserve_order: bool = False) -> PageGroup:
@@ -101,14 +108,14 @@ def merge_groups_in_order(groups: list[PageGroup], description: str) -> tuple[se
     Returns:
         Tuple of (all_pages_set, ordered_groups_list)
     """
-    all_pages = set()
+    all_pages = PageSet()
     ordered_groups = []
     
     for group in groups:
-        all_pages.update(group.pages)
+        all_pages |= group.page_set
         ordered_groups.append(group)
     
-    return all_pages, ordered_groups
+    return all_pages.to_set(), ordered_groups
 
 
 # End of file #
@@ -34,6 +34,8 @@ from pdf_manipulator.core.page_range.boolean import (
     evaluate_boolean_expression_with_groups
 )
 
+from pdf_manipulator.core.page_range.page_set import PageSet
+
 from pdf_manipulator.core.page_range.page_group import (
     PageGroup, create_ordered_group, create_range_group, merge_groups_in_order
 )
@@ -118,11 +120,14 @@ class PageRangeParser:
 
         # ARCHITECTURE FIX: Check for comma-separated FIRST
         if ',' in range_str:
-            return self._parse_comma_separated_arguments(range_str)
+            pages, description, groups = self._parse_comma_separated_arguments(range_str)
         else:
-            return self._parse_single_argument(range_str)
+            pages, description, groups = self._parse_single_argument(range_str)
+
+        # Selections are PageSets internally; the public API returns a plain set
+        return pages.to_set(), description, groups
     
-    def _parse_comma_separated_arguments(self, range_str: str) -> tuple[set[int], str, list[PageGroup]]:
+    def _parse_comma_separated_arguments(self, range_str: str) -> tuple[PageSet, str, list[PageGroup]]:
         """
         Parse comma-separated arguments.
         
@@ -134,7 +139,7 @@ class PageRangeParser:
         # Determine if we should preserve order
         self.preserve_comma_order = self._should_preserve_order(arguments)
         
-        all_pages = set()
+        all_pages = PageSet()
         descriptions = []
         
         # Process each argument independently
@@ -151,7 +156,7 @@ class PageRangeParser:
                     for group in groups:
                         group.preserve_order = True
                 
-                all_pages.update(pages)
+                all_pages |= pages
                 descriptions.append(desc)
                 self.ordered_groups.extend(groups)
                 
@@ -174,7 +179,7 @@ class PageRangeParser:
 
         return all_pages, combined_desc, self.ordered_groups
     
-    def _parse_single_argument(self, arg: str) -> tuple[set[int], str, list[PageGroup]]:
+    def _parse_single_argument(self, arg: str) -> tuple[PageSet, str, list[PageGroup]]:
         """
         Parse a single argument (no commas).
         
@@ -252,28 +257,40 @@ class PageRangeParser:
         # If we have numeric values, check if they're not in ascending order
         return len(numeric_values) >= 2 and numeric_values != sorted(numeric_values)
     
-    def _try_special_keywords(self, arg: str) -> tuple[set[int], str, list[PageGroup]] | None:
+    def parse_numeric_term(self, term: str) -> PageSet | None:
+        """
+        Parse page numbers, ranges and keywords ('5', '3-7', 'last 2', 'odd', 'all').
+        
+        Returns:
+            PageSet, or None if the term isn't numeric
+        """
+        result = self._try_special_keywords(term) or self._try_numeric_range(term)
+        if result is None:
+            return None
+        return result[0]
+    
+    def _try_special_keywords(self, arg: str) -> tuple[PageSet, str, list[PageGroup]] | None:
         """Try to parse special keywords like 'all'."""
         arg_lower = arg.lower().strip()
         
         if arg_lower == 'all':
             pages = list(range(1, self.total_pages + 1))
             group = PageGroup(pages, True, arg)
-            return set(pages), "All pages", [group]
+            return PageSet.all_pages(self.total_pages), "All pages", [group]
         
         if arg_lower == 'odd':
             pages = list(range(1, self.total_pages + 1, 2))
             group = PageGroup(pages, False, arg)
-            return set(pages), "Odd pages", [group]
+            return PageSet(pages), "Odd pages", [group]
         
         if arg_lower == 'even':
             pages = list(range(2, self.total_pages + 1, 2))
             group = PageGroup(pages, False, arg)
-            return set(pages), "Even pages", [group]
+            return PageSet(pages), "Even pages", [group]
         
         return None
     
-    def _try_advanced_patterns(self, arg: str) -> tuple[set[int], str, list[PageGroup]] | None:
+    def _try_advanced_patterns(self, arg: str) -> tuple[PageSet, str, list[PageGroup]] | None:
         """
         Try to parse advanced patterns.
         
@@ -284,7 +301,7 @@ class PageRangeParser:
             try:
                 pages, groups = evaluate_boolean_expression_with_groups(arg, self.pdf_path, self.total_pages)
                 description = create_boolean_description(arg)
-                return set(pages), description, groups
+                return PageSet(pages), description, groups
             except Exception as e:
                 raise ValueError(f"Boolean expression error: {e}")
         
@@ -294,7 +311,7 @@ class PageRangeParser:
                 from pdf_manipulator.core.page_range.patterns import parse_range_pattern_with_groups
                 pages, groups = parse_range_pattern_with_groups(arg, self.pdf_path, self.total_pages)
                 description = create_pattern_description(arg)
-                return set(pages), description, groups
+                return PageSet(pages), description, groups
             except Exception as e:
                 raise ValueError(f"Range pattern error: {e}")
         
@@ -304,13 +321,13 @@ class PageRangeParser:
                 pages = parse_pattern_expression(arg, self.pdf_path, self.total_pages)
                 description = create_pattern_description(arg)
                 groups = [PageGroup(pages, len(pages) > 1, arg)]
-                return set(pages), description, groups
+                return PageSet(pages), description, groups
             except Exception as e:
                 raise ValueError(f"Pattern error: {e}")
         
         return None
     
-    def _try_numeric_range(self, arg: str) -> tuple[set[int], str, list[PageGroup]] | None:
+    def _try_numeric_range(self, arg: str) -> tuple[PageSet, str, list[PageGroup]] | None:
         """Try to parse as numeric range."""
         arg = arg.strip()
         
@@ -319,7 +336,7 @@ class PageRangeParser:
             page_num = int(arg)
             if 1 <= page_num <= self.total_pages:
                 group = PageGroup([page_num], False, arg)
-                return {page_num}, f"Page {page_num}", [group]
+                return PageSet([page_num]), f"Page {page_num}", [group]
             else:
                 raise ValueError(f"Page number {page_num} out of range (1-{self.total_pages})")
         
@@ -342,7 +359,7 @@ class PageRangeParser:
                     desc = f"Pages {start}-{end} (reverse)"
                 
                 group = PageGroup(pages, True, arg)
-                return set(pages), desc, [group]
+                return PageSet.from_range(min(start, end), max(start, end)), desc, [group]
                 
             except ValueError as e:
                 if "out of range" in str(e):
@@ -355,7 +372,7 @@ class PageRangeParser:
             count = min(int(first_match.group(1)), self.total_pages)
             pages = list(range(1, count + 1))
             group = PageGroup(pages, True, arg)
-            return set(pages), f"First {count} pages", [group]
+            return PageSet.from_range(1, count), f"First {count} pages", [group]
         
         last_match = re.match(r'^last\s+(\d+)$', arg.lower())
         if last_match:
@@ -363,14 +380,14 @@ class PageRangeParser:
             start = max(1, self.total_pages - count + 1)
             pages = list(range(start, self.total_pages + 1))
             group = PageGroup(pages, True, arg)
-            return set(pages), f"Last {count} pages", [group]
+            return PageSet.from_range(start, self.total_pages), f"Last {count} pages", [group]
         
         # Slicing patterns like "::2" (every 2nd page)
         if re.match(r'^::\d+$', arg):
             step = int(arg[2:])
             pages = list(range(1, self.total_pages + 1, step))
             group = PageGroup(pages, False, arg)
-            return set(pages), f"Every {step} pages", [group]
+            return PageSet(pages), f"Every {step} pages", [group]
         
         return None
     
@@ -0,0 +1,226 @@
+"""
+Compact page set backed by an int bitmask.
+File: pdf_manipulator/core/page_range/page_set.py
+
+Page selections used to travel as list[int]/set[int], with conversions like
+list(set(a) & set(b)) at every step and set(range(1, total_pages + 1)) for
+every NOT. On 10k+ page documents with many-term expressions the hashing and
+allocation churn is measurable. PageSet keeps one Python int (bit N = page N):
+
+- union/intersection/difference/complement are single big-int operations
+- membership is a bit test, len() is a popcount
+- iteration is always ascending; runs() gives run-length (start, end) pairs
+- shift() moves every page by an offset (pattern offsets like "+1")
+
+PageSet is immutable and hashable. It compares equal to sets/frozensets with
+the same pages, so it can be handed to code that expects a set of ints.
+Public APIs that returned sets/lists keep doing so - PageSet is what flows
+between the parser, boolean evaluation, group filtering and deduplication.
+"""
+
+import re
+
+from typing import Iterable, Iterator
+
+
+_RUN_OF_ONES = re.compile('1+')
+
+
+class PageSet:
+    """Immutable set of 1-based page numbers."""
+
+    __slots__ = ('_mask',)
+
+    def __init__(self, pages: Iterable[int] = ()):
+        if isinstance(pages, PageSet):
+            self._mask = pages._mask
+        elif isinstance(pages, range) and pages.step == 1:
+            self._mask = _range_mask(pages.start, pages.stop - 1)
+        else:
+            self._mask = _pages_to_mask(pages)
+
+    @classmethod
+    def from_mask(cls, mask: int) -> 'PageSet':
+        """Wrap an existing bitmask (bit N = page N); bit 0 is ignored."""
+        page_set = cls.__new__(cls)
+        page_set._mask = mask & ~1 if mask > 0 else 0
+        return page_set
+
+    @classmethod
+    def from_range(cls, start: int, end: int) -> 'PageSet':
+        """Pages start..end inclusive (empty if start > end)."""
+        return cls.from_mask(_range_mask(start, end))
+
+    @classmethod
+    def all_pages(cls, total_pages: int) -> 'PageSet':
+        """Pages 1..total_pages."""
+        return cls.from_range(1, total_pages)
+
+    @property
+    def mask(self) -> int:
+        """The underlying bitmask."""
+        return self._mask
+
+    # Set operations - accept PageSets and any iterable of ints
+
+    def __or__(self, other) -> 'PageSet':
+        return PageSet.from_mask(self._mask | _as_mask(other))
+
+    def __and__(self, other) -> 'PageSet':
+        return PageSet.from_mask(self._mask & _as_mask(other))
+
+    def __sub__(self, other) -> 'PageSet':
+        return PageSet.from_mask(self._mask & ~_as_mask(other))
+
+    def __xor__(self, other) -> 'PageSet':
+        return PageSet.from_mask(self._mask ^ _as_mask(other))
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __rsub__(self, other) -> 'PageSet':
+        return PageSet.from_mask(_as_mask(other) & ~self._mask)
+
+    def union(self, *others) -> 'PageSet':
+        mask = self._mask
+        for other in others:
+            mask |= _as_mask(other)
+        return PageSet.from_mask(mask)
+
+    def intersection(self, *others) -> 'PageSet':
+        mask = self._mask
+        for other in others:
+            mask &= _as_mask(other)
+        return PageSet.from_mask(mask)
+
+    def difference(self, *others) -> 'PageSet':
+        mask = self._mask
+        for other in others:
+            mask &= ~_as_mask(other)
+        return PageSet.from_mask(mask)
+
+    def complement(self, total_pages: int) -> 'PageSet':
+        """Pages 1..total_pages that are not in this set."""
+        return PageSet.from_mask(_range_mask(1, total_pages) & ~self._mask)
+
+    def shift(self, offset: int) -> 'PageSet':
+        """Every page moved by offset; pages that fall below 1 are dropped."""
+        if offset >= 0:
+            return PageSet.from_mask(self._mask << offset)
+        return PageSet.from_mask(self._mask >> -offset)
+
+    def clip(self, total_pages: int) -> 'PageSet':
+        """Only the pages within 1..total_pages."""
+        return PageSet.from_mask(self._mask & _range_mask(1, total_pages))
+
+    def isdisjoint(self, other) -> bool:
+        return not (self._mask & _as_mask(other))
+
+    def issubset(self, other) -> bool:
+        return not (self._mask & ~_as_mask(other))
+
+    def issuperset(self, other) -> bool:
+        return not (_as_mask(other) & ~self._mask)
+
+    # Container protocol
+
+    def __contains__(self, page) -> bool:
+        return isinstance(page, int) and page > 0 and bool(self._mask >> page & 1)
+
+    def __len__(self) -> int:
+        return self._mask.bit_count()
+
+    def __bool__(self) -> bool:
+        return self._mask != 0
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.to_list())
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self.to_list())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PageSet):
+            return self._mask == other._mask
+        if isinstance(other, (set, frozenset)):
+            return all(isinstance(page, int) for page in other) and self._mask == _pages_to_mask(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Must agree with frozenset hashing, since equal sets compare equal
+        return hash(frozenset(self.to_list()))
+
+    def __repr__(self) -> str:
+        return f"PageSet({self.format_runs() or ''})"
+
+    # Output
+
+    def first(self) -> int | None:
+        """Lowest page, or None if empty."""
+        if not self._mask:
+            return None
+        return (self._mask & -self._mask).bit_length() - 1
+
+    def last(self) -> int | None:
+        """Highest page, or None if empty."""
+        return self._mask.bit_length() - 1 if self._mask else None
+
+    def to_list(self) -> list[int]:
+        """Pages in ascending order."""
+        bits = bin(self._mask)[:1:-1]       # Bit 0 first
+        return [page for page, bit in enumerate(bits) if bit == '1']
+
+    def to_set(self) -> set[int]:
+        """Pages as a plain set."""
+        return set(self.to_list())
+
+    def runs(self) -> list[tuple[int, int]]:
+        """Consecutive runs as inclusive (start, end) pairs, ascending."""
+        bits = bin(self._mask)[:1:-1]
+        return [(match.start(), match.end() - 1) for match in _RUN_OF_ONES.finditer(bits)]
+
+    def is_consecutive(self) -> bool:
+        """True if the pages form one unbroken run (empty counts as not consecutive)."""
+        if not self._mask:
+            return False
+        low = self._mask >> (self.first())
+        return (low & (low + 1)) == 0
+
+    def format_runs(self) -> str:
+        """Compact description like '1-3,7,10-12'."""
+        return ','.join(str(start) if start == end else f"{start}-{end}"
+                        for start, end in self.runs())
+
+
+#################################################################################################
+# Private helpers
+
+def _range_mask(start: int, end: int) -> int:
+    """Bitmask of pages start..end inclusive."""
+    start = max(start, 1)
+    if end < start:
+        return 0
+    return ((1 << (end - start + 1)) - 1) << start
+
+
+def _pages_to_mask(pages: Iterable[int]) -> int:
+    """Build a bitmask from page numbers in linear time (non-positive pages are ignored)."""
+    pages = [page for page in pages if page > 0]
+    if not pages:
+        return 0
+
+    bits = bytearray(max(pages) // 8 + 1)
+    for page in pages:
+        bits[page >> 3] |= 1 << (page & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def _as_mask(other) -> int:
+    """Bitmask of a PageSet or any iterable of page numbers."""
+    if isinstance(other, PageSet):
+        return other._mask
+    return PageSet(other)._mask
+
+
+# End of file #
@@ -0,0 +1,333 @@
+"""
+Lazy Page Text Provider
+File: pdf_manipulator/core/page_range/page_text.py
+
+Per-document page text that is extracted only when a predicate asks for it.
+
+Before this, every content pattern extracted text for ALL pages up front, so
+"1-10 & contains:'Invoice'" on an 800-page manual paid for 800 pages. The
+provider instead serves text page by page:
+
+1. In-memory memo (per provider, lives for the process)
+2. Persistent text cache (if configured) - only the requested pages are read
+3. Extraction of just the missing pages - raw pdfplumber on one open handle,
+   sharded across worker processes for large requests, pypdf as fallback
+
+Each provider belongs to its document's DocumentSession (core/document_session.py),
+which owns the single pdfplumber handle and pypdf reader it extracts through.
+Sessions are kept in a small LRU registry keyed by (path, size, mtime), so an
+edited file gets a fresh provider and open handles don't pile up in batch runs.
+
+Documents indexed with --index-build also get candidate narrowing: the
+persistent page text index (cache/text_index.py) tells contains: and
+line-starts: predicates which pages can possibly match, so only those pages
+are fetched and scanned.
+"""
+
+import pypdf
+
+from pathlib import Path
+
+from pdf_manipulator.core.document_session import DocumentSession, close_document_sessions, get_document_session
+from pdf_manipulator.core.cache.text_cache import get_text_cache, get_document_key, make_extractor_id
+from pdf_manipulator.core.cache.text_index import (
+    get_text_index,
+    line_start_query_terms,
+    substring_query_terms,
+)
+from pdf_manipulator.core.page_range.page_set import PageSet
+from pdf_manipulator.core.page_range.text_matcher import TextPredicate
+
+# Try to import pdfplumber for better text extraction
+try:
+    import pdfplumber
+    PDFPLUMBER_AVAILABLE = True
+except ImportError:
+    PDFPLUMBER_AVAILABLE = False
+
+from pdf_manipulator.core.page_range.sharded_extraction import (
+    DEFAULT_SHARD_SIZE,
+    extract_pages_sharded,
+    raw_page_text,
+    resolve_worker_count,
+)
+
+
+#################################################################################################
+# Extraction settings
+
+_extraction_workers = 1                     # 1 = extract in-process, 0 = one worker per CPU
+_extraction_shard_size = DEFAULT_SHARD_SIZE
+
+
+def configure_text_extraction(workers: int = 1, shard_size: int = DEFAULT_SHARD_SIZE):
+    """
+    Configure page-parallel text extraction for pattern matching.
+
+    Requests for more pages than shard_size are split into contiguous page
+    ranges, each extracted by a worker process that opens the file itself.
+
+    Args:
+        workers: Worker processes (1 = no parallelism, 0 = one per CPU)
+        shard_size: Maximum pages per worker task
+    """
+    global _extraction_workers, _extraction_shard_size
+
+    if workers < 0:
+        raise ValueError("workers must be 0 (one per CPU) or a positive number")
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+
+    _extraction_workers = workers
+    _extraction_shard_size = shard_size
+
+
+def text_extractor_ids() -> list[str]:
+    """Extractor ids in the order the provider tries the extraction libraries."""
+    ids = []
+    if PDFPLUMBER_AVAILABLE:
+        ids.append(make_extractor_id('pdfplumber', pdfplumber.__version__))
+    ids.append(make_extractor_id('pypdf', pypdf.__version__))
+    return ids
+
+
+def text_pipeline_id() -> str:
+    """Id of the whole extraction pipeline - an index built by one pipeline is useless to another."""
+    return '+'.join(text_extractor_ids())
+
+
+#################################################################################################
+# PageTextProvider class
+
+class PageTextProvider:
+    """
+    Lazily extracted, memoized page text for one PDF.
+
+    Pages are 1-based. Pages outside 1..total_pages (or past the real end of
+    the document) are empty strings, matching the old pad-with-"" behavior.
+    """
+
+    def __init__(self, pdf_path: Path, total_pages: int, session: DocumentSession | None = None):
+        self.pdf_path = Path(pdf_path)
+        self.total_pages = total_pages
+        self.session = session or DocumentSession(self.pdf_path)
+        self.pages_extracted = 0            # Pages actually run through an extractor
+
+        self._texts: dict[int, str] = {}
+        self._doc_key: str | None = None
+        self._plumber_failed = False
+
+    def get(self, page_num: int) -> str:
+        """Text of a single page."""
+        return self.get_many([page_num])[page_num]
+
+    def get_many(self, page_numbers) -> dict[int, str]:
+        """
+        Text for several pages, extracting only the ones not seen before.
+
+        Returns:
+            Dict of page number -> text for every requested page
+        """
+        wanted = sorted(set(page_numbers))
+        missing = [p for p in wanted if p not in self._texts and 1 <= p <= self.total_pages]
+
+        if missing:
+            self._load(missing)
+
+        return {p: self._texts.get(p, "") for p in wanted}
+
+    def all_texts(self) -> list[str]:
+        """Text of every page as a 0-indexed list."""
+        texts = self.get_many(range(1, self.total_pages + 1))
+        return [texts[p] for p in range(1, self.total_pages + 1)]
+
+    @property
+    def loaded_pages(self) -> set[int]:
+        """Pages whose text is currently memoized."""
+        return set(self._texts)
+
+    def close(self):
+        """Release the document's pdfplumber handle (memoized text is kept)."""
+        self.session.close_plumber()
+
+    def _load(self, pages: list[int]):
+        """Fill the memo for the given pages from the persistent cache or by extraction."""
+        remaining = list(pages)
+        text_cache = get_text_cache()
+
+        if text_cache is not None:
+            try:
+                if self._doc_key is None:
+                    self._doc_key = get_document_key(self.pdf_path)
+            except OSError:
+                text_cache = None
+
+        if text_cache is not None:
+            for extractor_id in text_extractor_ids():
+                cached = text_cache.get_pages(self._doc_key, extractor_id, remaining)
+                self._texts.update(cached)
+                remaining = [p for p in remaining if p not in cached]
+                if not remaining:
+                    return
+
+        extracted, extractor_id = self._extract(remaining)
+        self._texts.update(extracted)
+        self.pages_extracted += len(remaining)
+
+        if extractor_id is not None and text_cache is not None:
+            text_cache.store_pages(self._doc_key, extractor_id, extracted)
+
+    def _extract(self, pages: list[int]) -> tuple[dict[int, str], str | None]:
+        """
+        Run the actual extraction (pdfplumber first, pypdf fallback).
+
+        Returns:
+            (texts, extractor_id) - extractor_id is None when every method failed,
+            in which case the empty results must not be cached persistently
+        """
+        if PDFPLUMBER_AVAILABLE and not self._plumber_failed:
+            try:
+                workers = resolve_worker_count(_extraction_workers)
+                if workers > 1 and len(pages) > _extraction_shard_size:
+                    texts = extract_pages_sharded(self.pdf_path, pages, raw_page_text,
+                                                    workers=workers, shard_size=_extraction_shard_size)
+                else:
+                    texts = self._extract_with_open_handle(pages)
+                return texts, make_extractor_id('pdfplumber', pdfplumber.__version__)
+            except Exception:
+                # Can't be read by pdfplumber - stick to pypdf for this document
+                self._plumber_failed = True
+                self.close()
+
+        # Fallback to pypdf (less accurate for OCR'd PDFs)
+        try:
+            texts = {}
+            page_count = self.session.page_count
+            for page_num in pages:
+                if page_num > page_count:
+                    texts[page_num] = ""
+                    continue
+                try:
+                    texts[page_num] = self.session.pypdf_page_text(page_num)
+                except Exception:
+                    texts[page_num] = ""
+            return texts, make_extractor_id('pypdf', pypdf.__version__)
+        except Exception:
+            return {page_num: "" for page_num in pages}, None
+
+    def _extract_with_open_handle(self, pages: list[int]) -> dict[int, str]:
+        """Extract pages in-process through the session's pdfplumber handle."""
+        pdf = self.session.plumber()
+        page_count = len(pdf.pages)
+        texts = {}
+
+        for page_num in pages:
+            if page_num > page_count:
+                texts[page_num] = ""
+                continue
+            page = pdf.pages[page_num - 1]
+            try:
+                texts[page_num] = raw_page_text(page)
+            except Exception:
+                texts[page_num] = ""
+            finally:
+                page.flush_cache()
+
+        return texts
+
+
+#################################################################################################
+# Provider access
+
+def get_page_text_provider(pdf_path: Path, total_pages: int) -> PageTextProvider:
+    """
+    Get the shared text provider for a PDF, creating it on first use.
+
+    The provider belongs to the document's session, which is keyed by resolved
+    path, size and modification time, so memoized text is never served for a
+    file that changed on disk.
+    """
+    return get_document_session(pdf_path).text_provider(total_pages)
+
+
+def clear_page_text_providers():
+    """Drop all providers and their memoized text (closes every document session)."""
+    close_document_sessions()
+
+
+#################################################################################################
+# Page text index
+
+def build_page_text_index(pdf_path: Path, total_pages: int) -> dict:
+    """
+    Build (or rebuild) the persistent text index for a PDF.
+
+    Every page's text goes through the provider, so it also lands in the text
+    cache if one is configured.
+
+    Returns:
+        Dict with total_pages, term_count and total_bytes of the index
+
+    Raises:
+        ValueError: If no text index is configured
+    """
+    text_index = get_text_index()
+    if text_index is None:
+        raise ValueError("The page text index is disabled")
+
+    provider = get_page_text_provider(pdf_path, total_pages)
+    texts = provider.get_many(range(1, total_pages + 1))
+    return text_index.build(get_document_key(pdf_path), text_pipeline_id(), texts)
+
+
+def page_text_index_info(pdf_path: Path) -> dict | None:
+    """Index details for a PDF, or None if it isn't indexed (or indexing is off)."""
+    text_index = get_text_index()
+    if text_index is None:
+        return None
+    try:
+        return text_index.document_info(get_document_key(pdf_path), text_pipeline_id())
+    except OSError:
+        return None
+
+
+def index_candidates(pdf_path: Path, predicates) -> dict[TextPredicate, PageSet | None] | None:
+    """
+    Pages each text predicate can possibly match, according to the text index.
+
+    Returns:
+        None if the document isn't indexed; otherwise predicate -> candidate
+        pages, or predicate -> None where the index can't narrow (regex:,
+        needles shorter than a trigram)
+    """
+    text_index = get_text_index()
+    if text_index is None:
+        return None
+
+    try:
+        doc_key = get_document_key(pdf_path)
+    except OSError:
+        return None
+
+    pipeline = text_pipeline_id()
+    if not text_index.has_document(doc_key, pipeline):
+        return None
+
+    candidates = {}
+    for predicate in predicates:
+        terms = None
+        if predicate.pattern_type == 'contains':
+            terms = substring_query_terms(predicate.value)
+        elif predicate.pattern_type == 'line-starts':
+            if '\n' in predicate.value:
+                candidates[predicate] = PageSet()       # Stripped lines never contain newlines
+                continue
+            terms = line_start_query_terms(predicate.value)
+
+        mask = text_index.lookup(doc_key, pipeline, terms) if terms else None
+        candidates[predicate] = PageSet.from_mask(mask) if mask is not None else None
+
+    return candidates
+
+
+# End of file #
@@ -10,69 +10,52 @@ properly reconstructs lines based on character positioning. This fixes issues
 where pypdf splits lines incorrectly, causing regex patterns to fail on OCR'd PDFs.
 
 Features:
-- Single pattern detection: contains:, type:, size:, regex:, line-starts:
+- Single pattern detection: contains:, type:, size:, regex:, line-starts:, dup:
 - Range pattern detection: "X to Y" patterns
 - Pattern parsing and evaluation
 - Quote-aware utilities for use by parser
 - No comma detection - parser handles that
 - Pdfplumber text extraction for reliable pattern matching (with caching)
+- Lazy text access: only the pages a pattern actually examines are extracted,
+  optionally restricted to a candidate page set (see page_text.py)
+- Duplicate pages: dup:seen / dup:doc / dup:any select pages already seen in
+  earlier documents or earlier in the same one (see page_fingerprint.py)
 """
 
 import re
 
-from pypdf import PdfReader
 from pathlib import Path
 from rich.console import Console
 
-from pdf_manipulator.core.page_analysis import PageAnalyzer
-from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
+from pdf_manipulator.core.page_analysis import PageAnalyzer, compare_size, parse_size_condition
+from pdf_manipulator.core.page_fingerprint import DUPLICATE_SCOPES, duplicate_pages
 from pdf_manipulator.core.page_range.page_group import PageGroup
-
-# Try to import pdfplumber for better text extraction
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
+from pdf_manipulator.core.page_range.page_set import PageSet
+from pdf_manipulator.core.page_range.page_text import (
+    clear_page_text_providers,
+    get_page_text_provider,
+    index_candidates,
+)
+from pdf_manipulator.core.page_range.text_matcher import TEXT_PATTERN_TYPES, TextMatcher, TextPredicate
 
 
 console = Console()
 
 
 #################################################################################################
-# Text Extraction Cache (to avoid re-extracting for each pattern)
-
-_extracted_texts_cache = {}  # Key: pdf_path (str), Value: list of page texts
-
-
-def _get_cache_key(pdf_path: Path) -> str:
-    """Get a cache key for a PDF file."""
-    return str(pdf_path.resolve())
-
+# Page Text Access (lazy, memoized - see page_text.py)
 
 def _clear_extraction_cache():
     """Clear the extraction cache (useful for testing)."""
-    global _extracted_texts_cache
-    _extracted_texts_cache = {}
+    clear_page_text_providers()
 
 
-#################################################################################################
-# Text Extraction Helper
-
 def _extract_all_page_texts(pdf_path: Path, total_pages: int) -> list[str]:
     """
     Extract text from all pages using pdfplumber (raw) or pypdf fallback.
     
-    Results are cached per PDF file to avoid re-extraction when evaluating
-    multiple patterns against the same document.
-    
-    We use pdfplumber's raw extract_text() which properly reconstructs lines
-    based on character positioning. This fixes issues where pypdf splits lines
-    incorrectly, causing regex patterns to fail on OCR'd PDFs.
-    
-    Note: We intentionally use raw pdfplumber, NOT the tuned PDFPlumberProcessor,
-    because the adaptive spacing tuning can over-correct and insert unwanted
-    spaces/tabs that break pattern matching.
+    Kept for callers that genuinely need every page; pattern evaluation goes
+    through the lazy provider and only asks for the pages it examines.
     
     Args:
         pdf_path: Path to the PDF file
@@ -81,61 +64,7 @@ def _extract_all_page_texts(pdf_path: Path, total_pages: int) -> list[str]:
     Returns:
         List of text strings, one per page (0-indexed)
     """
-    global _extracted_texts_cache
-    
-    cache_key = _get_cache_key(pdf_path)
-    
-    # Check cache first
-    if cache_key in _extracted_texts_cache:
-        cached = _extracted_texts_cache[cache_key]
-        # Ensure we have enough pages (in case total_pages increased)
-        if len(cached) >= total_pages:
-            return cached[:total_pages]
-    
-    # Extract using raw pdfplumber if available
-    if PDFPLUMBER_AVAILABLE:
-        try:
-            all_texts = []
-            with pdfplumber.open(pdf_path) as pdf:
-                for i in range(min(total_pages, len(pdf.pages))):
-                    try:
-                        text = pdf.pages[i].extract_text()
-                        all_texts.append(text if text else "")
-                    except Exception:
-                        all_texts.append("")
-            
-            # Pad with empty strings if needed
-            if len(all_texts) < total_pages:
-                all_texts += [""] * (total_pages - len(all_texts))
-            
-            # Cache the results
-            _extracted_texts_cache[cache_key] = all_texts
-            return all_texts
-            
-        except Exception:
-            pass  # Fall through to pypdf
-    
-    # Fallback to pypdf (less accurate for OCR'd PDFs)
-    try:
-        with suppress_pdf_warnings():
-            reader = PdfReader(pdf_path)
-            texts = []
-            for i in range(min(total_pages, len(reader.pages))):
-                try:
-                    text = reader.pages[i].extract_text()
-                    texts.append(text if text else "")
-                except Exception:
-                    texts.append("")
-            
-            # Pad with empty strings if needed
-            result = texts + [""] * (total_pages - len(texts))
-            
-            # Cache the results
-            _extracted_texts_cache[cache_key] = result
-            return result
-            
-    except Exception:
-        return [""] * total_pages
+    return get_page_text_provider(pdf_path, total_pages).all_texts()
 
 
 #################################################################################################
@@ -154,7 +83,7 @@ def looks_like_pattern(range_str: str) -> bool:
         return False
     
     # Check for valid pattern prefixes
-    pattern_prefixes = ['contains', 'regex', 'line-starts', 'type', 'size']
+    pattern_prefixes = ['contains', 'regex', 'line-starts', 'type', 'size', 'dup']
     
     for prefix in pattern_prefixes:
         # Handle case-insensitive patterns: "contains/i:"
@@ -174,9 +103,20 @@ def looks_like_range_pattern(range_str: str) -> bool:
     return _contains_unquoted_text(range_str, ' to ')
 
 
-def parse_pattern_expression(expression: str, pdf_path: Path, total_pages: int) -> list[int]:
-    """Parse pattern expression and return matching page numbers."""
-    return _parse_single_pattern_with_offset(expression, pdf_path, total_pages)
+def parse_pattern_expression(expression: str, pdf_path: Path, total_pages: int,
+                                candidate_pages: PageSet | set[int] | None = None) -> list[int]:
+    """
+    Parse pattern expression and return matching page numbers.
+    
+    Args:
+        expression: Pattern such as "contains:'Invoice'" or "type:text+1"
+        pdf_path: PDF to evaluate against
+        total_pages: Number of pages in the PDF
+        candidate_pages: If given, only these pages are examined (and returned).
+            Lets callers that already know the answer must lie within a page set
+            (e.g. "1-10 & contains:X") avoid extracting text for other pages.
+    """
+    return _parse_single_pattern_with_offset(expression, pdf_path, total_pages, candidate_pages)
 
 
 def parse_range_pattern(expression: str, pdf_path: Path, total_pages: int) -> list[int]:
@@ -410,41 +350,65 @@ def _split_on_unquoted_text(text: str, separator: str) -> list[str]:
     return parts
 
 
-def _parse_single_pattern_with_offset(expression: str, pdf_path: Path, total_pages: int) -> list[int]:
+def _parse_single_pattern_with_offset(expression: str, pdf_path: Path, total_pages: int,
+                                        candidate_pages: PageSet | set[int] | None = None) -> list[int]:
     """Parse a single pattern expression and return matching page numbers."""
     # Check for offset modifiers (+N or -N at the end)
-    offset = 0
-    base_expression = expression
+    base_expression, offset = split_pattern_offset(expression)
     
-    # Match offset at end: +5, -3, etc.
-    offset_match = re.search(r'([+-]\d+)$', expression)
-    if offset_match:
-        offset = int(offset_match.group(1))
-        base_expression = expression[:offset_match.start()]
+    # Result page p comes from base page p - offset, so shift the candidates back
+    base_candidates = None
+    if candidate_pages is not None:
+        base_candidates = PageSet(candidate_pages).shift(-offset)
     
     # Get matching pages for the base pattern
-    matching_pages = _evaluate_pattern(base_expression, pdf_path, total_pages)
+    matching_pages = _evaluate_pattern(base_expression, pdf_path, total_pages, base_candidates)
     
     # Apply offset
     if offset != 0:
-        matching_pages = [p + offset for p in matching_pages]
-        # Filter to valid range
-        matching_pages = [p for p in matching_pages if 1 <= p <= total_pages]
+        # Shift, then filter to valid range
+        matching_pages = PageSet(matching_pages).shift(offset).clip(total_pages).to_list()
     
     return matching_pages
 
 
-def _evaluate_pattern(expression: str, pdf_path: Path, total_pages: int) -> list[int]:
+def split_pattern_offset(expression: str) -> tuple[str, int]:
+    """Split "contains:'X'+2" into ("contains:'X'", 2); no offset gives 0."""
+    # Match offset at end: +5, -3, etc.
+    offset_match = re.search(r'([+-]\d+)$', expression)
+    if offset_match:
+        return expression[:offset_match.start()], int(offset_match.group(1))
+    return expression, 0
+
+
+def validate_pattern_expression(expression: str) -> None:
     """
-    Evaluate a pattern expression and return matching page numbers.
+    Check a pattern's syntax without opening the PDF.
     
-    Uses pdfplumber's raw extract_text() for text extraction, which properly
-    reconstructs lines based on character positioning. This fixes issues where
-    pypdf splits lines incorrectly on OCR'd PDFs.
+    Raises the ValueError that evaluating the pattern would raise for any
+    document: a missing ':' or value, a bad size: condition, an unknown dup:
+    scope, or a range pattern without exactly one ' to '. Unknown pattern
+    types and invalid regexes are accepted - they simply never match.
     """
-    if not pdf_path or not pdf_path.exists():
-        raise ValueError(f"PDF file not found: {pdf_path}")
+    if looks_like_range_pattern(expression):
+        parts = _split_on_unquoted_text(expression, ' to ')
+        if len(parts) != 2:
+            raise ValueError(f"Range pattern must have exactly one ' to ' separator: {expression}")
+        for part in parts:
+            validate_pattern_expression(part.strip())
+        return
     
+    base_expression, _ = split_pattern_offset(expression.strip())
+    pattern_type, value, _ = _split_pattern(base_expression)
+    
+    if pattern_type == 'size':
+        parse_size_condition(value)
+    elif pattern_type == 'dup' and value.lower() not in DUPLICATE_SCOPES:
+        raise ValueError(f"dup: scope must be one of: {', '.join(DUPLICATE_SCOPES)}")
+
+
+def _split_pattern(expression: str) -> tuple[str, str, bool]:
+    """Split "contains/i:'X'" into ('contains', 'X', True); raises ValueError if malformed."""
     expression = expression.strip()
     
     # Parse pattern type and value
@@ -470,105 +434,93 @@ def _evaluate_pattern(expression: str, pdf_path: Path, total_pages: int) -> list
     if not value:
         raise ValueError(f"Empty pattern value: {expression}")
     
-    # Extract all page texts upfront using tuned pdfplumber (or pypdf fallback)
-    # This is the key improvement - pdfplumber's adaptive spacing reconstructs
-    # text correctly, keeping "Place of receipt VALDEZ, AK" on one line instead
-    # of splitting it across multiple lines like pypdf does.
-    page_texts = _extract_all_page_texts(pdf_path, total_pages)
+    return pattern_type, value, is_case_insensitive
+
+
+def _evaluate_pattern(expression: str, pdf_path: Path, total_pages: int,
+                        candidate_pages: PageSet | set[int] | None = None) -> list[int]:
+    """
+    Evaluate a pattern expression and return matching page numbers.
+    
+    Uses pdfplumber's raw extract_text() for text extraction, which properly
+    reconstructs lines based on character positioning. This fixes issues where
+    pypdf splits lines incorrectly on OCR'd PDFs.
+    
+    Text is fetched lazily: only the pages being examined (all pages, or the
+    candidate pages if given) are extracted, and each page only once per run.
+    """
+    if not pdf_path or not pdf_path.exists():
+        raise ValueError(f"PDF file not found: {pdf_path}")
+    
+    pattern_type, value, is_case_insensitive = _split_pattern(expression)
+    
+    # Pages to examine - everything, or just the candidates the caller cares about
+    if candidate_pages is None:
+        pages_to_check = list(range(1, total_pages + 1))
+    else:
+        pages_to_check = PageSet(candidate_pages).clip(total_pages).to_list()
     
     matching_pages = []
     
-    # For type: and size: patterns, we still need the pypdf page objects
+    # For type: and size: patterns, use PageAnalyzer (results persist in the analysis store)
     if pattern_type in ['type', 'size']:
         try:
-            with suppress_pdf_warnings():
-                reader = PdfReader(pdf_path)
-                for page_num in range(1, min(total_pages + 1, len(reader.pages) + 1)):
-                    page = reader.pages[page_num - 1]
-                    if _page_matches_structural_pattern(page, pattern_type, value, is_case_insensitive):
-                        matching_pages.append(page_num)
+            size_condition = parse_size_condition(value) if pattern_type == 'size' else None
+            with PageAnalyzer(pdf_path) as analyzer:
+                page_count = len(analyzer.reader.pages)
+                pages_in_document = [page_num for page_num in pages_to_check if page_num <= page_count]
+                for analysis in analyzer.analyze_pages(pages_in_document):
+                    if _page_matches_structural_pattern(analysis, pattern_type, value, size_condition):
+                        matching_pages.append(analysis.page_number)
+        except Exception as e:
+            raise ValueError(f"Error processing PDF: {e}")
+    elif pattern_type == 'dup':
+        # Page fingerprints, compared across documents through the page index
+        try:
+            duplicates = duplicate_pages(pdf_path, value.lower())
+        except ValueError:
+            raise
         except Exception as e:
             raise ValueError(f"Error processing PDF: {e}")
+        matching_pages = [page_num for page_num in pages_to_check if page_num in duplicates]
     else:
-        # For text-based patterns (contains, regex, line-starts), use extracted texts
-        for page_num in range(1, total_pages + 1):
-            text = page_texts[page_num - 1] if page_num <= len(page_texts) else ""
-            if _text_matches_pattern(text, pattern_type, value, is_case_insensitive):
-                matching_pages.append(page_num)
-    
-    return matching_pages
-
-
-def _text_matches_pattern(text: str, pattern_type: str, value: str, case_insensitive: bool) -> bool:
-    """
-    Check if text matches the given pattern.
-    
-    This function receives pre-extracted text (from pdfplumber's raw extraction),
-    which has proper line reconstruction for OCR'd PDFs.
-    """
-    if not text:
-        return False
-    
-    try:
-        if pattern_type == 'contains':
-            if case_insensitive:
-                return value.lower() in text.lower()
-            else:
-                return value in text
+        # For text-based patterns (contains, regex, line-starts), use raw pdfplumber
+        # text (or pypdf fallback) - pdfplumber keeps "Place of receipt VALDEZ, AK"
+        # on one line instead of splitting it across lines like pypdf does.
+        if pattern_type not in TEXT_PATTERN_TYPES:
+            return []       # Unknown pattern type never matches
         
-        elif pattern_type == 'regex':
-            flags = re.IGNORECASE if case_insensitive else 0
-            return bool(re.search(value, text, flags))
+        predicate = TextPredicate(pattern_type, value, is_case_insensitive)
         
-        elif pattern_type == 'line-starts':
-            lines = text.split('\n')
-            for line in lines:
-                line = line.strip()
-                if case_insensitive:
-                    if line.lower().startswith(value.lower()):
-                        return True
-                else:
-                    if line.startswith(value):
-                        return True
-            return False
+        # An indexed document only needs the pages the index can't rule out
+        narrowed = index_candidates(pdf_path, [predicate])
+        if narrowed and narrowed[predicate] is not None:
+            pages_to_check = (narrowed[predicate] & pages_to_check).to_list()
         
-        else:
-            raise ValueError(f"Unknown text pattern type: {pattern_type}")
-            
-    except Exception:
-        return False
+        page_texts = get_page_text_provider(pdf_path, total_pages).get_many(pages_to_check)
+        matching_pages = TextMatcher([predicate]).match_pages(page_texts)[predicate].to_list()
+    
+    return matching_pages
 
 
-def _page_matches_structural_pattern(page, pattern_type: str, value: str, case_insensitive: bool) -> bool:
+def _page_matches_structural_pattern(analysis, pattern_type: str, value: str,
+                                        size_condition: tuple[str, int] | None = None) -> bool:
     """
     Check if a page matches structural patterns (type, size).
     
-    These patterns need access to the pypdf page object for structural analysis,
-    not just extracted text.
+    Both read the page's PageAnalysis: type: compares the classified page type
+    ('text', 'image', 'mixed', 'empty'), size: the single-page size, e.g. '>1MB'.
+    size_condition is the already parsed size: value, if the caller has it.
     """
-    try:
-        if pattern_type == 'type':
-            # Simplified type detection - should use PageAnalyzer
-            if value.lower() == 'text':
-                text = page.extract_text()
-                if text:
-                    text = text.strip()
-                return text and len(text) > 50  # Simple heuristic
-            elif value.lower() == 'image':
-                # Check for images - simplified
-                return '/XObject' in str(page.get('/Resources', {}))
-            else:
-                return False
-        
-        elif pattern_type == 'size':
-            # Simplified size detection - should be more sophisticated
-            return True  # Placeholder
-        
-        else:
-            raise ValueError(f"Unknown structural pattern type: {pattern_type}")
-            
-    except Exception:
-        return False
+    if pattern_type == 'type':
+        return analysis.page_type == value.lower()
+    
+    elif pattern_type == 'size':
+        operator, target_bytes = size_condition or parse_size_condition(value)
+        return compare_size(analysis.size_bytes, operator, target_bytes)
+    
+    else:
+        raise ValueError(f"Unknown structural pattern type: {pattern_type}")
 
 
 def _find_all_range_sections(start_pattern: str, end_pattern: str, pdf_path: Path, total_pages: int) -> list[tuple[int, int]]:
@@ -576,12 +528,14 @@ def _find_all_range_sections(start_pattern: str, end_pattern: str, pdf_path: Pat
     # Find all pages matching start pattern
     start_pages = parse_pattern_expression(start_pattern, pdf_path, total_pages)
     
-    # Find all pages matching end pattern  
-    end_pages = parse_pattern_expression(end_pattern, pdf_path, total_pages)
-    
     if not start_pages:
         raise ValueError(f"No pages found matching start pattern: {start_pattern}")
     
+    # End pages before the first start can never close a section - don't examine them
+    first_start = min(start_pages)
+    end_pages = parse_pattern_expression(end_pattern, pdf_path, total_pages,
+                                            candidate_pages=PageSet.from_range(first_start, total_pages))
+    
     if not end_pages:
         raise ValueError(f"No pages found matching end pattern: {end_pattern}")
     
@@ -0,0 +1,231 @@
+"""
+Boolean Expression Query Planning
+File: pdf_manipulator/core/page_range/query_plan.py
+
+Compiles the tokens of a boolean page expression into a small AST and plans
+its evaluation, so expensive predicates run on as few pages as possible.
+
+Architecture:
+- Compiler: recursive descent over the supervisor's tokens with the usual
+  precedence (parentheses → NOT → AND → OR); nested ANDs/ORs are flattened
+- Cost model: numeric < type/size < contains/line-starts < regex < range sections
+- Planner: AND/OR operands are ordered cheapest first; for AND, exactly known
+  numeric operands go first, smallest first
+- Page sets: PageSet bitsets end to end, no list/set round trips
+
+The executor lives in UnifiedBooleanSupervisor - it owns term evaluation.
+"""
+
+import re
+
+from dataclasses import dataclass
+
+from pdf_manipulator.core.page_range.page_set import PageSet
+
+
+#################################################################################################
+# AST nodes
+
+@dataclass(frozen=True)
+class TermNode:
+    """A single operand: page number/range/keyword, pattern or range pattern."""
+    text: str
+
+
+@dataclass(frozen=True)
+class NotNode:
+    """Complement of the child against the pages being considered."""
+    child: object
+
+
+@dataclass(frozen=True)
+class AndNode:
+    """Intersection of two or more operands."""
+    children: tuple
+
+
+@dataclass(frozen=True)
+class OrNode:
+    """Union of two or more operands."""
+    children: tuple
+
+
+#################################################################################################
+# Compiler
+
+def compile_tokens(tokens: list[str]):
+    """
+    Compile supervisor tokens into an AST.
+
+    Raises:
+        ValueError: If operators lack operands, parentheses don't balance or
+            operands follow each other without an operator
+    """
+    if not tokens:
+        raise ValueError("Empty boolean expression")
+
+    parser = _TokenParser(tokens)
+    node = parser.parse_or()
+
+    if parser.position < len(tokens):
+        remaining = tokens[parser.position:]
+        if remaining[0] == ')':
+            raise ValueError("Unbalanced parentheses: unexpected closing parenthesis")
+        raise ValueError(f"Invalid boolean expression: unexpected tokens remaining: {remaining}")
+
+    return node
+
+
+class _TokenParser:
+    """Recursive descent parser: or := and ('|' and)*, and := not ('&' not)*."""
+
+    def __init__(self, tokens: list[str]):
+        self.tokens = tokens
+        self.position = 0
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def parse_or(self):
+        children = [self.parse_and()]
+        while self._peek() == '|':
+            self.position += 1
+            if self._peek() in (None, ')', '&', '|'):
+                raise ValueError("OR operator missing operand")
+            children.append(self.parse_and())
+        return _flatten(OrNode, children)
+
+    def parse_and(self):
+        children = [self.parse_not()]
+        while self._peek() == '&':
+            self.position += 1
+            if self._peek() in (None, ')', '&', '|'):
+                raise ValueError("AND operator missing operand")
+            children.append(self.parse_not())
+        return _flatten(AndNode, children)
+
+    def parse_not(self):
+        if self._peek() == '!':
+            self.position += 1
+            if self._peek() in (None, ')', '&', '|'):
+                raise ValueError("NOT operator missing operand")
+            child = self.parse_not()
+            # !!x is x
+            return child.child if isinstance(child, NotNode) else NotNode(child)
+        return self.parse_primary()
+
+    def parse_primary(self):
+        token = self._peek()
+
+        if token is None:
+            raise ValueError("Missing operand at end of expression")
+
+        if token == '(':
+            self.position += 1
+            if self._peek() == ')':
+                raise ValueError("Empty parentheses")
+            node = self.parse_or()
+            if self._peek() != ')':
+                raise ValueError("Unbalanced parentheses: missing closing parenthesis")
+            self.position += 1
+            return node
+
+        if token in (')', '&', '|'):
+            operator = {'&': 'AND', '|': 'OR'}.get(token)
+            if operator:
+                raise ValueError(f"{operator} operator missing operand")
+            raise ValueError("Unbalanced parentheses: unexpected closing parenthesis")
+
+        self.position += 1
+        return TermNode(token)
+
+
+def _flatten(node_type, children: list):
+    """Build an AND/OR node, merging directly nested nodes of the same type."""
+    if len(children) == 1:
+        return children[0]
+
+    flat = []
+    for child in children:
+        if isinstance(child, node_type):
+            flat.extend(child.children)
+        else:
+            flat.append(child)
+    return node_type(tuple(flat))
+
+
+#################################################################################################
+# Cost model
+
+# Relative cost of evaluating a term against one page
+COST_NUMERIC = 0        # Page numbers, ranges, keywords - no PDF access
+COST_METADATA = 1       # type:/size:/dup: - page structure, no text extraction
+COST_TEXT = 4           # contains:/line-starts: - page text
+COST_REGEX = 6          # regex: - page text plus a regex scan
+COST_RANGE = 12         # 'A to B' - two text patterns over the whole document
+
+_PATTERN_COSTS = {
+    'type': COST_METADATA,
+    'size': COST_METADATA,
+    'dup': COST_METADATA,
+    'contains': COST_TEXT,
+    'line-starts': COST_TEXT,
+    'regex': COST_REGEX,
+}
+
+_PATTERN_PREFIX = re.compile(r'^\s*([a-z-]+)(?:/i)?:', re.IGNORECASE)
+
+
+def term_cost(term: str, is_numeric: bool = False, is_range: bool = False) -> int:
+    """Estimated per-page cost of a term."""
+    if is_numeric:
+        return COST_NUMERIC
+    if is_range:
+        return COST_RANGE
+
+    match = _PATTERN_PREFIX.match(term)
+    if match:
+        return _PATTERN_COSTS.get(match.group(1).lower(), COST_REGEX)
+    return COST_REGEX
+
+
+def node_cost(node, term_costs: dict[str, int]) -> int:
+    """Estimated cost of a whole subtree (sum of its term costs)."""
+    if isinstance(node, TermNode):
+        return term_costs[node.text]
+    if isinstance(node, NotNode):
+        return node_cost(node.child, term_costs)
+    return sum(node_cost(child, term_costs) for child in node.children)
+
+
+def iter_terms(node):
+    """Yield every TermNode of a subtree."""
+    if isinstance(node, TermNode):
+        yield node
+    elif isinstance(node, NotNode):
+        yield from iter_terms(node.child)
+    else:
+        for child in node.children:
+            yield from iter_terms(child)
+
+
+def order_operands(node, term_costs: dict[str, int], known_pages: dict[str, PageSet]) -> list:
+    """
+    Order the operands of an AND/OR node for evaluation.
+
+    Cheapest first. Among AND operands whose pages are already known (numeric
+    terms), the most selective (fewest pages) goes first so later operands see
+    the smallest candidate set. For OR it's the opposite - the term covering the
+    most pages leaves the least for the expensive terms to examine.
+    """
+    def sort_key(child):
+        cost = node_cost(child, term_costs)
+        if isinstance(child, TermNode) and child.text in known_pages:
+            pages = len(known_pages[child.text])
+            return (cost, pages if isinstance(node, AndNode) else -pages)
+        return (cost, 0)
+
+    return sorted(node.children, key=sort_key)
+
+
+# End of file #
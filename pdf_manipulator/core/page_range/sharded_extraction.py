@@ -0,0 +1,138 @@
+"""
+Page-parallel text extraction with page-range sharding.
+File: pdf_manipulator/core/page_range/sharded_extraction.py
+
+Splits the requested pages into contiguous shards and extracts each shard in
+its own worker process. Every worker opens the PDF itself (pdfplumber handles
+can't be shared across processes) and walks its range in order, so the
+per-page cost that dominates large scanned documents runs on all cores.
+
+The page text function is pluggable so the same engine serves raw pdfplumber
+extraction and the filtered PDFPlumberProcessor output. It must be picklable:
+a module-level function or a bound method of a picklable object.
+
+The standalone scraper (simple_pdf_scraper/processors/sharded_extraction.py)
+keeps its own copy, so neither package needs the other; change both together.
+"""
+
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+
+DEFAULT_SHARD_SIZE = 50
+
+
+def raw_page_text(page):
+    """Plain pdfplumber extract_text(), empty string for pages without text."""
+    return page.extract_text() or ""
+
+
+def plan_shards(page_numbers, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Split page numbers into contiguous shards of at most shard_size pages.
+
+    A gap in the page numbers always starts a new shard, so each worker reads
+    one run of neighbouring pages.
+
+    Args:
+        page_numbers (list[int]): 1-based page numbers, in any order
+        shard_size (int): Maximum pages per shard
+
+    Returns:
+        list[list[int]]: Shards in ascending page order
+    """
+    shard_size = max(1, shard_size)
+    shards = []
+    current = []
+
+    for page in sorted(set(page_numbers)):
+        if current and (page != current[-1] + 1 or len(current) >= shard_size):
+            shards.append(current)
+            current = []
+        current.append(page)
+
+    if current:
+        shards.append(current)
+    return shards
+
+
+def extract_shard(pdf_path, pages, page_text_fn=raw_page_text):
+    """
+    Extract one shard in the current process.
+
+    Failed pages come back as empty strings (with a warning on stderr); a PDF
+    that can't be opened raises, so the caller can fall back to another library.
+
+    Returns:
+        dict[int, str]: Page number -> text
+    """
+    texts = {}
+    with pdfplumber.open(pdf_path) as pdf:
+        page_count = len(pdf.pages)
+        for page_num in pages:
+            if not 1 <= page_num <= page_count:
+                texts[page_num] = ""
+                continue
+            page = pdf.pages[page_num - 1]
+            try:
+                texts[page_num] = page_text_fn(page)
+            except Exception as page_error:
+                texts[page_num] = ""
+                print(f"Warning: Failed to extract text from page {page_num}: {page_error}", file=sys.stderr)
+            finally:
+                # Drop parsed layout objects as we go - large reports otherwise pile up memory
+                page.flush_cache()
+    return texts
+
+
+def resolve_worker_count(workers):
+    """Turn a worker setting into a process count (0 or None means one per CPU)."""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def extract_pages_sharded(pdf_path, page_numbers, page_text_fn=raw_page_text,
+                            workers=1, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Extract text for the given pages, sharded across worker processes.
+
+    Runs in-process when only one worker is requested or everything fits in a
+    single shard - starting a pool would only add overhead.
+
+    Args:
+        pdf_path (str|Path): PDF file to read
+        page_numbers (list[int]): 1-based pages to extract
+        page_text_fn (callable): Picklable function taking a pdfplumber page, returning text
+        workers (int): Worker processes (0 = one per CPU)
+        shard_size (int): Maximum contiguous pages handled by one task
+
+    Returns:
+        dict[int, str]: Page number -> text for every requested page
+    """
+    if pdfplumber is None:
+        raise ImportError("pdfplumber is required. Install with: pip install pdfplumber")
+
+    shards = plan_shards(page_numbers, shard_size)
+    workers = min(resolve_worker_count(workers), len(shards))
+
+    if workers <= 1:
+        # One open, one pass - same as classic sequential extraction
+        return extract_shard(pdf_path, sorted(set(page_numbers)), page_text_fn)
+
+    texts = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(extract_shard, pdf_path, shard, page_text_fn) for shard in shards]
+        for future in futures:
+            texts.update(future.result())
+    return texts
+
+
+# End of file #
@@ -0,0 +1,175 @@
+"""
+Single-Pass Multi-Pattern Text Matcher
+File: pdf_manipulator/core/page_range/text_matcher.py
+
+Evaluates every text predicate of an expression (contains:, regex:,
+line-starts:, with or without /i) against a page in one pass over the page.
+
+Per page, the derived views are built once and shared by all predicates:
+- lowercased text (for every case-insensitive contains:/line-starts:)
+- stripped lines, joined with newlines (for every line-starts:)
+Regexes are compiled once per matcher, not once per page.
+
+Literal and regex predicates are checked individually against those shared
+views. CPython's str search and compiled regexes with literal prefixes are
+C fast paths; a single combined alternation regex runs on the backtracking
+engine and measures 5-20x slower, so it is deliberately not used here.
+
+Semantics match the one-predicate-at-a-time _text_matches_pattern():
+- contains: substring test (case-insensitive = both sides lowercased)
+- regex: re.search (case-insensitive = re.IGNORECASE); invalid regexes never match
+- line-starts: some line, stripped, starts with the value
+- empty page text never matches
+"""
+
+import re
+
+from dataclasses import dataclass
+from typing import Iterable
+
+from pdf_manipulator.core.page_range.page_set import PageSet
+
+
+TEXT_PATTERN_TYPES = ('contains', 'regex', 'line-starts')
+
+
+@dataclass(frozen=True)
+class TextPredicate:
+    """One text condition, e.g. TextPredicate('contains', 'Invoice', case_insensitive=True)."""
+    pattern_type: str
+    value: str
+    case_insensitive: bool = False
+
+
+def parse_text_predicate(expression: str) -> TextPredicate | None:
+    """
+    Parse "contains:'X'", "regex/i:..." or "line-starts:..." (no offset).
+
+    Mirrors the parsing in patterns._evaluate_pattern().
+
+    Returns:
+        TextPredicate, or None if the expression isn't a text pattern
+    """
+    expression = expression.strip()
+    if ':' not in expression:
+        return None
+
+    case_insensitive = '/i:' in expression
+    if case_insensitive:
+        pattern_type, value = expression.split('/i:', 1)
+    else:
+        pattern_type, value = expression.split(':', 1)
+
+    pattern_type = pattern_type.lower().strip()
+    value = value.strip()
+
+    if (value.startswith('"') and value.endswith('"')) or \
+       (value.startswith("'") and value.endswith("'")):
+        value = value[1:-1]
+
+    if pattern_type not in TEXT_PATTERN_TYPES or not value:
+        return None
+
+    return TextPredicate(pattern_type, value, case_insensitive)
+
+
+class TextMatcher:
+    """
+    Compiled set of text predicates, evaluated together page by page.
+
+    Example:
+        matcher = TextMatcher([TextPredicate('contains', 'Invoice'),
+                                TextPredicate('line-starts', 'total', True)])
+        results = matcher.match_pages({1: text1, 2: text2})   # predicate -> PageSet
+    """
+
+    def __init__(self, predicates: Iterable[TextPredicate]):
+        self.predicates = tuple(dict.fromkeys(predicates))
+
+        # (predicate, needle) per view - needles are prepared once here
+        self._contains: list[tuple[TextPredicate, str]] = []
+        self._contains_lower: list[tuple[TextPredicate, str]] = []
+        self._line_starts: list[tuple[TextPredicate, str]] = []
+        self._line_starts_lower: list[tuple[TextPredicate, str]] = []
+        self._regexes: list[tuple[TextPredicate, re.Pattern]] = []
+
+        for predicate in self.predicates:
+            value = predicate.value
+
+            if predicate.pattern_type == 'contains':
+                if predicate.case_insensitive:
+                    self._contains_lower.append((predicate, value.lower()))
+                else:
+                    self._contains.append((predicate, value))
+
+            elif predicate.pattern_type == 'line-starts':
+                # A stripped line never contains a newline, so such values can't match
+                if '\n' in value:
+                    continue
+                # "\n" + value found in "\n" + joined lines <=> some line starts with value
+                if predicate.case_insensitive:
+                    self._line_starts_lower.append((predicate, '\n' + value.lower()))
+                else:
+                    self._line_starts.append((predicate, '\n' + value))
+
+            elif predicate.pattern_type == 'regex':
+                flags = re.IGNORECASE if predicate.case_insensitive else 0
+                try:
+                    self._regexes.append((predicate, re.compile(value, flags)))
+                except re.error:
+                    pass        # Invalid regex never matches
+
+    def matches(self, text: str) -> set[TextPredicate]:
+        """Predicates satisfied by one page of text."""
+        found = set()
+        if not text:
+            return found
+
+        for predicate, needle in self._contains:
+            if needle in text:
+                found.add(predicate)
+
+        if self._contains_lower or self._line_starts_lower:
+            lowered = text.lower()
+            for predicate, needle in self._contains_lower:
+                if needle in lowered:
+                    found.add(predicate)
+
+        if self._line_starts or self._line_starts_lower:
+            lines = '\n' + '\n'.join(line.strip() for line in text.split('\n'))
+            for predicate, needle in self._line_starts:
+                if needle in lines:
+                    found.add(predicate)
+
+            if self._line_starts_lower:
+                lines_lowered = lines.lower()
+                for predicate, needle in self._line_starts_lower:
+                    if needle in lines_lowered:
+                        found.add(predicate)
+
+        for predicate, regex in self._regexes:
+            if regex.search(text):
+                found.add(predicate)
+
+        return found
+
+    def match_pages(self, page_texts: dict[int, str]) -> dict[TextPredicate, PageSet]:
+        """
+        Evaluate every predicate on every given page.
+
+        Args:
+            page_texts: Page number -> text
+
+        Returns:
+            Predicate -> pages (among those given) where it matches
+        """
+        hits: dict[TextPredicate, list[int]] = {predicate: [] for predicate in self.predicates}
+
+        for page_num, text in page_texts.items():
+            for predicate in self.matches(text):
+                hits[predicate].append(page_num)
+
+        return {predicate: PageSet(pages) for predicate, pages in hits.items()}
+
+
+# End of file #
@@ -0,0 +1,229 @@
+"""
+In-memory page size estimation.
+File: pdf_manipulator/core/page_size.py
+
+The size of a page is what a single-page PDF containing it would take on disk.
+Measuring that literally means serializing a PdfWriter per page and writing
+it to a temp file - a full serialization plus a filesystem round trip for
+every page, every time size: or --analyze-detailed runs.
+
+PageSizeEstimator instead walks the page's object graph (page dictionary,
+content streams, resources, XObjects, fonts, annotations) and adds up the
+serialized size of every object it reaches:
+
+- Shared resources are counted once per page, however often they're referenced
+- Each object's serialized size and outgoing references are memoized, so a
+  font or logo shared by 1,500 pages is serialized once per document
+- Other pages reached through links are not followed (/Parent, /P, page
+  objects other than the one being measured)
+
+Estimates are within a few percent of the written size. When exact numbers
+are needed, exact_page_size() serializes a real single-page PdfWriter into a
+counting sink - still no disk access.
+
+The same walk yields a page fingerprint: a digest of every object the page
+reaches, so the analysis store can tell which pages of an edited document
+are unchanged.
+"""
+
+import hashlib
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject
+
+
+# Keys that point back up the tree or to other pages - never part of a page's own size
+_EXCLUDED_KEYS = frozenset({'/Parent', '/P', '/StructParents'})
+
+# "N 0 obj\n" + "\nendobj\n" + one xref table line
+_OBJECT_OVERHEAD = len("0000 0 obj\n") + len("\nendobj\n") + 20
+
+
+class CountingSink:
+    """Binary write-only stream that only counts the bytes written to it."""
+
+    def __init__(self):
+        self.count = 0
+
+    def write(self, data) -> int:
+        self.count += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.count
+
+    def flush(self):
+        pass
+
+
+class HashingSink(CountingSink):
+    """Counting sink that also digests what is written to it."""
+
+    def __init__(self):
+        super().__init__()
+        self.digest = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self.digest.update(data)
+        return super().write(data)
+
+
+def serialized_size(obj) -> int:
+    """Bytes pypdf writes for an object body (stream data included)."""
+    sink = CountingSink()
+    obj.write_to_stream(sink)
+    return sink.count
+
+
+def serialized_digest(obj) -> tuple[int, bytes]:
+    """Size and SHA-256 digest of what pypdf writes for an object body."""
+    sink = HashingSink()
+    obj.write_to_stream(sink)
+    return sink.count, sink.digest.digest()
+
+
+_document_overhead: int | None = None
+
+
+def document_overhead() -> int:
+    """Header, catalog, page tree, info dictionary, xref and trailer of a written PDF."""
+    global _document_overhead
+    if _document_overhead is None:
+        sink = CountingSink()
+        PdfWriter().write(sink)
+        _document_overhead = sink.count
+    return _document_overhead
+
+
+def exact_page_size(reader: PdfReader, page_number: int) -> int:
+    """
+    Size of a single-page PDF holding the given page, serialized in memory.
+
+    Args:
+        reader: Open reader of the source document
+        page_number: 1-indexed page number
+    """
+    writer = PdfWriter()
+    writer.add_page(reader.pages[page_number - 1])
+    sink = CountingSink()
+    writer.write(sink)
+    return sink.count
+
+
+class PageSizeEstimator:
+    """
+    Per-document page size estimator with per-object memoization.
+
+    Example:
+        estimator = PageSizeEstimator(reader)
+        sizes = [estimator.estimate(n) for n in range(1, len(reader.pages) + 1)]
+    """
+
+    def __init__(self, reader: PdfReader):
+        self.reader = reader
+        # (idnum, generation) -> (serialized size incl. overhead, referenced objects, is a page)
+        self._objects: dict[tuple[int, int], tuple[int, tuple[IndirectObject, ...], bool]] = {}
+        self._digests: dict[tuple[int, int], bytes] = {}
+
+    def estimate(self, page_number: int) -> int:
+        """
+        Estimated size in bytes of a single-page PDF holding the given page.
+
+        Args:
+            page_number: 1-indexed page number
+        """
+        page = self.reader.pages[page_number - 1]
+        total = document_overhead()
+
+        if page.indirect_reference is None:
+            # Page isn't an indirect object (unusual) - measure it directly
+            total += serialized_size(page) + _OBJECT_OVERHEAD
+
+        for key, size in self._walk(page):
+            total += size
+        return total
+
+    def fingerprint(self, page_number: int) -> str:
+        """
+        Digest of everything the page reaches (contents, resources, annotations).
+
+        Identical pages in different files share a fingerprint as long as their
+        objects are serialized identically; any edit to the page changes it.
+
+        Args:
+            page_number: 1-indexed page number
+        """
+        page = self.reader.pages[page_number - 1]
+        digest = hashlib.sha256()
+
+        if page.indirect_reference is None:
+            digest.update(serialized_digest(page)[1])
+
+        for key, _ in self._walk(page):
+            digest.update(self._digests[key])
+
+        return digest.hexdigest()
+
+    def _walk(self, page):
+        """Yield (object key, serialized size) for every object the page reaches, once each."""
+        root = page.indirect_reference
+        if root is None:
+            stack = list(_references(page))
+            root_key = None
+        else:
+            stack = [root]
+            root_key = (root.idnum, root.generation)
+
+        seen = set()
+        while stack:
+            reference = stack.pop()
+            key = (reference.idnum, reference.generation)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            size, references, is_page = self._object_info(reference, key)
+            if is_page and key != root_key:
+                continue        # Link to another page - not part of this one
+
+            yield key, size
+            stack.extend(references)
+
+    def _object_info(self, reference: IndirectObject, key: tuple[int, int]):
+        """Serialized size, outgoing references and page flag of an object (memoized)."""
+        info = self._objects.get(key)
+        if info is None:
+            obj = reference.get_object()
+            is_page = isinstance(obj, DictionaryObject) and obj.get('/Type') == '/Page'
+            try:
+                size, self._digests[key] = serialized_digest(obj)
+                size += _OBJECT_OVERHEAD
+            except Exception:
+                size = _OBJECT_OVERHEAD
+                self._digests[key] = b''
+
+            info = (size, tuple(_references(obj)), is_page)
+            self._objects[key] = info
+        return info
+
+
+def _references(obj) -> list[IndirectObject]:
+    """Indirect references directly inside an object (not following them)."""
+    references = []
+    stack = [obj]
+
+    while stack:
+        item = stack.pop()
+        if isinstance(item, IndirectObject):
+            references.append(item)
+        elif isinstance(item, DictionaryObject):
+            for key, value in item.items():
+                if key not in _EXCLUDED_KEYS:
+                    stack.append(value)
+        elif isinstance(item, ArrayObject):
+            stack.extend(item)
+
+    return references
+
+
+# End of file #
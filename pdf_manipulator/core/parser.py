@@ -92,10 +92,10 @@ def parse_page_range(*args, **kwargs):
     args = None
     kwargs = None
     
-    # Check if we already have results
-    if OpCtx.has_parsed_results():
+    # Check if we already have results for this PDF and these arguments
+    cached = OpCtx.get_cached_parsing_results()
+    if cached:
         console.print("✨ Using cached parsing results")
-        cached = OpCtx.get_cached_parsing_results()
         return cached.selected_pages, cached.range_description, cached.page_groups
     
 
@@ -112,6 +112,7 @@ def parse_page_range(*args, **kwargs):
     total_pages = OpCtx.current_page_count
     pdf_path = OpCtx.current_pdf_path
     filter_matches = getattr(OpCtx.args, 'filter_matches', None)
+    filter_mode = getattr(OpCtx.args, 'filter_mode', None) or 'any'
     group_start = getattr(OpCtx.args, 'group_start', None)
     group_end = getattr(OpCtx.args, 'group_end', None)
     
@@ -121,7 +122,7 @@ def parse_page_range(*args, **kwargs):
     if has_advanced_features:
         # Use advanced pipeline
         selected_pages, range_description, page_groups = _parse_with_advanced_pipeline(
-            range_str, total_pages, pdf_path, filter_matches, group_start, group_end
+            range_str, total_pages, pdf_path, filter_matches, group_start, group_end, filter_mode
         )
     else:
         # Use original logic
@@ -146,7 +147,7 @@ def _parse_original_logic(range_str: str, total_pages: int, pdf_path: Path = Non
 
 def _parse_with_advanced_pipeline(range_str: str, total_pages: int, pdf_path: Path,
                                     filter_matches: str, group_start: str, 
-                                    group_end: str) -> tuple[set[int], str, list[PageGroup]]:
+                                    group_end: str, filter_mode: str = 'any') -> tuple[set[int], str, list[PageGroup]]:
     """Parse using advanced pipeline with filtering and boundary detection."""
     
     # Phase 1: Initial page selection (use original logic)
@@ -171,7 +172,7 @@ def _parse_with_advanced_pipeline(range_str: str, total_pages: int, pdf_path: Pa
         from pdf_manipulator.core.page_range.group_filtering import filter_page_groups
         
         current_groups = filter_page_groups(
-            current_groups, filter_matches, pdf_path, total_pages
+            current_groups, filter_matches, pdf_path, total_pages, filter_mode
         )
         
         # Recalculate pages from filtered groups
@@ -288,25 +289,8 @@ def parse_page_range_from_args(*args, **kwargs):
     args = None
     kwargs = None
     
-    # Check if we already have results
-    cached = OpCtx.get_cached_parsing_results()
-    if cached:
-        console.print("✨ Using cached parsing results")
-        return cached.selected_pages, cached.range_description, cached.page_groups
-    
-    # No results yet - parse using OpCtx args
-    selected_pages, range_description, page_groups = parse_page_range(
-        OpCtx.get_page_range_arg(),
-        OpCtx.current_page_count,
-        OpCtx.current_pdf_path,
-        getattr(OpCtx.args, 'filter_matches', None),
-        getattr(OpCtx.args, 'group_start', None),
-        getattr(OpCtx.args, 'group_end', None)
-    )
-    
-    # Store and return
-    OpCtx.store_parsed_results(selected_pages, range_description, page_groups)
-    return selected_pages, range_description, page_groups
+    # parse_page_range() serves cached results for the current PDF and arguments
+    return parse_page_range()
 
 
 # End of file #
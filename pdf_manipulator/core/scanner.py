@@ -1,42 +1,193 @@
-"""File system scanning and PDF info extraction."""
+"""
+File system scanning and PDF info extraction.
+
+Page counts come from the page tree root's /Count, which only needs the
+trailer, catalog and root page node - not a walk of the whole page tree like
+len(reader.pages). The full walk is only done when /Count doesn't add up.
+
+Folders with many PDFs are scanned on a process pool (parsing is CPU-bound
+pypdf work) and results are yielded as they arrive.
+
+When folder manifests are configured (see cache/folder_manifest.py), files
+whose (inode, size, mtime_ns) haven't changed since the last scan aren't
+opened at all.
+"""
+
+import os
 
 from pypdf import PdfReader
 from pathlib import Path
 from rich.console import Console
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator
 
 from pdf_manipulator.core.warning_suppression import suppress_pdf_warnings
+from pdf_manipulator.core.document_session import get_document_session
+from pdf_manipulator.core.cache.text_cache import get_document_key
+from pdf_manipulator.core.cache.folder_manifest import FolderManifest, get_folder_manifests
 
 console = Console()
 
 
+PARALLEL_SCAN_THRESHOLD = 32    # Fewer files than this aren't worth starting a pool for
+SCAN_CHUNK_SIZE = 16            # Files per worker task
+
+
+def read_page_count(reader: PdfReader) -> int:
+    """
+    Page count of an open PDF, read from the page tree root.
+
+    The root's /Count is trusted when its direct kids add up to it (a kid
+    counts 1 if it's a page, its own /Count if it's an intermediate node);
+    otherwise the whole page tree is walked.
+    """
+    try:
+        pages_root = reader.trailer['/Root']['/Pages']
+        count = int(pages_root['/Count'])
+
+        kid_total = 0
+        for kid in pages_root['/Kids']:
+            kid = kid.get_object()
+            kid_total += int(kid['/Count']) if '/Kids' in kid else 1
+
+        if count > 0 and kid_total == count:
+            return count
+    except Exception:
+        pass
+
+    return len(reader.pages)
+
+
+def _read_pdf_info(pdf_path: Path) -> tuple[int, float]:
+    """Page count and size in MB (raises on unreadable files)."""
+    with suppress_pdf_warnings():
+        with open(pdf_path, 'rb') as file:
+            page_count = read_page_count(PdfReader(file))
+
+    file_size = pdf_path.stat().st_size / (1024 * 1024)  # Convert to MB
+    return page_count, file_size
+
+
 def get_pdf_info(pdf_path: Path) -> tuple[int, float]:
-    """Get page count and file size for a PDF."""
+    """Get page count and file size for a PDF (read through its shared document session)."""
     try:
         with suppress_pdf_warnings():
-            with open(pdf_path, 'rb') as file:
-                reader = PdfReader(file)
-                page_count = len(reader.pages)
-
-            file_size = pdf_path.stat().st_size / (1024 * 1024)  # Convert to MB
-            return page_count, file_size
+            page_count = read_page_count(get_document_session(pdf_path).reader)
+        return page_count, pdf_path.stat().st_size / (1024 * 1024)
     except Exception as e:
         console.print(f"[red]Error reading {pdf_path.name}: {e}[/red]")
         return 0, 0
 
 
-def scan_folder(folder_path: Path) -> list[tuple[Path, int, float]]:
-    """Scan folder for PDF files and return their info."""
-    pdf_files = []
+def _scan_chunk(pdf_paths: list[Path],
+                content_hash: bool = False) -> list[tuple[Path, int, float, str | None, str | None]]:
+    """Worker task: (path, pages, size MB, error message or None, content hash or None) per file."""
+    results = []
+    for pdf_path in pdf_paths:
+        try:
+            page_count, file_size = _read_pdf_info(pdf_path)
+            digest = get_document_key(pdf_path) if content_hash else None
+            results.append((pdf_path, page_count, file_size, None, digest))
+        except Exception as e:
+            results.append((pdf_path, 0, 0, str(e), None))
+    return results
+
+
+def _iter_scan_results(pdf_paths: list[Path], jobs: int | None = None, content_hash: bool = False):
+    """Raw _scan_chunk results for every file, serially or on a process pool."""
+    if jobs is None:
+        jobs = 0 if len(pdf_paths) >= PARALLEL_SCAN_THRESHOLD else 1
+    workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+
+    chunks = [pdf_paths[i:i + SCAN_CHUNK_SIZE] for i in range(0, len(pdf_paths), SCAN_CHUNK_SIZE)]
 
-    for pdf_path in folder_path.glob("*.pdf"):
-        # Skip processing hidden files ".", including macOS metadata files "._"
-        if pdf_path.name.startswith("."):
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield from _scan_chunk(chunk, content_hash)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        futures = [executor.submit(_scan_chunk, chunk, content_hash) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def iter_pdf_info(pdf_paths: Iterable[Path], jobs: int | None = None) -> Iterator[tuple[Path, int, float]]:
+    """
+    Scan PDFs, yielding (path, page_count, size_mb) as each one is read.
+
+    Unreadable files are reported and skipped, as are files without pages.
+    With several workers, results arrive in completion order.
+
+    Args:
+        pdf_paths: Files to scan
+        jobs: Worker processes (None = one per CPU for large scans, 0 = one per CPU, 1 = serial)
+    """
+    results = _iter_scan_results(list(pdf_paths), jobs)
+    yield from _report_results(result[:4] for result in results)
+
+
+def _scan_with_manifest(manifest: FolderManifest, pdf_paths: list[Path],
+                        jobs: int | None = None) -> Iterator[tuple[Path, int, float]]:
+    """Scan only the files that changed since the manifest was written, then save it."""
+    results = []
+    changed = {}
+
+    for pdf_path in pdf_paths:
+        try:
+            stat = pdf_path.stat()
+        except OSError as e:
+            results.append((pdf_path, 0, 0, str(e)))
             continue
-        page_count, file_size = get_pdf_info(pdf_path)
-        if page_count > 0:
-            pdf_files.append((pdf_path, page_count, file_size))
 
-    return sorted(pdf_files, key=lambda x: x[0].name)
+        entry = manifest.lookup(pdf_path, stat)
+        if entry is None:
+            changed[pdf_path] = stat
+        else:
+            results.append((pdf_path, entry['pages'], entry['size_mb'], entry['error']))
+
+    for pdf_path, page_count, file_size, error, digest in _iter_scan_results(list(changed), jobs,
+                                                                             content_hash=True):
+        manifest.update(pdf_path, changed[pdf_path], page_count, file_size, error, digest)
+        results.append((pdf_path, page_count, file_size, error))
+
+    manifest.retain(pdf_paths)
+    manifest.save()
+    return _report_results(results)
+
+
+def _report_results(results) -> Iterator[tuple[Path, int, float]]:
+    """Print read errors and drop empty files."""
+    for pdf_path, page_count, file_size, error in results:
+        if error is not None:
+            console.print(f"[red]Error reading {pdf_path.name}: {error}[/red]")
+        elif page_count > 0:
+            yield pdf_path, page_count, file_size
+
+
+def find_pdf_files(folder_path: Path, recursive: bool = False) -> list[Path]:
+    """PDF files in a folder (and its subfolders if recursive), skipping hidden files and folders."""
+    candidates = folder_path.rglob("*.pdf") if recursive else folder_path.glob("*.pdf")
+
+    # Skip hidden files ".", including macOS metadata files "._", and hidden folders
+    return [pdf_path for pdf_path in candidates
+            if not any(part.startswith(".") for part in pdf_path.relative_to(folder_path).parts)]
+
+
+def scan_folder(folder_path: Path, recursive: bool = False,
+                jobs: int | None = None) -> list[tuple[Path, int, float]]:
+    """Scan folder for PDF files and return their info, sorted by path."""
+    pdf_paths = find_pdf_files(folder_path, recursive)
+
+    manifests = get_folder_manifests()
+    if manifests is None:
+        pdf_files = list(iter_pdf_info(pdf_paths, jobs))
+    else:
+        manifest = manifests.load(folder_path, recursive)
+        manifests.track(manifest, pdf_paths)
+        pdf_files = list(_scan_with_manifest(manifest, pdf_paths, jobs))
+
+    return sorted(pdf_files, key=lambda x: x[0].relative_to(folder_path).as_posix())
 
 
 def scan_file(file_path: Path) -> list[tuple[Path, int, float]]:
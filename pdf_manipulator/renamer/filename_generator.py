@@ -75,7 +75,7 @@ class FilenameGenerator:
             # Parse and validate all patterns
             parsed_patterns = self.pattern_processor.validate_pattern_list(patterns)
             extraction_results['patterns_processed'] = [
-                f"{var}={keyword}:{spec}" for var, keyword, spec in parsed_patterns
+                pattern_info['original_pattern'] for pattern_info in parsed_patterns
             ]
             
             # Extract content using enhanced pattern processor
@@ -152,35 +152,17 @@ class FilenameGenerator:
         
         Args:
             pdf_path: Path to PDF file
-            parsed_patterns: List of (variable_name, keyword, extraction_spec) tuples
+            parsed_patterns: Pattern dictionaries from validate_pattern_list
             source_page: Fallback page for patterns without pg specification
             dry_run: Whether this is a dry-run extraction
             
         Returns:
             Dictionary mapping variable names to extraction results
         """
-        results = {}
-        
-        for variable_name, keyword, extraction_spec in parsed_patterns:
-            try:
-                # Phase 3: Use enhanced extraction with multi-page/multi-match support
-                result = self.pattern_processor.extract_from_pdf(
-                    pdf_path, variable_name, keyword, extraction_spec, source_page
-                )
-                results[variable_name] = result
-                
-            except Exception as e:
-                # Individual pattern extraction failed
-                results[variable_name] = {
-                    'variable_name': variable_name,
-                    'keyword': keyword,
-                    'success': False,
-                    'selected_match': f"Error: {str(e)}",
-                    'warnings': [f"Extraction failed: {str(e)}"],
-                    'debug_info': {'exception': str(e)}
-                }
-        
-        return results
+        # Phase 3: Use enhanced extraction with multi-page/multi-match support,
+        # one pass over the document for all patterns (per-pattern errors are
+        # reported in that pattern's result)
+        return self.pattern_processor.extract_all_from_pdf(pdf_path, parsed_patterns, source_page)
     
     def _build_template_variables(self, extraction_results: dict, original_path: Path, 
                                  page_range_desc: str, dry_run: bool) -> dict:
@@ -357,7 +339,11 @@ class FilenameGenerator:
         try:
             parsed_patterns = self.pattern_processor.validate_pattern_list(patterns)
             
-            for var_name, keyword, extraction_spec in parsed_patterns:
+            for pattern_info in parsed_patterns:
+                var_name = pattern_info['variable_name']
+                keyword = pattern_info['keyword']
+                extraction_spec = pattern_info['extraction_spec']
+                
                 # Create realistic simulated values
                 simulated_value = self._generate_simulated_value(keyword, var_name)
                 extraction_preview[var_name] = {
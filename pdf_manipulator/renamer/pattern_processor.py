@@ -411,56 +411,117 @@ class PatternProcessor:
         # Validate and parse patterns
         parsed_patterns = self.validate_pattern_list(patterns)
         
-        # Extract text from PDF
+        return self.extract_all_from_pdf(pdf_path, parsed_patterns)
+    
+    def extract_from_pdf(self, pdf_path: Path, variable_name: str, keyword: str,
+                         extraction_spec: dict, source_page: int = 1) -> dict:
+        """
+        Extract a single parsed pattern from a PDF.
+        
+        Args:
+            pdf_path: Path to PDF file
+            variable_name: Variable the result is stored under
+            keyword: Keyword to search for
+            extraction_spec: Parsed extraction spec (see _parse_extraction_spec)
+            source_page: Page searched when the pattern has no pg specification
+            
+        Returns:
+            Extraction result dictionary
+        """
+        parsed_pattern = {
+            'variable_name': variable_name,
+            'keyword': keyword,
+            'extraction_spec': extraction_spec,
+        }
+        return self.extract_all_from_pdf(pdf_path, [parsed_pattern], source_page)[variable_name]
+    
+    def extract_all_from_pdf(self, pdf_path: Path, parsed_patterns: list[dict],
+                             source_page: int = 1) -> dict:
+        """
+        Extract every parsed pattern from a PDF in one pass over its pages.
+        
+        Each page any pattern needs is extracted once and patterns sharing a
+        keyword share the keyword search (see PatternExtractor.extract_patterns_enhanced).
+        Space exclusion and trimming are applied to the selected match afterwards.
+        
+        Args:
+            pdf_path: Path to PDF file
+            parsed_patterns: Pattern dictionaries from validate_pattern_list
+            source_page: Page searched by patterns without pg specification
+            
+        Returns:
+            Dictionary mapping variable names to extraction results
+        """
+        requests = []
+        for pattern_info in parsed_patterns:
+            extraction_spec = pattern_info['extraction_spec']
+            pattern = {
+                'keyword': pattern_info['keyword'],
+                **extraction_spec,
+                'flexible': extraction_spec.get('flags', {}).get('flexible', False),
+            }
+            if pattern.get('match_spec') is None:
+                pattern.pop('match_spec', None)     # Extractor default: first match
+            page_spec = extraction_spec.get('page_spec') or {'type': 'single', 'value': source_page}
+            requests.append((pattern, page_spec))
+        
         try:
-            pdf_text = self.processor.extract_text_simple(pdf_path)
-        except Exception as e:
-            raise CompactPatternError(f"Failed to extract text from PDF: {e}")
+            extracted = self.extractor.extract_patterns_enhanced(pdf_path, requests)
+        except Exception:
+            # Retry one at a time so only the failing pattern reports the error
+            # (page text is memoized by the document session, so this doesn't re-extract)
+            extracted = []
+            for pattern, page_spec in requests:
+                try:
+                    extracted.append(self.extractor.extract_pattern_enhanced(pdf_path, pattern, page_spec))
+                except Exception as e:
+                    extracted.append(e)
         
-        # Process each pattern
         results = {}
-        for pattern_info in parsed_patterns:
+        for pattern_info, result in zip(parsed_patterns, extracted):
             var_name = pattern_info['variable_name']
             keyword = pattern_info['keyword']
-            extraction_spec = pattern_info['extraction_spec']
             
             try:
-                # Use PatternExtractor to extract content
-                extracted_value = self.extractor.extract_pattern_enhanced(
-                    pdf_path, 
-                    {
-                        'keyword': keyword,
-                        **extraction_spec
-                    }
-                )
-                
-                # Apply trimming if specified
-                if extraction_spec.get('start_trimmers') or extraction_spec.get('end_trimmers'):
-                    if extracted_value and 'result' in extracted_value:
-                        content = extracted_value['result']
-                        
-                        # Apply space exclusion flag if set
-                        if extraction_spec.get('flags', {}).get('exclude_spaces'):
-                            content = content.replace(' ', '')
-                        
-                        # Apply trimming
-                        trimmed_content = apply_trimmers(
-                            content,
-                            extraction_spec.get('start_trimmers', []),
-                            extraction_spec.get('end_trimmers', [])
-                        )
-                        
-                        extracted_value['result'] = trimmed_content
-                
-                results[var_name] = extracted_value
-                
+                if isinstance(result, Exception):
+                    raise result
+                results[var_name] = self._finish_result(result, pattern_info['extraction_spec'])
             except Exception as e:
                 results[var_name] = {
-                    'error': str(e),
-                    'pattern': pattern_info['original_pattern']
+                    'success': False,
+                    'selected_match': f"Error: {str(e)}",
+                    'warnings': [f"Extraction failed: {str(e)}"],
+                    'debug_info': {'exception': str(e)}
                 }
+            
+            results[var_name]['variable_name'] = var_name
+            results[var_name]['keyword'] = keyword
         
         return results
-
+    
+    def _finish_result(self, result: dict, extraction_spec: dict) -> dict:
+        """Apply space exclusion and trimming to the selected match(es) of a result."""
+        selected = result.get('selected_match')
+        if not result.get('success') or selected in (None, "No_Match"):
+            return result
+        
+        exclude_spaces = extraction_spec.get('flags', {}).get('exclude_spaces', False)
+        start_trimmers = extraction_spec.get('start_trimmers', [])
+        end_trimmers = extraction_spec.get('end_trimmers', [])
+        if not (exclude_spaces or start_trimmers or end_trimmers):
+            return result
+        
+        def finish(content: str) -> str:
+            if exclude_spaces:
+                content = content.replace(' ', '')
+            if start_trimmers or end_trimmers:
+                content = apply_trimmers(content, start_trimmers, end_trimmers)
+            return content
+        
+        if isinstance(selected, list):
+            result['selected_match'] = [finish(content) for content in selected]
+        else:
+            result['selected_match'] = finish(selected)
+        return result
 
 # End of file #
@@ -4,7 +4,7 @@ Entry point for running Simple PDF Scraper as a module.
 
 import sys
 
-from simple_pdf_scraper.cli import main
+from pdf_manipulator.scraper.cli import main
 
 
 if __name__ == "__main__":
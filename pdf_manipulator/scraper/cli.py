@@ -10,12 +10,23 @@ import argparse
 import warnings
 
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-from simple_pdf_scraper.output.tsv_writer import TSVWriter
+from pdf_manipulator.scraper.output.schema import column_types_for
+from pdf_manipulator.scraper.output.tsv_writer import TSVStreamWriter
+from pdf_manipulator.scraper.output.sqlite_writer import SQLiteStreamWriter
+from pdf_manipulator.scraper.output.columnar_writer import ColumnarStreamWriter, default_columnar_suffix
 from simple_pdf_scraper.processors.pypdf_processor import PyPDFProcessor
 from simple_pdf_scraper.extractors.pattern_extractor import PatternExtractor
 
 
+# Files in flight per worker: bounds the reorder buffer between workers finishing
+# out of order and rows being written in input order
+FILES_IN_FLIGHT_PER_JOB = 4
+
+OUTPUT_FORMATS = ['tsv', 'sqlite', 'columnar']
+
+
 def parse_pattern(pattern_str):
     """
     Parse pattern string in format: keyword:direction:distance:extract_type
@@ -142,6 +153,102 @@ def dump_text_from_pdf(pdf_file, processor, verbose=False, output_file=None):
         return False
 
 
+def extract_rows(pdf_file, processor, extractor, patterns):
+    """Extract one file's rows (pages where at least one pattern matched)."""
+    rows = []
+    pages = processor.extract_pages(pdf_file)
+    for page_num, page_text in enumerate(pages, 1):
+        row = [pdf_file, page_num]
+        
+        for pattern in patterns:
+            result = extractor.extract_pattern(page_text, pattern)
+            row.append(result if result is not None else '')
+        
+        # Only add row if at least one pattern matched
+        if any(cell != '' for cell in row[2:]):
+            rows.append(row)
+    
+    return rows
+
+
+_worker_state = {}
+
+
+def _init_worker(processor, patterns):
+    """Set up a pool worker's processor and extractor once."""
+    _worker_state['processor'] = processor
+    _worker_state['extractor'] = PatternExtractor()
+    _worker_state['patterns'] = patterns
+
+
+def _extract_rows_in_worker(pdf_file):
+    try:
+        return extract_rows(pdf_file, _worker_state['processor'], _worker_state['extractor'],
+                            _worker_state['patterns']), None
+    except Exception as e:
+        return None, str(e)
+
+
+def iter_file_rows(pdf_files, processor, patterns, jobs=1):
+    """
+    Extract rows file by file, yielding (pdf_file, rows, error) in input order.
+    
+    With jobs > 1 files are extracted by a process pool. At most
+    FILES_IN_FLIGHT_PER_JOB files per worker are submitted ahead of the next
+    file to yield, so results that finish early wait in a bounded buffer and
+    output order never depends on scheduling.
+    """
+    if jobs <= 1:
+        extractor = PatternExtractor()
+        for pdf_file in pdf_files:
+            try:
+                yield pdf_file, extract_rows(pdf_file, processor, extractor, patterns), None
+            except Exception as e:
+                yield pdf_file, None, str(e)
+        return
+    
+    window = jobs * FILES_IN_FLIGHT_PER_JOB
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(processor, patterns)) as pool:
+        pending = {}
+        next_submit = 0
+        try:
+            for index, pdf_file in enumerate(pdf_files):
+                while next_submit < len(pdf_files) and next_submit < index + window:
+                    pending[next_submit] = pool.submit(_extract_rows_in_worker, pdf_files[next_submit])
+                    next_submit += 1
+                
+                rows, error = pending.pop(index).result()
+                yield pdf_file, rows, error
+        finally:
+            for future in pending.values():
+                future.cancel()
+
+
+def default_output_file(output_format):
+    """Default output file name for an output format."""
+    if output_format == 'sqlite':
+        return 'extracted_data.sqlite'
+    if output_format == 'columnar':
+        return f'extracted_data{default_columnar_suffix()}'
+    return 'extracted_data.tsv'
+
+
+def open_output_writer(output_format, output_file, headers, patterns, resume=False):
+    """
+    Open the streaming writer for an output format.
+    
+    Raises:
+        IOError: If the output cannot be written
+        ValueError: If the previous run can't be resumed
+    """
+    if output_format == 'sqlite':
+        return SQLiteStreamWriter(output_file, headers, column_types_for(patterns), resume=resume)
+    if output_format == 'columnar':
+        return ColumnarStreamWriter(output_file, headers, column_types_for(patterns), resume=resume)
+    return TSVStreamWriter(output_file, headers, resume=resume)
+
+
 def create_argument_parser():
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -150,19 +257,25 @@ def create_argument_parser():
         epilog="""
 Examples:
   # Dump raw text to console (debugging)
-  python -m simple_pdf_scraper --dump-text document.pdf
+  python -m pdf_manipulator.scraper --dump-text document.pdf
   
   # Dump text to file
-  python -m simple_pdf_scraper --dump-text document.pdf -o extracted_text.txt
+  python -m pdf_manipulator.scraper --dump-text document.pdf -o extracted_text.txt
   
   # Extract invoice number (word immediately right of "Invoice #")
-  python -m simple_pdf_scraper invoice.pdf --pattern "Invoice #:right:0:word"
+  python -m pdf_manipulator.scraper invoice.pdf --pattern "Invoice #:right:0:word"
   
   # Extract company name (line above "Invoice #") 
-  python -m simple_pdf_scraper invoice.pdf --pattern "Invoice #:above:1:line"
+  python -m pdf_manipulator.scraper invoice.pdf --pattern "Invoice #:above:1:line"
   
   # Multiple patterns from file
-  python -m simple_pdf_scraper *.pdf --patterns-file patterns.txt -o results.tsv
+  python -m pdf_manipulator.scraper *.pdf --patterns-file patterns.txt -o results.tsv
+  
+  # Large batch: 8 worker processes, continue where an interrupted run stopped
+  python -m pdf_manipulator.scraper *.pdf --patterns-file patterns.txt -o results.tsv --jobs 8 --resume
+  
+  # Typed output for analytics (numbers stay numbers)
+  python -m pdf_manipulator.scraper *.pdf --patterns-file patterns.txt --format sqlite -o results.sqlite
 
 Pattern format: keyword:direction:distance:extract_type
   keyword:       Text to search for (case-insensitive)
@@ -188,15 +301,22 @@ work even though TSV output flattens results into cells.
     
     # Output options
     parser.add_argument('--output', '-o', 
-                       help='Output file name (default: extracted_data.tsv for patterns, stdout for --dump-text)')
+                       help='Output file name (default: extracted_data.<format> for patterns, stdout for --dump-text)')
     parser.add_argument('--headers', nargs='+',
                        help='Custom column headers (default: auto-generated from patterns)')
+    parser.add_argument('--format', default='tsv', choices=OUTPUT_FORMATS,
+                       help='Output format: tsv, sqlite, or columnar (Parquet with pyarrow, '
+                            'otherwise a compact typed column file) (default: tsv)')
     
     # Processing options
     parser.add_argument('--processor', default='pypdf', choices=['pypdf'],
                        help='PDF processing backend (default: pypdf)')
     parser.add_argument('--quiet', '-q', action='store_true',
                        help='Suppress pypdf warnings about malformed PDFs')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of worker processes for pattern extraction (default: 1)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Skip files completed by an interrupted run with the same output file')
     
     # Verbosity
     parser.add_argument('--verbose', '-v', action='store_true',
@@ -282,14 +402,12 @@ def main():
             return 1
         
         # Set default output file for pattern mode
-        output_file = args.output or 'extracted_data.tsv'
+        output_file = args.output or default_output_file(args.format)
         
         if args.verbose:
             print(f"Found {len(pdf_files)} PDF files to process")
             print(f"Using {len(patterns)} extraction patterns")
         
-        extractor = PatternExtractor()
-        
         # Set up column headers
         if args.headers:
             if len(args.headers) != len(patterns):
@@ -299,47 +417,47 @@ def main():
         else:
             headers = ['filename', 'page'] + [p['keyword'] for p in patterns]
         
-        # Process files
-        all_results = []
+        # Process files, writing each file's rows as soon as it is done
+        try:
+            writer = open_output_writer(args.format, output_file, headers, patterns, resume=args.resume)
+        except (IOError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        
         total_files = len(pdf_files)
-        processed_files = 0
+        pending_files = [f for f in pdf_files if not writer.is_completed(f)]
+        processed_files = total_files - len(pending_files)
+        failed_files = 0
         
-        for pdf_file in pdf_files:
-            if args.verbose:
-                print(f"Processing: {pdf_file}")
-            
-            try:
-                pages = processor.extract_pages(pdf_file)
-                for page_num, page_text in enumerate(pages, 1):
-                    row = [pdf_file, page_num]
-                    
-                    for pattern in patterns:
-                        result = extractor.extract_pattern(page_text, pattern)
-                        row.append(result if result is not None else '')
-                    
-                    # Only add row if at least one pattern matched
-                    if any(cell != '' for cell in row[2:]):
-                        all_results.append(row)
+        if args.verbose and processed_files:
+            print(f"Skipping {processed_files} files completed by a previous run")
+        
+        with writer:
+            for pdf_file, rows, error in iter_file_rows(pending_files, processor, patterns, args.jobs):
+                if args.verbose:
+                    print(f"Processing: {pdf_file}")
                 
-                processed_files += 1
+                if error is not None:
+                    print(f"Error processing {pdf_file}: {error}", file=sys.stderr)
+                    failed_files += 1
+                    continue
                 
-            except Exception as e:
-                print(f"Error processing {pdf_file}: {e}", file=sys.stderr)
-                continue
-        
-        # Write results
-        if all_results:
-            writer = TSVWriter()
-            writer.write_results(output_file, headers, all_results)
+                writer.write_file_rows(pdf_file, rows)
+                processed_files += 1
             
-            if args.verbose:
-                print(f"Successfully processed {processed_files}/{total_files} files")
-                print(f"Extracted {len(all_results)} rows of data")
-                print(f"Results written to: {output_file}")
-        else:
+            # Keep the checkpoint while failed files remain to be retried
+            writer.close(finished=failed_files == 0)
+        
+        if writer.rows_written == 0:
+            writer.discard()
             print("No data extracted from any files", file=sys.stderr)
             return 1
         
+        if args.verbose:
+            print(f"Successfully processed {processed_files}/{total_files} files")
+            print(f"Extracted {writer.rows_written} rows of data")
+            print(f"Results written to: {output_file}")
+        
         return 0
         
     finally:
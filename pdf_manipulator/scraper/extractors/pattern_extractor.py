@@ -15,6 +15,8 @@ import re
 from pathlib import Path
 
 from pdf_manipulator.scraper.processors.pypdf_processor import PyPDFProcessor
+from pdf_manipulator.scraper.extractors.tokenized_page import TokenizedPage, tokenize_page
+from pdf_manipulator.core.document_session import get_document_session
 
 
 class PatternExtractor:
@@ -47,12 +49,61 @@ class PatternExtractor:
         Returns:
             Dictionary with comprehensive extraction results and metadata
         """
-        # Determine pages to search
-        if page_spec:
-            pages_to_search = self._resolve_page_range(pdf_path, page_spec)
-        else:
-            pages_to_search = [1]  # Default to first page for backward compatibility
+        return self.extract_patterns_enhanced(pdf_path, [(pattern, page_spec)])[0]
+    
+    def extract_patterns_enhanced(self, pdf_path: Path, requests: list[tuple[dict, dict]]) -> list[dict]:
+        """
+        Extract several patterns in a single pass over the document.
+        
+        Every pattern's page specification is resolved against one page count,
+        each page in their union is extracted once, and keyword matches are
+        found once per (page, keyword) and shared by every pattern using them.
+        
+        Args:
+            pdf_path: Path to PDF file
+            requests: (pattern, page_spec) pairs, as passed to extract_pattern_enhanced
+            
+        Returns:
+            One result dictionary per request, in order - the same dictionaries
+            extract_pattern_enhanced returns
+        """
+        total_pages = None
+        if any(page_spec for _, page_spec in requests):
+            total_pages = self._get_pdf_page_count(pdf_path)
         
+        # Determine pages to search for each pattern
+        page_lists = []
+        for _, page_spec in requests:
+            if page_spec:
+                page_lists.append(self._resolve_page_range(pdf_path, page_spec, total_pages))
+            else:
+                page_lists.append([1])  # Default to first page for backward compatibility
+        
+        # Extract every needed page once
+        page_texts = {page_num: self._extract_page_text(pdf_path, page_num)
+                      for page_num in sorted(set().union(*page_lists))}
+        
+        keyword_matches = {}
+        return [
+            self._evaluate_pattern(pattern, page_spec, pages_to_search, page_texts, keyword_matches)
+            for (pattern, page_spec), pages_to_search in zip(requests, page_lists)
+        ]
+    
+    def _evaluate_pattern(self, pattern: dict, page_spec: dict, pages_to_search: list[int],
+                          page_texts: dict[int, str], keyword_matches: dict) -> dict:
+        """
+        Find and select one pattern's matches in already extracted page text.
+        
+        Args:
+            pattern: Enhanced pattern dictionary with movements, extraction spec
+            page_spec: Page specification (for debug info)
+            pages_to_search: Resolved pages for this pattern
+            page_texts: Page number -> extracted text for (at least) those pages
+            keyword_matches: Shared (page, keyword) -> matches memo
+            
+        Returns:
+            Dictionary with comprehensive extraction results and metadata
+        """
         if not pages_to_search:
             return {
                 'success': False,
@@ -69,10 +120,16 @@ class PatternExtractor:
         
         for page_num in pages_to_search:
             try:
-                page_text = self._extract_page_text(pdf_path, page_num)
+                page_text = page_texts[page_num]
                 if page_text.strip():  # Only process pages with content
                     pages_with_text.append(page_num)
-                    page_matches = self.find_all_keyword_matches(page_text, pattern['keyword'])
+                    page = tokenize_page(page_text)
+                    
+                    # Patterns sharing a keyword share the search (copies - matches get annotated below)
+                    match_key = (page_num, pattern['keyword'])
+                    if match_key not in keyword_matches:
+                        keyword_matches[match_key] = self.find_all_keyword_matches(page, pattern['keyword'])
+                    page_matches = [dict(match) for match in keyword_matches[match_key]]
                     
                     # Add page context and extract content from each match
                     for match in page_matches:
@@ -80,7 +137,7 @@ class PatternExtractor:
                         match['page_text'] = page_text
                         
                         # Extract content from this match position
-                        extracted_content = self._extract_from_match_position(page_text, match, pattern)
+                        extracted_content = self._extract_from_match_position(page, match, pattern)
                         match['extracted_content'] = extracted_content
                         
                         all_matches.append(match)
@@ -153,20 +210,22 @@ class PatternExtractor:
                 }
             }
     
-    def _resolve_page_range(self, pdf_path: Path, page_spec: dict) -> list[int]:
+    def _resolve_page_range(self, pdf_path: Path, page_spec: dict, total_pages: int = None) -> list[int]:
         """
         Convert page specification to actual page numbers.
         
         Args:
             pdf_path: Path to PDF file
             page_spec: Page specification dictionary
+            total_pages: Page count if already known
             
         Returns:
             List of valid page numbers
         """
         try:
             # Get total page count
-            total_pages = self._get_pdf_page_count(pdf_path)
+            if total_pages is None:
+                total_pages = self._get_pdf_page_count(pdf_path)
             
             if page_spec['type'] == 'all':
                 return list(range(1, total_pages + 1))
@@ -201,10 +260,7 @@ class PatternExtractor:
             Number of pages, or 1 if unable to determine
         """
         try:
-            import pypdf
-            with open(pdf_path, 'rb') as f:
-                reader = pypdf.PdfReader(f)
-                return len(reader.pages)
+            return get_document_session(pdf_path).page_count
         except Exception:
             return 1  # Conservative fallback
     
@@ -271,12 +327,12 @@ class PatternExtractor:
         
         return [matches[0]] if matches else [], warnings  # Fallback to first match
     
-    def _extract_from_match_position(self, page_text: str, match_info: dict, pattern: dict) -> str:
+    def _extract_from_match_position(self, page_text: str | TokenizedPage, match_info: dict, pattern: dict) -> str:
         """
         Extract content from a specific match position using pattern movements.
         
         Args:
-            page_text: Full page text
+            page_text: Full page text (or its tokenized form)
             match_info: Match position information
             pattern: Pattern specification with movements and extraction
             
@@ -303,6 +359,9 @@ class PatternExtractor:
         Legacy method for backward compatibility with Phase 2 patterns.
         """
         # Convert to single-page, single-match format for legacy callers
+        if text:
+            text = self._tokenized(text)
+        
         if isinstance(pattern, dict) and 'keyword' in pattern:
             # Enhanced pattern format
             keyword_pos = self.find_keyword(text, pattern['keyword'])
@@ -332,6 +391,11 @@ class PatternExtractor:
             target_pos = self._calculate_target_position(text, keyword_pos, movement_direction, movement_distance)
             return self._extract_content(text, target_pos, extract_type)
     
+    @staticmethod
+    def _tokenized(text) -> TokenizedPage:
+        """Page text or an already tokenized page, as a TokenizedPage."""
+        return text if isinstance(text, TokenizedPage) else tokenize_page(text)
+    
     def find_keyword(self, text, keyword):
         """
         Find the position of a keyword in text.
@@ -340,58 +404,19 @@ class PatternExtractor:
         if not text or not keyword:
             return None
         
-        lines = text.split('\n')
-        keyword_lower = keyword.lower()
-        keyword_words = keyword_lower.split()
-        
-        # If single word keyword, use original logic but handle punctuation
-        if len(keyword_words) == 1:
-            for line_idx, line in enumerate(lines):
-                words = line.split()
-                for word_idx, word in enumerate(words):
-                    # Remove punctuation for comparison
-                    clean_word = ''.join(c for c in word.lower() if c.isalnum())
-                    clean_keyword = ''.join(c for c in keyword_lower if c.isalnum())
-                    
-                    if clean_keyword in clean_word:
-                        return {
-                            'line': line_idx,
-                            'word_index': word_idx,
-                            'word': word,
-                            'line_text': line
-                        }
-        
-        # Multi-word keyword matching
-        else:
-            for line_idx, line in enumerate(lines):
-                words = line.split()
-                for word_idx in range(len(words) - len(keyword_words) + 1):
-                    # Check if consecutive words match the keyword
-                    match = True
-                    for i, kw in enumerate(keyword_words):
-                        if word_idx + i >= len(words):
-                            match = False
-                            break
-                        
-                        word = words[word_idx + i]
-                        # Remove punctuation for comparison
-                        clean_word = ''.join(c for c in word.lower() if c.isalnum())
-                        clean_keyword = ''.join(c for c in kw if c.isalnum())
-                        
-                        if clean_keyword not in clean_word:
-                            match = False
-                            break
-                    
-                    if match:
-                        # Return position of the last word in the keyword phrase
-                        return {
-                            'line': line_idx,
-                            'word_index': word_idx + len(keyword_words) - 1,
-                            'word': words[word_idx + len(keyword_words) - 1],
-                            'line_text': line
-                        }
+        page = self._tokenized(text)
+        matches = page.find_keyword(keyword)
+        if not matches:
+            return None
         
-        return None
+        # Position of the last word in a multi-word keyword phrase
+        line_idx, _, word_idx = matches[0]
+        return {
+            'line': line_idx,
+            'word_index': word_idx,
+            'word': page.words[line_idx][word_idx],
+            'line_text': page.lines[line_idx]
+        }
 
     def find_all_keyword_matches(self, text, keyword):
         """
@@ -401,65 +426,19 @@ class PatternExtractor:
         if not text or not keyword:
             return []
         
+        page = self._tokenized(text)
         matches = []
-        lines = text.split('\n')
-        keyword_lower = keyword.lower()
-        keyword_words = keyword_lower.split()
-        
-        # Single word keyword matching
-        if len(keyword_words) == 1:
-            for line_idx, line in enumerate(lines):
-                words = line.split()
-                for word_idx, word in enumerate(words):
-                    # Remove punctuation for comparison
-                    clean_word = ''.join(c for c in word.lower() if c.isalnum())
-                    clean_keyword = ''.join(c for c in keyword_lower if c.isalnum())
-                    
-                    if clean_keyword in clean_word:
-                        matches.append({
-                            'line': line_idx,
-                            'word_index': word_idx,
-                            'word': word,
-                            'line_text': line,
-                            'match_text': word,
-                            'keyword': keyword
-                        })
-        
-        # Multi-word keyword matching
-        else:
-            for line_idx, line in enumerate(lines):
-                words = line.split()
-                for word_idx in range(len(words) - len(keyword_words) + 1):
-                    # Check if consecutive words match the keyword
-                    match = True
-                    matched_words = []
-                    
-                    for i, kw in enumerate(keyword_words):
-                        if word_idx + i >= len(words):
-                            match = False
-                            break
-                        
-                        word = words[word_idx + i]
-                        # Remove punctuation for comparison
-                        clean_word = ''.join(c for c in word.lower() if c.isalnum())
-                        clean_keyword = ''.join(c for c in kw if c.isalnum())
-                        
-                        if clean_keyword not in clean_word:
-                            match = False
-                            break
-                        
-                        matched_words.append(word)
-                    
-                    if match:
-                        # Use position of the last word in the keyword phrase
-                        matches.append({
-                            'line': line_idx,
-                            'word_index': word_idx + len(keyword_words) - 1,
-                            'word': words[word_idx + len(keyword_words) - 1],
-                            'line_text': line,
-                            'match_text': ' '.join(matched_words),
-                            'keyword': keyword
-                        })
+        for line_idx, first_word, last_word in page.find_keyword(keyword):
+            words = page.words[line_idx]
+            # Use position of the last word in the keyword phrase
+            matches.append({
+                'line': line_idx,
+                'word_index': last_word,
+                'word': words[last_word],
+                'line_text': page.lines[line_idx],
+                'match_text': ' '.join(words[first_word:last_word + 1]),
+                'keyword': keyword
+            })
         
         return matches
 
@@ -471,7 +450,8 @@ class PatternExtractor:
         if not keyword_pos:
             return None
         
-        lines = text.split('\n')
+        page = self._tokenized(text)
+        line_count = len(page.words)
         current_line = keyword_pos['line']
         current_word = keyword_pos['word_index']
         
@@ -482,32 +462,29 @@ class PatternExtractor:
                 # Reset word position to start of line
                 current_word = 0
             elif direction == 'd':
-                current_line = min(len(lines) - 1, current_line + distance)
+                current_line = min(line_count - 1, current_line + distance)
                 # Reset word position to start of line
                 current_word = 0
             elif direction == 'l':
                 # Move left within current line
-                if current_line < len(lines):
-                    words_in_line = len(lines[current_line].split())
-                    current_word = max(0, current_word - distance)
+                current_word = max(0, current_word - distance)
             elif direction == 'r':
                 # Move right within current line
-                if current_line < len(lines):
-                    words_in_line = len(lines[current_line].split())
+                if current_line < line_count:
+                    words_in_line = len(page.words[current_line])
                     current_word = min(words_in_line - 1, current_word + distance)
         
         # Validate final position
-        if current_line >= len(lines):
+        if current_line >= line_count:
             return None
         
-        words_in_line = lines[current_line].split()
-        if current_word >= len(words_in_line):
+        if current_word >= len(page.words[current_line]):
             return None
         
         return {
             'line': current_line,
             'word_index': current_word,
-            'line_text': lines[current_line]
+            'line_text': page.lines[current_line]
         }
 
     def _extract_content_enhanced(self, text, target_pos, extract_type, extract_count, flexible, movements=None):
@@ -517,35 +494,35 @@ class PatternExtractor:
         if not target_pos:
             return None
         
-        lines = text.split('\n')
+        page = self._tokenized(text)
         start_line = target_pos['line']
         start_word = target_pos.get('word_index', 0)
         
         # Apply movements if provided (for direct calls)
         if movements:
-            adjusted_pos = self._calculate_target_position_chained(text, target_pos, movements)
+            adjusted_pos = self._calculate_target_position_chained(page, target_pos, movements)
             if not adjusted_pos:
                 return None
             start_line = adjusted_pos['line']
             start_word = adjusted_pos.get('word_index', 0)
         
         if extract_type == 'wd':
-            return self._extract_words_enhanced(lines, start_line, start_word, extract_count, flexible)
+            return self._extract_words_enhanced(page, start_line, start_word, extract_count, flexible)
         elif extract_type == 'ln':
-            return self._extract_lines_enhanced(lines, start_line, extract_count, flexible)
+            return self._extract_lines_enhanced(page, start_line, extract_count, flexible)
         elif extract_type == 'nb':
-            return self._extract_numbers_enhanced(lines, start_line, start_word, extract_count, flexible)
+            return self._extract_numbers_enhanced(page, start_line, start_word, extract_count, flexible)
         
         return None
 
-    def _extract_words_enhanced(self, lines, start_line, start_word, count, flexible):
+    def _extract_words_enhanced(self, page, start_line, start_word, count, flexible):
         """Extract words with Phase 2/3 enhancements."""
-        if start_line >= len(lines):
+        if start_line >= len(page.words):
             return None
         
         if count == 0:
             # Zero-count: extract until end of line
-            words = lines[start_line].split()
+            words = page.words[start_line]
             if start_word >= len(words):
                 return None
             result_words = words[start_word:]
@@ -557,8 +534,8 @@ class PatternExtractor:
         current_word = start_word
         words_needed = count
         
-        while words_needed > 0 and current_line < len(lines):
-            words = lines[current_line].split()
+        while words_needed > 0 and current_line < len(page.words):
+            words = page.words[current_line]
             
             # Extract words from current line
             while current_word < len(words) and words_needed > 0:
@@ -575,8 +552,9 @@ class PatternExtractor:
         
         return ' '.join(result_words) if result_words else None
 
-    def _extract_lines_enhanced(self, lines, start_line, count, flexible):
+    def _extract_lines_enhanced(self, page, start_line, count, flexible):
         """Extract lines with Phase 2/3 enhancements."""
+        lines = page.lines
         if start_line >= len(lines):
             return None
         
@@ -595,12 +573,12 @@ class PatternExtractor:
         
         return '\n'.join(result_lines) if result_lines else None
 
-    def _extract_numbers_enhanced(self, lines, start_line, start_word, count, flexible):
+    def _extract_numbers_enhanced(self, page, start_line, start_word, count, flexible):
         """Extract numbers with Phase 2/3 enhancements."""
-        if start_line >= len(lines):
+        if start_line >= len(page.words):
             return None
         
-        words = lines[start_line].split()
+        words = page.words[start_line]
         if start_word >= len(words):
             return None
         
@@ -622,8 +600,8 @@ class PatternExtractor:
         current_word = start_word
         numbers_needed = count
         
-        while numbers_needed > 0 and current_line < len(lines):
-            words = lines[current_line].split()
+        while numbers_needed > 0 and current_line < len(page.words):
+            words = page.words[current_line]
             
             while current_word < len(words) and numbers_needed > 0:
                 word = words[current_word]
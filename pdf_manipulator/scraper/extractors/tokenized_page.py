@@ -0,0 +1,103 @@
+"""
+Pre-tokenized page model for pattern extraction.
+File: pdf_manipulator/scraper/extractors/tokenized_page.py
+
+A TokenizedPage splits page text into lines and words once, keeps the
+normalized (lowercase, alphanumeric-only) form of every word, and indexes
+word positions by normalized form. Keyword search, movements and wd/ln/nb
+extraction all work on these arrays instead of re-splitting the text and
+re-normalizing every word on every call.
+
+Keyword fragments match a word when they are contained in its normalized
+form. Lookups check each distinct normalized form once (pages repeat words
+a lot) and are memoized per fragment.
+"""
+
+from functools import lru_cache
+
+
+def normalize_word(word: str) -> str:
+    """Lowercase alphanumeric form of a word, as used for keyword comparison."""
+    return ''.join(c for c in word.lower() if c.isalnum())
+
+
+class TokenizedPage:
+    """
+    Lines, words and a normalized word index for one page of text.
+
+    Positions are (line index, word index) pairs into `words`.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lines = text.split('\n')
+        self.words = [line.split() for line in self.lines]
+
+        normalized_forms = {}
+        self.normalized = []
+        self.index: dict[str, list[tuple[int, int]]] = {}
+        for line_idx, line_words in enumerate(self.words):
+            line_normalized = []
+            for word_idx, word in enumerate(line_words):
+                form = normalized_forms.get(word)
+                if form is None:
+                    form = normalized_forms[word] = normalize_word(word)
+                line_normalized.append(form)
+                self.index.setdefault(form, []).append((line_idx, word_idx))
+            self.normalized.append(line_normalized)
+
+        self._fragment_positions: dict[str, list[tuple[int, int]]] = {}
+
+    def positions_containing(self, fragment: str) -> list[tuple[int, int]]:
+        """Reading-order positions of words whose normalized form contains a normalized fragment."""
+        positions = self._fragment_positions.get(fragment)
+        if positions is None:
+            exact = self.index.get(fragment)
+            forms = [form for form in self.index if fragment in form]
+            if len(forms) == 1 and exact is not None:
+                positions = exact
+            else:
+                positions = sorted(pos for form in forms for pos in self.index[form])
+            self._fragment_positions[fragment] = positions
+        return positions
+
+    def contains_at(self, line_idx: int, word_idx: int, fragment: str) -> bool:
+        """Whether the word at a position exists and contains a normalized fragment."""
+        line_normalized = self.normalized[line_idx]
+        return word_idx < len(line_normalized) and fragment in line_normalized[word_idx]
+
+    def find_keyword(self, keyword: str) -> list[tuple[int, int, int]]:
+        """
+        Find every occurrence of a (possibly multi-word) keyword.
+
+        Multi-word keywords match consecutive words on one line, each
+        containing the corresponding keyword word.
+
+        Returns:
+            (line index, first word index, last word index) per match, in reading order
+        """
+        keyword_words = keyword.lower().split()
+        if not keyword_words:
+            return []
+        if len(keyword_words) == 1:
+            fragment = normalize_word(keyword)
+            return [(line_idx, word_idx, word_idx)
+                    for line_idx, word_idx in self.positions_containing(fragment)]
+
+        fragments = [normalize_word(kw) for kw in keyword_words]
+        last = len(fragments) - 1
+        matches = []
+        for line_idx, word_idx in self.positions_containing(fragments[0]):
+            if all(self.contains_at(line_idx, word_idx + i, fragment)
+                   for i, fragment in enumerate(fragments[1:], 1)):
+                matches.append((line_idx, word_idx, word_idx + last))
+        return matches
+
+
+@lru_cache(maxsize=64)
+def tokenize_page(text: str) -> TokenizedPage:
+    """Tokenized form of a page's text, built once per distinct text."""
+    return TokenizedPage(text)
+
+
+# End of file #
@@ -0,0 +1,261 @@
+"""
+Columnar output writer for extracted data.
+File: pdf_manipulator/scraper/output/columnar_writer.py
+
+Rows are buffered per column and written in batches with typed columns
+(see schema.py), so loading a scrape is a bulk read instead of re-parsing
+text:
+
+- Parquet (one row group per batch) when pyarrow is installed
+- otherwise a compact typed column file (read it back with read_column_file)
+
+Column file layout (little-endian):
+    b'PDFCOLS1'
+    u32 length + JSON schema {"columns": [{"name", "type"}, ...]}
+    per batch: u32 length + JSON {"rows": n, "sizes": [bytes per column]},
+               then one block per column:
+               integer -> int64 values (INT_NULL for missing)
+               number  -> float64 values (NaN for missing)
+               text    -> u32 byte lengths, then the UTF-8 bytes
+
+Batches are self-delimiting; a reader stops at a batch cut off by a crash.
+"""
+
+import sys
+import json
+import math
+import struct
+
+from array import array
+from pathlib import Path
+
+from pdf_manipulator.scraper.output.schema import INTEGER, NUMBER, convert_value, unique_column_names
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+COLUMN_FILE_MAGIC = b'PDFCOLS1'
+INT_NULL = -2 ** 63
+DEFAULT_BATCH_ROWS = 50000
+
+_LENGTH = struct.Struct('<I')
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def default_columnar_suffix():
+    """File suffix of the columnar format this installation writes."""
+    return '.parquet' if PYARROW_AVAILABLE else '.cols'
+
+
+def _little_endian_bytes(values):
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _encode_column(values, column_type):
+    """Encode one batch of a column as a binary block."""
+    if column_type == INTEGER:
+        return _little_endian_bytes(array('q', (INT_NULL if v is None else v for v in values)))
+    if column_type == NUMBER:
+        return _little_endian_bytes(array('d', (math.nan if v is None else v for v in values)))
+    
+    encoded = [v.encode('utf-8') for v in values]
+    return _little_endian_bytes(array('I', (len(b) for b in encoded))) + b''.join(encoded)
+
+
+def _decode_column(block, column_type, rows):
+    """Decode a binary column block back into Python values."""
+    if column_type in (INTEGER, NUMBER):
+        values = array('q' if column_type == INTEGER else 'd')
+        values.frombytes(block)
+        if _BIG_ENDIAN:
+            values.byteswap()
+        if column_type == INTEGER:
+            return [None if v == INT_NULL else v for v in values]
+        return [None if math.isnan(v) else v for v in values]
+    
+    lengths = array('I')
+    lengths.frombytes(block[:4 * rows])
+    if _BIG_ENDIAN:
+        lengths.byteswap()
+    strings = []
+    position = 4 * rows
+    for length in lengths:
+        strings.append(block[position:position + length].decode('utf-8'))
+        position += length
+    return strings
+
+
+class ColumnarStreamWriter:
+    """
+    Write extraction results to a typed columnar file one PDF at a time.
+    
+    Same streaming interface as TSVStreamWriter. Columnar files can't be
+    appended to, so runs can't be resumed - use the TSV or SQLite format for
+    jobs that may need --resume.
+    """
+    
+    def __init__(self, output_path, headers, column_types, resume=False, batch_rows=DEFAULT_BATCH_ROWS):
+        """
+        Create the output file.
+        
+        Args:
+            output_path (str): Path for the output file (.parquet needs pyarrow)
+            headers (list): Column headers
+            column_types (list): Column type per header (see schema.column_types_for)
+            resume (bool): Not supported - raises ValueError
+            batch_rows (int): Rows buffered per written batch / row group
+        
+        Raises:
+            IOError: If the file cannot be written
+            ValueError: If asked to resume
+        """
+        if resume:
+            raise ValueError("Columnar output can't be resumed - use --format tsv or sqlite")
+        
+        self.output_path = Path(output_path)
+        self.headers = unique_column_names(headers)
+        self.column_types = list(column_types)
+        self.batch_rows = batch_rows
+        self.completed_files = set()
+        self.rows_written = 0
+        self.parquet = PYARROW_AVAILABLE and self.output_path.suffix.lower() != '.cols'
+        
+        self._columns = [[] for _ in self.headers]
+        self._buffered = 0
+        
+        try:
+            if self.parquet:
+                arrow_types = {INTEGER: pa.int64(), NUMBER: pa.float64()}
+                self._schema = pa.schema([(name, arrow_types.get(column_type, pa.string()))
+                                          for name, column_type in zip(self.headers, self.column_types)])
+                self._writer = pq.ParquetWriter(str(self.output_path), self._schema)
+            else:
+                self._file = open(self.output_path, 'wb')
+                schema = json.dumps({'columns': [{'name': name, 'type': column_type}
+                                                 for name, column_type in zip(self.headers, self.column_types)]})
+                schema = schema.encode('utf-8')
+                self._file.write(COLUMN_FILE_MAGIC + _LENGTH.pack(len(schema)) + schema)
+        except OSError as e:
+            raise IOError(f"Cannot write to {self.output_path}: {e}")
+        
+        self._closed = False
+    
+    def is_completed(self, pdf_file):
+        """Whether a file's rows were written by this run."""
+        return str(pdf_file) in self.completed_files
+    
+    def write_file_rows(self, pdf_file, rows):
+        """
+        Buffer one PDF's rows; full batches are written out.
+        
+        Args:
+            pdf_file (str): The PDF the rows were extracted from
+            rows (list): List of data rows, each row is a list of values
+        """
+        for row in rows:
+            for column, value, column_type in zip(self._columns, row, self.column_types):
+                column.append(convert_value(value, column_type))
+        
+        self._buffered += len(rows)
+        self.rows_written += len(rows)
+        self.completed_files.add(str(pdf_file))
+        
+        if self._buffered >= self.batch_rows:
+            self.flush()
+    
+    def flush(self):
+        """Write the buffered rows as one batch."""
+        if not self._buffered:
+            return
+        
+        try:
+            if self.parquet:
+                arrays = [pa.array(values, type=field.type) for values, field in zip(self._columns, self._schema)]
+                self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+            else:
+                blocks = [_encode_column(values, column_type)
+                          for values, column_type in zip(self._columns, self.column_types)]
+                header = json.dumps({'rows': self._buffered, 'sizes': [len(block) for block in blocks]}).encode('utf-8')
+                self._file.write(_LENGTH.pack(len(header)) + header + b''.join(blocks))
+                self._file.flush()
+        except OSError as e:
+            raise IOError(f"Cannot write to {self.output_path}: {e}")
+        
+        self._columns = [[] for _ in self.headers]
+        self._buffered = 0
+    
+    def close(self, finished=False):
+        """
+        Write buffered rows and close the file.
+        
+        Args:
+            finished (bool): The run completed (nothing else to clean up)
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            if self.parquet:
+                self._writer.close()
+            else:
+                self._file.close()
+    
+    def discard(self):
+        """Remove the output (nothing was extracted)."""
+        self.close()
+        self.output_path.unlink(missing_ok=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_column_file(path):
+    """
+    Read a compact column file written by ColumnarStreamWriter.
+    
+    Returns:
+        dict: Column name -> list of values (None for missing numbers)
+    """
+    data = Path(path).read_bytes()
+    if not data.startswith(COLUMN_FILE_MAGIC):
+        raise ValueError(f"Not a column file: {path}")
+    
+    position = len(COLUMN_FILE_MAGIC)
+    (length,) = _LENGTH.unpack_from(data, position)
+    position += _LENGTH.size
+    columns = json.loads(data[position:position + length])['columns']
+    position += length
+    
+    result = {column['name']: [] for column in columns}
+    while position + _LENGTH.size <= len(data):
+        (length,) = _LENGTH.unpack_from(data, position)
+        header_end = position + _LENGTH.size + length
+        try:
+            batch = json.loads(data[position + _LENGTH.size:header_end])
+        except ValueError:
+            break
+        if header_end + sum(batch['sizes']) > len(data):
+            break       # Batch cut off mid-write
+        
+        position = header_end
+        for column, size in zip(columns, batch['sizes']):
+            block = data[position:position + size]
+            result[column['name']].extend(_decode_column(block, column['type'], batch['rows']))
+            position += size
+    
+    return result
+
+
+# End of file #
@@ -0,0 +1,58 @@
+"""
+Column types for typed output formats.
+File: pdf_manipulator/scraper/output/schema.py
+
+TSV stores everything as text. The typed sinks (SQLite, columnar) keep
+numbers as numbers: 'page' is an integer column, columns of number patterns
+are float columns, everything else is text.
+"""
+
+TEXT = 'text'
+INTEGER = 'integer'
+NUMBER = 'number'
+
+_NUMBER_STRIP = str.maketrans('', '', ', $')
+
+
+def column_types_for(patterns):
+    """Column types for the filename, page and pattern columns of a scrape."""
+    return [TEXT, INTEGER] + [NUMBER if p.get('extract_type') == 'number' else TEXT for p in patterns]
+
+
+def unique_column_names(headers):
+    """Headers made unique for formats that need distinct column names ('Total', 'Total_2')."""
+    names = []
+    seen = set()
+    for header in headers:
+        name = str(header)
+        suffix = 2
+        while name in seen:
+            name = f"{header}_{suffix}"
+            suffix += 1
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def parse_number(value):
+    """Float value of an extracted number ('$1,250.00' -> 1250.0), or None if it isn't one."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).translate(_NUMBER_STRIP))
+    except ValueError:
+        return None
+
+
+def convert_value(value, column_type):
+    """Convert an extracted cell to its column's type (None for missing values)."""
+    if column_type == NUMBER:
+        return parse_number(value)
+    if column_type == INTEGER:
+        return None if value is None or value == '' else int(value)
+    return '' if value is None else str(value)
+
+
+# End of file #
@@ -0,0 +1,165 @@
+"""
+SQLite output writer for extracted data.
+File: pdf_manipulator/scraper/output/sqlite_writer.py
+
+Rows go to a 'results' table with typed columns (see schema.py) and an
+index on filename, so a day's scrape can be queried without parsing text.
+Inserts are batched with executemany and committed together with the files
+they belong to (the 'completed_files' table), so a resumed run knows exactly
+which files made it in - an interrupted transaction leaves no partial rows.
+"""
+
+import os
+import sqlite3
+
+from pathlib import Path
+
+from pdf_manipulator.scraper.output.schema import INTEGER, NUMBER, convert_value, unique_column_names
+
+
+_SQL_TYPES = {INTEGER: 'INTEGER', NUMBER: 'REAL'}
+
+DEFAULT_BATCH_ROWS = 5000
+
+
+def _quote_identifier(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class SQLiteStreamWriter:
+    """
+    Write extraction results to a SQLite database one PDF at a time.
+    
+    Same streaming interface as TSVStreamWriter: write_file_rows per PDF,
+    is_completed for resumed runs, close when done.
+    """
+    
+    def __init__(self, output_path, headers, column_types, resume=False, batch_rows=DEFAULT_BATCH_ROWS):
+        """
+        Open (or create) the database.
+        
+        Args:
+            output_path (str): Path for the database file
+            headers (list): Column headers
+            column_types (list): Column type per header (see schema.column_types_for)
+            resume (bool): Continue a previous run stored in the database
+            batch_rows (int): Rows buffered before they are inserted and committed
+        
+        Raises:
+            IOError: If the database cannot be written
+            ValueError: If resuming a run that used different headers
+        """
+        self.output_path = Path(output_path)
+        self.headers = unique_column_names(headers)
+        self.column_types = list(column_types)
+        self.batch_rows = batch_rows
+        self.completed_files = set()
+        self.rows_written = 0
+        
+        self._pending_rows = []
+        self._pending_files = []
+        
+        try:
+            self._conn = sqlite3.connect(str(self.output_path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            
+            if resume and self._load_completed():
+                return
+            
+            columns = ', '.join(f"{_quote_identifier(header)} {_SQL_TYPES.get(column_type, 'TEXT')}"
+                                for header, column_type in zip(self.headers, self.column_types))
+            with self._conn:
+                self._conn.execute("DROP TABLE IF EXISTS results")
+                self._conn.execute("DROP TABLE IF EXISTS completed_files")
+                self._conn.execute(f"CREATE TABLE results ({columns})")
+                self._conn.execute(f"CREATE INDEX idx_results_filename ON results ({_quote_identifier(self.headers[0])})")
+                self._conn.execute("CREATE TABLE completed_files (path TEXT PRIMARY KEY, rows INTEGER NOT NULL)")
+        except sqlite3.Error as e:
+            raise IOError(f"Cannot write to {self.output_path}: {e}")
+    
+    def _load_completed(self):
+        """Load completed files of a previous run; returns False if there is none to resume."""
+        tables = {name for (name,) in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if not {'results', 'completed_files'} <= tables:
+            return False
+        
+        existing = [row[1] for row in self._conn.execute("PRAGMA table_info(results)")]
+        if existing != self.headers:
+            raise ValueError(f"Cannot resume {self.output_path}: it was written with "
+                             f"different columns ({', '.join(existing)})")
+        
+        for path, rows in self._conn.execute("SELECT path, rows FROM completed_files"):
+            self.completed_files.add(path)
+            self.rows_written += rows
+        return True
+    
+    def is_completed(self, pdf_file):
+        """Whether a file's rows were written by this or a resumed run."""
+        return os.path.abspath(pdf_file) in self.completed_files
+    
+    def write_file_rows(self, pdf_file, rows):
+        """
+        Buffer one PDF's rows; they are inserted with the next batch.
+        
+        Args:
+            pdf_file (str): The PDF the rows were extracted from
+            rows (list): List of data rows, each row is a list of values
+        """
+        types = self.column_types
+        self._pending_rows.extend(tuple(convert_value(value, column_type)
+                                        for value, column_type in zip(row, types))
+                                  for row in rows)
+        self._pending_files.append((os.path.abspath(pdf_file), len(rows)))
+        self.completed_files.add(os.path.abspath(pdf_file))
+        self.rows_written += len(rows)
+        
+        if len(self._pending_rows) >= self.batch_rows:
+            self.flush()
+    
+    def flush(self):
+        """Insert buffered rows and record their files in one transaction."""
+        if not self._pending_files:
+            return
+        
+        placeholders = ', '.join('?' * len(self.headers))
+        try:
+            with self._conn:
+                self._conn.executemany(f"INSERT INTO results VALUES ({placeholders})", self._pending_rows)
+                self._conn.executemany("INSERT OR REPLACE INTO completed_files (path, rows) VALUES (?, ?)",
+                                       self._pending_files)
+        except sqlite3.Error as e:
+            raise IOError(f"Cannot write to {self.output_path}: {e}")
+        
+        self._pending_rows = []
+        self._pending_files = []
+    
+    def close(self, finished=False):
+        """
+        Write buffered rows and close the database.
+        
+        Args:
+            finished (bool): The run completed (completed files stay recorded either way)
+        """
+        if self._conn is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+            self._conn = None
+    
+    def discard(self):
+        """Remove the output (nothing was extracted)."""
+        self.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(f"{self.output_path}{suffix}").unlink(missing_ok=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# End of file #
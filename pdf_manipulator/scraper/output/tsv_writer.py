@@ -2,7 +2,10 @@
 TSV output writer for extracted data.
 """
 
+import os
 import csv
+import json
+
 from pathlib import Path
 
 
@@ -210,3 +213,142 @@ class TSVWriter:
             'non_empty_cells': total_cells - empty_cells,
             'fill_rate': (total_cells - empty_cells) / total_cells if total_cells > 0 else 0
         }
+
+
+class TSVStreamWriter(TSVWriter):
+    """
+    Write extraction results to a TSV file one PDF at a time.
+    
+    Rows are flushed to disk as soon as a file's rows are written, so memory
+    doesn't grow with the corpus and a crash keeps everything written so far.
+    
+    Each completed file is recorded in a checkpoint (JSON lines next to the
+    output: the file name, its row count and the output size after its rows).
+    Resuming truncates the output back to the last recorded size - dropping
+    rows of a file that was cut off mid-write - and reports the completed
+    files so the caller can skip them.
+    """
+    
+    def __init__(self, output_path, headers, checkpoint_path=None, resume=False):
+        """
+        Open the output (and checkpoint) for writing.
+        
+        Args:
+            output_path (str): Path for the output file
+            headers (list): Column headers
+            checkpoint_path (str): Checkpoint file (default: output path + '.checkpoint')
+            resume (bool): Continue a previous run recorded in the checkpoint
+            
+        Raises:
+            IOError: If the files cannot be written
+            ValueError: If resuming a run that used different headers
+        """
+        super().__init__()
+        self.output_path = Path(output_path)
+        self.checkpoint_path = Path(checkpoint_path or f"{output_path}.checkpoint")
+        self.headers = list(headers)
+        self.completed_files = set()
+        self.rows_written = 0
+        
+        resumed_offset = self._load_checkpoint() if resume else None
+        
+        try:
+            if resumed_offset is not None:
+                with open(self.output_path, 'r+b') as file:
+                    file.truncate(resumed_offset)
+                self._file = open(self.output_path, 'a', newline='', encoding='utf-8')
+                self._writer = csv.writer(self._file, delimiter='\t', quoting=csv.QUOTE_MINIMAL)
+                self._checkpoint = open(self.checkpoint_path, 'a', encoding='utf-8')
+            else:
+                self.completed_files.clear()
+                self.rows_written = 0
+                self._file = open(self.output_path, 'w', newline='', encoding='utf-8')
+                self._writer = csv.writer(self._file, delimiter='\t', quoting=csv.QUOTE_MINIMAL)
+                self._writer.writerow(self.headers)
+                self._checkpoint = open(self.checkpoint_path, 'w', encoding='utf-8')
+                self._record({'headers': self.headers, 'offset': self._flush()})
+        except IOError as e:
+            raise IOError(f"Cannot write to {self.output_path}: {e}")
+    
+    def _load_checkpoint(self):
+        """Read the checkpoint; returns the output size to resume from, or None to start over."""
+        if not (self.checkpoint_path.exists() and self.output_path.exists()):
+            return None
+        
+        offset = None
+        with open(self.checkpoint_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break       # Cut off mid-write - everything after it is unrecorded
+                
+                if 'headers' in record:
+                    if record['headers'] != self.headers:
+                        raise ValueError(f"Cannot resume {self.output_path}: it was written with "
+                                         f"different columns ({', '.join(record['headers'])})")
+                else:
+                    self.completed_files.add(os.path.abspath(record['file']))
+                    self.rows_written += record['rows']
+                offset = record['offset']
+        
+        if offset is None or offset > self.output_path.stat().st_size:
+            return None
+        return offset
+    
+    def _flush(self):
+        """Flush the output to disk and return its size."""
+        self._file.flush()
+        return os.fstat(self._file.fileno()).st_size
+    
+    def _record(self, record):
+        self._checkpoint.write(json.dumps(record) + '\n')
+        self._checkpoint.flush()
+    
+    def is_completed(self, pdf_file):
+        """Whether a file's rows were written by this or a resumed run."""
+        return os.path.abspath(pdf_file) in self.completed_files
+    
+    def write_file_rows(self, pdf_file, rows):
+        """
+        Write one PDF's rows, flush them, and record the file as completed.
+        
+        Args:
+            pdf_file (str): The PDF the rows were extracted from
+            rows (list): List of data rows, each row is a list of values
+        """
+        try:
+            for row in rows:
+                self._writer.writerow([self._clean_cell_value(cell) for cell in row])
+            
+            self.rows_written += len(rows)
+            self.completed_files.add(os.path.abspath(pdf_file))
+            self._record({'file': str(pdf_file), 'rows': len(rows), 'offset': self._flush()})
+        except IOError as e:
+            raise IOError(f"Cannot write to {self.output_path}: {e}")
+    
+    def close(self, finished=False):
+        """
+        Close the output.
+        
+        Args:
+            finished (bool): The run completed - delete the checkpoint
+        """
+        if self._file.closed:
+            return
+        self._file.close()
+        self._checkpoint.close()
+        if finished:
+            self.checkpoint_path.unlink(missing_ok=True)
+    
+    def discard(self):
+        """Remove the output and checkpoint (nothing was extracted)."""
+        self.close()
+        self.output_path.unlink(missing_ok=True)
+        self.checkpoint_path.unlink(missing_ok=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
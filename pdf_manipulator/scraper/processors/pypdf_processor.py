@@ -10,9 +10,8 @@ import warnings
 from pathlib import Path
 from contextlib import redirect_stderr
 
-import pypdf
-
 from simple_pdf_scraper.processors.base import PDFProcessor
+from pdf_manipulator.core.document_session import get_document_session
 
 
 class PyPDFProcessor(PDFProcessor):
@@ -21,6 +20,8 @@ class PyPDFProcessor(PDFProcessor):
     
     Good balance of speed and reliability for machine-generated PDFs.
     Includes improved error handling for corrupted or malformed PDFs.
+    Documents are read through their shared DocumentSession, so repeated
+    calls for the same file don't re-parse it or re-extract page text.
     """
     
     def __init__(self, suppress_warnings=True):
@@ -45,29 +46,28 @@ class PyPDFProcessor(PDFProcessor):
         pages_text = []
         
         try:
-            with open(pdf_path, 'rb') as file:
-                # Capture stderr to suppress pypdf error messages if needed
-                stderr_capture = io.StringIO() if self.suppress_warnings else None
+            # Capture stderr to suppress pypdf error messages if needed
+            stderr_capture = io.StringIO() if self.suppress_warnings else None
                 
-                with redirect_stderr(stderr_capture) if stderr_capture else self._null_context():
-                    reader = pypdf.PdfReader(file)
+            with redirect_stderr(stderr_capture) if stderr_capture else self._null_context():
+                reader = get_document_session(pdf_path).reader
                     
-                    # Check if PDF is encrypted
-                    if reader.is_encrypted:
-                        raise Exception("PDF is password protected and cannot be processed")
+                # Check if PDF is encrypted
+                if reader.is_encrypted:
+                    raise Exception("PDF is password protected and cannot be processed")
                     
-                    for page_num, page in enumerate(reader.pages):
-                        try:
-                            # Extract text and clean up common pypdf artifacts
-                            text = page.extract_text()
-                            # Normalize whitespace but preserve line structure
-                            text = self._clean_text(text)
-                            pages_text.append(text)
-                        except Exception as page_error:
-                            # If individual page fails, add empty text but continue
-                            pages_text.append("")
-                            if not self.suppress_warnings:
-                                print(f"Warning: Failed to extract text from page {page_num + 1}: {page_error}", file=sys.stderr)
+                for page_num, page in enumerate(reader.pages):
+                    try:
+                        # Extract text (memoized per document) and clean up common pypdf artifacts
+                        text = get_document_session(pdf_path).pypdf_page_text(page_num + 1)
+                        # Normalize whitespace but preserve line structure
+                        text = self._clean_text(text)
+                        pages_text.append(text)
+                    except Exception as page_error:
+                        # If individual page fails, add empty text but continue
+                        pages_text.append("")
+                        if not self.suppress_warnings:
+                            print(f"Warning: Failed to extract text from page {page_num + 1}: {page_error}", file=sys.stderr)
                     
         except FileNotFoundError:
             raise
@@ -92,21 +92,19 @@ class PyPDFProcessor(PDFProcessor):
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
         try:
-            with open(pdf_path, 'rb') as file:
-                stderr_capture = io.StringIO() if self.suppress_warnings else None
+            stderr_capture = io.StringIO() if self.suppress_warnings else None
                 
-                with redirect_stderr(stderr_capture) if stderr_capture else self._null_context():
-                    reader = pypdf.PdfReader(file)
+            with redirect_stderr(stderr_capture) if stderr_capture else self._null_context():
+                reader = get_document_session(pdf_path).reader
                     
-                    if reader.is_encrypted:
-                        raise Exception("PDF is password protected and cannot be processed")
+                if reader.is_encrypted:
+                    raise Exception("PDF is password protected and cannot be processed")
                     
-                    if page_number < 1 or page_number > len(reader.pages):
-                        raise IndexError(f"Page {page_number} out of range (1-{len(reader.pages)})")
+                if page_number < 1 or page_number > len(reader.pages):
+                    raise IndexError(f"Page {page_number} out of range (1-{len(reader.pages)})")
                     
-                    page = reader.pages[page_number - 1]  # Convert to 0-based
-                    text = page.extract_text()
-                    return self._clean_text(text)
+                text = get_document_session(pdf_path).pypdf_page_text(page_number)
+                return self._clean_text(text)
                     
         except (IndexError, FileNotFoundError):
             raise
@@ -126,16 +124,15 @@ class PyPDFProcessor(PDFProcessor):
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
         try:
-            with open(pdf_path, 'rb') as file:
-                stderr_capture = io.StringIO() if self.suppress_warnings else None
+            stderr_capture = io.StringIO() if self.suppress_warnings else None
                 
-                with redirect_stderr(stderr_capture) if stderr_capture else self._null_context():
-                    reader = pypdf.PdfReader(file)
+            with redirect_stderr(stderr_capture) if stderr_capture else self._null_context():
+                reader = get_document_session(pdf_path).reader
                     
-                    if reader.is_encrypted:
-                        raise Exception("PDF is password protected and cannot be processed")
+                if reader.is_encrypted:
+                    raise Exception("PDF is password protected and cannot be processed")
                     
-                    return len(reader.pages)
+                return len(reader.pages)
         except FileNotFoundError:
             raise
         except Exception as e:
@@ -174,41 +171,40 @@ class PyPDFProcessor(PDFProcessor):
             }
         
         try:
-            with open(pdf_path, 'rb') as file:
-                stderr_capture = io.StringIO() if self.suppress_warnings else None
+            stderr_capture = io.StringIO() if self.suppress_warnings else None
                 
-                with redirect_stderr(stderr_capture) if stderr_capture else self._null_context():
-                    reader = pypdf.PdfReader(file)
+            with redirect_stderr(stderr_capture) if stderr_capture else self._null_context():
+                reader = get_document_session(pdf_path).reader
+                    
+                info = {
+                    'page_count': len(reader.pages),
+                    'encrypted': reader.is_encrypted,
+                    'metadata': reader.metadata if hasattr(reader, 'metadata') else None
+                }
                     
-                    info = {
-                        'page_count': len(reader.pages),
-                        'encrypted': reader.is_encrypted,
-                        'metadata': reader.metadata if hasattr(reader, 'metadata') else None
+                if reader.is_encrypted:
+                    return {
+                        'valid': False,
+                        'error': 'PDF is password protected',
+                        'info': info
                     }
                     
-                    if reader.is_encrypted:
+                # Try to extract text from first page to test readability
+                if len(reader.pages) > 0:
+                    try:
+                        reader.pages[0].extract_text()
+                    except Exception as extract_error:
                         return {
                             'valid': False,
-                            'error': 'PDF is password protected',
+                            'error': f'Cannot extract text: {extract_error}',
                             'info': info
                         }
                     
-                    # Try to extract text from first page to test readability
-                    if len(reader.pages) > 0:
-                        try:
-                            reader.pages[0].extract_text()
-                        except Exception as extract_error:
-                            return {
-                                'valid': False,
-                                'error': f'Cannot extract text: {extract_error}',
-                                'info': info
-                            }
-                    
-                    return {
-                        'valid': True,
-                        'error': None,
-                        'info': info
-                    }
+                return {
+                    'valid': True,
+                    'error': None,
+                    'info': info
+                }
                     
         except Exception as e:
             error_msg = str(e)
@@ -257,6 +253,8 @@ class PyPDFProcessor(PDFProcessor):
     
     def get_processor_info(self):
         """Return information about this processor."""
+        # Only the version is needed here - documents are read through their DocumentSession
+        import pypdf
         return {
             'name': 'PyPDF',
             'library': 'pypdf',
@@ -401,10 +401,8 @@ def estimate_output_size(pdf_path: Path, page_count: int) -> Optional[float]:
         source_size = pdf_path.stat().st_size / (1024 * 1024)  # MB
         
         # Get total pages for ratio calculation
-        from pypdf import PdfReader
-        with open(pdf_path, 'rb') as f:
-            reader = PdfReader(f)
-            total_pages = len(reader.pages)
+        from pdf_manipulator.core.document_session import get_document_session
+        total_pages = get_document_session(pdf_path).page_count
         
         if total_pages > 0:
             ratio = page_count / total_pages
@@ -16,6 +16,19 @@ except ImportError:
     pdfplumber = None
 
 from simple_pdf_scraper.processors.base import PDFProcessor
+from simple_pdf_scraper.processors.sharded_extraction import (
+    DEFAULT_SHARD_SIZE,
+    extract_pages_sharded,
+    resolve_worker_count,
+)
+from simple_pdf_scraper.processors.vectorized_lines import (
+    NUMPY_AVAILABLE,
+    PageChars,
+    assemble_lines,
+    group_line_indices,
+    line_ids_for,
+    median_char_spacings,
+)
 
 
 class PDFPlumberProcessor(PDFProcessor):
@@ -35,7 +48,10 @@ class PDFPlumberProcessor(PDFProcessor):
                  space_char=' ',
                  tab_char='\t',
                  min_space_distance=None,
-                 add_space_distance=None):
+                 add_space_distance=None,
+                 workers=1,
+                 shard_size=DEFAULT_SHARD_SIZE,
+                 vectorized=True):
         """
         Initialize the processor with adaptive or fixed spacing thresholds.
         
@@ -48,6 +64,9 @@ class PDFPlumberProcessor(PDFProcessor):
             tab_char (str): Character to insert for large gaps (default: tab)
             min_space_distance (float): Fixed minimum distance (legacy, overrides adaptive)
             add_space_distance (float): Fixed distance threshold (legacy, overrides adaptive)
+            workers (int): Worker processes for extract_pages (1 = in-process, 0 = one per CPU)
+            shard_size (int): Contiguous pages handed to each worker task
+            vectorized (bool): Assemble lines with NumPy when it is installed (same output)
             
         Note: 
             Default ratios (1.1× and 1.3×) are empirically tested on real-world problematic PDFs:
@@ -75,6 +94,9 @@ class PDFPlumberProcessor(PDFProcessor):
         self.line_tolerance = line_tolerance
         self.space_char = space_char
         self.tab_char = tab_char
+        self.workers = workers
+        self.shard_size = shard_size
+        self.vectorized = vectorized and NUMPY_AVAILABLE
     
     def extract_pages(self, pdf_path):
         """Extract text from all pages using center-distance filtering."""
@@ -86,13 +108,24 @@ class PDFPlumberProcessor(PDFProcessor):
         
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    try:
-                        text = self._extract_page_with_filtering(page)
-                        pages_text.append(text)
-                    except Exception as page_error:
-                        pages_text.append("")
-                        print(f"Warning: Failed to extract text from page {page_num + 1}: {page_error}", file=sys.stderr)
+                page_count = len(pdf.pages)
+                sharded = resolve_worker_count(self.workers) > 1 and page_count > self.shard_size
+                
+                if not sharded:
+                    for page_num, page in enumerate(pdf.pages):
+                        try:
+                            text = self._extract_page_with_filtering(page)
+                            pages_text.append(text)
+                        except Exception as page_error:
+                            pages_text.append("")
+                            print(f"Warning: Failed to extract text from page {page_num + 1}: {page_error}", file=sys.stderr)
+            
+            if sharded:
+                # Large document: each worker opens the file and filters a contiguous page range
+                texts = extract_pages_sharded(pdf_path, range(1, page_count + 1),
+                                                self._extract_page_with_filtering,
+                                                workers=self.workers, shard_size=self.shard_size)
+                pages_text = [texts[page_num] for page_num in range(1, page_count + 1)]
         
         except Exception as e:
             # Handle potential encryption or other PDF access issues
@@ -226,6 +259,9 @@ class PDFPlumberProcessor(PDFProcessor):
         if not chars:
             return ""
         
+        if self.vectorized:
+            return self._extract_page_vectorized(chars)
+        
         # Group characters by line (same Y coordinate within tolerance)
         lines = self._group_characters_by_line(chars)
         
@@ -242,6 +278,33 @@ class PDFPlumberProcessor(PDFProcessor):
         
         return '\n'.join(processed_lines)
     
+    def _extract_page_vectorized(self, chars):
+        """Same filtering as the per-character path, on NumPy arrays (see vectorized_lines.py)."""
+        page_chars = PageChars(chars)
+        lines = group_line_indices(page_chars, self.line_tolerance)
+        order, line_ids = line_ids_for(lines)
+        
+        texts = page_chars.texts[order]
+        centers = page_chars.centers[order]
+        is_space = page_chars.is_space[order]
+        
+        if self.adaptive_mode:
+            avg_char_spacing = median_char_spacings(centers, is_space, line_ids, len(lines))[line_ids]
+            line_texts = assemble_lines(
+                texts, centers, is_space, line_ids,
+                avg_char_spacing * self.min_space_ratio,
+                avg_char_spacing * self.add_space_ratio,
+                avg_char_spacing * self.add_tab_ratio,
+                self.space_char, self.tab_char
+            )
+        else:
+            # Legacy mode only adds plain spaces
+            line_texts = assemble_lines(texts, centers, is_space, line_ids,
+                                        self.min_space_distance, self.add_space_distance)
+        
+        # Only keep non-empty lines
+        return '\n'.join(line_text for line_text in line_texts if line_text.strip())
+    
     def _group_characters_by_line(self, chars):
         """Group characters into lines based on Y coordinate."""
         if not chars:
@@ -479,7 +542,8 @@ class PDFPlumberProcessor(PDFProcessor):
                 'add_space_ratio': self.add_space_ratio,
                 'add_tab_ratio': self.add_tab_ratio,
                 'space_char': repr(self.space_char),
-                'tab_char': repr(self.tab_char)
+                'tab_char': repr(self.tab_char),
+                'vectorized': self.vectorized
             }
         else:
             return {
@@ -492,7 +556,8 @@ class PDFPlumberProcessor(PDFProcessor):
                 'add_space_distance': self.add_space_distance,
                 'add_tab_distance': self.add_tab_distance,
                 'space_char': repr(self.space_char),
-                'tab_char': repr(self.tab_char)
+                'tab_char': repr(self.tab_char),
+                'vectorized': self.vectorized
             }
 
 # End of file #
@@ -0,0 +1,159 @@
+"""
+NumPy line assembly for the PDFPlumberProcessor.
+File: simple_pdf_scraper/processors/vectorized_lines.py
+
+Same algorithm as the per-character path in pdfplumber_processor.py, on
+arrays: the page's character coordinates are loaded once, lines are cut
+from the y-sorted coordinates with searchsorted, and the per-line median
+spacing and space/tab decisions are computed for the whole page at once.
+Comparisons use the same float expressions as the per-character code, so
+the assembled text is identical - only faster on dense pages (tabular
+manifests carry 15k+ glyphs per page).
+
+Requires NumPy; check NUMPY_AVAILABLE before use.
+"""
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+FALLBACK_CHAR_SPACING = 4.8     # Typical 12pt font spacing
+MAX_CHAR_SPACING = 50           # Larger center distances are gaps, not character spacing
+
+
+class PageChars:
+    """A page's characters as parallel arrays."""
+
+    def __init__(self, chars):
+        self.texts = np.array([c['text'] for c in chars], dtype=object)
+        self.x0 = np.array([c['x0'] for c in chars], dtype=float)
+        self.x1 = np.array([c['x1'] for c in chars], dtype=float)
+        self.y1 = np.array([c['y1'] for c in chars], dtype=float)
+        self.centers = (self.x0 + self.x1) / 2
+        self.is_space = self.texts == ' '
+
+
+def group_line_indices(page_chars, line_tolerance):
+    """
+    Group characters into lines, as index arrays in reading order.
+
+    Characters are sorted top to bottom, then left to right. A line takes
+    every following character within line_tolerance of its first
+    character's y1, then is sorted by x0 (stable, like list.sort).
+    """
+    order = np.lexsort((page_chars.x0, -page_chars.y1))
+    ys = page_chars.y1[order]
+    descending = -ys
+    count = len(order)
+
+    lines = []
+    start = 0
+    while start < count:
+        anchor = ys[start]
+        end = int(np.searchsorted(descending, descending[start] + line_tolerance, side='right'))
+
+        # searchsorted compares -y1 values; settle the boundary with the exact
+        # |y1 - anchor| <= tolerance test (monotone along the sorted run)
+        while end < count and abs(ys[end] - anchor) <= line_tolerance:
+            end += 1
+        while end > start + 1 and abs(ys[end - 1] - anchor) > line_tolerance:
+            end -= 1
+
+        line = order[start:end]
+        lines.append(line[np.argsort(page_chars.x0[line], kind='stable')])
+        start = end
+
+    return lines
+
+
+def line_ids_for(lines):
+    """Reading-order permutation of the page and the line number of each position."""
+    order = np.concatenate(lines)
+    line_ids = np.repeat(np.arange(len(lines)), [len(line) for line in lines])
+    return order, line_ids
+
+
+def median_char_spacings(centers, is_space, line_ids, line_count):
+    """
+    Median spacing between adjacent non-space character centers, per line.
+
+    Spacings outside (0, MAX_CHAR_SPACING) are ignored; lines without any
+    get FALLBACK_CHAR_SPACING.
+    """
+    non_space = ~is_space
+    non_space_centers = centers[non_space]
+    non_space_lines = line_ids[non_space]
+
+    spacings = np.diff(non_space_centers)
+    spacing_lines = non_space_lines[1:]
+    keep = ((non_space_lines[:-1] == spacing_lines)
+            & (spacings > 0) & (spacings < MAX_CHAR_SPACING))
+    spacings = spacings[keep]
+    spacing_lines = spacing_lines[keep]
+
+    # Sort each line's spacings and pick the middle one (or two)
+    by_line = np.lexsort((spacings, spacing_lines))
+    spacings = spacings[by_line]
+    counts = np.bincount(spacing_lines, minlength=line_count)
+    starts = np.cumsum(counts) - counts
+
+    medians = np.full(line_count, FALLBACK_CHAR_SPACING)
+    odd = (counts % 2 == 1)
+    even = (counts > 0) & ~odd
+    middle = starts + counts // 2
+    medians[odd] = spacings[middle[odd]]
+    medians[even] = (spacings[middle[even] - 1] + spacings[middle[even]]) / 2
+    return medians
+
+
+def assemble_lines(texts, centers, is_space, line_ids, min_space_distance, add_space_distance,
+                   add_tab_distance=None, space_char=' ', tab_char='\t'):
+    """
+    Assemble every line's text with center-distance filtering.
+
+    Arrays are in reading order with line_ids marking each position's line;
+    thresholds are scalars or per-position arrays. Space characters are kept
+    when the non-space characters around them on the line are at least
+    min_space_distance apart (or one side has none). A separator is added
+    after a non-space character followed by another non-space character at
+    least add_space_distance (space) or add_tab_distance (tab) away.
+
+    Returns:
+        list: One string per line
+    """
+    count = len(centers)
+    positions = np.arange(count)
+    same_line_next = np.append(line_ids[1:] == line_ids[:-1], False)
+    line_first = np.maximum.accumulate(np.where(np.append(True, ~same_line_next[:-1]), positions, 0))
+    line_stop = np.minimum.accumulate(np.where(same_line_next, count, positions + 1)[::-1])[::-1]
+
+    # Nearest non-space character on the same line before and after every position
+    non_space = ~is_space
+    prev_index = np.maximum.accumulate(np.where(non_space, positions, line_first - 1))
+    next_index = np.minimum.accumulate(np.where(non_space, positions, line_stop)[::-1])[::-1]
+    has_neighbours = (prev_index >= line_first) & (next_index < line_stop)
+    neighbour_gap = centers[np.minimum(next_index, count - 1)] - centers[np.maximum(prev_index, 0)]
+    keep_space = is_space & (~has_neighbours | (neighbour_gap >= min_space_distance))
+
+    # Separators after non-space characters followed by a non-space character
+    step = np.append(np.diff(centers), 0.0)
+    followed = non_space & same_line_next & np.append(non_space[1:], False)
+    if add_tab_distance is not None:
+        add_tab = followed & (step >= add_tab_distance)
+    else:
+        add_tab = np.zeros(count, dtype=bool)
+    add_space = followed & ~add_tab & (step >= add_space_distance)
+
+    pieces = np.where(is_space, np.where(keep_space, space_char, ''), texts)
+    separators = np.where(add_tab, tab_char, np.where(add_space, space_char, ''))
+    pieces = (pieces + separators).tolist()
+
+    bounds = np.flatnonzero(~same_line_next) + 1
+    return [''.join(pieces[start:stop]) for start, stop in zip(np.append(0, bounds[:-1]).tolist(), bounds.tolist())]
+
+
+# End of file #
@@ -0,0 +1,169 @@
+"""
+Test Persistent Page Analysis Store
+Run: python tests/test_analysis_store.py
+
+Tests that PageAnalysis results are stored per page fingerprint: repeated
+runs read stored metadata, edited documents only re-analyze changed pages,
+and type:/size: patterns go through the same store.
+"""
+
+import sys
+import atexit
+
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core.cache.analysis_store import (
+    PageAnalysisStore,
+    analysis_revision,
+    configure_analysis_store,
+)
+from pdf_manipulator.core.page_analysis import PageAnalyzer, parse_size_condition
+from pdf_manipulator.core.page_range.patterns import parse_pattern_expression
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs, create_temp_dir
+
+
+atexit.register(cleanup_test_pdfs)
+
+LONG_TEXT = "This page has plenty of text to count as a text page for the analyzer."
+
+
+def _content(changed_page: int | None = None) -> dict:
+    content = {page: f"Page {page}\n{LONG_TEXT}" for page in range(1, 7)}
+    content[4] = ""
+    if changed_page is not None:
+        content[changed_page] = f"Edited page {changed_page}\n{LONG_TEXT}"
+    return content
+
+
+def _analyze(pdf_path: Path) -> tuple[list, int]:
+    with PageAnalyzer(pdf_path) as analyzer:
+        analyses = analyzer.analyze_all_pages()
+        return analyses, analyzer.pages_analyzed
+
+
+def test_store_round_trip():
+    """Records come back per document and per fingerprint."""
+    print("=== Testing Analysis Store Round Trip ===")
+    store = PageAnalysisStore(create_temp_dir())
+    record = {'page_type': 'text', 'size_bytes': 1234, 'text_length': 80,
+                'image_count': 0, 'has_meaningful_text': True, 'confidence': 0.85}
+    revision = analysis_revision(exact_sizes=False)
+
+    store.store('doc', revision, {1: ('fp-1', record), 2: ('fp-1', record)})
+
+    assert store.get_document('doc', revision) == {1: record, 2: record}
+    assert store.get_fingerprints(['fp-1', 'fp-2'], revision) == {'fp-1': record}
+    assert store.get_document('doc', analysis_revision(exact_sizes=True)) == {}
+    assert store.stats()['documents'] == 1 and store.stats()['pages'] == 1
+    store.close()
+    print("✓ Records round trip by document and fingerprint")
+    return True
+
+
+def test_second_run_reads_stored_metadata():
+    """A second analysis of the same document analyzes nothing."""
+    print("=== Testing Repeated Analysis ===")
+    pdf_path = create_test_pdf('test_analysis_store.pdf', _content())
+
+    try:
+        configure_analysis_store(create_temp_dir())
+        first, analyzed = _analyze(pdf_path)
+        assert analyzed == 6
+        second, analyzed = _analyze(pdf_path)
+        assert analyzed == 0
+        assert first == second
+
+    finally:
+        configure_analysis_store(enabled=False)
+
+    print("✓ Stored analyses are reused")
+    return True
+
+
+def test_edited_document_reanalyzes_changed_pages_only():
+    """Only pages whose objects changed are analyzed again."""
+    print("=== Testing Incremental Re-Analysis ===")
+    original = create_test_pdf('test_analysis_store_v1.pdf', _content())
+    edited = create_test_pdf('test_analysis_store_v2.pdf', _content(changed_page=3))
+
+    try:
+        configure_analysis_store(create_temp_dir())
+        _analyze(original)
+        with mock.patch.object(PageAnalysisStore, 'get_fingerprints',
+                                autospec=True, side_effect=PageAnalysisStore.get_fingerprints) as lookups:
+            analyses, analyzed = _analyze(edited)
+        assert analyzed == 1, f"Expected only the edited page to be analyzed, got {analyzed}"
+        assert lookups.call_count == 1, f"Expected one fingerprint lookup, got {lookups.call_count}"
+
+        configure_analysis_store(enabled=False)
+        fresh, _ = _analyze(edited)
+        assert analyses == fresh
+
+    finally:
+        configure_analysis_store(enabled=False)
+
+    print("✓ Unchanged pages are served from the store with one lookup")
+    return True
+
+
+def test_patterns_use_page_analysis():
+    """type: and size: patterns use PageAnalysis and its store."""
+    print("=== Testing type:/size: Patterns ===")
+    pdf_path = create_test_pdf('test_analysis_store_patterns.pdf', _content())
+
+    try:
+        configure_analysis_store(create_temp_dir())
+        assert parse_pattern_expression("type:empty", pdf_path, 6) == [4]
+        assert parse_pattern_expression("type:text", pdf_path, 6) == [1, 2, 3, 5, 6]
+        assert parse_pattern_expression("size:>1MB", pdf_path, 6) == []
+        assert parse_pattern_expression("size:<1MB", pdf_path, 6) == [1, 2, 3, 4, 5, 6]
+        assert parse_size_condition(">=1.5kb") == ('>=', 1536)
+
+        _, analyzed = _analyze(pdf_path)
+        assert analyzed == 0, "Pattern evaluation should have stored every page"
+
+    finally:
+        configure_analysis_store(enabled=False)
+
+    print("✓ Patterns classify pages through PageAnalyzer")
+    return True
+
+
+def main():
+    """Run all analysis store tests."""
+    print("ANALYSIS STORE TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_store_round_trip,
+        test_second_run_reads_stored_metadata,
+        test_edited_document_reanalyzes_changed_pages_only,
+        test_patterns_use_page_analysis,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"ANALYSIS STORE TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
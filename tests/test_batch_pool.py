@@ -0,0 +1,165 @@
+"""
+Test Parallel Batch Extraction (--jobs)
+Run: python tests/test_batch_pool.py
+
+Runs process_batch_extract() serially and with worker processes over the same
+folder and checks that both produce the same files, that worker output comes
+back in input order, and that concurrent 'rename' conflict resolution never
+lets two workers write the same file.
+"""
+
+import sys
+import argparse
+import tempfile
+
+from pathlib import Path
+from contextlib import redirect_stdout
+from io import StringIO
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core.operation_context import OpCtx
+from pdf_manipulator.core.folder_operations import process_batch_extract, resolve_job_count
+from pdf_manipulator.core.file_conflicts import set_reservation_lock, resolve_file_conflicts, release_reservations
+
+from tests.test_pdf_utils import create_test_pdf
+
+
+def _make_args(extract_pages: str, jobs: int) -> argparse.Namespace:
+    """Build the argument namespace the CLI would produce for a batch extraction."""
+    return argparse.Namespace(
+        path=Path('.'), extract_pages=extract_pages, batch=True, jobs=jobs, dry_run=False,
+        respect_groups=False, separate_files=False, replace=False, conflicts='rename',
+        dedup=None, filter_matches=None, group_start=None, group_end=None,
+        scrape_pattern=None, scrape_patterns_file=None, filename_template=None,
+        pattern_source_page=1, name_prefix=None, no_timestamp=False, smart_names=False,
+        preview=False,
+    )
+
+
+def _make_folder(folder: Path, count: int) -> list[tuple[Path, int, float]]:
+    pdf_files = []
+    for i in range(count):
+        pdf_path = create_test_pdf(str(folder / f"doc{i}.pdf"),
+                                    {1: f"Invoice {i}", 2: "Summary", 3: "Other"})
+        pdf_files.append((pdf_path, 3, pdf_path.stat().st_size / 1024 / 1024))
+    return pdf_files
+
+
+def _run_batch(args: argparse.Namespace, pdf_files: list) -> str:
+    OpCtx.reset()
+    OpCtx.set_args(args)
+    buffer = StringIO()
+    with redirect_stdout(buffer):
+        process_batch_extract(args, pdf_files, None, None, 1, False)
+    OpCtx.reset()
+    return buffer.getvalue()
+
+
+def test_parallel_matches_serial():
+    """Worker processes create the same files as the serial loop, logged in input order."""
+    print("=== Testing Parallel Batch Extraction ===")
+
+    with tempfile.TemporaryDirectory() as serial_dir, tempfile.TemporaryDirectory() as parallel_dir:
+        serial_files = _make_folder(Path(serial_dir), 4)
+        parallel_files = _make_folder(Path(parallel_dir), 4)
+
+        _run_batch(_make_args("2-3", jobs=1), serial_files)
+        output = _run_batch(_make_args("2-3", jobs=3), parallel_files)
+
+        serial_names = sorted(p.name for p in Path(serial_dir).glob("*.pdf"))
+        parallel_names = sorted(p.name for p in Path(parallel_dir).glob("*.pdf"))
+        assert serial_names == parallel_names, f"{serial_names} != {parallel_names}"
+
+        positions = [output.index(f"Processing doc{i}.pdf") for i in range(4)]
+        assert positions == sorted(positions), "Worker output must be merged in input order"
+        assert "4 processed, 0 skipped, 0 failed" in output
+
+    print("✓ Parallel run matches serial run")
+    return True
+
+
+def test_parallel_rename_conflicts():
+    """Re-running into a populated folder renames every output exactly once."""
+    print("=== Testing Parallel Conflict Resolution ===")
+
+    with tempfile.TemporaryDirectory() as folder:
+        pdf_files = _make_folder(Path(folder), 4)
+        args = _make_args("1", jobs=4)
+
+        _run_batch(args, pdf_files)
+        _run_batch(args, pdf_files)
+
+        outputs = sorted(p.name for p in Path(folder).glob("doc*_extracted_*.pdf"))
+        assert len(outputs) == 8, outputs
+        assert all(p.stat().st_size > 0 for p in Path(folder).glob("*.pdf")), "No placeholder may remain"
+
+    print("✓ Renamed outputs never collide")
+    return True
+
+
+def test_reservation_claims_paths():
+    """With a reservation lock, a resolved path is claimed so the next resolution renames."""
+    print("=== Testing Output Reservation ===")
+    import threading
+
+    with tempfile.TemporaryDirectory() as folder:
+        target = Path(folder) / "out.pdf"
+        set_reservation_lock(threading.Lock())
+        try:
+            first, _ = resolve_file_conflicts([target], 'rename', interactive=False)
+            second, _ = resolve_file_conflicts([target], 'rename', interactive=False)
+            assert first == [target]
+            assert second[0] != target, "Second resolution must not reuse a claimed path"
+
+            release_reservations()
+            assert not target.exists(), "Unwritten placeholders are released"
+        finally:
+            set_reservation_lock(None)
+
+    print("✓ Reservation claims and releases paths")
+    return True
+
+
+def test_job_count():
+    """--jobs 0 means one worker per CPU."""
+    assert resolve_job_count(0) >= 1
+    assert resolve_job_count(3) == 3
+    assert resolve_job_count(1) == 1
+    return True
+
+
+def main():
+    """Run all parallel batch tests."""
+    print("PARALLEL BATCH TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_parallel_matches_serial,
+        test_parallel_rename_conflicts,
+        test_reservation_claims_paths,
+        test_job_count,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"PARALLEL BATCH TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
@@ -0,0 +1,147 @@
+"""
+Test Shared Document Sessions
+Run: python tests/test_document_session.py
+
+Tests that the per-file pipeline (page count, type:/size: patterns, page
+analysis, output size estimate, scraper processor) parses a PDF once, and
+that sessions are replaced when the file changes.
+"""
+
+import sys
+import atexit
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pypdf import PdfReader
+
+from pdf_manipulator.core import document_session
+from pdf_manipulator.core.document_session import close_document_sessions, get_document_session
+from pdf_manipulator.core.page_analysis import PageAnalyzer
+from pdf_manipulator.core.page_range.patterns import parse_pattern_expression
+from pdf_manipulator.core.scanner import get_pdf_info
+from pdf_manipulator.scraper.extractors.pattern_extractor import PatternExtractor
+from pdf_manipulator.ui_enhanced import estimate_output_size
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs
+
+
+atexit.register(cleanup_test_pdfs)
+
+LONG_TEXT = "This page has plenty of text to count as a text page for the analyzer."
+
+
+def _counting_reader_opens():
+    """Count PdfReader constructions, wherever they happen."""
+    opens = []
+    original = PdfReader.__init__
+
+    def counting(self, stream, *args, **kwargs):
+        opens.append(Path(stream).name if isinstance(stream, (str, Path)) else '<stream>')
+        original(self, stream, *args, **kwargs)
+
+    PdfReader.__init__ = counting
+    return opens, lambda: setattr(PdfReader, '__init__', original)
+
+
+def test_pipeline_parses_once():
+    """Every step of a single-file run shares one reader."""
+    print("=== Testing One Parse Per File ===")
+    content = {page: f"Page {page}\nInvoice {page}\n{LONG_TEXT}" for page in range(1, 7)}
+    content[4] = ""
+    pdf_path = create_test_pdf('test_document_session.pdf', content)
+    close_document_sessions()
+
+    opens, restore = _counting_reader_opens()
+    try:
+        page_count, _ = get_pdf_info(pdf_path)
+        assert page_count == 6
+        assert parse_pattern_expression("type:empty", pdf_path, page_count) == [4]
+        assert parse_pattern_expression("size:<1MB", pdf_path, page_count) == [1, 2, 3, 4, 5, 6]
+        with PageAnalyzer(pdf_path) as analyzer:
+            assert analyzer.analyze_page(4).page_type == 'empty'
+        assert estimate_output_size(pdf_path, 3) is not None
+
+        extractor = PatternExtractor()
+        assert extractor._get_pdf_page_count(pdf_path) == 6
+        assert "Invoice 2" in extractor._extract_page_text(pdf_path, 2)
+        assert "Invoice 2" in extractor._extract_page_text(pdf_path, 2)
+    finally:
+        restore()
+
+    assert opens == ['test_document_session.pdf'], f"Expected one parse, got {opens}"
+    print("✓ One PdfReader for the whole pipeline")
+    return True
+
+
+def test_changed_file_gets_new_session():
+    """Rewriting a file replaces its session."""
+    print("=== Testing Session Invalidation ===")
+    pdf_path = create_test_pdf('test_document_session_edit.pdf', {1: "One", 2: "Two"})
+    first = get_document_session(pdf_path)
+    assert first.page_count == 2
+    assert get_document_session(pdf_path) is first
+
+    create_test_pdf('test_document_session_edit.pdf', {1: "One", 2: "Two", 3: "Three"})
+    second = get_document_session(pdf_path)
+    assert second is not first
+    assert second.page_count == 3
+    print("✓ Edited files get a fresh session")
+    return True
+
+
+def test_evicted_sessions_release_handles():
+    """Sessions beyond the registry limit are closed."""
+    print("=== Testing Session Eviction ===")
+    close_document_sessions()
+    paths = [create_test_pdf(f'test_document_session_{i}.pdf', {1: f"Doc {i}"})
+                for i in range(document_session.MAX_SESSIONS + 1)]
+
+    first = get_document_session(paths[0])
+    first.plumber()
+    assert first._plumber_pdf is not None
+
+    for pdf_path in paths[1:]:
+        get_document_session(pdf_path)
+
+    assert first._plumber_pdf is None, "Evicted session kept its pdfplumber handle"
+    assert len(document_session._sessions) == document_session.MAX_SESSIONS
+    close_document_sessions()
+    print("✓ Evicted sessions are closed")
+    return True
+
+
+def main():
+    """Run all document session tests."""
+    print("DOCUMENT SESSION TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_pipeline_parses_once,
+        test_changed_file_gets_new_session,
+        test_evicted_sessions_release_handles,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"DOCUMENT SESSION TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
@@ -0,0 +1,154 @@
+"""
+Test Document Fingerprint Service
+Run: python tests/test_fingerprint.py
+
+Tests the memory-mapped file digest (matches a plain SHA-256, memoized per
+file identity, re-hashed after a change), and the per-page content
+fingerprint (same digest as hashing all page content at once, metadata
+ignored, equal pages hash equal, unreadable files fall back to file bytes).
+"""
+
+import os
+import sys
+import hashlib
+
+from pathlib import Path
+from unittest import mock
+
+from pypdf import PdfReader, PdfWriter
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core.cache import fingerprint
+from pdf_manipulator.core.cache.fingerprint import clear_fingerprint_memo, content_fingerprint, file_digest
+from pdf_manipulator.core.cache.text_cache import get_document_key
+from pdf_manipulator.core.ghostscript import _get_content_hash, _get_file_hash
+
+from tests.test_pdf_utils import create_test_pdf, create_temp_dir
+
+
+def _whole_document_hash(pdf_path: Path) -> str:
+    """The content hash computed from all pages joined at once."""
+    reader = PdfReader(pdf_path)
+    parts = []
+    for page in reader.pages:
+        content = page.get_contents()
+        if content is not None:
+            parts.append(content.get_data())
+        parts.append(str(page.mediabox).encode('utf-8'))
+    return hashlib.sha256(b''.join(parts)).hexdigest()
+
+
+def test_file_digest():
+    """The mapped digest is the file's SHA-256 and is memoized until the file changes."""
+    print("=== Testing File Digest ===")
+    clear_fingerprint_memo()
+    folder = create_temp_dir()
+    data_path = folder / "data.bin"
+    data_path.write_bytes(os.urandom(300_000))
+    empty_path = folder / "empty.bin"
+    empty_path.write_bytes(b"")
+
+    with mock.patch.object(fingerprint, 'HASH_SLICE_SIZE', 65536):
+        assert file_digest(data_path) == hashlib.sha256(data_path.read_bytes()).hexdigest()
+    assert file_digest(empty_path) == hashlib.sha256(b"").hexdigest()
+    assert get_document_key(data_path) == file_digest(data_path)
+    assert _get_file_hash(folder / "missing.pdf") == ""
+
+    with mock.patch.object(fingerprint.mmap, 'mmap', side_effect=AssertionError("re-hashed")):
+        file_digest(data_path)
+        linked = folder / "linked.bin"
+        os.link(data_path, linked)
+        assert file_digest(linked) == file_digest(data_path), "Same inode must not be re-hashed"
+
+    data_path.write_bytes(b"changed" * 1000)
+    assert file_digest(data_path) == hashlib.sha256(b"changed" * 1000).hexdigest()
+    print("✓ Digest correct, memoized per file identity")
+    return True
+
+
+def test_content_fingerprint():
+    """Per-page hashing gives the same document digest plus one hash per page."""
+    print("=== Testing Content Fingerprint ===")
+    clear_fingerprint_memo()
+    folder = create_temp_dir()
+    pdf_path = create_test_pdf(str(folder / "doc.pdf"), {1: "Cover", 2: "Statement", 3: "Cover"})
+
+    result = content_fingerprint(pdf_path)
+    assert result.digest == _whole_document_hash(pdf_path)
+    assert _get_content_hash(pdf_path) == result.digest
+    assert len(result.page_hashes) == 3 and not result.from_file_bytes
+    assert result.page_hashes[0] == result.page_hashes[2] != result.page_hashes[1]
+    print("✓ Document digest unchanged, pages hashed separately")
+    return True
+
+
+def test_metadata_ignored():
+    """A copy with different metadata has the same content fingerprint."""
+    print("=== Testing Metadata Independence ===")
+    clear_fingerprint_memo()
+    folder = create_temp_dir()
+    pdf_path = create_test_pdf(str(folder / "original.pdf"), {1: "Invoice", 2: "Totals"})
+
+    writer = PdfWriter(clone_from=PdfReader(pdf_path))
+    writer.add_metadata({'/Producer': 'Something else', '/Title': 'Renamed'})
+    copy_path = folder / "copy.pdf"
+    with open(copy_path, 'wb') as f:
+        writer.write(f)
+
+    assert file_digest(copy_path) != file_digest(pdf_path)
+    assert content_fingerprint(copy_path) == content_fingerprint(pdf_path)
+    print("✓ Metadata ignored")
+    return True
+
+
+def test_unreadable_falls_back():
+    """Files pypdf can't read are fingerprinted by their bytes."""
+    print("=== Testing Fallback ===")
+    clear_fingerprint_memo()
+    folder = create_temp_dir()
+    garbage = folder / "garbage.pdf"
+    garbage.write_bytes(b"not a pdf at all")
+
+    result = content_fingerprint(garbage)
+    assert result.from_file_bytes and result.page_hashes == ()
+    assert result.digest == hashlib.sha256(b"not a pdf at all").hexdigest()
+    assert _get_content_hash(folder / "missing.pdf") == ""
+    print("✓ Unreadable files fall back to the file digest")
+    return True
+
+
+def main():
+    """Run all fingerprint tests."""
+    print("FINGERPRINT TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_file_digest,
+        test_content_fingerprint,
+        test_metadata_ignored,
+        test_unreadable_falls_back,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"FINGERPRINT TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
@@ -0,0 +1,196 @@
+"""
+Test Folder Scan Manifests
+Run: python tests/test_folder_manifest.py
+
+Tests that re-scanning an unchanged folder reads page counts and malformation
+verdicts from the manifest, and that new, modified and deleted files are
+picked up.
+"""
+
+import os
+import sys
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core import scanner
+from pdf_manipulator.core.cache import fingerprint, text_cache
+from pdf_manipulator.core.cache.folder_manifest import configure_folder_manifests
+from pdf_manipulator.core.malformation_utils import check_and_fix_malformation_batch, check_pdf_malformation
+from pdf_manipulator.core.scanner import scan_folder
+
+from tests.test_pdf_utils import create_test_pdf, create_temp_dir
+
+
+def _make_pdf(path: Path, pages: int) -> Path:
+    return create_test_pdf(str(path), {page: f"Page {page}" for page in range(1, pages + 1)})
+
+
+def _counting_reads():
+    """Patch the scanner's PDF reader to record which files get parsed."""
+    reads = []
+    original = scanner._read_pdf_info
+
+    def counting(pdf_path):
+        reads.append(pdf_path.name)
+        return original(pdf_path)
+
+    scanner._read_pdf_info = counting
+    return reads, lambda: setattr(scanner, '_read_pdf_info', original)
+
+
+def test_unchanged_folder_skips_parsing():
+    """A second scan of an unchanged folder parses nothing."""
+    print("=== Testing Unchanged Folder ===")
+    folder = create_temp_dir()
+    cache_dir = create_temp_dir()
+    for index in range(3):
+        _make_pdf(folder / f"doc{index}.pdf", index + 1)
+
+    reads, restore = _counting_reads()
+    try:
+        configure_folder_manifests(cache_dir)
+        first = scan_folder(folder)
+        assert len(reads) == 3
+
+        configure_folder_manifests(cache_dir)   # Same store, fresh process state
+        second = scan_folder(folder)
+        assert len(reads) == 3, f"Unchanged files were parsed again: {reads[3:]}"
+        assert first == second
+    finally:
+        restore()
+        configure_folder_manifests(enabled=False)
+
+    print("✓ Unchanged files served from the manifest")
+    return True
+
+
+def test_changed_files_rescanned():
+    """New and modified files are scanned; deleted ones disappear."""
+    print("=== Testing Changed Files ===")
+    folder = create_temp_dir()
+    cache_dir = create_temp_dir()
+    for index in range(3):
+        _make_pdf(folder / f"doc{index}.pdf", 1)
+
+    reads, restore = _counting_reads()
+    try:
+        configure_folder_manifests(cache_dir)
+        scan_folder(folder)
+        reads.clear()
+
+        _make_pdf(folder / "doc1.pdf", 4)
+        stat = (folder / "doc1.pdf").stat()
+        os.utime(folder / "doc1.pdf", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        _make_pdf(folder / "new.pdf", 2)
+        (folder / "doc2.pdf").unlink()
+
+        configure_folder_manifests(cache_dir)
+        results = scan_folder(folder)
+        assert sorted(reads) == ["doc1.pdf", "new.pdf"]
+        assert [(p.name, n) for p, n, _ in results] == [("doc0.pdf", 1), ("doc1.pdf", 4), ("new.pdf", 2)]
+    finally:
+        restore()
+        configure_folder_manifests(enabled=False)
+
+    print("✓ Only changed files were parsed")
+    return True
+
+
+def test_malformation_verdicts_stored():
+    """Malformation checks for scanned files run once across runs."""
+    print("=== Testing Stored Malformation Verdicts ===")
+    from pdf_manipulator.core import ghostscript
+
+    folder = create_temp_dir()
+    cache_dir = create_temp_dir()
+    for index in range(2):
+        _make_pdf(folder / f"doc{index}.pdf", 2)
+
+    checks = []
+    original = ghostscript.detect_malformed_pdf
+
+    def counting(pdf_path):
+        checks.append(pdf_path.name)
+        return original(pdf_path)
+
+    ghostscript.detect_malformed_pdf = counting
+    try:
+        configure_folder_manifests(cache_dir)
+        pdf_files = scan_folder(folder)
+        check_and_fix_malformation_batch(pdf_files, "scanning")
+        verdicts = [check_pdf_malformation(pdf_path) for pdf_path, _, _ in pdf_files]
+        assert len(checks) == 2
+
+        configure_folder_manifests(cache_dir)
+        pdf_files = scan_folder(folder)
+        check_and_fix_malformation_batch(pdf_files, "scanning")
+        assert [check_pdf_malformation(pdf_path) for pdf_path, _, _ in pdf_files] == verdicts
+        assert len(checks) == 2, "Verdicts should come from the manifest"
+    finally:
+        ghostscript.detect_malformed_pdf = original
+        configure_folder_manifests(enabled=False)
+
+    print("✓ Malformation verdicts reused")
+    return True
+
+
+def test_content_hashes_seed_document_keys():
+    """Manifest hashes are used as document keys without re-hashing."""
+    print("=== Testing Stored Content Hashes ===")
+    folder = create_temp_dir()
+    cache_dir = create_temp_dir()
+    pdf_path = _make_pdf(folder / "doc.pdf", 2)
+
+    try:
+        configure_folder_manifests(cache_dir)
+        scan_folder(folder)
+        expected = text_cache.get_document_key(pdf_path)
+
+        fingerprint.clear_fingerprint_memo()
+        configure_folder_manifests(cache_dir)
+        scan_folder(folder)
+        assert len(fingerprint._file_digest_memo) == 1
+        assert text_cache.get_document_key(pdf_path) == expected
+    finally:
+        configure_folder_manifests(enabled=False)
+
+    print("✓ Document keys come from the manifest")
+    return True
+
+
+def main():
+    """Run all folder manifest tests."""
+    print("FOLDER MANIFEST TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_unchanged_folder_skips_parsing,
+        test_changed_files_rescanned,
+        test_malformation_verdicts_stored,
+        test_content_hashes_seed_document_keys,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"FOLDER MANIFEST TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
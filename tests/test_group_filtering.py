@@ -9,6 +9,7 @@ import sys
 import tempfile
 
 from pathlib import Path
+from unittest import mock
 from rich.console import Console
 
 # Add project root to path for imports
@@ -19,9 +20,13 @@ from pdf_manipulator.core.page_range.group_filtering import (
     filter_page_groups,
     validate_filter_syntax,
     describe_filter_result,
+    get_group_sizes,
+    parse_filter_mode,
     _is_index_based_filter,
     _filter_by_indices
 )
+from pdf_manipulator.core.page_range.boolean import UnifiedBooleanSupervisor
+from tests.test_pdf_utils import create_test_pdf
 
 
 console = Console()
@@ -272,6 +277,89 @@ def test_description_helper() -> bool:
     return success
 
 
+def test_content_filtering_and_modes() -> bool:
+    """Test that content criteria are evaluated once and that any/all/count>=N modes apply."""
+    print("Testing content filtering modes...")
+    success = True
+    
+    with tempfile.TemporaryDirectory() as folder:
+        pdf_path = create_test_pdf(str(Path(folder) / "chapters.pdf"), {
+            1: "Chapter Important", 2: "Body", 3: "Body",
+            4: "Chapter Important", 5: "Important note", 6: "Body",
+            7: "Important", 8: "Important", 9: "Appendix",
+        })
+        groups = [
+            PageGroup([1, 2, 3], True, "ch1"),
+            PageGroup([4, 5], True, "ch2"),
+            PageGroup([7, 8], True, "ch3"),
+        ]
+        criteria = "contains:'Important'"
+        
+        # Test 1: One evaluation for all groups, restricted to their pages
+        with mock.patch.object(UnifiedBooleanSupervisor, 'evaluate', autospec=True,
+                                side_effect=UnifiedBooleanSupervisor.evaluate) as evaluate:
+            filtered = filter_page_groups(groups, criteria, pdf_path, 9)
+        candidates = evaluate.call_args.kwargs.get('candidate_pages')
+        if evaluate.call_count == 1 and candidates is not None and list(candidates) == [1, 2, 3, 4, 5, 7, 8] \
+                and [g.original_spec for g in filtered] == ["ch1", "ch2", "ch3"]:
+            print("  ✓ Criteria evaluated once for the union of group pages")
+        else:
+            print(f"  ✗ Single evaluation failed: {evaluate.call_count} calls, candidates {candidates}")
+            success = False
+        
+        # Test 2: Modes
+        expected = {
+            'any': ["ch1", "ch2", "ch3"],
+            'all': ["ch2", "ch3"],
+            'count>=2': ["ch2", "ch3"],
+            'count>=3': [],
+        }
+        for mode, names in expected.items():
+            filtered = filter_page_groups(groups, criteria, pdf_path, 9, mode=mode)
+            if [g.original_spec for g in filtered] == names:
+                print(f"  ✓ Mode {mode}")
+            else:
+                print(f"  ✗ Mode {mode}: got {[g.original_spec for g in filtered]}, expected {names}")
+                success = False
+        
+        # Test 3: Negated criteria only decide group pages
+        filtered = filter_page_groups(groups, "all & !contains:'Body'", pdf_path, 9, mode='all')
+        if [g.original_spec for g in filtered] == ["ch2", "ch3"]:
+            print("  ✓ Boolean criteria restricted to group pages")
+        else:
+            print(f"  ✗ Boolean criteria failed: got {[g.original_spec for g in filtered]}")
+            success = False
+        
+        # Test 4: Group sizes from one pass
+        sizes = get_group_sizes(groups, pdf_path)
+        if len(sizes) == 3 and all(size > 0 for size in sizes):
+            print("  ✓ Group sizes")
+        else:
+            print(f"  ✗ Group sizes failed: {sizes}")
+            success = False
+    
+    # Test 5: Mode parsing
+    try:
+        parsed = [parse_filter_mode(m) for m in (None, 'ANY', 'all', 'count >= 4')]
+        if parsed == [('any', 1), ('any', 1), ('all', 0), ('count', 4)]:
+            print("  ✓ Mode parsing")
+        else:
+            print(f"  ✗ Mode parsing failed: {parsed}")
+            success = False
+        for bad in ('most', 'count>=0', 'count>2'):
+            try:
+                parse_filter_mode(bad)
+                print(f"  ✗ Invalid mode accepted: {bad}")
+                success = False
+            except ValueError:
+                pass
+    except Exception as e:
+        print(f"  ✗ Mode parsing error: {e}")
+        success = False
+    
+    return success
+
+
 def run_all_tests() -> bool:
     """Run all tests and return overall success."""
     console.print("\n[bold blue]Group Filtering Tests[/bold blue]")
@@ -282,6 +370,7 @@ def run_all_tests() -> bool:
         test_index_based_filtering,
         test_empty_and_edge_cases,
         test_description_helper,
+        test_content_filtering_and_modes,
     ]
     
     results = []
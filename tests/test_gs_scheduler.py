@@ -0,0 +1,226 @@
+"""
+Test Parallel Ghostscript Repair Scheduler
+Run: python tests/test_gs_scheduler.py
+
+Runs --gs-batch-fix repairs against a stand-in `gs` executable (it copies the
+input to the output file and logs when it ran) to test that jobs overlap,
+timeouts scale with file size, transient failures are retried, and the batch
+results keep the order the files were found in.
+"""
+
+import os
+import sys
+
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from rich.console import Console
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core import ghostscript, gs_scheduler
+from pdf_manipulator.core.gs_scheduler import RepairJobResult, job_timeout, run_repair_job, run_repair_jobs
+
+from tests.test_pdf_utils import create_test_pdf, create_temp_dir
+
+
+FAKE_GS = '''#!{python}
+import os, sys, time, shutil
+if sys.argv[1:] == ['--version']:
+    print('10.02.1')
+    sys.exit(0)
+output = next(a.split('=', 1)[1] for a in sys.argv if a.startswith('-sOutputFile='))
+source = sys.argv[-1]
+log = os.environ['FAKE_GS_LOG']
+with open(log, 'a') as f:
+    f.write(f"start {{os.path.basename(source)}} {{time.time()}}\\n")
+hang_marker = source + '.hang-once'
+if os.path.exists(hang_marker):
+    os.remove(hang_marker)
+    time.sleep(30)
+if source.endswith('broken.pdf'):
+    print('Unrecoverable error', file=sys.stderr)
+    sys.exit(1)
+time.sleep(float(os.environ.get('FAKE_GS_DELAY', '0')))
+shutil.copyfile(source, output)
+with open(log, 'a') as f:
+    f.write(f"end {{os.path.basename(source)}} {{time.time()}}\\n")
+'''
+
+
+def _fake_gs_environment(folder: Path, delay: float = 0.0) -> dict:
+    """Environment with a stand-in gs first on PATH (it logs to folder/gs.log)."""
+    bin_dir = folder / "bin"
+    bin_dir.mkdir()
+    gs_path = bin_dir / "gs"
+    gs_path.write_text(FAKE_GS.format(python=sys.executable))
+    gs_path.chmod(0o755)
+
+    return {
+        'PATH': f"{bin_dir}{os.pathsep}{os.environ['PATH']}",
+        'FAKE_GS_LOG': str(folder / "gs.log"),
+        'FAKE_GS_DELAY': str(delay),
+    }
+
+
+def _make_folder(folder: Path, count: int) -> list[Path]:
+    return [create_test_pdf(str(folder / f"doc{i}.pdf"), {1: f"Invoice {i}", 2: "Summary"})
+            for i in range(count)]
+
+
+def _runs(log_path: Path) -> dict:
+    """Start/end times per file from the fake gs log."""
+    runs = {}
+    for line in log_path.read_text().splitlines():
+        event, name, when = line.split()
+        runs.setdefault(name, {})[event] = float(when)
+    return runs
+
+
+def test_job_timeout_scales_with_size():
+    """Bigger inputs get longer Ghostscript timeouts, up to the maximum."""
+    print("=== Testing Job Timeouts ===")
+    folder = create_temp_dir()
+    small = folder / "small.pdf"
+    small.write_bytes(b"%PDF" + b"0" * 1024)
+    big = folder / "big.pdf"
+    big.write_bytes(b"%PDF" + b"0" * (20 * 1024 * 1024))
+
+    assert job_timeout(small) == gs_scheduler.BASE_TIMEOUT
+    assert job_timeout(big) == gs_scheduler.BASE_TIMEOUT + 20 * gs_scheduler.TIMEOUT_SECONDS_PER_MB
+    with mock.patch.object(gs_scheduler, 'MAX_TIMEOUT', 100):
+        assert job_timeout(big) == 100
+    print("✓ Timeouts scale with input size")
+    return True
+
+
+def test_transient_failure_retried():
+    """A timed-out job is retried with backoff; a hard failure is not."""
+    print("=== Testing Retries ===")
+    folder = create_temp_dir()
+    pdf_path = create_test_pdf(str(folder / "slow.pdf"), {1: "Slow"})
+    Path(f"{pdf_path}.hang-once").touch()
+    broken = create_test_pdf(str(folder / "broken.pdf"), {1: "Broken"})
+
+    with mock.patch.dict(os.environ, _fake_gs_environment(folder)), \
+            mock.patch.object(gs_scheduler, 'BASE_TIMEOUT', 2), \
+            mock.patch.object(gs_scheduler, 'TIMEOUT_SECONDS_PER_MB', 0):
+        result = run_repair_job(pdf_path, "test", backoff=0.01)
+        failed = run_repair_job(broken, "test", backoff=0.01)
+
+    assert result.error is None, result.error
+    assert result.attempts == 2
+    assert result.output_path == folder / "slow_gs_fixed.pdf" and result.output_path.exists()
+
+    assert failed.attempts == 1, "Non-transient failures must not be retried"
+    assert "exit code 1" in failed.error
+    assert _runs(folder / "gs.log")['slow.pdf']['end']
+    print("✓ Transient failure retried, hard failure reported")
+    return True
+
+
+def test_jobs_run_concurrently():
+    """Several gs processes run at once and every file is repaired."""
+    print("=== Testing Concurrent Jobs ===")
+    folder = create_temp_dir()
+    pdf_files = _make_folder(folder, 4)
+
+    with mock.patch.dict(os.environ, _fake_gs_environment(folder, delay=0.5)):
+        results = list(run_repair_jobs([(pdf, "test") for pdf in pdf_files], jobs=4))
+
+    assert sorted(result.pdf_path for result in results) == sorted(pdf_files)
+    assert all(result.error is None and result.output_path.exists() for result in results)
+
+    runs = _runs(folder / "gs.log")
+    overlapping = max(run['start'] for run in runs.values()) < min(run['end'] for run in runs.values())
+    assert overlapping, "All four jobs should have been running at the same time"
+    print("✓ Jobs overlapped")
+    return True
+
+
+def test_safe_batch_fix_keeps_order():
+    """The batch fix confirms first, then reports results in discovery order."""
+    print("=== Testing Batch Fix ===")
+    folder = create_temp_dir()
+    pdf_files = _make_folder(folder, 3)
+    (folder / "broken.pdf").write_bytes(pdf_files[0].read_bytes())
+    discovery_order = list(folder.glob("*.pdf"))
+
+    asked = []
+
+    def confirm(prompt, default=True):
+        asked.append(prompt)
+        return True
+
+    with mock.patch.dict(os.environ, _fake_gs_environment(folder)), \
+            mock.patch.object(ghostscript, 'detect_malformed_pdf', lambda path: (True, "Resource duplication")), \
+            mock.patch('rich.prompt.Confirm.ask', confirm):
+        results = ghostscript.safe_batch_fix_pdfs(folder, jobs=2)
+
+    assert len(asked) == 1 and "4 malformed PDFs" in asked[0]
+    assert [path for path, _ in results] == discovery_order
+    messages = dict(results)
+    assert messages[folder / "broken.pdf"].startswith("Error:")
+    assert messages[pdf_files[1]] == "Fixed as doc1_gs_fixed.pdf (Resource duplication)"
+    print("✓ Results in discovery order with failures reported")
+    return True
+
+
+def test_failed_job_output_shown():
+    """Output captured in the worker is shown for failed jobs only."""
+    print("=== Testing Captured Job Output ===")
+    failed = RepairJobResult(Path("broken.pdf"), "Resource duplication", attempts=1,
+                             error="Ghostscript exited with 1", output="GPL Ghostscript: Unrecoverable error [x]\n")
+    buffer = StringIO()
+    message = ghostscript._finish_repair_job(failed, True, Console(file=buffer, width=200))
+    assert message == "Error: Ghostscript exited with 1"
+    assert "Unrecoverable error [x]" in buffer.getvalue()
+
+    folder = create_temp_dir()
+    fixed = folder / "doc_gs_fixed.pdf"
+    fixed.write_bytes(b"%PDF-1.4")
+    succeeded = RepairJobResult(folder / "doc.pdf", "Resource duplication", output_path=fixed,
+                                attempts=1, output="Fixing doc.pdf...\n")
+    buffer = StringIO()
+    ghostscript._finish_repair_job(succeeded, True, Console(file=buffer, width=200))
+    assert "Fixing doc.pdf" not in buffer.getvalue()
+    print("✓ Failure output shown, success output kept quiet")
+    return True
+
+
+def main():
+    """Run all Ghostscript scheduler tests."""
+    print("GHOSTSCRIPT SCHEDULER TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_job_timeout_scales_with_size,
+        test_transient_failure_retried,
+        test_jobs_run_concurrently,
+        test_safe_batch_fix_keeps_order,
+        test_failed_job_output_shown,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"GHOSTSCRIPT SCHEDULER TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
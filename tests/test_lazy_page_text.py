@@ -0,0 +1,205 @@
+"""
+Test Lazy Page Text Extraction
+Run: python tests/test_lazy_page_text.py
+
+Tests that content patterns only extract the pages they examine: the lazy
+page text provider, numeric terms inside boolean expressions, and candidate
+restriction of content patterns by top-level numeric terms.
+"""
+
+import sys
+import atexit
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core.page_range import patterns
+from pdf_manipulator.core.page_range.boolean import UnifiedBooleanSupervisor
+from pdf_manipulator.core.page_range.page_text import get_page_text_provider
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs
+
+
+atexit.register(cleanup_test_pdfs)
+
+TOTAL_PAGES = 20
+
+
+def _create_invoice_pdf() -> Path:
+    """Odd pages are invoices, even pages are summaries."""
+    content = {page: (f"Invoice {page}" if page % 2 else f"Summary {page}")
+                for page in range(1, TOTAL_PAGES + 1)}
+    return create_test_pdf('test_lazy_page_text.pdf', content)
+
+
+def _evaluate(pdf_path: Path, expression: str) -> tuple[list[int], set[int]]:
+    """Evaluate from a cold provider; return (pages, pages whose text was loaded)."""
+    patterns._clear_extraction_cache()
+    pages, _ = UnifiedBooleanSupervisor(pdf_path, TOTAL_PAGES).evaluate(expression)
+    loaded = get_page_text_provider(pdf_path, TOTAL_PAGES).loaded_pages
+    return sorted(pages), loaded
+
+
+def _full_pages(pdf_path: Path, expression: str) -> list[int]:
+    """Evaluate a single (possibly negated) pattern without any candidate restriction."""
+    patterns._clear_extraction_cache()
+    negated = expression.startswith('!')
+    pages = set(patterns.parse_pattern_expression(expression.lstrip('!'), pdf_path, TOTAL_PAGES))
+    if negated:
+        pages = set(range(1, TOTAL_PAGES + 1)) - pages
+    return sorted(pages)
+
+
+def test_provider_extracts_only_requested_pages():
+    """The provider extracts requested pages once and memoizes them."""
+    print("=== Testing Lazy Page Text Provider ===")
+    pdf_path = _create_invoice_pdf()
+
+    try:
+        patterns._clear_extraction_cache()
+        provider = get_page_text_provider(pdf_path, TOTAL_PAGES)
+
+        texts = provider.get_many([2, 5])
+        assert "Summary 2" in texts[2] and "Invoice 5" in texts[5]
+        assert provider.loaded_pages == {2, 5}
+        assert provider.pages_extracted == 2
+
+        provider.get_many([2, 5, 6])
+        assert provider.pages_extracted == 3, "Memoized pages must not be extracted again"
+        assert provider.get(TOTAL_PAGES + 5) == "", "Pages past the end are empty"
+
+    finally:
+        patterns._clear_extraction_cache()
+
+    print("✓ Only requested pages are extracted, each only once")
+    return True
+
+
+def test_numeric_terms_in_boolean_expressions():
+    """Page numbers, ranges and keywords work as boolean operands."""
+    print("=== Testing Numeric Terms in Boolean Expressions ===")
+    pdf_path = _create_invoice_pdf()
+
+    try:
+        assert _evaluate(pdf_path, "1-3 & contains:Invoice")[0] == [1, 3]
+        assert _evaluate(pdf_path, "contains:Invoice & 1-3")[0] == [1, 3]
+        assert _evaluate(pdf_path, "!1-15 & contains:Summary")[0] == [16, 18, 20]
+        assert _evaluate(pdf_path, "last 4 & !contains:Invoice")[0] == [18, 20]
+        assert _evaluate(pdf_path, "2-3 | contains:'Invoice 19'")[0] == [2, 3, 19]
+        assert _evaluate(pdf_path, "odd & !1-15")[0] == [17, 19]
+
+    finally:
+        patterns._clear_extraction_cache()
+
+    print("✓ Numeric terms combine with content patterns")
+    return True
+
+
+def test_candidate_restriction_limits_extraction():
+    """Top-level numeric terms restrict which pages content patterns read."""
+    print("=== Testing Candidate Restriction ===")
+    pdf_path = _create_invoice_pdf()
+
+    try:
+        pages, loaded = _evaluate(pdf_path, "1-3 & contains:Invoice")
+        assert pages == [1, 3]
+        assert loaded == {1, 2, 3}, f"Only candidate pages should be extracted, got {sorted(loaded)}"
+
+        pages, loaded = _evaluate(pdf_path, "1-4 & (contains:Invoice | contains:'Summary 2')")
+        assert pages == [1, 2, 3]
+        assert loaded == {1, 2, 3, 4}
+
+        # Offsets shift the candidates back to the pages the base pattern reads
+        pages, loaded = _evaluate(pdf_path, "contains:Invoice+1 & 1-4")
+        assert pages == [2, 4]
+        assert loaded == {1, 2, 3}
+
+        # OR operands only examine pages nothing has matched yet
+        pages, loaded = _evaluate(pdf_path, "2-3 | contains:'Invoice 19'")
+        assert loaded == set(range(1, TOTAL_PAGES + 1)) - {2, 3}
+
+    finally:
+        patterns._clear_extraction_cache()
+
+    print("✓ Content patterns only read candidate pages")
+    return True
+
+
+def test_restricted_matches_full_evaluation():
+    """Restricted evaluation gives the same pages as evaluating everything."""
+    print("=== Testing Restricted vs Full Evaluation ===")
+    pdf_path = _create_invoice_pdf()
+
+    # (restricted expression, unrestricted pattern, pages of the numeric term)
+    cases = [
+        ("5-12 & contains:Summary", "contains:Summary", range(5, 13)),
+        ("!contains:Invoice & 3-9", "!contains:Invoice", range(3, 10)),
+        ("contains:Invoice-1 & 10-14", "contains:Invoice-1", range(10, 15)),
+    ]
+
+    try:
+        for restricted, unrestricted, bounds in cases:
+            expected = sorted(set(_full_pages(pdf_path, unrestricted)) & set(bounds))
+            assert _evaluate(pdf_path, restricted)[0] == expected, restricted
+
+    finally:
+        patterns._clear_extraction_cache()
+
+    print("✓ Restricted evaluation matches full evaluation")
+    return True
+
+
+def test_range_pattern_skips_pages_before_first_start():
+    """End patterns of range sections aren't evaluated before the first start page."""
+    print("=== Testing Range Pattern End Search ===")
+    pdf_path = _create_invoice_pdf()
+
+    try:
+        patterns._clear_extraction_cache()
+        pages = patterns.parse_range_pattern("contains:'Invoice 15' to contains:Summary",
+                                                pdf_path, TOTAL_PAGES)
+        assert pages == [15, 16]
+
+    finally:
+        patterns._clear_extraction_cache()
+
+    print("✓ Range sections are found with a bounded end search")
+    return True
+
+
+def main():
+    """Run all lazy page text tests."""
+    print("LAZY PAGE TEXT TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_provider_extracts_only_requested_pages,
+        test_numeric_terms_in_boolean_expressions,
+        test_candidate_restriction_limits_extraction,
+        test_restricted_matches_full_evaluation,
+        test_range_pattern_skips_pages_before_first_start,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"LAZY PAGE TEXT TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
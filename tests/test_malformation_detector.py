@@ -0,0 +1,202 @@
+"""
+Test Malformation Detection
+Run: python tests/test_malformation_detector.py
+
+Tests page sampling strategies, that detection opens each PDF once, that
+stratified sampling catches resource duplication on a late page, that
+verdicts are stored by content hash (a renamed copy isn't re-analyzed, other
+sampling settings are), and that pooled detection matches serial detection.
+"""
+
+import sys
+import shutil
+
+from pathlib import Path
+from unittest import mock
+
+from pypdf import PdfWriter
+from pypdf.generic import DictionaryObject, NameObject, NumberObject, StreamObject
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core import ghostscript, malformation_detector, malformation_utils
+from pdf_manipulator.core.cache.analysis_store import configure_analysis_store
+from pdf_manipulator.core.malformation_detector import (
+    configure_malformation_detection,
+    detect_malformation,
+    sample_page_indices,
+)
+from pdf_manipulator.core.malformation_utils import check_pdf_malformations
+
+from tests.test_pdf_utils import create_test_pdf, create_temp_dir
+
+
+def _make_duplicated_resources_pdf(pdf_path: Path, pages: int, bad_page: int) -> Path:
+    """PDF whose bad_page (1-based) references an image for every page of the document."""
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=200, height=200)
+
+    xobjects = DictionaryObject()
+    for index in range(pages):
+        image = StreamObject()
+        image.update({
+            NameObject('/Type'): NameObject('/XObject'),
+            NameObject('/Subtype'): NameObject('/Image'),
+            NameObject('/Width'): NumberObject(1),
+            NameObject('/Height'): NumberObject(1),
+            NameObject('/ColorSpace'): NameObject('/DeviceGray'),
+            NameObject('/BitsPerComponent'): NumberObject(8),
+        })
+        image.set_data(b'\x00')
+        xobjects[NameObject(f'/Im{index}')] = writer._add_object(image)
+
+    page = writer.pages[bad_page - 1]
+    page[NameObject('/Resources')] = DictionaryObject({NameObject('/XObject'): xobjects})
+
+    with open(pdf_path, 'wb') as f:
+        writer.write(f)
+    return pdf_path
+
+
+def test_sampling_strategies():
+    """Each strategy picks the expected pages; short documents are fully checked."""
+    print("=== Testing Sampling Strategies ===")
+    assert sample_page_indices(10, 3, 'first') == [0, 1, 2]
+    assert sample_page_indices(10, 3, 'last') == [7, 8, 9]
+    assert sample_page_indices(10, 3, 'stratified') == [0, 4, 9]
+    assert sample_page_indices(2, 3, 'stratified') == [0, 1]
+    assert sample_page_indices(1, 3, 'last') == [0]
+
+    picked = sample_page_indices(100, 5, 'random', seed='doc')
+    assert picked == sample_page_indices(100, 5, 'random', seed='doc'), "Random sampling must be reproducible"
+    assert len(set(picked)) == 5 and picked == sorted(picked)
+    print("✓ Sampling strategies pick the expected pages")
+    return True
+
+
+def test_single_open():
+    """Structural and resource checks share one PdfReader."""
+    print("=== Testing Single Open ===")
+    folder = create_temp_dir()
+    pdf_path = create_test_pdf(str(folder / "clean.pdf"), {1: "One", 2: "Two", 3: "Three"})
+
+    opened = []
+    original_reader = malformation_detector.PdfReader
+
+    def counting_reader(*args, **kwargs):
+        opened.append(args[0])
+        return original_reader(*args, **kwargs)
+
+    with mock.patch.object(malformation_detector, 'PdfReader', counting_reader):
+        assert detect_malformation(pdf_path) == (False, "No issues detected")
+
+    assert len(opened) == 1, opened
+    print("✓ PDF opened once")
+    return True
+
+
+def test_late_page_duplication():
+    """Stratified sampling catches resource duplication that first-page sampling misses."""
+    print("=== Testing Late Page Detection ===")
+    folder = create_temp_dir()
+    pdf_path = _make_duplicated_resources_pdf(folder / "late.pdf", pages=12, bad_page=12)
+
+    assert detect_malformation(pdf_path, sampling='first') == (False, "No issues detected")
+    is_malformed, description = detect_malformation(pdf_path, sampling='stratified')
+    assert is_malformed and description == "Resource duplication: 12 images per page", description
+    assert detect_malformation(pdf_path, sampling='last', sample_size=1)[0]
+    print("✓ Late page duplication detected")
+    return True
+
+
+def test_verdicts_stored_by_content_hash():
+    """A copy of an analyzed PDF reuses its verdict; other sampling settings don't."""
+    print("=== Testing Stored Verdicts ===")
+    folder = create_temp_dir()
+    pdf_path = _make_duplicated_resources_pdf(folder / "stored.pdf", pages=6, bad_page=6)
+    copy_path = folder / "renamed copy.pdf"
+    shutil.copyfile(pdf_path, copy_path)
+
+    checks = []
+    original = ghostscript.detect_malformed_pdf
+
+    def counting(path):
+        checks.append(path.name)
+        return original(path)
+
+    configure_analysis_store(cache_dir=create_temp_dir())
+    try:
+        with mock.patch.object(ghostscript, 'detect_malformed_pdf', counting):
+            first = check_pdf_malformations([pdf_path], jobs=1)
+            assert check_pdf_malformations([copy_path], jobs=1)[copy_path] == first[pdf_path]
+            assert checks == ["stored.pdf"], checks
+
+            configure_malformation_detection(sampling='first')
+            assert check_pdf_malformations([copy_path], jobs=1)[copy_path][0] is False
+            assert checks == ["stored.pdf", "renamed copy.pdf"], checks
+    finally:
+        configure_malformation_detection()
+        configure_analysis_store(enabled=False)
+
+    assert first[pdf_path][0] is True
+    print("✓ Verdicts reused by content hash")
+    return True
+
+
+def test_pooled_detection_matches_serial():
+    """Detection on a process pool returns the same verdicts as serial detection."""
+    print("=== Testing Pooled Detection ===")
+    folder = create_temp_dir()
+    pdf_paths = [create_test_pdf(str(folder / f"doc{i}.pdf"), {1: f"Doc {i}", 2: "More"}) for i in range(20)]
+    pdf_paths.append(_make_duplicated_resources_pdf(folder / "bad.pdf", pages=4, bad_page=4))
+    (folder / "garbage.pdf").write_bytes(b"not a pdf")
+    pdf_paths.append(folder / "garbage.pdf")
+
+    with mock.patch.object(malformation_utils, 'DETECT_CHUNK_SIZE', 4):
+        serial = check_pdf_malformations(pdf_paths, jobs=1)
+        pooled = check_pdf_malformations(pdf_paths, jobs=3)
+
+    assert pooled == serial
+    assert serial[folder / "bad.pdf"][0] is True
+    assert serial[folder / "garbage.pdf"][0] is True, "Unreadable files are reported as malformed"
+    assert sum(1 for is_malformed, _ in serial.values() if is_malformed) == 2
+    print("✓ Pooled detection matches serial detection")
+    return True
+
+
+def main():
+    """Run all malformation detection tests."""
+    print("MALFORMATION DETECTION TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_sampling_strategies,
+        test_single_open,
+        test_late_page_duplication,
+        test_verdicts_stored_by_content_hash,
+        test_pooled_detection_matches_serial,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"MALFORMATION DETECTION TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
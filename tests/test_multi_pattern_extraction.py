@@ -0,0 +1,176 @@
+"""
+Test Multi-Pattern Extraction
+Run: python tests/test_multi_pattern_extraction.py
+
+Tests that extracting several patterns from a document extracts each page
+once, gives the same results as extracting the patterns one at a time, and
+that the renamer's pattern processor uses the single-pass path.
+"""
+
+import sys
+import atexit
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core.document_session import close_document_sessions
+from pdf_manipulator.renamer.filename_generator import FilenameGenerator
+from pdf_manipulator.renamer.pattern_processor import PatternProcessor
+from pdf_manipulator.scraper.extractors.pattern_extractor import PatternExtractor
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs
+
+
+atexit.register(cleanup_test_pdfs)
+
+CONTENT = {
+    page: f"Invoice Number: INV-{page:03d}\nCompany: Acme Corp {page}\nTotal: ${page}00.00\nDate: 2024-0{page}-15"
+    for page in range(1, 6)
+}
+CONTENT[3] = ""
+
+
+def _pattern(keyword: str, movements: list, extract_type: str = 'wd', extract_count: int = 1,
+                match_spec: dict = None) -> dict:
+    pattern = {'keyword': keyword, 'movements': movements, 'extract_type': extract_type,
+                'extract_count': extract_count, 'flexible': False}
+    if match_spec:
+        pattern['match_spec'] = match_spec
+    return pattern
+
+
+def _counting_page_text(extractor: PatternExtractor):
+    """Patch an extractor to record which pages it extracts text from."""
+    pages = []
+    original = extractor._extract_page_text
+
+    def counting(pdf_path, page_num):
+        pages.append(page_num)
+        return original(pdf_path, page_num)
+
+    extractor._extract_page_text = counting
+    return pages
+
+
+def test_pages_extracted_once():
+    """Six patterns over every page extract each page once."""
+    print("=== Testing One Extraction Per Page ===")
+    pdf_path = create_test_pdf('test_multi_pattern.pdf', CONTENT)
+    close_document_sessions()
+
+    all_pages = {'type': 'all'}
+    requests = [
+        (_pattern('Invoice Number', [('r', 1)]), all_pages),
+        (_pattern('Company', [('r', 1)], extract_count=2), all_pages),
+        (_pattern('Total', [('r', 1)], extract_type='nb'), all_pages),
+        (_pattern('Date', [('r', 1)]), all_pages),
+        (_pattern('Invoice Number', [('r', 1)], match_spec={'type': 'all'}), all_pages),
+        (_pattern('Missing', [('r', 1)]), {'type': 'range', 'start': 2, 'end': 4}),
+    ]
+
+    extractor = PatternExtractor()
+    pages = _counting_page_text(extractor)
+    results = extractor.extract_patterns_enhanced(pdf_path, requests)
+
+    assert sorted(pages) == [1, 2, 3, 4, 5], f"Pages extracted {pages}"
+    assert results[0]['selected_match'] == 'INV-001'
+    assert results[1]['selected_match'] == 'Acme Corp'
+    assert results[4]['selected_match'] == ['INV-001', 'INV-002', 'INV-004', 'INV-005']
+    assert results[5]['selected_match'] == "No_Match"
+    print("✓ Each page extracted once for six patterns")
+    return True
+
+
+def test_matches_single_pattern_results():
+    """Batched results equal the one-at-a-time results."""
+    print("=== Testing Batched Results ===")
+    pdf_path = create_test_pdf('test_multi_pattern_same.pdf', CONTENT)
+
+    requests = [
+        (_pattern('Invoice Number', [('r', 1)], match_spec={'type': 'range', 'start': 2, 'end': 3}),
+            {'type': 'all'}),
+        (_pattern('Company', [('r', 1)], extract_count=0), {'type': 'range', 'start': 2, 'end': 5}),
+        (_pattern('Total', [('r', 1)], extract_type='nb'), None),
+        (_pattern('Invoice Number', [('d', 1)], extract_type='ln'), {'type': 'single', 'value': 4}),
+    ]
+
+    extractor = PatternExtractor()
+    batched = extractor.extract_patterns_enhanced(pdf_path, requests)
+    single = [extractor.extract_pattern_enhanced(pdf_path, pattern, page_spec)
+                for pattern, page_spec in requests]
+
+    for batched_result, single_result in zip(batched, single):
+        assert batched_result == single_result, f"{batched_result} != {single_result}"
+    print("✓ Batched and single results match")
+    return True
+
+
+def test_renamer_patterns_single_pass():
+    """The renamer extracts all of its patterns with one pass."""
+    print("=== Testing Renamer Extraction ===")
+    pdf_path = create_test_pdf('test_multi_pattern_renamer.pdf', CONTENT)
+
+    generator = FilenameGenerator()
+    pages = _counting_page_text(generator.pattern_processor.extractor)
+    parsed_patterns = generator.pattern_processor.validate_pattern_list(
+        ["invoice=Invoice Number:r1wd1^ch4", "company=Company:r1wd2_", "total=Total:r1nb1pg2"])
+    variables = generator._extract_all_patterns(pdf_path, parsed_patterns, source_page=1, dry_run=False)
+
+    assert variables['invoice']['selected_match'] == '001'
+    assert variables['company']['selected_match'] == 'AcmeCorp'
+    assert variables['total']['success'] and variables['total']['debug_info']['selected_from_page'] == 2
+    assert variables['invoice']['variable_name'] == 'invoice'
+    assert sorted(pages) == [1, 2], f"Pages extracted {pages}"
+    print("✓ Renamer patterns extracted in one pass")
+    return True
+
+
+def test_process_pdf_with_patterns():
+    """The pattern processor extracts a list of pattern strings."""
+    print("=== Testing Pattern Processor ===")
+    pdf_path = create_test_pdf('test_multi_pattern_processor.pdf', CONTENT)
+
+    results = PatternProcessor().process_pdf_with_patterns(
+        pdf_path, ["Invoice Number:r1wd1pg2", "date=Date:r1wd1pg0mt0"])
+
+    assert results['invoice_number']['selected_match'] == 'INV-002'
+    assert results['date']['selected_match'] == ['2024-01-15', '2024-02-15', '2024-04-15', '2024-05-15']
+    print("✓ Pattern strings extracted")
+    return True
+
+
+def main():
+    """Run all multi-pattern extraction tests."""
+    print("MULTI-PATTERN EXTRACTION TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_pages_extracted_once,
+        test_matches_single_pattern_results,
+        test_renamer_patterns_single_pass,
+        test_process_pdf_with_patterns,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"MULTI-PATTERN EXTRACTION TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
@@ -10,19 +10,25 @@ Run: python tests/test_operation_context.py
 """
 
 import sys
+import tempfile
 from pathlib import Path
+from unittest import mock
 
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import argparse
-from datetime import datetime
 from rich.console import Console
 
+from pdf_manipulator.core import operation_context
 from pdf_manipulator.core.operation_context import (
-    OperationContext, OpCtx, ParsedResults,
+    OperationContext, OpCtx,
     get_cached_parsing_results, store_parsing_results, get_parsed_pages
 )
+from pdf_manipulator.core.cache import parse_store
+from pdf_manipulator.core.cache.parse_store import ParseResultStore, configure_parse_store
+from pdf_manipulator.core.page_range import page_text
+from pdf_manipulator.core.page_range.page_group import PageGroup
 
 
 console = Console()
@@ -405,6 +411,132 @@ def test_reset_functionality():
         return False
 
 
+def test_keyed_parse_cache():
+    """Test that cached results are keyed by document and arguments, bounded and counted."""
+    console.print("[cyan]Testing keyed parse cache...[/cyan]")
+    
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            first = Path(folder) / "first.pdf"
+            second = Path(folder) / "second.pdf"
+            first.write_bytes(b"%PDF-1.4 first")
+            second.write_bytes(b"%PDF-1.4 second")
+            
+            OperationContext.reset()
+            args = create_mock_args(extract_pages="1-3")
+            OperationContext.set_args(args)
+            
+            # Multi-file batch: each PDF keeps its own results
+            OperationContext.set_current_pdf(first, 10)
+            store_parsing_results({1, 2, 3}, "pages1-3", [PageGroup([1, 2, 3], True, "1-3")])
+            OperationContext.set_current_pdf(second, 10)
+            if OperationContext.has_parsed_results():
+                console.print("  [red]✗ Results of first.pdf served for second.pdf[/red]")
+                return False
+            store_parsing_results({2}, "page2", [PageGroup([2], False, "2")])
+            OperationContext.set_current_pdf(first, 10)
+            cached = get_cached_parsing_results()
+            if not cached or cached.selected_pages != {1, 2, 3}:
+                console.print(f"  [red]✗ Switching back to first.pdf didn't hit: {cached}[/red]")
+                return False
+            console.print("  ✓ Results keyed per document in a batch")
+            
+            # Other arguments or an edited file miss
+            args.filter_matches = "contains:'X'"
+            missed_filter = get_cached_parsing_results() is None
+            args.filter_matches = None
+            first.write_bytes(b"%PDF-1.4 first, edited")
+            missed_edit = get_cached_parsing_results() is None
+            stats = OperationContext.parse_cache_stats()
+            if not (missed_filter and missed_edit and stats['hits'] == 1 and stats['misses'] == 2):
+                console.print(f"  [red]✗ Stale results served or wrong counters: {stats}[/red]")
+                return False
+            console.print("  ✓ Changed arguments and edited files miss")
+            
+            # Bounded LRU
+            with mock.patch.object(operation_context, 'PARSE_CACHE_SIZE', 2):
+                for expression in ("1", "2", "3"):
+                    args.extract_pages = expression
+                    store_parsing_results({1}, expression, [])
+                args.extract_pages = "3"
+                kept = OperationContext.has_parsed_results()
+                args.extract_pages = "1"
+                evicted = not OperationContext.has_parsed_results()
+            if not (kept and evicted and len(OperationContext.parse_cache) == 2):
+                console.print("  [red]✗ LRU eviction failed[/red]")
+                return False
+            console.print("  ✓ Least recently used results evicted")
+            
+            # Another text extractor (e.g. an upgraded pdfplumber) misses
+            args.extract_pages = "3"
+            with mock.patch.object(page_text, 'text_pipeline_id', lambda: "pdfplumber-99.0/r1+pypdf-99.0/r1"):
+                missed_extractor = not OperationContext.has_parsed_results()
+            if not (missed_extractor and OperationContext.has_parsed_results()):
+                console.print("  [red]✗ Results served for another text extractor[/red]")
+                return False
+            console.print("  ✓ Results keyed by text extractor")
+            
+            # Persistent layer survives a reset (a new run); dup: results are never stored
+            configure_parse_store(cache_dir=Path(folder) / "cache")
+            try:
+                args.extract_pages = "contains:'Total'"
+                store_parsing_results({4}, "total", [PageGroup([4], False, "contains:'Total'")])
+                args.extract_pages = "all & !dup:seen"
+                store_parsing_results({5}, "unseen", [])
+                
+                OperationContext.reset()
+                OperationContext.set_args(args)
+                OperationContext.set_current_pdf(first, 10)
+                not_stored = get_cached_parsing_results() is None
+                args.extract_pages = "contains:'Total'"
+                cached = get_cached_parsing_results()
+            finally:
+                configure_parse_store(enabled=False)
+            if not (not_stored and cached and cached.selected_pages == {4}
+                    and cached.page_groups[0].original_spec == "contains:'Total'"
+                    and OperationContext.parse_cache_stats()['persistent_hits'] == 1):
+                console.print(f"  [red]✗ Persistent layer failed: {cached}[/red]")
+                return False
+            console.print("  [green]✓ Persistent results served after a reset[/green]")
+            
+        OperationContext.reset()
+        return True
+        
+    except Exception as e:
+        console.print(f"  [red]✗ Error testing keyed parse cache: {e}[/red]")
+        return False
+
+
+def test_parse_store_eviction():
+    """Test that the persistent parse store drops its least recently used results."""
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            store = ParseResultStore(Path(folder), max_entries=3)
+            clock = iter(range(1, 100))
+            try:
+                with mock.patch.object(parse_store, 'time', mock.Mock(time=lambda: next(clock))):
+                    for key in ("a", "b", "c"):
+                        store.put(key, {'pages': [1], 'description': key, 'groups': []})
+                    store.get("a")                  # "b" is now the least recently used
+                    store.put("d", {'pages': [2], 'description': "d", 'groups': []})
+                
+                kept = {key for key in "abcd" if store.get(key) is not None}
+                stats = store.stats()
+            finally:
+                store.close()
+            
+            if kept != {"a", "c", "d"} or stats['entries'] != 3 or stats['max_entries'] != 3:
+                console.print(f"  [red]✗ Wrong results kept: {kept}, {stats}[/red]")
+                return False
+            console.print("  [green]✓ Least recently used result evicted at the limit[/green]")
+        
+        return True
+        
+    except Exception as e:
+        console.print(f"  [red]✗ Error testing parse store eviction: {e}[/red]")
+        return False
+
+
 def run_all_tests():
     """Run all OperationContext tests."""
     console.print("\n[bold blue]🧪 OperationContext Class-Based Tests[/bold blue]\n")
@@ -419,6 +551,8 @@ def run_all_tests():
         ("OpCtx Alias", test_opctx_alias),
         ("Batch Mode Conversion", test_batch_mode_conflict_conversion),
         ("Reset Functionality", test_reset_functionality),
+        ("Keyed Parse Cache", test_keyed_parse_cache),
+        ("Parse Store Eviction", test_parse_store_eviction),
     ]
     
     results = []
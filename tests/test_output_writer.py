@@ -0,0 +1,227 @@
+"""
+Test One-Pass Multi-Output Writer
+Run: python tests/test_output_writer.py
+
+Tests that outputs written by MultiOutputWriter are byte-identical to one
+PdfWriter per output, that shared objects are serialized once and reused
+while unique ones are never kept, that outputs are unchanged without the
+pypdf internals memoization uses, that sizes match the written files, that
+results keep plan order under a tiny in-flight budget, and that
+--split-pages reports the same files.
+"""
+
+import io
+import sys
+
+from pathlib import Path
+from unittest import mock
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DictionaryObject, NameObject, NumberObject, StreamObject
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core import output_writer
+from pdf_manipulator.core.operations import split_to_pages
+from pdf_manipulator.core.output_writer import MultiOutputWriter, PlannedOutput
+
+from tests.test_pdf_utils import create_test_pdf, create_temp_dir
+
+
+def _make_shared_image_pdf(pdf_path: Path, pages: int) -> Path:
+    """PDF whose pages all use one 64x64 image."""
+    writer = PdfWriter()
+    image = StreamObject()
+    image.update({
+        NameObject('/Type'): NameObject('/XObject'),
+        NameObject('/Subtype'): NameObject('/Image'),
+        NameObject('/Width'): NumberObject(64),
+        NameObject('/Height'): NumberObject(64),
+        NameObject('/ColorSpace'): NameObject('/DeviceGray'),
+        NameObject('/BitsPerComponent'): NumberObject(8),
+    })
+    image.set_data(bytes(range(256)) * 16)
+    image_ref = writer._add_object(image)
+
+    for _ in range(pages):
+        page = writer.add_blank_page(width=200, height=200)
+        page[NameObject('/Resources')] = DictionaryObject({
+            NameObject('/XObject'): DictionaryObject({NameObject('/Im0'): image_ref})
+        })
+
+    with open(pdf_path, 'wb') as f:
+        writer.write(f)
+    return pdf_path
+
+
+def _sequential_bytes(reader: PdfReader, page_numbers: list[int]) -> bytes:
+    """What writing one output with its own PdfWriter produces."""
+    writer = PdfWriter()
+    for page_num in page_numbers:
+        writer.add_page(reader.pages[page_num - 1])
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_outputs_match_sequential_writes():
+    """Every output is byte-identical to writing it with its own PdfWriter."""
+    print("=== Testing Identical Outputs ===")
+    folder = create_temp_dir()
+    pdf_path = create_test_pdf(str(folder / "source.pdf"), {i: f"Statement page {i}" for i in range(1, 7)})
+    reader = PdfReader(pdf_path)
+
+    planned = [PlannedOutput(folder / f"out{i}.pdf", pages)
+               for i, pages in enumerate([[1], [2, 3], [6, 4], [5], [], [1, 1]])]
+    results = list(MultiOutputWriter(reader, threads=3).write_all(planned))
+
+    assert [output for output, _ in results] == planned
+    for output, size_mb in results:
+        data = output.output_path.read_bytes()
+        assert data == _sequential_bytes(PdfReader(pdf_path), output.page_numbers), output.output_path.name
+        assert size_mb == output.output_path.stat().st_size / 1024 / 1024
+    print("✓ Outputs identical to sequential writes, sizes match")
+    return True
+
+
+def test_shared_objects_serialized_once():
+    """A shared image is serialized for the first output and reused after."""
+    print("=== Testing Memoized Objects ===")
+    folder = create_temp_dir()
+    pdf_path = _make_shared_image_pdf(folder / "shared.pdf", pages=5)
+    reader = PdfReader(pdf_path)
+    engine = MultiOutputWriter(reader)
+    planned = [PlannedOutput(None, [page_num]) for page_num in range(1, 6)]
+    engine.plan(planned)
+
+    writes = []
+    original = StreamObject.write_to_stream
+
+    def counting(self, stream, *args, **kwargs):
+        if self.get('/Subtype') == '/Image':
+            writes.append(1)
+        return original(self, stream, *args, **kwargs)
+
+    with mock.patch.object(StreamObject, 'write_to_stream', counting):
+        outputs = [engine.serialize(output) for output in planned]
+
+    assert len(writes) == 1, f"Image serialized {len(writes)} times"
+    assert engine.memo_hits >= 4
+    assert engine._memo == {}, "Shared objects must be dropped after their last output"
+    assert outputs == [_sequential_bytes(PdfReader(pdf_path), [page_num]) for page_num in range(1, 6)]
+    print("✓ Shared image serialized once")
+    return True
+
+
+def test_unique_pages_not_memoized():
+    """Splitting pages that share nothing keeps no serialized objects in memory."""
+    print("=== Testing Unique Pages ===")
+    folder = create_temp_dir()
+    writer = PdfWriter()
+    for page_num in range(1, 41):
+        page = writer.add_blank_page(width=200, height=200)
+        content = StreamObject()
+        content.set_data(f"BT /F1 12 Tf 10 10 Td (Page {page_num}) Tj ET ".encode() * 200)
+        page[NameObject('/Contents')] = writer._add_object(content)
+    pdf_path = folder / "unique.pdf"
+    with open(pdf_path, 'wb') as f:
+        writer.write(f)
+
+    engine = MultiOutputWriter(PdfReader(pdf_path))
+    planned = [PlannedOutput(folder / f"u{page_num}.pdf", [page_num]) for page_num in range(1, 41)]
+    results = list(engine.write_all(planned))
+
+    assert len(results) == 40
+    assert engine.memo_peak_bytes == 0, f"{engine.memo_peak_bytes} bytes memoized for unique pages"
+    assert engine.memo_hits == 0 and engine._memo == {}
+    print("✓ Nothing memoized when no object is shared")
+    return True
+
+
+def test_plain_writer_fallback():
+    """Without the pypdf internals, outputs are written with a plain PdfWriter."""
+    print("=== Testing Plain Writer Fallback ===")
+    assert output_writer.MEMOIZATION_AVAILABLE, "Installed pypdf should support memoization"
+
+    folder = create_temp_dir()
+    pdf_path = _make_shared_image_pdf(folder / "fallback.pdf", pages=3)
+    engine = MultiOutputWriter(PdfReader(pdf_path))
+    with mock.patch.object(output_writer, 'MEMOIZATION_AVAILABLE', False):
+        outputs = [engine.serialize(PlannedOutput(None, [page_num])) for page_num in range(1, 4)]
+
+    assert engine.memo_hits == 0
+    assert outputs == [_sequential_bytes(PdfReader(pdf_path), [page_num]) for page_num in range(1, 4)]
+    print("✓ Same outputs without memoization")
+    return True
+
+
+def test_bounded_in_flight_keeps_order():
+    """With a budget smaller than one file, writes still finish in plan order."""
+    print("=== Testing In-Flight Budget ===")
+    folder = create_temp_dir()
+    pdf_path = _make_shared_image_pdf(folder / "budget.pdf", pages=8)
+    reader = PdfReader(pdf_path)
+
+    planned = [PlannedOutput(folder / f"p{page_num}.pdf", [page_num]) for page_num in range(1, 9)]
+    with mock.patch.object(output_writer, '_write_file', wraps=output_writer._write_file) as write_file:
+        results = list(MultiOutputWriter(reader, threads=4, max_in_flight_mb=0.001).write_all(planned))
+
+    assert [output.output_path for output, _ in results] == [output.output_path for output in planned]
+    assert write_file.call_count == 8
+    assert all(output.output_path.exists() for output in planned)
+    print("✓ Results in plan order under a tiny budget")
+    return True
+
+
+def test_split_to_pages():
+    """--split-pages writes one file per page and reports its size."""
+    print("=== Testing Split To Pages ===")
+    folder = create_temp_dir()
+    pdf_path = create_test_pdf(str(folder / "run.pdf"), {1: "One", 2: "Two", 3: "Three"})
+
+    output_files = split_to_pages(pdf_path)
+
+    assert [path.name for path, _ in output_files] == ["run_page01.pdf", "run_page02.pdf", "run_page03.pdf"]
+    for page_num, (path, size_mb) in enumerate(output_files, start=1):
+        assert size_mb == path.stat().st_size / 1024 / 1024
+        assert PdfReader(path).pages[0].extract_text().strip() == ["One", "Two", "Three"][page_num - 1]
+    print("✓ Split files written with their sizes")
+    return True
+
+
+def main():
+    """Run all multi-output writer tests."""
+    print("MULTI-OUTPUT WRITER TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_outputs_match_sequential_writes,
+        test_shared_objects_serialized_once,
+        test_unique_pages_not_memoized,
+        test_plain_writer_fallback,
+        test_bounded_in_flight_keeps_order,
+        test_split_to_pages,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"MULTI-OUTPUT WRITER TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
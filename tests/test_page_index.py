@@ -0,0 +1,270 @@
+"""
+Test Cross-Document Page Fingerprints
+Run: python tests/test_page_index.py
+
+Tests that page fingerprints ignore object numbering and whitespace, that
+dup:seen drops pages already indexed from earlier documents (also on a
+re-run and inside boolean expressions), that dup:doc finds repeats within a
+document, and that a batch extracts byte-identical inputs once and clones
+the outputs.
+"""
+
+import sys
+import argparse
+import multiprocessing
+
+from pathlib import Path
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+
+from pypdf import PdfReader, PdfWriter
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core import page_fingerprint
+from pdf_manipulator.core.batch_pool import _init_worker
+from pdf_manipulator.core.cache.page_index import configure_page_index
+from pdf_manipulator.core.operation_context import OpCtx
+from pdf_manipulator.core.folder_operations import process_batch_extract
+from pdf_manipulator.core.page_fingerprint import (
+    PageFingerprinter,
+    duplicate_pages,
+    normalize_content,
+    register_documents,
+    run_index_documents,
+)
+from pdf_manipulator.core.page_range.page_range_parser import PageRangeParser
+
+from tests.test_pdf_utils import create_test_pdf, create_temp_dir
+
+
+def _fresh_index() -> Path:
+    """Point the page index at an empty directory and forget this run's documents."""
+    cache_dir = create_temp_dir()
+    configure_page_index(cache_dir=cache_dir)
+    page_fingerprint._run_index = page_fingerprint._RunIndex()
+    return cache_dir
+
+
+def _select(expression: str, pdf_path: Path, total_pages: int) -> list[int]:
+    parser = PageRangeParser(total_pages, pdf_path=pdf_path)
+    pages, _, _ = parser.parse(expression)
+    return sorted(pages)
+
+
+def _run_batch(folder: Path, pdf_files: list, conflicts: str = 'rename') -> str:
+    """Run a batch extraction of page 2 and return its console output."""
+    args = argparse.Namespace(
+        path=folder, extract_pages="2", batch=True, jobs=1, dry_run=False,
+        respect_groups=False, separate_files=False, replace=False, conflicts=conflicts,
+        dedup=None, filter_matches=None, group_start=None, group_end=None,
+        scrape_pattern=None, scrape_patterns_file=None, filename_template=None,
+        pattern_source_page=1, name_prefix=None, no_timestamp=False, smart_names=False,
+        preview=False,
+    )
+    OpCtx.reset()
+    OpCtx.set_args(args)
+    buffer = StringIO()
+    with redirect_stdout(buffer):
+        process_batch_extract(args, pdf_files, None, None, 1, False)
+    OpCtx.reset()
+    return buffer.getvalue()
+
+
+def test_fingerprint_ignores_numbering():
+    """The same page written into another file with other object numbers keeps its fingerprint."""
+    print("=== Testing Numbering Independence ===")
+    folder = create_temp_dir()
+    pdf_path = create_test_pdf(str(folder / "source.pdf"), {1: "Cover page", 2: "Statement"})
+
+    writer = PdfWriter()
+    writer.add_blank_page(width=100, height=100)
+    writer.add_page(PdfReader(pdf_path).pages[1])
+    writer.add_page(PdfReader(pdf_path).pages[0])
+    copy_path = folder / "reordered.pdf"
+    with open(copy_path, 'wb') as f:
+        writer.write(f)
+
+    original = PageFingerprinter(PdfReader(pdf_path))
+    copy = PageFingerprinter(PdfReader(copy_path))
+    assert original.fingerprint(1) == copy.fingerprint(3)
+    assert original.fingerprint(2) == copy.fingerprint(2)
+    assert original.fingerprint(1) != original.fingerprint(2)
+
+    assert normalize_content(b"BT\n  /F1 12 Tf\r\n(a  b) Tj ET \n") == b"BT /F1 12 Tf (a  b) Tj ET"
+    print("✓ Fingerprints match across files, strings keep their spaces")
+    return True
+
+
+def test_dup_seen():
+    """dup:seen selects pages indexed from earlier documents; verdicts survive a re-run."""
+    print("=== Testing dup:seen ===")
+    _fresh_index()
+    folder = create_temp_dir()
+    first = create_test_pdf(str(folder / "first.pdf"), {1: "Cover page", 2: "Statement A"})
+    second = create_test_pdf(str(folder / "second.pdf"), {1: "Cover page", 2: "Statement B", 3: "Terms"})
+    third = create_test_pdf(str(folder / "third.pdf"), {1: "Terms", 2: "Statement C"})
+
+    register_documents([first, second, third])
+    assert duplicate_pages(first, 'seen') == set()
+    assert duplicate_pages(second, 'seen') == {1}
+    assert duplicate_pages(third, 'seen') == {1}
+
+    # A new run with the persistent index still knows the order
+    page_fingerprint._run_index = page_fingerprint._RunIndex()
+    register_documents([third, second, first])
+    assert duplicate_pages(first, 'seen') == set()
+    assert duplicate_pages(third, 'seen') == {1}
+
+    assert _select("dup:seen", second, 3) == [1]
+    assert _select("all & !dup:seen", second, 3) == [2, 3]
+    configure_page_index(enabled=False)
+    print("✓ Pages from earlier documents selected, order kept across runs")
+    return True
+
+
+def test_dup_doc_and_run_index():
+    """dup:doc finds repeats inside a document; without the index dup:seen covers this run."""
+    print("=== Testing dup:doc ===")
+    configure_page_index(enabled=False)
+    page_fingerprint._run_index = page_fingerprint._RunIndex()
+    try:
+        folder = create_temp_dir()
+        first = create_test_pdf(str(folder / "a.pdf"), {1: "Cover", 2: "Body", 3: "Cover", 4: "Body"})
+        second = create_test_pdf(str(folder / "b.pdf"), {1: "Body", 2: "New"})
+
+        assert duplicate_pages(first, 'doc') == {3, 4}
+        register_documents([first, second])
+        assert duplicate_pages(second, 'seen') == {1}
+        assert duplicate_pages(second, 'any') == {1}
+        assert _select("dup:doc", first, 4) == [3, 4]
+
+        try:
+            duplicate_pages(first, 'everything')
+            assert False, "Unknown scope must be rejected"
+        except ValueError:
+            pass
+    finally:
+        configure_page_index(enabled=False)
+    print("✓ Repeats within a document found, run-only index works")
+    return True
+
+
+def test_run_index_reaches_spawned_workers():
+    """Without the persistent index, spawned batch workers get the parent's run index."""
+    print("=== Testing Run Index in Spawned Workers ===")
+    configure_page_index(enabled=False)
+    page_fingerprint._run_index = page_fingerprint._RunIndex()
+    try:
+        folder = create_temp_dir()
+        first = create_test_pdf(str(folder / "a.pdf"), {1: "Cover", 2: "Statement A"})
+        second = create_test_pdf(str(folder / "b.pdf"), {1: "Cover", 2: "Statement B"})
+        register_documents([first, second])
+
+        context = multiprocessing.get_context('spawn')
+        args = argparse.Namespace(extract_pages="dup:seen", batch=True, dry_run=False)
+        task_settings = {'run_fingerprints': run_index_documents(), 'dry_run': False}
+        with ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_init_worker,
+                                    initargs=(args, context.Lock(), None, False, task_settings)) as executor:
+            assert executor.submit(duplicate_pages, second, 'seen').result() == {1}
+
+        # A worker left to itself indexes only what it sees
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            assert executor.submit(duplicate_pages, second, 'seen').result() == set()
+    finally:
+        configure_page_index(enabled=False)
+    print("✓ Spawned workers see documents fingerprinted by the parent")
+    return True
+
+
+def test_batch_clones_identical_files():
+    """Byte-identical inputs are extracted once and get copies of the outputs."""
+    print("=== Testing Identical File Cloning ===")
+    folder = create_temp_dir()
+    original = create_test_pdf(str(folder / "statement.pdf"), {1: "Cover", 2: "Statement"})
+    copy = folder / "statement_copy.pdf"
+    copy.write_bytes(original.read_bytes())
+    other = create_test_pdf(str(folder / "other.pdf"), {1: "Other", 2: "Pages"})
+    pdf_files = [(path, 2, path.stat().st_size / 1024 / 1024) for path in (original, copy, other)]
+
+    output = _run_batch(folder, pdf_files)
+
+    outputs = sorted(path.name for path in folder.glob("*_extracted_*.pdf"))
+    assert len(outputs) == 3, outputs
+    original_output = next(folder.glob("statement_extracted_*.pdf"))
+    copy_output = next(folder.glob("statement_copy_extracted_*.pdf"))
+    assert copy_output.read_bytes() == original_output.read_bytes()
+    assert "Identical to statement.pdf" in output
+    assert "3 processed, 0 skipped, 0 failed" in output
+    print("✓ Copy got cloned outputs")
+    return True
+
+
+def test_batch_clones_into_copy_folder():
+    """A copy in another folder gets its outputs in its own folder, through conflict resolution."""
+    print("=== Testing Cloning Across Folders ===")
+    folder = create_temp_dir()
+    (folder / "sub1").mkdir()
+    (folder / "sub2").mkdir()
+    alpha = create_test_pdf(str(folder / "sub1" / "alpha.pdf"), {1: "Cover", 2: "Statement"})
+    beta = folder / "sub2" / "beta.pdf"
+    beta.write_bytes(alpha.read_bytes())
+    pdf_files = [(path, 2, path.stat().st_size / 1024 / 1024) for path in (alpha, beta)]
+
+    output = _run_batch(folder, pdf_files)
+    assert "Identical to alpha.pdf" in output
+    assert [path.name for path in (folder / "sub1").glob("*_extracted_*.pdf")] == \
+        [next((folder / "sub1").glob("alpha_extracted_*.pdf")).name]
+    beta_outputs = list((folder / "sub2").glob("beta_extracted_*.pdf"))
+    assert len(beta_outputs) == 1, beta_outputs
+
+    # A second run renames instead of overwriting, like a normal extraction
+    output = _run_batch(folder, pdf_files)
+    assert len(list((folder / "sub2").glob("beta_extracted_*.pdf"))) == 2
+    assert "Renaming to avoid conflict" in output or "Auto-renaming" in output
+
+    # 'skip' leaves the existing output alone
+    before = sorted(path.name for path in (folder / "sub2").iterdir())
+    _run_batch(folder, pdf_files, conflicts='skip')
+    assert sorted(path.name for path in (folder / "sub2").iterdir()) == before
+    print("✓ Clones written next to the copy, conflicts resolved")
+    return True
+
+
+def main():
+    """Run all page fingerprint index tests."""
+    print("PAGE INDEX TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_fingerprint_ignores_numbering,
+        test_dup_seen,
+        test_dup_doc_and_run_index,
+        test_run_index_reaches_spawned_workers,
+        test_batch_clones_identical_files,
+        test_batch_clones_into_copy_folder,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"PAGE INDEX TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
@@ -0,0 +1,197 @@
+"""
+Test PageSet Bitset
+Run: python tests/test_page_set.py
+
+Tests the bitmask-backed PageSet and its use in page groups, boundary
+detection and deduplication.
+"""
+
+import sys
+import random
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core.page_range.page_set import PageSet
+from pdf_manipulator.core.page_range.page_group import PageGroup, merge_groups_in_order
+from pdf_manipulator.core.page_range.boundary_detection import _split_group_at_boundaries
+from pdf_manipulator.core.deduplication import detect_duplicates, apply_deduplication_strategy
+from pdf_manipulator.core.page_range.page_range_parser import PageRangeParser
+
+
+def test_construction_and_iteration():
+    """PageSets iterate ascending and ignore duplicates and non-positive pages."""
+    print("=== Testing PageSet Construction ===")
+    assert PageSet([5, 1, 3, 3]).to_list() == [1, 3, 5]
+    assert list(PageSet(range(4, 8))) == [4, 5, 6, 7]
+    assert PageSet.from_range(3, 5) == PageSet([3, 4, 5])
+    assert PageSet.all_pages(3).to_list() == [1, 2, 3]
+    assert PageSet([0, -2, 2]).to_list() == [2]
+    assert not PageSet() and len(PageSet()) == 0
+    assert PageSet([1, 2]) == {1, 2} and PageSet([1, 2]) != {1, 3}
+    assert hash(PageSet([1, 2])) == hash(frozenset({1, 2}))
+    print("✓ Construction, iteration and equality work")
+    return True
+
+
+def test_set_operations():
+    """Union, intersection, difference and complement match Python sets."""
+    print("=== Testing PageSet Operations ===")
+    rng = random.Random(3)
+
+    for _ in range(50):
+        a = {rng.randint(1, 300) for _ in range(rng.randint(0, 60))}
+        b = {rng.randint(1, 300) for _ in range(rng.randint(0, 60))}
+        pa, pb = PageSet(a), PageSet(b)
+
+        assert (pa | pb) == a | b
+        assert (pa & pb) == a & b
+        assert (pa - pb) == a - b
+        assert (pa ^ pb) == a ^ b
+        assert pa.complement(300) == set(range(1, 301)) - a
+        assert pa.isdisjoint(pb) == a.isdisjoint(b)
+        assert pa.issubset(pa | pb) and (pa | pb).issuperset(pb)
+        assert len(pa) == len(a)
+        assert all((page in pa) == (page in a) for page in range(0, 305))
+
+    # Mixing with plain sets works from either side
+    assert ({1, 2, 3} & PageSet([2, 3, 4])) == {2, 3}
+    assert (PageSet([2, 3, 4]) - {3}) == {2, 4}
+    print("✓ Set operations match Python sets")
+    return True
+
+
+def test_runs_shift_and_bounds():
+    """Run-length output, shifting, clipping and first/last."""
+    print("=== Testing PageSet Runs and Shifts ===")
+    pages = PageSet([1, 2, 3, 7, 10, 11, 12])
+
+    assert pages.runs() == [(1, 3), (7, 7), (10, 12)]
+    assert pages.format_runs() == "1-3,7,10-12"
+    assert repr(pages) == "PageSet(1-3,7,10-12)"
+    assert pages.first() == 1 and pages.last() == 12
+    assert PageSet().first() is None and PageSet().last() is None
+
+    assert pages.shift(2).to_list() == [3, 4, 5, 9, 12, 13, 14]
+    assert pages.shift(-2).to_list() == [1, 5, 8, 9, 10]
+    assert pages.clip(10).to_list() == [1, 2, 3, 7, 10]
+
+    assert PageSet(range(5, 9)).is_consecutive()
+    assert not pages.is_consecutive() and not PageSet().is_consecutive()
+    print("✓ Runs, shifts and bounds are correct")
+    return True
+
+
+def test_large_documents():
+    """Operations stay exact on 20k-page selections."""
+    print("=== Testing PageSet on Large Documents ===")
+    total = 20_000
+    odd = PageSet(range(1, total + 1, 2))
+    first_half = PageSet.from_range(1, total // 2)
+
+    assert len(odd) == total // 2
+    assert len(odd & first_half) == total // 4
+    assert odd.complement(total) == PageSet(range(2, total + 1, 2))
+    assert len(first_half.runs()) == 1
+    print("✓ Large page sets work")
+    return True
+
+
+def test_page_group_integration():
+    """PageGroup exposes its pages as a PageSet; merging keeps returning a set."""
+    print("=== Testing PageGroup Integration ===")
+    group = PageGroup([5, 3, 4], True, "5-3")
+
+    assert group.page_set == PageSet([3, 4, 5])
+    assert group.pages == [5, 3, 4], "Group page order must not change"
+
+    all_pages, ordered = merge_groups_in_order([group, PageGroup([9], False, "9")], "merged")
+    assert all_pages == {3, 4, 5, 9} and isinstance(all_pages, set)
+    assert ordered[0] is group
+
+    split = _split_group_at_boundaries(PageGroup([1, 2, 3, 4, 5], True, "1-5"),
+                                        PageSet([3]), PageSet())
+    assert [g.pages for g in split] == [[1, 2], [3, 4, 5]]
+    assert [g.original_spec for g in split] == ["pages1-2", "pages3-5"]
+    print("✓ PageGroup, merging and boundary splitting work with PageSet")
+    return True
+
+
+def test_deduplication_with_page_sets():
+    """Duplicate detection and strict deduplication keep their behavior."""
+    print("=== Testing Deduplication ===")
+    clean = [PageGroup([1, 2], True, "1-2"), PageGroup([3], False, "3")]
+    info = detect_duplicates(clean)
+    assert not info['has_duplicates'] and info['duplicate_pages'] == []
+    assert info['page_to_groups'][3] == [(1, "3")]
+
+    overlapping = [PageGroup([1, 2, 3], True, "a"), PageGroup([3, 2, 4], False, "b"),
+                    PageGroup([4, 4, 5], False, "c")]
+    info = detect_duplicates(overlapping)
+    assert info['duplicate_pages'] == [2, 3, 4]
+
+    deduped, _ = apply_deduplication_strategy(overlapping, 'strict')
+    assert [g.pages for g in deduped] == [[1, 2, 3], [4], [5]]
+
+    # A page repeated inside one group also counts as a duplicate
+    assert detect_duplicates([PageGroup([7, 7], False, "7,7")])['duplicate_pages'] == [7]
+    print("✓ Deduplication results are unchanged")
+    return True
+
+
+def test_parser_selections():
+    """The parser combines PageSets internally and still returns plain sets and ordered groups."""
+    print("=== Testing Parser Selections ===")
+    parser = PageRangeParser(20)
+
+    pages, _, groups = parser.parse("10-8,last 2,odd,3")
+    assert type(pages) is set
+    assert pages == set(range(1, 20, 2)) | {8, 10, 19, 20}
+    assert [g.pages for g in groups][:2] == [[10, 9, 8], [19, 20]]
+
+    pages, description, _ = parser.parse("first 3")
+    assert type(pages) is set and pages == {1, 2, 3} and description == "First 3 pages"
+    assert parser.parse("all")[0] == set(range(1, 21))
+    assert parser.parse("::5")[0] == {1, 6, 11, 16}
+    print("✓ Comma-separated selections combined, results unchanged")
+    return True
+
+
+def main():
+    """Run all PageSet tests."""
+    print("PAGE SET TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_construction_and_iteration,
+        test_set_operations,
+        test_runs_shift_and_bounds,
+        test_large_documents,
+        test_page_group_integration,
+        test_deduplication_with_page_sets,
+        test_parser_selections,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"PAGE SET TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
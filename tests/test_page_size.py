@@ -0,0 +1,175 @@
+"""
+Test In-Memory Page Size Estimation
+Run: python tests/test_page_size.py
+
+Tests PageSizeEstimator against the size of a real single-page PDF, shared
+resource memoization, and that PageAnalyzer no longer touches temp files.
+"""
+
+import io
+import sys
+import atexit
+import random
+import tempfile
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image
+from pypdf import PdfReader, PdfWriter
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import ImageReader
+
+from pdf_manipulator.core import page_size
+from pdf_manipulator.core.page_size import PageSizeEstimator, exact_page_size
+from pdf_manipulator.core.page_analysis import PageAnalyzer
+
+from tests.test_pdf_utils import cleanup_test_pdfs
+
+
+atexit.register(cleanup_test_pdfs)
+
+
+def _create_scan_pdf() -> Path:
+    """Six pages sharing one noisy logo; even pages also carry their own image."""
+    rng = random.Random(5)
+
+    def noisy_image(size):
+        image = Image.new('RGB', (size, size))
+        image.putdata([(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+                        for _ in range(size * size)])
+        return image
+
+    logo = ImageReader(noisy_image(64))
+    pdf_path = Path('test_page_size.pdf')
+    c = canvas.Canvas(str(pdf_path), pagesize=letter)
+
+    for page in range(1, 7):
+        c.drawImage(logo, 50, 700, 64, 64)
+        c.drawString(100, 650, f"Scanned page {page}")
+        if page % 2 == 0:
+            c.drawImage(ImageReader(noisy_image(40 + page)), 50, 400, 100, 100)
+        c.showPage()
+
+    c.save()
+    return pdf_path
+
+
+def _written_size(reader: PdfReader, page_number: int) -> int:
+    """Size of the page written out the old way (PdfWriter to a real stream)."""
+    writer = PdfWriter()
+    writer.add_page(reader.pages[page_number - 1])
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return len(buffer.getvalue())
+
+
+def test_estimates_match_written_size():
+    """Estimates are within 2% of the written single-page PDF."""
+    print("=== Testing Estimate Accuracy ===")
+    reader = PdfReader(_create_scan_pdf())
+    estimator = PageSizeEstimator(reader)
+
+    for page_number in range(1, len(reader.pages) + 1):
+        expected = _written_size(reader, page_number)
+        estimate = estimator.estimate(page_number)
+        assert abs(estimate - expected) <= expected * 0.02, f"Page {page_number}: {estimate} vs {expected}"
+        assert exact_page_size(reader, page_number) == expected
+
+    # Pages with their own image are bigger than the ones sharing just the logo
+    assert estimator.estimate(2) > estimator.estimate(1)
+    print("✓ Estimates match written sizes; exact sizes are exact")
+    return True
+
+
+def test_shared_objects_serialized_once():
+    """Shared resources are serialized once per document, not once per page."""
+    print("=== Testing Per-Object Memoization ===")
+    reader = PdfReader(_create_scan_pdf())
+    estimator = PageSizeEstimator(reader)
+
+    calls = []
+    original = page_size.serialized_digest
+
+    def counting(obj):
+        calls.append(id(obj))
+        return original(obj)
+
+    page_size.serialized_digest = counting
+    try:
+        first_pass = [estimator.estimate(n) for n in range(1, 7)]
+        serialized = len(calls)
+        second_pass = [estimator.estimate(n) for n in range(1, 7)]
+        fingerprints = [estimator.fingerprint(n) for n in range(1, 7)]
+    finally:
+        page_size.serialized_digest = original
+
+    assert first_pass == second_pass
+    assert serialized > 0 and len(set(fingerprints)) == 6
+    assert len(calls) == serialized, "Second pass should be served from the memo"
+    assert len(calls) == len(set(calls)), "An object was serialized twice"
+    print("✓ Every object is serialized at most once")
+    return True
+
+
+def test_analyzer_uses_no_temp_files():
+    """PageAnalyzer sizes pages without creating temporary files."""
+    print("=== Testing PageAnalyzer Without Temp Files ===")
+    pdf_path = _create_scan_pdf()
+
+    original = tempfile.NamedTemporaryFile
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("Temp file created while sizing pages")
+
+    tempfile.NamedTemporaryFile = forbidden
+    try:
+        with PageAnalyzer(pdf_path) as analyzer:
+            estimated = [analysis.size_bytes for analysis in analyzer.analyze_all_pages()]
+        with PageAnalyzer(pdf_path, exact_sizes=True) as analyzer:
+            exact = [analysis.size_bytes for analysis in analyzer.analyze_all_pages()]
+    finally:
+        tempfile.NamedTemporaryFile = original
+
+    reader = PdfReader(pdf_path)
+    assert exact == [_written_size(reader, n) for n in range(1, 7)]
+    assert all(abs(e - x) <= x * 0.02 for e, x in zip(estimated, exact))
+    print("✓ Page sizes computed in memory")
+    return True
+
+
+def main():
+    """Run all page size tests."""
+    print("PAGE SIZE TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_estimates_match_written_size,
+        test_shared_objects_serialized_once,
+        test_analyzer_uses_no_temp_files,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"PAGE SIZE TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
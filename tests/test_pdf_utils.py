@@ -1,5 +1,7 @@
 """Utilities for creating test PDFs with known content."""
 
+import tempfile
+
 from pathlib import Path
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
@@ -35,3 +37,11 @@ def cleanup_test_pdfs():
     """Remove all test PDFs."""
     for pdf_file in Path('.').glob('test_*.pdf'):
         pdf_file.unlink(missing_ok=True)
+
+_temp_dirs = []
+
+def create_temp_dir() -> Path:
+    """Create a temporary directory that is removed when the test process exits."""
+    temp_dir = tempfile.TemporaryDirectory()
+    _temp_dirs.append(temp_dir)
+    return Path(temp_dir.name)
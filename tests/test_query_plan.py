@@ -0,0 +1,273 @@
+"""
+Test Boolean Expression Query Planning
+Run: python tests/test_query_plan.py
+
+Tests the AST compiler and planner behind UnifiedBooleanSupervisor:
+precedence, error handling, operand ordering, short-circuiting, per-term
+memoization and agreement with a naive set-based evaluation.
+"""
+
+import sys
+import atexit
+import random
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core.page_range import patterns
+from pdf_manipulator.core.page_range.boolean import UnifiedBooleanSupervisor
+from pdf_manipulator.core.page_range.page_text import get_page_text_provider
+from pdf_manipulator.core.page_range.query_plan import (
+    TermNode,
+    NotNode,
+    AndNode,
+    OrNode,
+    compile_tokens,
+    order_operands,
+)
+from pdf_manipulator.core.page_range.page_set import PageSet
+from pdf_manipulator.core.page_range.text_matcher import TextMatcher
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs
+
+
+atexit.register(cleanup_test_pdfs)
+
+TOTAL_PAGES = 12
+
+
+def _create_report_pdf() -> Path:
+    """Pages 1-12: every third page is a chapter, even pages mention totals."""
+    content = {}
+    for page in range(1, TOTAL_PAGES + 1):
+        lines = [f"Page {page}"]
+        if page % 3 == 1:
+            lines.append("Chapter start")
+        if page % 2 == 0:
+            lines.append("Total due")
+        content[page] = "\n".join(lines)
+    return create_test_pdf('test_query_plan.pdf', content)
+
+
+def _compile(expression: str):
+    supervisor = UnifiedBooleanSupervisor(Path("dummy.pdf"), TOTAL_PAGES)
+    return compile_tokens(supervisor._tokenize_expression(expression))
+
+
+def test_compiler_precedence():
+    """NOT binds tighter than AND, AND tighter than OR; nesting is flattened."""
+    print("=== Testing Compiler Precedence ===")
+    a, b, c = TermNode("contains:A"), TermNode("contains:B"), TermNode("contains:C")
+
+    assert _compile("contains:A | contains:B & contains:C") == OrNode((a, AndNode((b, c))))
+    assert _compile("!contains:A & contains:B") == AndNode((NotNode(a), b))
+    assert _compile("(contains:A | contains:B) & contains:C") == AndNode((OrNode((a, b)), c))
+    assert _compile("contains:A & (contains:B & contains:C)") == AndNode((a, b, c))
+    assert _compile("!(!contains:A)") == a
+    print("✓ Precedence and flattening are correct")
+    return True
+
+
+def test_compiler_errors():
+    """Malformed expressions raise ValueError."""
+    print("=== Testing Compiler Errors ===")
+    for expression in ["(contains:A & )", "( | contains:A)", "(contains:A", "contains:A)", "!"]:
+        try:
+            _compile(expression)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected ValueError for: {expression}")
+    print("✓ Malformed expressions are rejected")
+    return True
+
+
+def test_operand_ordering():
+    """Cheap operands run first; the most selective numeric term leads an AND."""
+    print("=== Testing Operand Ordering ===")
+    node = _compile("regex:'X' & contains:A & type:text & 1-10 & 2-3")
+    costs = {"regex:'X'": 6, "contains:A": 4, "type:text": 1, "1-10": 0, "2-3": 0}
+    known = {"1-10": PageSet(range(1, 11)), "2-3": PageSet([2, 3])}
+
+    ordered = [child.text for child in order_operands(node, costs, known)]
+    assert ordered == ["2-3", "1-10", "type:text", "contains:A", "regex:'X'"], ordered
+    print("✓ Operands are ordered by cost and selectivity")
+    return True
+
+
+def test_empty_intersection_short_circuits():
+    """An empty numeric intersection means content terms are never evaluated."""
+    print("=== Testing Empty Intersection Short-Circuit ===")
+    pdf_path = _create_report_pdf()
+
+    try:
+        patterns._clear_extraction_cache()
+        pages, _ = UnifiedBooleanSupervisor(pdf_path, TOTAL_PAGES).evaluate(
+            "contains:Chapter & 2 & 5")
+        assert pages == []
+        assert get_page_text_provider(pdf_path, TOTAL_PAGES).loaded_pages == set()
+
+    finally:
+        patterns._clear_extraction_cache()
+
+    print("✓ No text extracted for an empty intersection")
+    return True
+
+
+def test_malformed_terms_rejected_before_short_circuit():
+    """A malformed term is an error even when short-circuiting would skip it."""
+    print("=== Testing Malformed Terms Behind a Short-Circuit ===")
+    pdf_path = _create_report_pdf()
+
+    try:
+        for expression in ["2 & 5 & bogus:", "2 & 5 & size:huge", "(1-3 & !1-3) & dup:everywhere",
+                           "2 & 5 & contains:A to contains:B to contains:C", "2 & 5 & nonsense"]:
+            try:
+                UnifiedBooleanSupervisor(pdf_path, TOTAL_PAGES).evaluate(expression)
+            except ValueError:
+                continue
+            raise AssertionError(f"Expected ValueError for: {expression}")
+
+        # Well-formed terms behind the same short-circuit still evaluate to nothing
+        pages, _ = UnifiedBooleanSupervisor(pdf_path, TOTAL_PAGES).evaluate(
+            "2 & 5 & size:<1MB & dup:seen & unknown:x")
+        assert pages == []
+        assert get_page_text_provider(pdf_path, TOTAL_PAGES).loaded_pages == set()
+
+    finally:
+        patterns._clear_extraction_cache()
+
+    print("✓ Malformed terms are reported before evaluation")
+    return True
+
+
+def test_repeated_terms_examine_pages_once():
+    """A term used several times only examines each page once per evaluation."""
+    print("=== Testing Repeated Term Memoization ===")
+    pdf_path = _create_report_pdf()
+
+    original = TextMatcher.match_pages
+    scanned = []
+
+    def recording(matcher, page_texts):
+        scanned.extend(page_texts)
+        return original(matcher, page_texts)
+
+    try:
+        patterns._clear_extraction_cache()
+        TextMatcher.match_pages = recording
+        pages, _ = UnifiedBooleanSupervisor(pdf_path, TOTAL_PAGES).evaluate(
+            "(contains:Chapter & contains:Total) | (contains:Chapter & !contains:Total)")
+
+        assert pages == [1, 4, 7, 10]
+        assert scanned, "Text terms should go through the shared matcher"
+        assert len(scanned) == len(set(scanned)), "A page was scanned twice"
+
+    finally:
+        TextMatcher.match_pages = original
+        patterns._clear_extraction_cache()
+
+    print("✓ Repeated terms reuse earlier results")
+    return True
+
+
+def test_range_pattern_operand():
+    """'A to B' sections work as boolean operands."""
+    print("=== Testing Range Pattern Operands ===")
+    pdf_path = _create_report_pdf()
+
+    try:
+        patterns._clear_extraction_cache()
+        supervisor = UnifiedBooleanSupervisor(pdf_path, TOTAL_PAGES)
+        pages, _ = supervisor.evaluate("contains:'Page 4' to contains:'Page 6' & contains:Total")
+        assert pages == [4, 6]
+
+    finally:
+        patterns._clear_extraction_cache()
+
+    print("✓ Range sections combine with other operands")
+    return True
+
+
+def test_planner_matches_naive_evaluation():
+    """Random expressions give the same pages as straightforward set logic."""
+    print("=== Testing Planner Against Naive Evaluation ===")
+    pdf_path = _create_report_pdf()
+    all_pages = set(range(1, TOTAL_PAGES + 1))
+
+    try:
+        patterns._clear_extraction_cache()
+        term_pages = {
+            "contains:Chapter": {1, 4, 7, 10},
+            "contains:Total": {2, 4, 6, 8, 10, 12},
+            "contains/i:'PAGE 1'": {1, 10, 11, 12},
+            "2-9": set(range(2, 10)),
+            "last 3": {10, 11, 12},
+            "odd": {p for p in all_pages if p % 2},
+        }
+        terms = list(term_pages)
+        rng = random.Random(7)
+
+        def build(depth):
+            if depth == 0 or rng.random() < 0.3:
+                term = rng.choice(terms)
+                return term, term_pages[term]
+            if rng.random() < 0.2:
+                text, pages = build(depth - 1)
+                return f"!({text})", all_pages - pages
+            left_text, left_pages = build(depth - 1)
+            right_text, right_pages = build(depth - 1)
+            if rng.random() < 0.5:
+                return f"({left_text} & {right_text})", left_pages & right_pages
+            return f"({left_text} | {right_text})", left_pages | right_pages
+
+        for _ in range(40):
+            expression, expected = build(3)
+            pages, _ = UnifiedBooleanSupervisor(pdf_path, TOTAL_PAGES).evaluate(expression)
+            assert pages == sorted(expected), f"{expression}: {pages} != {sorted(expected)}"
+
+    finally:
+        patterns._clear_extraction_cache()
+
+    print("✓ Planner results match naive evaluation")
+    return True
+
+
+def main():
+    """Run all query planner tests."""
+    print("QUERY PLAN TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_compiler_precedence,
+        test_compiler_errors,
+        test_operand_ordering,
+        test_empty_intersection_short_circuits,
+        test_malformed_terms_rejected_before_short_circuit,
+        test_repeated_terms_examine_pages_once,
+        test_range_pattern_operand,
+        test_planner_matches_naive_evaluation,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"QUERY PLAN TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
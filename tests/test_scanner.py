@@ -0,0 +1,140 @@
+"""
+Test Folder Scanning
+Run: python tests/test_scanner.py
+
+Tests header-only page counting (with fallback when /Count is wrong),
+recursive scanning with hidden files skipped, and parallel scanning.
+"""
+
+import sys
+import tempfile
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import NameObject, NumberObject
+
+from pdf_manipulator.core import scanner
+from pdf_manipulator.core.scanner import find_pdf_files, iter_pdf_info, read_page_count, scan_folder
+
+from tests.test_pdf_utils import create_test_pdf
+
+
+def _make_pdf(path: Path, pages: int) -> Path:
+    """Write a PDF with the given number of pages."""
+    content = {page: f"Page {page}" for page in range(1, pages + 1)}
+    created = create_test_pdf(str(path), content)
+    return created
+
+
+def test_header_count_matches_full_count():
+    """The /Count read agrees with walking the page tree."""
+    print("=== Testing Header Page Count ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_path = _make_pdf(Path(temp_dir) / "seven.pdf", 7)
+        assert read_page_count(PdfReader(pdf_path)) == 7
+        assert len(PdfReader(pdf_path).pages) == 7
+    print("✓ Header count matches")
+    return True
+
+
+def test_inconsistent_count_falls_back():
+    """A wrong /Count falls back to the real number of pages."""
+    print("=== Testing Fallback on Wrong /Count ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = _make_pdf(Path(temp_dir) / "source.pdf", 3)
+        writer = PdfWriter(clone_from=source)
+        writer._root_object['/Pages'][NameObject('/Count')] = NumberObject(99)
+        broken = Path(temp_dir) / "broken.pdf"
+        with open(broken, 'wb') as f:
+            writer.write(f)
+
+        reader = PdfReader(broken)
+        assert reader.trailer['/Root']['/Pages']['/Count'] == 99
+        assert read_page_count(reader) == 3
+    print("✓ Inconsistent counts fall back to the page tree")
+    return True
+
+
+def test_recursive_scan_skips_hidden():
+    """Recursive scans include subfolders but skip hidden files and folders."""
+    print("=== Testing Recursive Scanning ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        (root / "sub").mkdir()
+        (root / ".hidden").mkdir()
+        _make_pdf(root / "b.pdf", 2)
+        _make_pdf(root / "sub" / "a.pdf", 1)
+        _make_pdf(root / ".hidden" / "c.pdf", 1)
+        _make_pdf(root / "._meta.pdf", 1)
+        (root / "broken.pdf").write_bytes(b"not a pdf")
+
+        flat = scan_folder(root)
+        assert [(p.name, n) for p, n, _ in flat] == [("b.pdf", 2)]
+
+        nested = scan_folder(root, recursive=True)
+        assert [(p.relative_to(root).as_posix(), n) for p, n, _ in nested] == [("b.pdf", 2), ("sub/a.pdf", 1)]
+        assert sorted(p.name for p in find_pdf_files(root, recursive=True)) == ["a.pdf", "b.pdf", "broken.pdf"]
+    print("✓ Recursive scans work and hidden entries are skipped")
+    return True
+
+
+def test_parallel_scan_matches_serial():
+    """A pooled scan finds the same files and counts as a serial one."""
+    print("=== Testing Parallel Scanning ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        for index in range(40):
+            _make_pdf(root / f"doc{index:02d}.pdf", index % 4 + 1)
+
+        original_chunk = scanner.SCAN_CHUNK_SIZE
+        scanner.SCAN_CHUNK_SIZE = 5
+        try:
+            serial = sorted(iter_pdf_info(find_pdf_files(root), jobs=1))
+            parallel = sorted(iter_pdf_info(find_pdf_files(root), jobs=3))
+        finally:
+            scanner.SCAN_CHUNK_SIZE = original_chunk
+
+        assert len(serial) == 40
+        assert parallel == serial
+        assert scan_folder(root, jobs=2) == sorted(serial, key=lambda x: x[0].name)
+    print("✓ Parallel scans match serial scans")
+    return True
+
+
+def main():
+    """Run all scanner tests."""
+    print("SCANNER TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_header_count_matches_full_count,
+        test_inconsistent_count_falls_back,
+        test_recursive_scan_skips_hidden,
+        test_parallel_scan_matches_serial,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"SCANNER TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
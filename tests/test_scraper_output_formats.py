@@ -0,0 +1,207 @@
+"""
+Test Typed Scraper Output Formats
+Run: python tests/test_scraper_output_formats.py
+
+Tests the SQLite and columnar sinks: typed columns (numbers stay numbers),
+the same rows as the TSV output, batched writes, SQLite resume, and the
+column file reader stopping at a batch cut off by a crash.
+"""
+
+import sys
+import sqlite3
+import subprocess
+
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.scraper import cli
+from pdf_manipulator.scraper.output import columnar_writer
+from pdf_manipulator.scraper.output.columnar_writer import ColumnarStreamWriter, read_column_file
+from pdf_manipulator.scraper.output.schema import INTEGER, NUMBER, TEXT, parse_number, unique_column_names
+from pdf_manipulator.scraper.output.sqlite_writer import SQLiteStreamWriter
+
+from tests.test_pdf_utils import create_test_pdf, create_temp_dir
+
+
+HEADERS = ['filename', 'page', 'Invoice Number', 'Total']
+COLUMN_TYPES = [TEXT, INTEGER, TEXT, NUMBER]
+
+
+def _run_scraper(pdf_files, output_file, *extra_args) -> int:
+    argv = ['scraper', *pdf_files, '--pattern', 'Invoice Number:right:0:word',
+            '--pattern', 'Total:right:0:number', '-o', str(output_file), *extra_args]
+    with mock.patch.object(sys, 'argv', argv):
+        return cli.main()
+
+
+def _make_corpus(folder: Path) -> list[str]:
+    return [str(create_test_pdf(str(folder / f"doc{index}.pdf"),
+                                {page: f"Invoice Number: INV-{index}{page}\nTotal: ${index},{page}00.25"
+                                 for page in range(1, 3)}))
+            for index in range(3)]
+
+
+def test_number_parsing():
+    """Extracted numbers become floats; non-numbers become missing values."""
+    print("=== Testing Number Parsing ===")
+    assert parse_number('$1,250.00') == 1250.0
+    assert parse_number('-7') == -7.0
+    assert parse_number('') is None
+    assert parse_number('n/a') is None
+    assert unique_column_names(['filename', 'page', 'Total', 'Total']) == ['filename', 'page', 'Total', 'Total_2']
+    print("✓ Numbers parsed")
+    return True
+
+
+def test_sqlite_output():
+    """The SQLite sink stores the TSV rows with typed columns and an index."""
+    print("=== Testing SQLite Output ===")
+    folder = create_temp_dir()
+    pdf_files = _make_corpus(folder)
+    output_file = folder / "results.sqlite"
+    assert _run_scraper(pdf_files, output_file, '--format', 'sqlite') == 0
+
+    conn = sqlite3.connect(str(output_file))
+    rows = conn.execute('SELECT filename, page, "Invoice Number", Total FROM results').fetchall()
+    assert len(rows) == 6
+    assert rows[0] == (pdf_files[0], 1, 'INV-01', 100.25), rows[0]
+    assert conn.execute("SELECT typeof(Total), typeof(page) FROM results LIMIT 1").fetchone() == ('real', 'integer')
+    indexes = [row[1] for row in conn.execute("PRAGMA index_list(results)")]
+    assert 'idx_results_filename' in indexes
+    assert conn.execute("SELECT COUNT(*) FROM completed_files").fetchone()[0] == 3
+    conn.close()
+    print("✓ SQLite rows typed and indexed")
+    return True
+
+
+def test_formats_from_module_entry_point():
+    """python -m pdf_manipulator.scraper writes the SQLite and columnar sinks."""
+    print("=== Testing Formats From The Module Entry Point ===")
+    folder = create_temp_dir()
+    pdf_files = _make_corpus(folder)
+
+    for output_format, output_file in (('sqlite', folder / "module.sqlite"), ('columnar', folder / "module.cols")):
+        completed = subprocess.run(
+            [sys.executable, '-m', 'pdf_manipulator.scraper', *pdf_files, '--pattern', 'Total:right:0:number',
+             '--format', output_format, '-o', str(output_file)],
+            cwd=Path(__file__).parent.parent, capture_output=True, text=True)
+        assert completed.returncode == 0, completed.stderr
+        assert output_file.exists(), output_format
+
+    with sqlite3.connect(str(folder / "module.sqlite")) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 6
+    print("✓ Typed sinks reachable from the module entry point")
+    return True
+
+
+def test_sqlite_resume():
+    """Files committed to the database are skipped on --resume."""
+    print("=== Testing SQLite Resume ===")
+    folder = create_temp_dir()
+    pdf_files = _make_corpus(folder)
+    output_file = folder / "results.sqlite"
+
+    writer = SQLiteStreamWriter(output_file, HEADERS, COLUMN_TYPES)
+    writer.write_file_rows(pdf_files[0], [[pdf_files[0], 1, 'INV-01', '$100.25']])
+    writer.flush()
+    writer.write_file_rows(pdf_files[1], [[pdf_files[1], 1, 'lost', '1']])     # Never committed
+    writer._conn.close()
+    writer._conn = None
+
+    extracted = []
+    original_extract_rows = cli.extract_rows
+
+    def counting(pdf_file, *args):
+        extracted.append(Path(pdf_file).name)
+        return original_extract_rows(pdf_file, *args)
+
+    with mock.patch.object(cli, 'extract_rows', counting):
+        assert _run_scraper(pdf_files, output_file, '--format', 'sqlite', '--resume') == 0
+
+    assert extracted == ['doc1.pdf', 'doc2.pdf'], extracted
+    conn = sqlite3.connect(str(output_file))
+    assert conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 5
+    assert conn.execute("SELECT COUNT(*) FROM results WHERE \"Invoice Number\" = 'lost'").fetchone()[0] == 0
+    conn.close()
+    print("✓ Committed files skipped")
+    return True
+
+
+def test_column_file_output():
+    """Without pyarrow the columnar sink writes a typed column file."""
+    print("=== Testing Column File Output ===")
+    folder = create_temp_dir()
+    pdf_files = _make_corpus(folder)
+    output_file = folder / "results.cols"
+    assert _run_scraper(pdf_files, output_file, '--format', 'columnar') == 0
+
+    columns = read_column_file(output_file)
+    assert list(columns) == HEADERS
+    assert columns['page'] == [1, 2, 1, 2, 1, 2]
+    assert columns['Total'] == [100.25, 200.25, 1100.25, 1200.25, 2100.25, 2200.25]
+    assert columns['Invoice Number'][0] == 'INV-01'
+    print("✓ Column file typed")
+    return True
+
+
+def test_column_file_batches_and_truncation():
+    """Batches are appended as written; a cut-off batch is ignored."""
+    print("=== Testing Column File Batches ===")
+    folder = create_temp_dir()
+    output_file = folder / "batches.cols"
+
+    with mock.patch.object(columnar_writer, 'PYARROW_AVAILABLE', False):
+        writer = ColumnarStreamWriter(output_file, HEADERS, COLUMN_TYPES, batch_rows=2)
+        for index in range(5):
+            writer.write_file_rows(f"doc{index}.pdf", [[f"doc{index}.pdf", 1, f"Iñvoice {index}", None]])
+        writer.close()
+
+    columns = read_column_file(output_file)
+    assert columns['Invoice Number'] == [f"Iñvoice {index}" for index in range(5)]
+    assert columns['Total'] == [None] * 5
+
+    data = output_file.read_bytes()
+    output_file.write_bytes(data[:-3])
+    assert read_column_file(output_file)['page'] == [1, 1, 1, 1], "Only complete batches should be read"
+    print("✓ Batches framed and truncation tolerated")
+    return True
+
+
+def main():
+    """Run all scraper output format tests."""
+    print("SCRAPER OUTPUT FORMAT TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_number_parsing,
+        test_sqlite_output,
+        test_formats_from_module_entry_point,
+        test_sqlite_resume,
+        test_column_file_output,
+        test_column_file_batches_and_truncation,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"SCRAPER OUTPUT FORMAT TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
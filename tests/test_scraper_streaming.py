@@ -0,0 +1,169 @@
+"""
+Test Streaming Scraper Output
+Run: python tests/test_scraper_streaming.py
+
+Tests that the standalone scraper writes rows file by file, that --jobs
+produces exactly the serial output, and that --resume skips files a crashed
+run completed while dropping the rows of the file it was cut off in, and
+that python -m pdf_manipulator.scraper reaches these options.
+"""
+
+import sys
+import subprocess
+
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.scraper import cli
+from pdf_manipulator.scraper.output.tsv_writer import TSVStreamWriter
+
+from tests.test_pdf_utils import create_test_pdf, create_temp_dir
+
+
+def _make_corpus(folder: Path, count: int = 6) -> list[str]:
+    pdf_files = []
+    for index in range(count):
+        content = {page: f"Invoice Number: INV-{index}-{page}\nTotal: {index}{page}.50"
+                    for page in range(1, 3)}
+        if index == 2:
+            content = {1: "Nothing to see here"}
+        pdf_files.append(str(create_test_pdf(str(folder / f"doc{index}.pdf"), content)))
+    return pdf_files
+
+
+def _run_scraper(pdf_files, output_file, *extra_args) -> int:
+    argv = ['scraper', *pdf_files, '--pattern', 'Invoice Number:right:0:word',
+            '--pattern', 'Total:right:0:number', '-o', str(output_file), *extra_args]
+    with mock.patch.object(sys, 'argv', argv):
+        return cli.main()
+
+
+def test_parallel_matches_serial():
+    """--jobs output is byte-identical to the serial output."""
+    print("=== Testing Parallel Output Order ===")
+    folder = create_temp_dir()
+    pdf_files = _make_corpus(folder)
+
+    serial_output = folder / "serial.tsv"
+    parallel_output = folder / "parallel.tsv"
+    assert _run_scraper(pdf_files, serial_output) == 0
+    assert _run_scraper(pdf_files, parallel_output, '--jobs', '3') == 0
+
+    serial_text = serial_output.read_text(encoding='utf-8')
+    assert serial_text == parallel_output.read_text(encoding='utf-8')
+    assert len(serial_text.splitlines()) == 1 + 5 * 2
+    assert not Path(f"{serial_output}.checkpoint").exists(), "Finished runs should drop the checkpoint"
+    print("✓ Parallel rows written in input order")
+    return True
+
+
+def test_resume_after_crash():
+    """A resumed run skips completed files and drops partial rows."""
+    print("=== Testing Resume ===")
+    folder = create_temp_dir()
+    pdf_files = _make_corpus(folder)
+
+    expected_output = folder / "expected.tsv"
+    assert _run_scraper(pdf_files, expected_output) == 0
+
+    # Simulate a run killed while writing the third file's rows
+    output_file = folder / "results.tsv"
+    headers = ['filename', 'page', 'Invoice Number', 'Total']
+    writer = TSVStreamWriter(output_file, headers)
+    processor = cli.PyPDFProcessor()
+    extractor = cli.PatternExtractor()
+    patterns = [cli.parse_pattern('Invoice Number:right:0:word'), cli.parse_pattern('Total:right:0:number')]
+    for pdf_file in pdf_files[:2]:
+        writer.write_file_rows(pdf_file, cli.extract_rows(pdf_file, processor, extractor, patterns))
+    writer._file.write(f"{pdf_files[3]}\t1\tINV-3-")
+    writer._file.close()
+    writer._checkpoint.write('{"file": "')
+    writer._checkpoint.close()
+
+    extracted = []
+    original_extract_rows = cli.extract_rows
+
+    def counting(pdf_file, *args):
+        extracted.append(Path(pdf_file).name)
+        return original_extract_rows(pdf_file, *args)
+
+    with mock.patch.object(cli, 'extract_rows', counting):
+        assert _run_scraper(pdf_files, output_file, '--resume') == 0
+
+    assert extracted == ['doc2.pdf', 'doc3.pdf', 'doc4.pdf', 'doc5.pdf'], extracted
+    assert output_file.read_text(encoding='utf-8') == expected_output.read_text(encoding='utf-8')
+    print("✓ Resumed output matches a full run")
+    return True
+
+
+def test_resume_rejects_other_columns():
+    """Resuming with different patterns is refused instead of mixing columns."""
+    print("=== Testing Resume Column Check ===")
+    folder = create_temp_dir()
+    output_file = folder / "results.tsv"
+    writer = TSVStreamWriter(output_file, ['filename', 'page', 'Total'])
+    writer._file.close()
+    writer._checkpoint.close()
+
+    try:
+        TSVStreamWriter(output_file, ['filename', 'page', 'Invoice'], resume=True)
+    except ValueError:
+        print("✓ Mismatched columns rejected")
+        return True
+    assert False, "Resume with different headers should fail"
+
+
+def test_module_entry_point():
+    """python -m pdf_manipulator.scraper runs this CLI, with --jobs and --resume."""
+    print("=== Testing Module Entry Point ===")
+    folder = create_temp_dir()
+    pdf_files = _make_corpus(folder, count=3)
+    output_file = folder / "results.tsv"
+
+    completed = subprocess.run(
+        [sys.executable, '-m', 'pdf_manipulator.scraper', *pdf_files,
+         '--pattern', 'Total:right:0:number', '--jobs', '2', '--resume', '-o', str(output_file)],
+        cwd=Path(__file__).parent.parent, capture_output=True, text=True)
+
+    assert completed.returncode == 0, completed.stderr
+    assert len(output_file.read_text(encoding='utf-8').splitlines()) == 5    # Header + 4 rows
+    print("✓ Module entry point accepts --jobs and --resume")
+    return True
+
+
+def main():
+    """Run all streaming scraper tests."""
+    print("STREAMING SCRAPER TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_parallel_matches_serial,
+        test_resume_after_crash,
+        test_resume_rejects_other_columns,
+        test_module_entry_point,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"STREAMING SCRAPER TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
@@ -0,0 +1,147 @@
+"""
+Test Page-Parallel Sharded Text Extraction
+Run: python tests/test_sharded_extraction.py
+
+Tests shard planning and that sharded extraction (in-process and with worker
+processes) returns exactly what sequential extraction returns, in page order.
+"""
+
+import sys
+import atexit
+import inspect
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simple_pdf_scraper.processors import sharded_extraction as scraper_sharding
+from pdf_manipulator.core.page_range import sharded_extraction
+from pdf_manipulator.core.page_range.sharded_extraction import plan_shards, extract_pages_sharded
+from simple_pdf_scraper.processors.pdfplumber_processor import PDFPlumberProcessor
+from pdf_manipulator.core.page_range import patterns
+from pdf_manipulator.core.page_range.page_text import configure_text_extraction
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs
+
+
+atexit.register(cleanup_test_pdfs)
+
+PAGE_COUNT = 12
+
+
+def _make_pdf() -> Path:
+    return create_test_pdf('test_sharded.pdf', {i: f"Page marker {i}\nLine two of {i}"
+                                                for i in range(1, PAGE_COUNT + 1)})
+
+
+def test_plan_shards():
+    """Shards are contiguous, bounded by shard_size, and split at gaps."""
+    print("=== Testing Shard Planning ===")
+    assert plan_shards(range(1, 8), 3) == [[1, 2, 3], [4, 5, 6], [7]]
+    assert plan_shards([9, 1, 2, 5, 6, 7], 10) == [[1, 2], [5, 6, 7], [9]]
+    assert plan_shards([], 5) == []
+    assert plan_shards([3, 3, 4], 5) == [[3, 4]]
+    print("✓ Shard planning works")
+    return True
+
+
+def test_scraper_copy_in_sync():
+    """The standalone scraper's copy of the sharding engine matches the core one."""
+    print("=== Testing Scraper Copy ===")
+    for name in ('raw_page_text', 'plan_shards', 'extract_shard', 'resolve_worker_count', 'extract_pages_sharded'):
+        assert inspect.getsource(getattr(sharded_extraction, name)) == \
+            inspect.getsource(getattr(scraper_sharding, name)), f"{name} differs between the copies"
+    assert sharded_extraction.DEFAULT_SHARD_SIZE == scraper_sharding.DEFAULT_SHARD_SIZE
+    print("✓ Both copies are identical")
+    return True
+
+
+def test_sharded_matches_sequential():
+    """Worker-process extraction returns the same text as in-process extraction."""
+    print("=== Testing Sharded Extraction ===")
+    pdf_path = _make_pdf()
+
+    sequential = extract_pages_sharded(pdf_path, range(1, PAGE_COUNT + 1), workers=1)
+    parallel = extract_pages_sharded(pdf_path, range(1, PAGE_COUNT + 1), workers=3, shard_size=4)
+
+    assert parallel == sequential
+    assert "Page marker 7" in parallel[7]
+    assert list(sorted(parallel)) == list(range(1, PAGE_COUNT + 1))
+
+    # Pages past the end come back empty rather than failing
+    assert extract_pages_sharded(pdf_path, [PAGE_COUNT, PAGE_COUNT + 1], workers=1)[PAGE_COUNT + 1] == ""
+    print("✓ Sharded extraction matches sequential extraction")
+    return True
+
+
+def test_processor_sharding():
+    """PDFPlumberProcessor.extract_pages gives identical output with workers."""
+    print("=== Testing PDFPlumberProcessor Sharding ===")
+    pdf_path = _make_pdf()
+
+    sequential = PDFPlumberProcessor().extract_pages(pdf_path)
+    sharded = PDFPlumberProcessor(workers=2, shard_size=5).extract_pages(pdf_path)
+
+    assert sharded == sequential
+    assert len(sharded) == PAGE_COUNT
+    print("✓ Processor output unchanged by sharding")
+    return True
+
+
+def test_pattern_extraction_sharding():
+    """Pattern text extraction uses the configured workers and keeps page order."""
+    print("=== Testing Pattern Extraction Sharding ===")
+    pdf_path = _make_pdf()
+
+    try:
+        patterns._clear_extraction_cache()
+        sequential = patterns._extract_all_page_texts(pdf_path, PAGE_COUNT)
+
+        configure_text_extraction(workers=2, shard_size=3)
+        patterns._clear_extraction_cache()
+        sharded = patterns._extract_all_page_texts(pdf_path, PAGE_COUNT)
+    finally:
+        configure_text_extraction()
+        patterns._clear_extraction_cache()
+
+    assert sharded == sequential
+    assert all(f"Page marker {i + 1}" in text for i, text in enumerate(sharded))
+    print("✓ Pattern extraction sharding keeps results identical")
+    return True
+
+
+def main():
+    """Run all sharded extraction tests."""
+    print("SHARDED EXTRACTION TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_plan_shards,
+        test_scraper_copy_in_sync,
+        test_sharded_matches_sequential,
+        test_processor_sharding,
+        test_pattern_extraction_sharding,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"SHARDED EXTRACTION TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
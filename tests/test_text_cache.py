@@ -0,0 +1,159 @@
+"""
+Test Persistent Page Text Cache
+Run: python tests/test_text_cache.py
+
+Tests the SQLite page text cache and its use by pattern text extraction:
+round trips, content-based keys, extractor-version keys and LRU eviction.
+"""
+
+import sys
+import atexit
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core.cache.text_cache import (
+    PageTextCache,
+    configure_text_cache,
+    get_text_cache,
+    get_document_key,
+)
+from pdf_manipulator.core.page_range import patterns
+from pdf_manipulator.core.page_range.page_text import text_extractor_ids
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs, create_temp_dir
+
+
+atexit.register(cleanup_test_pdfs)
+
+def test_round_trip():
+    """Stored pages come back unchanged, partial documents are allowed."""
+    print("=== Testing Text Cache Round Trip ===")
+    cache = PageTextCache(create_temp_dir())
+
+    cache.store_pages('doc-a', 'pypdf-1/r1', {1: "Invoice 1", 2: "", 3: "Ünïcödé ✓"})
+
+    assert cache.get_pages('doc-a', 'pypdf-1/r1') == {1: "Invoice 1", 2: "", 3: "Ünïcödé ✓"}
+    assert cache.get_pages('doc-a', 'pypdf-1/r1', [2, 3, 9]) == {2: "", 3: "Ünïcödé ✓"}
+    assert cache.get_pages('doc-a', 'pdfplumber-1/r1') == {}, "Extractor id must be part of the key"
+    assert cache.get_pages('doc-b', 'pypdf-1/r1') == {}
+
+    stats = cache.stats()
+    assert stats['documents'] == 1 and stats['pages'] == 3
+    cache.close()
+    print("✓ Round trip, partial fetch and extractor keys work")
+    return True
+
+
+def test_lru_eviction():
+    """Least recently used documents are evicted once the size limit is exceeded."""
+    print("=== Testing Text Cache LRU Eviction ===")
+    cache = PageTextCache(create_temp_dir(), max_bytes=10_000)
+
+    # Incompressible-ish text so each document takes real space
+    import random
+    rng = random.Random(42)
+
+    def noise():
+        return ''.join(chr(rng.randint(33, 126)) for _ in range(4000))
+
+    cache.store_pages('old', 'x/r1', {1: noise()})
+    cache.store_pages('mid', 'x/r1', {1: noise()})
+    cache.get_pages('old', 'x/r1')                  # 'old' is now more recent than 'mid'
+    cache.store_pages('new', 'x/r1', {1: noise()})  # pushes the cache over the limit
+
+    assert cache.get_pages('mid', 'x/r1') == {}, "Least recently used document should be evicted"
+    assert cache.get_pages('old', 'x/r1'), "Recently read document should survive"
+    assert cache.get_pages('new', 'x/r1'), "Newest document should survive"
+    assert cache.stats()['bytes'] <= 10_000
+    cache.close()
+    print("✓ LRU eviction keeps the cache under its limit")
+    return True
+
+
+def test_document_key_follows_content():
+    """Document keys depend on content, not on the file name."""
+    print("=== Testing Content-Based Document Keys ===")
+    first = create_test_pdf('test_cache_key_a.pdf', {1: "Same content"})
+    second = create_test_pdf('test_cache_key_b.pdf', {1: "Same content"})
+    different = create_test_pdf('test_cache_key_c.pdf', {1: "Other content"})
+
+    # reportlab embeds a creation timestamp, so compare a byte copy instead
+    second.write_bytes(first.read_bytes())
+
+    assert get_document_key(first) == get_document_key(second)
+    assert get_document_key(first) != get_document_key(different)
+    print("✓ Identical bytes share a key, different bytes do not")
+    return True
+
+
+def test_pattern_extraction_uses_cache():
+    """_extract_all_page_texts stores into and serves from the persistent cache."""
+    print("=== Testing Pattern Extraction With Persistent Cache ===")
+    pdf_path = create_test_pdf('test_cache_extract.pdf', {1: "Chapter 1", 2: "Summary"})
+
+    try:
+        cache = configure_text_cache(create_temp_dir())
+        patterns._clear_extraction_cache()
+
+        texts = patterns._extract_all_page_texts(pdf_path, 2)
+        assert "Chapter 1" in texts[0] and "Summary" in texts[1]
+        assert cache.stats()['pages'] == 2, "Extraction should populate the persistent cache"
+
+        # Replace the cached text to prove the next run is served from disk
+        doc_key = get_document_key(pdf_path)
+        extractor_id = text_extractor_ids()[0]
+        cache.store_pages(doc_key, extractor_id, {1: "cached one", 2: "cached two"})
+        patterns._clear_extraction_cache()
+
+        assert patterns._extract_all_page_texts(pdf_path, 2) == ["cached one", "cached two"]
+
+        # Disabled cache means a fresh extraction
+        configure_text_cache(enabled=False)
+        assert get_text_cache() is None
+        patterns._clear_extraction_cache()
+        assert "Chapter 1" in patterns._extract_all_page_texts(pdf_path, 2)[0]
+
+    finally:
+        configure_text_cache(enabled=False)
+        patterns._clear_extraction_cache()
+
+    print("✓ Pattern extraction reads and writes the persistent cache")
+    return True
+
+
+def main():
+    """Run all text cache tests."""
+    print("TEXT CACHE TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_round_trip,
+        test_lru_eviction,
+        test_document_key_follows_content,
+        test_pattern_extraction_uses_cache,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"TEXT CACHE TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
@@ -0,0 +1,209 @@
+"""
+Test Persistent Page Text Index
+Run: python tests/test_text_index.py
+
+Tests the inverted page text index: term generation, postings lookups, and
+that indexed documents give the same contains:/line-starts: results while
+only reading the pages the index can't rule out.
+"""
+
+import sys
+import atexit
+import random
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core.cache.text_cache import configure_text_cache
+from pdf_manipulator.core.cache.text_index import (
+    PageTextIndex,
+    configure_text_index,
+    line_start_query_terms,
+    page_terms,
+    substring_query_terms,
+)
+from pdf_manipulator.core.page_range import patterns
+from pdf_manipulator.core.page_range.boolean import UnifiedBooleanSupervisor
+from pdf_manipulator.core.page_range.page_text import (
+    build_page_text_index,
+    get_page_text_provider,
+    page_text_index_info,
+)
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs, create_temp_dir
+
+
+atexit.register(cleanup_test_pdfs)
+
+TOTAL_PAGES = 30
+
+
+def _create_archive_pdf() -> Path:
+    """Every fifth page is an invoice, page 7 is void, the rest are notes."""
+    content = {}
+    for page in range(1, TOTAL_PAGES + 1):
+        if page % 5 == 0:
+            content[page] = f"INVOICE {page}\n  Total: {page * 10}"
+        elif page == 7:
+            content[page] = "Void page\nsee Invoice 5"
+        else:
+            content[page] = f"Notes for page {page}"
+    return create_test_pdf('test_text_index.pdf', content)
+
+
+def test_terms():
+    """Pages produce lowercased trigrams and line-start prefixes."""
+    print("=== Testing Index Terms ===")
+    terms = page_terms("Ab Cd\n  xY")
+    assert {'tab ', 'tb c', 't cd', 'tcd\n'} <= terms
+    assert {'la', 'lab', 'lx', 'lxy'} <= terms
+    assert page_terms("") == set()
+
+    assert substring_query_terms("Ab") is None
+    assert substring_query_terms("ABCD") == {'tabc', 'tbcd'}
+    assert line_start_query_terms("To") == {'lto'}
+    assert line_start_query_terms("Total") == {'ltot', 'ttot', 'tota', 'ttal'}
+    print("✓ Terms are generated consistently for pages and queries")
+    return True
+
+
+def test_lookup():
+    """Lookups AND the postings of every term; unknown documents give None."""
+    print("=== Testing Postings Lookup ===")
+    index = PageTextIndex(create_temp_dir())
+    index.build('doc', 'pipe', {1: "alpha beta", 2: "beta gamma", 3: "", 4: "ALPHA"})
+
+    assert index.lookup('doc', 'pipe', substring_query_terms("alpha")) == (1 << 1) | (1 << 4)
+    assert index.lookup('doc', 'pipe', substring_query_terms("beta")) == (1 << 1) | (1 << 2)
+    assert index.lookup('doc', 'pipe', substring_query_terms("delta")) == 0
+    assert index.lookup('other', 'pipe', substring_query_terms("alpha")) is None
+    assert index.lookup('doc', 'other-pipe', substring_query_terms("alpha")) is None
+
+    info = index.document_info('doc', 'pipe')
+    assert info['total_pages'] == 4 and info['term_count'] > 0
+    assert index.stats()['documents'] == 1
+
+    index.remove('doc')
+    assert index.lookup('doc', 'pipe', substring_query_terms("alpha")) is None
+    index.close()
+    print("✓ Lookups return candidate page masks")
+    return True
+
+
+def test_indexed_queries_match_and_skip_pages():
+    """Indexed documents give identical results while reading fewer pages."""
+    print("=== Testing Indexed Queries ===")
+    pdf_path = _create_archive_pdf()
+    cache_dir = create_temp_dir()
+
+    expressions = [
+        "contains:'INVOICE'",
+        "contains/i:'invoice'",
+        "line-starts:'Total'",
+        "line-starts/i:'void'",
+        "contains:'Notes' & !contains/i:'page 1'",
+        "contains/i:'invoice' | line-starts:Total",
+        "regex:'INVOICE \\d0'",
+        "contains:'no such text'",
+        "contains:'Vo'",
+    ]
+
+    try:
+        configure_text_cache(enabled=False)
+        configure_text_index(enabled=False)
+        expected = {}
+        for expression in expressions:
+            patterns._clear_extraction_cache()
+            expected[expression], _ = UnifiedBooleanSupervisor(pdf_path, TOTAL_PAGES).evaluate(expression)
+
+        configure_text_cache(cache_dir)
+        configure_text_index(cache_dir)
+        assert page_text_index_info(pdf_path) is None
+        info = build_page_text_index(pdf_path, TOTAL_PAGES)
+        assert info['total_pages'] == TOTAL_PAGES
+        assert page_text_index_info(pdf_path)['term_count'] == info['term_count']
+
+        for expression in expressions:
+            patterns._clear_extraction_cache()
+            pages, _ = UnifiedBooleanSupervisor(pdf_path, TOTAL_PAGES).evaluate(expression)
+            assert pages == expected[expression], f"{expression}: {pages} != {expected[expression]}"
+
+        # Only the candidate pages are read for a selective query
+        patterns._clear_extraction_cache()
+        assert patterns.parse_pattern_expression("line-starts:'Total'", pdf_path, TOTAL_PAGES) == \
+            [5, 10, 15, 20, 25, 30]
+        assert get_page_text_provider(pdf_path, TOTAL_PAGES).loaded_pages == {5, 10, 15, 20, 25, 30}
+
+    finally:
+        configure_text_cache(enabled=False)
+        configure_text_index(enabled=False)
+        patterns._clear_extraction_cache()
+
+    print("✓ Indexed queries match and only read candidate pages")
+    return True
+
+
+def test_random_needles_never_lose_matches():
+    """Index candidates always include every page a needle really matches."""
+    print("=== Testing Candidate Supersets ===")
+    rng = random.Random(11)
+    alphabet = "abAB \n"
+    texts = {page: ''.join(rng.choice(alphabet) for _ in range(40)) for page in range(1, 41)}
+
+    index = PageTextIndex(create_temp_dir())
+    index.build('doc', 'pipe', texts)
+
+    for _ in range(200):
+        needle = ''.join(rng.choice("abAB ") for _ in range(rng.randint(3, 6)))
+        mask = index.lookup('doc', 'pipe', substring_query_terms(needle))
+        for page, text in texts.items():
+            if needle.lower() in text.lower():
+                assert mask >> page & 1, f"{needle!r} lost page {page}"
+
+        prefix = needle.strip()
+        if prefix:
+            mask = index.lookup('doc', 'pipe', line_start_query_terms(prefix))
+            for page, text in texts.items():
+                if any(line.strip().lower().startswith(prefix.lower()) for line in text.split('\n')):
+                    assert mask >> page & 1, f"line-starts {prefix!r} lost page {page}"
+
+    index.close()
+    print("✓ Candidates are supersets of the real matches")
+    return True
+
+
+def main():
+    """Run all text index tests."""
+    print("TEXT INDEX TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_terms,
+        test_lookup,
+        test_indexed_queries_match_and_skip_pages,
+        test_random_needles_never_lose_matches,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"TEXT INDEX TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
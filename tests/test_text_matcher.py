@@ -0,0 +1,206 @@
+"""
+Test Single-Pass Text Matcher
+Run: python tests/test_text_matcher.py
+
+Tests the multi-pattern TextMatcher: predicate parsing, matching semantics of
+contains:/regex:/line-starts: (with and without /i), and that boolean
+expressions with many text terms scan each page once.
+"""
+
+import re
+import sys
+import atexit
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.core.page_range import patterns
+from pdf_manipulator.core.page_range.boolean import UnifiedBooleanSupervisor
+from pdf_manipulator.core.page_range.page_set import PageSet
+from pdf_manipulator.core.page_range.text_matcher import TextMatcher, TextPredicate, parse_text_predicate
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs
+
+
+atexit.register(cleanup_test_pdfs)
+
+TOTAL_PAGES = 24
+
+
+def _reference_match(predicate: TextPredicate, text: str) -> bool:
+    """One-predicate-at-a-time reference semantics."""
+    if not text:
+        return False
+    value = predicate.value
+    if predicate.pattern_type == 'contains':
+        if predicate.case_insensitive:
+            return value.lower() in text.lower()
+        return value in text
+    if predicate.pattern_type == 'regex':
+        try:
+            return bool(re.search(value, text, re.IGNORECASE if predicate.case_insensitive else 0))
+        except re.error:
+            return False
+    lines = [line.strip() for line in text.split('\n')]
+    if predicate.case_insensitive:
+        return any(line.lower().startswith(value.lower()) for line in lines)
+    return any(line.startswith(value) for line in lines)
+
+
+def test_parse_text_predicate():
+    """Text patterns parse into predicates; other patterns don't."""
+    print("=== Testing Predicate Parsing ===")
+    assert parse_text_predicate("contains:'Invoice'") == TextPredicate('contains', 'Invoice')
+    assert parse_text_predicate("contains/i:\"total due\"") == TextPredicate('contains', 'total due', True)
+    assert parse_text_predicate("REGEX:\\d+") == TextPredicate('regex', '\\d+')
+    assert parse_text_predicate("line-starts/i: Chapter ") == TextPredicate('line-starts', 'Chapter', True)
+
+    assert parse_text_predicate("type:text") is None
+    assert parse_text_predicate("size:>1MB") is None
+    assert parse_text_predicate("contains:''") is None
+    assert parse_text_predicate("5-10") is None
+    print("✓ Text predicates parse correctly")
+    return True
+
+
+def test_semantics_match_reference():
+    """Every predicate gives the same answer as evaluating it on its own."""
+    print("=== Testing Matching Semantics ===")
+    texts = [
+        "",
+        "Invoice 42\n  Total due: $10\nthanks",
+        "INVOICE\nchapter 3 begins\n   Chapter 4",
+        "summary only",
+        "line one\nline two",
+    ]
+    predicates = [
+        TextPredicate('contains', 'Invoice'),
+        TextPredicate('contains', 'invoice', True),
+        TextPredicate('regex', r'\d+'),
+        TextPredicate('regex', r'^chapter', True),
+        TextPredicate('regex', r'[unclosed'),
+        TextPredicate('line-starts', 'Total'),
+        TextPredicate('line-starts', 'Chapter'),
+        TextPredicate('line-starts', 'CHAPTER', True),
+        TextPredicate('line-starts', 'one\nline'),
+    ]
+
+    matcher = TextMatcher(predicates)
+    for text in texts:
+        expected = {predicate for predicate in predicates if _reference_match(predicate, text)}
+        assert matcher.matches(text) == expected, f"{text!r}: {matcher.matches(text)} != {expected}"
+    print("✓ Results match one-at-a-time evaluation")
+    return True
+
+
+def test_match_pages_returns_page_sets():
+    """match_pages reports every predicate, with a PageSet of matching pages."""
+    print("=== Testing match_pages ===")
+    invoice, summary = TextPredicate('contains', 'Invoice'), TextPredicate('contains', 'Summary')
+    results = TextMatcher([invoice, summary, invoice]).match_pages(
+        {1: "Invoice 1", 2: "Summary 2", 3: "Invoice 3"})
+
+    assert set(results) == {invoice, summary}
+    assert results[invoice] == PageSet([1, 3]) and results[summary] == PageSet([2])
+    assert TextMatcher([invoice]).match_pages({})[invoice] == PageSet()
+    print("✓ match_pages returns PageSets per predicate")
+    return True
+
+
+def test_many_keywords_scan_each_page_once():
+    """An OR of 20+ keywords scans each page once and matches like separate patterns."""
+    print("=== Testing Many-Keyword Expressions ===")
+    content = {page: f"Page {page}\nKeyword{page}" for page in range(1, TOTAL_PAGES + 1)}
+    pdf_path = create_test_pdf('test_text_matcher.pdf', content)
+
+    original = TextMatcher.match_pages
+    scanned = []
+
+    def recording(matcher, page_texts):
+        scanned.extend(page_texts)
+        return original(matcher, page_texts)
+
+    try:
+        patterns._clear_extraction_cache()
+        keywords = [f"contains:'Keyword{page}'" for page in range(2, TOTAL_PAGES + 1, 2)]
+        keywords += ["regex:'Keyword1[0-9]$'", "line-starts:Nothing", "contains/i:'keyword23'"]
+        expression = "(" + " | ".join(keywords) + ") & !contains:'Keyword14'"
+
+        TextMatcher.match_pages = recording
+        pages, _ = UnifiedBooleanSupervisor(pdf_path, TOTAL_PAGES).evaluate(expression)
+        TextMatcher.match_pages = original
+
+        expected = set()
+        for keyword in keywords[:-3]:
+            expected |= set(patterns.parse_pattern_expression(keyword, pdf_path, TOTAL_PAGES))
+        expected |= set(range(10, 20)) | {23}
+        expected -= {14}
+        assert pages == sorted(expected), f"{pages} != {sorted(expected)}"
+        assert len(scanned) == len(set(scanned)), "A page was scanned twice"
+
+    finally:
+        TextMatcher.match_pages = original
+        patterns._clear_extraction_cache()
+
+    print("✓ Each page scanned once for all keywords")
+    return True
+
+
+def test_offsets_use_shared_scan():
+    """Text terms with offsets shift the pages they examine and report."""
+    print("=== Testing Offsets ===")
+    content = {page: ("Header" if page % 5 == 1 else f"Body {page}") for page in range(1, 11)}
+    pdf_path = create_test_pdf('test_text_matcher_offsets.pdf', content)
+
+    try:
+        patterns._clear_extraction_cache()
+        pages, _ = UnifiedBooleanSupervisor(pdf_path, 10).evaluate(
+            "contains:Header+1 | contains:Header")
+        assert pages == [1, 2, 6, 7]
+
+        pages, _ = UnifiedBooleanSupervisor(pdf_path, 10).evaluate("contains:Header-1 & 2-10")
+        assert pages == [5]
+
+    finally:
+        patterns._clear_extraction_cache()
+
+    print("✓ Offsets work through the shared matcher")
+    return True
+
+
+def main():
+    """Run all text matcher tests."""
+    print("TEXT MATCHER TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_parse_text_predicate,
+        test_semantics_match_reference,
+        test_match_pages_returns_page_sets,
+        test_many_keywords_scan_each_page_once,
+        test_offsets_use_shared_scan,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"TEXT MATCHER TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
@@ -0,0 +1,162 @@
+"""
+Test Tokenized Page Model
+Run: python tests/test_tokenized_page.py
+
+Tests the TokenizedPage word index (punctuation-insensitive, substring and
+multi-word keyword matches) and that pattern extraction tokenizes each page
+once, however many patterns and matches use it.
+"""
+
+import sys
+import atexit
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf_manipulator.scraper.extractors import tokenized_page
+from pdf_manipulator.scraper.extractors.pattern_extractor import PatternExtractor
+from pdf_manipulator.scraper.extractors.tokenized_page import TokenizedPage, normalize_word, tokenize_page
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs
+
+
+atexit.register(cleanup_test_pdfs)
+
+SAMPLE_TEXT = """ACME Corp. (Invoice)
+Invoice Number: INV-2024-001
+Total: $1,250.00 due
+Invoice number INV-2024-002
+
+Ship to: Invoice Dept."""
+
+
+def test_word_index():
+    """Lines, words and normalized forms are built once and indexed."""
+    print("=== Testing Word Index ===")
+    page = TokenizedPage(SAMPLE_TEXT)
+
+    assert page.lines == SAMPLE_TEXT.split('\n')
+    assert page.words[1] == ['Invoice', 'Number:', 'INV-2024-001']
+    assert page.normalized[2] == ['total', '125000', 'due']
+    assert page.words[4] == []
+    assert page.index['invoice'] == [(0, 2), (1, 0), (3, 0), (5, 2)]
+    assert normalize_word('(Invoice)') == 'invoice'
+    print("✓ Word index built")
+    return True
+
+
+def test_keyword_lookup():
+    """Keyword lookups match substrings of normalized words and consecutive words."""
+    print("=== Testing Keyword Lookup ===")
+    page = TokenizedPage(SAMPLE_TEXT)
+
+    assert page.find_keyword('INVOICE') == [(0, 2, 2), (1, 0, 0), (3, 0, 0), (5, 2, 2)]
+    assert page.find_keyword('voice') == [(0, 2, 2), (1, 0, 0), (3, 0, 0), (5, 2, 2)]
+    assert page.find_keyword('Invoice Number') == [(1, 0, 1), (3, 0, 1)]
+    assert page.find_keyword('Number INV') == [(1, 1, 2), (3, 1, 2)]
+    assert page.find_keyword('Missing') == []
+    assert page.find_keyword('   ') == []
+    print("✓ Keyword lookups correct")
+    return True
+
+
+def test_extractor_results():
+    """Extractor matches, movements and extraction work on the tokenized page."""
+    print("=== Testing Extractor On Tokenized Page ===")
+    extractor = PatternExtractor()
+
+    matches = extractor.find_all_keyword_matches(SAMPLE_TEXT, 'Invoice Number')
+    assert [m['match_text'] for m in matches] == ['Invoice Number:', 'Invoice number']
+    assert matches[0]['line_text'] == 'Invoice Number: INV-2024-001'
+
+    pattern = {'keyword': 'Invoice Number', 'movements': [('r', 1)],
+                'extract_type': 'wd', 'extract_count': 1, 'flexible': False}
+    assert extractor.extract_pattern(SAMPLE_TEXT, pattern) == 'INV-2024-001'
+
+    pattern = {'keyword': 'Total', 'movements': [('r', 1)],
+                'extract_type': 'nb', 'extract_count': 1, 'flexible': False}
+    assert extractor.extract_pattern(SAMPLE_TEXT, pattern) == '1,250.00'
+
+    pattern = {'keyword': 'Total', 'movements': [('d', 1)],
+                'extract_type': 'ln', 'extract_count': 3, 'flexible': True}
+    assert extractor.extract_pattern(SAMPLE_TEXT, pattern) == 'Invoice number INV-2024-002\nShip to: Invoice Dept.'
+
+    pattern = {'keyword': 'Ship', 'movements': [('u', 2), ('r', 1)],
+                'extract_type': 'wd', 'extract_count': 3, 'flexible': True}
+    assert extractor.extract_pattern(SAMPLE_TEXT, pattern) == 'number INV-2024-002 Ship'
+
+    pattern['movements'] = [('u', 1)]   # Lands on the blank line
+    assert extractor.extract_pattern(SAMPLE_TEXT, pattern) is None
+    print("✓ Extraction results correct")
+    return True
+
+
+def test_pages_tokenized_once():
+    """Several patterns over several pages tokenize each page once."""
+    print("=== Testing One Tokenization Per Page ===")
+    content = {page: f"Invoice Number: INV-{page}\nTotal: {page}00.00\nDate: 2024-01-0{page}"
+                for page in range(1, 4)}
+    pdf_path = create_test_pdf('test_tokenized_page.pdf', content)
+    tokenize_page.cache_clear()
+
+    built = []
+    original_init = TokenizedPage.__init__
+
+    def counting_init(self, text):
+        built.append(text)
+        original_init(self, text)
+
+    TokenizedPage.__init__ = counting_init
+    try:
+        patterns = [
+            {'keyword': keyword, 'movements': [('r', 1)], 'extract_type': extract_type,
+                'extract_count': 1, 'flexible': False, 'match_spec': {'type': 'all'}}
+            for keyword, extract_type in [('Invoice Number', 'wd'), ('Total', 'nb'), ('Date', 'wd'), ('Invoice', 'wd')]
+        ]
+        results = PatternExtractor().extract_patterns_enhanced(
+            pdf_path, [(pattern, {'type': 'all'}) for pattern in patterns])
+    finally:
+        TokenizedPage.__init__ = original_init
+
+    assert len(built) == 3, f"Expected 3 tokenizations, got {len(built)}"
+    assert results[1]['selected_match'] == ['100.00', '200.00', '300.00']
+    assert tokenized_page.tokenize_page.cache_info().hits > 0
+    print("✓ Each page tokenized once")
+    return True
+
+
+def main():
+    """Run all tokenized page tests."""
+    print("TOKENIZED PAGE TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_word_index,
+        test_keyword_lookup,
+        test_extractor_results,
+        test_pages_tokenized_once,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"TOKENIZED PAGE TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #
@@ -0,0 +1,191 @@
+"""
+Test Vectorized Line Assembly
+Run: python tests/test_vectorized_lines.py
+
+Tests that the NumPy line assembly of PDFPlumberProcessor produces exactly
+the text of the per-character path - on generated characters with lines
+near the y tolerance, stray spaces and ties, and on a real PDF - in both
+adaptive and fixed modes.
+
+Known pages with their expected text are checked on every available path,
+so the per-character path is tested without NumPy too; comparing the paths
+on generated pages needs NumPy (pip install numpy).
+"""
+
+import sys
+import random
+import atexit
+
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pdfplumber
+
+from simple_pdf_scraper.processors.pdfplumber_processor import PDFPlumberProcessor
+from simple_pdf_scraper.processors.vectorized_lines import NUMPY_AVAILABLE
+
+from tests.test_pdf_utils import create_test_pdf, cleanup_test_pdfs
+
+
+atexit.register(cleanup_test_pdfs)
+
+
+class _Page:
+    def __init__(self, chars):
+        self.chars = chars
+
+
+def _processors():
+    return [
+        PDFPlumberProcessor(),
+        PDFPlumberProcessor(min_space_distance=6.0, add_space_distance=5.3),
+        PDFPlumberProcessor(space_char='_', tab_char=' | '),
+    ]
+
+
+def _available_paths() -> list[bool]:
+    """Values of PDFPlumberProcessor.vectorized that can run here."""
+    return [False, True] if NUMPY_AVAILABLE else [False]
+
+
+def _line(words, y, width=6.0):
+    """Characters of (text, x0) words on one line, each character width wide."""
+    chars = []
+    for text, x0 in words:
+        for char in text:
+            chars.append({'text': char, 'x0': x0, 'x1': x0 + width, 'y1': y})
+            x0 += width
+    return chars
+
+
+# (characters, expected text with the default processor)
+_KNOWN_PAGES = [
+    (_line([("Total:", 10), ("$1,250.00", 70)], 700) + _line([("Ship", 10), ("To", 35.2)], 686),
+     "Total:\t$1,250.00\nShip To"),
+    (_line([("Item", 10), ("Qty", 120), ("Price", 200)], 500), "Item\tQty\tPrice"),
+    (_line([("ab", 10)], 300) + [{'text': 'c', 'x0': 22, 'x1': 28, 'y1': 301.5}], "abc"),      # Within y tolerance
+    (_line([("a", 10), (" ", 16), ("b", 22)], 200), "ab"),                                      # Stray space glyph
+]
+
+
+def _both_paths(processor, chars):
+    """Page text from the per-character path and the vectorized path."""
+    page = _Page(chars)
+    processor.vectorized = False
+    expected = processor._extract_page_with_filtering(page)
+    processor.vectorized = True
+    return expected, processor._extract_page_with_filtering(page)
+
+
+def _random_chars(rng):
+    chars = []
+    for _ in range(rng.randint(1, 80)):
+        x0 = round(rng.uniform(0, 300), rng.choice([0, 1, 3]))
+        width = rng.choice([0, 3, 4.8, 6, rng.uniform(0, 10)])
+        y1 = rng.choice([100, 101.5, 102, 102.0000001, 98, 97.9, 50]) + rng.choice([0, 0, rng.uniform(-2.5, 2.5)])
+        chars.append({'text': rng.choice('ab  1.$'), 'x0': x0, 'x1': x0 + width, 'y1': y1})
+    return chars
+
+
+def test_known_pages():
+    """Known pages assemble to their expected text on every available path."""
+    print("=== Testing Known Pages ===")
+    for vectorized in _available_paths():
+        processor = PDFPlumberProcessor()
+        processor.vectorized = vectorized
+        tab_processor = PDFPlumberProcessor(space_char='_', tab_char=' | ')
+        tab_processor.vectorized = vectorized
+        for chars, expected in _KNOWN_PAGES:
+            assert processor._extract_page_with_filtering(_Page(chars)) == expected, (vectorized, expected)
+            assert tab_processor._extract_page_with_filtering(_Page(chars)) == \
+                expected.replace(' ', '_').replace('\t', ' | '), (vectorized, expected)
+    paths = "per-character and vectorized paths" if NUMPY_AVAILABLE else "per-character path (NumPy not installed)"
+    print(f"✓ Expected text on the {paths}")
+    return True
+
+
+def test_generated_pages():
+    """Generated pages assemble to the same text on both paths."""
+    print("=== Testing Generated Pages ===")
+    if not NUMPY_AVAILABLE:
+        print("✓ Not compared: only the per-character path is available (NumPy not installed)")
+        return True
+
+    rng = random.Random(18)
+    processors = _processors()
+    for _ in range(500):
+        chars = _random_chars(rng)
+        for processor in processors:
+            expected, actual = _both_paths(processor, chars)
+            assert actual == expected, (expected, actual)
+    print("✓ Vectorized output identical on 1500 generated pages")
+    return True
+
+
+def test_real_pdf():
+    """A real PDF's pages assemble to the same text on every available path."""
+    print("=== Testing Real PDF ===")
+    pdf_path = create_test_pdf('test_vectorized_lines.pdf', {
+        1: "Invoice Number: INV-001\nTotal:    $1,250.00\nShip To   Warehouse 7",
+        2: "Item    Qty    Price\nWidget    4    12.50",
+    })
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        for vectorized in _available_paths():
+            processor = PDFPlumberProcessor()
+            processor.vectorized = vectorized
+            assert "Widget    4    12.50" in processor._extract_page_with_filtering(pdf.pages[1])
+
+        if NUMPY_AVAILABLE:
+            for page in pdf.pages:
+                for processor in _processors():
+                    expected, actual = _both_paths(processor, page.chars)
+                    assert actual == expected, (expected, actual)
+    print("✓ Real PDF text assembled on every available path")
+    return True
+
+
+def test_fallback_without_numpy():
+    """Without NumPy the processor uses the per-character path."""
+    print("=== Testing Fallback ===")
+    assert PDFPlumberProcessor(vectorized=False).vectorized is False
+    assert PDFPlumberProcessor().vectorized is NUMPY_AVAILABLE
+    assert PDFPlumberProcessor().get_processor_info()['vectorized'] is NUMPY_AVAILABLE
+    print("✓ Vectorized path only used when available")
+    return True
+
+
+def main():
+    """Run all vectorized line assembly tests."""
+    print("VECTORIZED LINE ASSEMBLY TESTS")
+    print("=" * 50)
+
+    tests = [
+        test_known_pages,
+        test_generated_pages,
+        test_real_pdf,
+        test_fallback_without_numpy,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            results.append(test_func())
+        except AssertionError as e:
+            print(f"✗ {test_func.__name__} failed: {e}")
+            results.append(False)
+
+    passed_tests = sum(results)
+    total_tests = len(results)
+
+    print("=" * 50)
+    print(f"VECTORIZED LINE ASSEMBLY TESTS: {passed_tests}/{total_tests} passed")
+    return 0 if passed_tests == total_tests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# End of file #